@@ -32,6 +32,7 @@ from .messages import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     DocumentFormat,
     DocumentMediaType,
     DocumentUrl,
@@ -85,6 +86,7 @@ from .toolsets import (
     AbstractToolset,
     ApprovalRequiredToolset,
     CombinedToolset,
+    ConcurrencyLimitedToolset,
     ExternalToolset,
     FilteredToolset,
     FunctionToolset,
@@ -127,6 +129,7 @@ __all__ = (
     'BinaryContent',
     'BuiltinToolCallPart',
     'BuiltinToolReturnPart',
+    'CachePoint',
     'DocumentFormat',
     'DocumentMediaType',
     'DocumentUrl',
@@ -183,6 +186,7 @@ __all__ = (
     'AbstractToolset',
     'ApprovalRequiredToolset',
     'CombinedToolset',
+    'ConcurrencyLimitedToolset',
     'ExternalToolset',
     'FilteredToolset',
     'FunctionToolset',
@@ -7,7 +7,7 @@ from asyncio import Task
 from collections import defaultdict, deque
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
 from contextlib import asynccontextmanager, contextmanager
-from contextvars import ContextVar
+from contextvars import ContextVar, copy_context
 from copy import deepcopy
 from dataclasses import field, replace
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeGuard, cast
@@ -23,7 +23,7 @@ from pydantic_ai.builtin_tools import AbstractBuiltinTool
 from pydantic_graph import BaseNode, Graph, GraphRunContext
 from pydantic_graph.nodes import End, NodeRunEndT
 
-from . import _output, _system_prompt, exceptions, messages as _messages, models, result, usage as _usage
+from . import _http_pool, _output, _system_prompt, exceptions, messages as _messages, models, result, usage as _usage
 from .exceptions import ToolRetryError
 from .output import OutputDataT, OutputSpec
 from .settings import ModelSettings
@@ -40,6 +40,7 @@ from .tools import (
 
 if TYPE_CHECKING:
     from .models.instrumented import InstrumentationSettings
+    from .rate_limit import AdaptiveRateLimiter
 
 __all__ = (
     'GraphAgentState',
@@ -407,29 +408,38 @@ class ModelRequestNode(AgentNode[DepsT, NodeRunEndT]):
         assert not self._did_stream, 'stream() should only be called once per node'
 
         model_settings, model_request_parameters, message_history, run_context = await self._prepare_request(ctx)
-        async with ctx.deps.model.request_stream(
-            message_history, model_settings, model_request_parameters, run_context
-        ) as streamed_response:
-            self._did_stream = True
-            ctx.state.usage.requests += 1
-            agent_stream = result.AgentStream[DepsT, T](
-                _raw_stream_response=streamed_response,
-                _output_schema=ctx.deps.output_schema,
-                _model_request_parameters=model_request_parameters,
-                _output_validators=ctx.deps.output_validators,
-                _run_ctx=build_run_context(ctx),
-                _usage_limits=ctx.deps.usage_limits,
-                _tool_manager=ctx.deps.tool_manager,
-            )
-            yield agent_stream
-            # In case the user didn't manually consume the full stream, ensure it is fully consumed here,
-            # otherwise usage won't be properly counted:
-            async for _ in agent_stream:
-                pass
+        # Captured outside of the model request, so that calls started early aren't traced as part of it
+        run_step_context = copy_context()
+        # The usage of the response is recorded on the rate limiters of the pooled clients that sent the request
+        with _http_pool.record_rate_limiters_used() as rate_limiters:
+            async with ctx.deps.model.request_stream(
+                message_history, model_settings, model_request_parameters, run_context
+            ) as streamed_response:
+                self._did_stream = True
+                ctx.state.usage.requests += 1
+                # Calls to side-effect-free tools can start as soon as their arguments are complete
+                tool_manager, usage_limits = ctx.deps.tool_manager, ctx.deps.usage_limits
+                streamed_response.on_tool_call_end(
+                    lambda call: tool_manager.start_speculative_call(call, usage_limits, run_step_context)
+                )
+                agent_stream = result.AgentStream[DepsT, T](
+                    _raw_stream_response=streamed_response,
+                    _output_schema=ctx.deps.output_schema,
+                    _model_request_parameters=model_request_parameters,
+                    _output_validators=ctx.deps.output_validators,
+                    _run_ctx=build_run_context(ctx),
+                    _usage_limits=ctx.deps.usage_limits,
+                    _tool_manager=ctx.deps.tool_manager,
+                )
+                yield agent_stream
+                # In case the user didn't manually consume the full stream, ensure it is fully consumed here,
+                # otherwise usage won't be properly counted:
+                async for _ in agent_stream:
+                    pass
 
-        model_response = streamed_response.get()
+            model_response = streamed_response.get()
 
-        self._finish_handling(ctx, model_response)
+        self._finish_handling(ctx, model_response, rate_limiters)
         assert self._result is not None  # this should be set by the previous line
 
     async def _make_request(
@@ -439,10 +449,11 @@ class ModelRequestNode(AgentNode[DepsT, NodeRunEndT]):
             return self._result  # pragma: no cover
 
         model_settings, model_request_parameters, message_history, _ = await self._prepare_request(ctx)
-        model_response = await ctx.deps.model.request(message_history, model_settings, model_request_parameters)
+        with _http_pool.record_rate_limiters_used() as rate_limiters:
+            model_response = await ctx.deps.model.request(message_history, model_settings, model_request_parameters)
         ctx.state.usage.requests += 1
 
-        return self._finish_handling(ctx, model_response)
+        return self._finish_handling(ctx, model_response, rate_limiters)
 
     async def _prepare_request(
         self, ctx: GraphRunContext[GraphAgentState, GraphAgentDeps[DepsT, NodeRunEndT]]
@@ -488,11 +499,14 @@ class ModelRequestNode(AgentNode[DepsT, NodeRunEndT]):
         self,
         ctx: GraphRunContext[GraphAgentState, GraphAgentDeps[DepsT, NodeRunEndT]],
         response: _messages.ModelResponse,
+        rate_limiters: set[AdaptiveRateLimiter],
     ) -> CallToolsNode[DepsT, NodeRunEndT]:
         # Update usage
         ctx.state.usage.incr(response.usage)
         if ctx.deps.usage_limits:  # pragma: no branch
             ctx.deps.usage_limits.check_tokens(ctx.state.usage)
+        for rate_limiter in rate_limiters:
+            rate_limiter.record_usage(response.usage)
 
         # Append the model response to state.message_history
         ctx.state.message_history.append(response)
@@ -846,6 +860,9 @@ async def process_tool_calls(  # noqa: C901
             for call in calls:
                 yield _messages.FunctionToolCallEvent(call)
 
+    # Calls that were started early but weren't run because a final result was found aren't needed anymore
+    await tool_manager.cancel_speculative_calls()
+
     if not final_result and deferred_calls:
         if not ctx.deps.output_schema.allows_deferred_tools:
             raise exceptions.UserError(
@@ -908,29 +925,32 @@ async def _call_tools(
 
                 return _messages.FunctionToolResultEvent(tool_part)
 
-        if tool_manager.should_call_sequentially(tool_calls):
-            for index, call in enumerate(tool_calls):
-                if event := await handle_call_or_result(
-                    _call_tool(tool_manager, call, tool_call_results.get(call.tool_call_id), usage_limits),
-                    index,
-                ):
-                    yield event
+        max_concurrent_calls = tool_manager.max_concurrent_calls
+        semaphore = asyncio.Semaphore(len(tool_calls) if max_concurrent_calls is None else max_concurrent_calls)
 
-        else:
-            tasks = [
-                asyncio.create_task(
-                    _call_tool(tool_manager, call, tool_call_results.get(call.tool_call_id), usage_limits),
-                    name=call.tool_name,
-                )
-                for call in tool_calls
-            ]
+        async def call_tool(
+            call: _messages.ToolCallPart,
+        ) -> tuple[_messages.ToolReturnPart | _messages.RetryPromptPart, _messages.UserPromptPart | None]:
+            async with semaphore:
+                return await _call_tool(tool_manager, call, tool_call_results.get(call.tool_call_id), usage_limits)
+
+        for batch in tool_manager.batch_calls(tool_calls):
+            if len(batch) == 1:
+                index = batch[0]
+                if event := await handle_call_or_result(call_tool(tool_calls[index]), index):
+                    yield event
+                continue
 
-            pending = tasks
+            tasks = {
+                asyncio.create_task(call_tool(tool_calls[index]), name=tool_calls[index].tool_name): index
+                for index in batch
+            }
+            pending = set(tasks)
             while pending:
                 done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
-                for task in done:
-                    index = tasks.index(task)
-                    if event := await handle_call_or_result(coro_or_task=task, index=index):
+                # Handle completed tasks in the order the calls were made, so the events are deterministic
+                for task in sorted(done, key=tasks.__getitem__):
+                    if event := await handle_call_or_result(coro_or_task=task, index=tasks[task]):
                         yield event
 
     # We append the results at the end, rather than as they are received, to retain a consistent ordering
@@ -0,0 +1,108 @@
+from __future__ import annotations as _annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from ._run_context import RunContext
+from .messages import ModelMessage, ModelResponse
+from .models import BatchModelRequest, KnownModelName, Model, ModelRequestParameters, StreamedResponse
+from .models.cached import CachedStreamedResponse
+from .models.wrapper import WrapperModel
+from .settings import ModelSettings
+
+
+@dataclass(init=False)
+class BatchingModel(WrapperModel):
+    """Model used by [`Agent.run_batch`][pydantic_ai.agent.AbstractAgent.run_batch] to collect the requests of concurrent runs into batches.
+
+    A request waits until every run that's still going is either waiting for a request of its own, or for a batch
+    that was already submitted, and is then submitted using the wrapped model's
+    [`request_batch`][pydantic_ai.models.Model.request_batch] together with the requests of the other runs. Once the
+    batch completes, each run continues with its response, and the requests it makes next go into a following batch.
+
+    Streamed requests are batched too, and the response is then replayed as a stream with one event per part.
+    """
+
+    max_batch_size: int | None
+    poll_interval: float
+
+    _pending: list[tuple[BatchModelRequest, asyncio.Future[ModelResponse | Exception]]] = field(repr=False)
+    _active_runs: int = field(repr=False)
+    _in_flight: int = field(repr=False)
+    _batches: set[asyncio.Task[None]] = field(repr=False)
+
+    def __init__(self, wrapped: Model | KnownModelName, *, max_batch_size: int | None, poll_interval: float):
+        super().__init__(wrapped)
+        self.max_batch_size = max_batch_size
+        self.poll_interval = poll_interval
+        self._pending = []
+        self._active_runs = 0
+        self._in_flight = 0
+        self._batches = set()
+
+    def runs_started(self, count: int) -> None:
+        """Record that `count` runs that will make requests to this model were started."""
+        self._active_runs += count
+
+    def run_finished(self) -> None:
+        """Record that one of the registered runs finished, so the others no longer wait for its requests."""
+        self._active_runs -= 1
+        self._maybe_submit()
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        future: asyncio.Future[ModelResponse | Exception] = asyncio.get_running_loop().create_future()
+        entry = (BatchModelRequest(messages, model_settings, model_request_parameters), future)
+        self._pending.append(entry)
+        self._maybe_submit()
+        try:
+            response = await future
+        except asyncio.CancelledError:  # pragma: no cover
+            if entry in self._pending:
+                self._pending.remove(entry)
+            raise
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        response = await self.request(messages, model_settings, model_request_parameters)
+        _, prepared_parameters = self.wrapped.prepare_request(model_settings, model_request_parameters)
+        yield CachedStreamedResponse(prepared_parameters, response)
+
+    def _maybe_submit(self) -> None:
+        while self._pending and (
+            len(self._pending) >= self._active_runs - self._in_flight
+            or (self.max_batch_size is not None and len(self._pending) >= self.max_batch_size)
+        ):
+            size = len(self._pending) if self.max_batch_size is None else self.max_batch_size
+            batch, self._pending = self._pending[:size], self._pending[size:]
+            self._in_flight += len(batch)
+            task = asyncio.create_task(self._submit(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _submit(self, batch: list[tuple[BatchModelRequest, asyncio.Future[ModelResponse | Exception]]]) -> None:
+        try:
+            responses = await self.wrapped.request_batch([r for r, _ in batch], poll_interval=self.poll_interval)
+        except Exception as e:
+            responses = [e] * len(batch)
+        finally:
+            self._in_flight -= len(batch)
+        for (_, future), response in zip(batch, responses):
+            if not future.done():  # pragma: no branch
+                future.set_result(response)
@@ -0,0 +1,302 @@
+"""Cache of files downloaded by `pydantic_ai.models.download_item`.
+
+Files referenced by URL in the message history are downloaded (and possibly base64-encoded) for every request that
+includes them, which is every request after they were added. The cache avoids fetching them again while the server
+says they're fresh, revalidates them with their ETag once they're stale, and keeps the encoded variants around.
+"""
+
+from __future__ import annotations as _annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+
+from . import _utils
+
+__all__ = ('CachedDownload', 'DownloadCache')
+
+
+@dataclass
+class CachedDownload:
+    """A downloaded file, along with the HTTP caching information needed to reuse it."""
+
+    url: str
+    """The URL the file was downloaded from."""
+    content: bytes
+    """The content of the file."""
+    content_type: str | None
+    """The `content-type` header of the response, if any."""
+    etag: str | None = None
+    """The `etag` header of the response, used to revalidate the file once it's stale."""
+    fresh_until: float = 0
+    """The Unix timestamp until which the file can be used without revalidating it."""
+
+    _variants: dict[str, str] = field(default_factory=dict, repr=False)
+
+    @property
+    def sha256(self) -> str:
+        """The SHA-256 hash of the content, used to store it on disk."""
+        return hashlib.sha256(self.content).hexdigest()
+
+    @property
+    def size(self) -> int:
+        """The number of bytes used by the content and its encoded variants."""
+        return len(self.content) + sum(len(v) for v in self._variants.values())
+
+    def base64(self) -> str:
+        """The base64-encoded content, encoded at most once."""
+        if (encoded := self._variants.get('base64')) is None:
+            encoded = self._variants['base64'] = base64.b64encode(self.content).decode('utf-8')
+        return encoded
+
+    def text(self) -> str:
+        """The content decoded as UTF-8, decoded at most once."""
+        if (text := self._variants.get('text')) is None:
+            text = self._variants['text'] = self.content.decode('utf-8')
+        return text
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+
+class DownloadCache:
+    """Size-bounded cache of downloaded files, honouring the `Cache-Control` and `ETag` headers of the responses.
+
+    Files are kept in an in-memory LRU, and optionally in a directory so they survive restarts of the process. On disk,
+    file contents are stored by their hash, so a file that's available at multiple URLs is only stored once.
+
+    Responses with `Cache-Control: no-store`, and responses that are neither fresh (`max-age`) nor have an `ETag` to
+    revalidate them with, aren't cached. Concurrent downloads of the same URL are deduplicated in either case.
+
+    To store files somewhere else, e.g. in a shared cache service, subclass this and override
+    [`load`][pydantic_ai.models.DownloadCache.load] and [`save`][pydantic_ai.models.DownloadCache.save].
+    """
+
+    max_size: int
+    """The maximum number of bytes of content and encoded variants to keep in memory."""
+    directory: Path | None
+    """The directory to store files in, if any."""
+    max_disk_size: int
+    """The maximum number of bytes of content to keep in `directory`."""
+
+    hits: int
+    """The number of downloads that were served from the cache without making a request."""
+    revalidations: int
+    """The number of stale files that were confirmed to be unchanged by the server."""
+    misses: int
+    """The number of downloads that required fetching the file."""
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 64 * 1024 * 1024,
+        directory: Path | str | None = None,
+        max_disk_size: int = 1024 * 1024 * 1024,
+    ):
+        """Create a download cache.
+
+        Args:
+            max_size: The maximum number of bytes of content and encoded variants to keep in memory.
+            directory: The directory to store downloaded files in, if any. It's created if it doesn't exist.
+            max_disk_size: The maximum number of bytes of content to keep in `directory`.
+        """
+        self.max_size = max_size
+        self.directory = Path(directory) if directory is not None else None
+        self.max_disk_size = max_disk_size
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, CachedDownload] = OrderedDict()
+        # the size of each file in memory when it was last used, and their total
+        self._memory_sizes: dict[str, int] = {}
+        self._memory_size = 0
+        self._in_flight: dict[str, asyncio.Task[CachedDownload]] = {}
+
+    async def fetch(self, url: str, client: httpx.AsyncClient) -> CachedDownload:
+        """Return the file at `url`, from the cache if it's fresh, otherwise by (re)validating or downloading it."""
+        cached = self._memory.get(url)
+        if cached is not None:
+            self._remember(cached)
+        else:
+            cached = await self.load(url)
+            if cached is not None:
+                self._remember(cached)
+
+        if cached is not None and cached.is_fresh():
+            self.hits += 1
+            return cached
+
+        task = self._in_flight.get(url)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._download(url, client, cached))
+            self._in_flight[url] = task
+            task.add_done_callback(lambda t: self._in_flight.pop(url, None) if self._in_flight.get(url) is t else None)
+        # shielded so that another caller waiting for the same download isn't affected if this one is cancelled
+        return await asyncio.shield(task)
+
+    async def load(self, url: str) -> CachedDownload | None:
+        """Load a file that isn't in memory from persistent storage, by default `directory` if it's set."""
+        if self.directory is None:
+            return None
+        return await _utils.run_in_executor(self._load_sync, url)
+
+    async def save(self, download: CachedDownload) -> None:
+        """Save a newly downloaded or revalidated file to persistent storage, by default `directory` if it's set."""
+        if self.directory is not None:
+            await _utils.run_in_executor(self._save_sync, download)
+
+    def clear(self) -> None:
+        """Remove all files from memory, and reset the counters. Files in `directory` are kept."""
+        self._memory.clear()
+        self._memory_sizes.clear()
+        self._memory_size = 0
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    async def _download(self, url: str, client: httpx.AsyncClient, stale: CachedDownload | None) -> CachedDownload:
+        headers = {'If-None-Match': stale.etag} if stale is not None and stale.etag else None
+        response = await client.get(url, headers=headers, follow_redirects=True)
+        now = time.time()
+        if stale is not None and response.status_code == 304:
+            self.revalidations += 1
+            stale.fresh_until = _fresh_until(response.headers, now) or now
+            await self.save(stale)
+            return stale
+
+        response.raise_for_status()
+        self.misses += 1
+        download = CachedDownload(
+            url=url,
+            content=response.content,
+            content_type=response.headers.get('content-type'),
+            etag=response.headers.get('etag'),
+        )
+        fresh_until = _fresh_until(response.headers, now)
+        if fresh_until is None or (fresh_until <= now and download.etag is None):
+            # can't be reused
+            self._forget(url)
+            return download
+
+        download.fresh_until = fresh_until
+        self._remember(download)
+        await self.save(download)
+        return download
+
+    def _remember(self, download: CachedDownload) -> None:
+        url = download.url
+        self._memory[url] = download
+        self._memory.move_to_end(url)
+        # encoded variants are added after a file is stored, so its size is measured again every time it's used
+        size = download.size
+        self._memory_size += size - self._memory_sizes.get(url, 0)
+        self._memory_sizes[url] = size
+        while self._memory_size > self.max_size and self._memory:
+            evicted_url, _ = self._memory.popitem(last=False)
+            self._memory_size -= self._memory_sizes.pop(evicted_url)
+
+    def _forget(self, url: str) -> None:
+        if self._memory.pop(url, None) is not None:
+            self._memory_size -= self._memory_sizes.pop(url)
+
+    def _meta_path(self, url: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f'{hashlib.sha256(url.encode()).hexdigest()}.json'
+
+    def _load_sync(self, url: str) -> CachedDownload | None:
+        assert self.directory is not None
+        try:
+            meta = json.loads(self._meta_path(url).read_bytes())
+            content = (self.directory / 'blobs' / meta['sha256']).read_bytes()
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+        if meta.get('url') != url:  # pragma: no cover
+            return None
+        return CachedDownload(
+            url=url,
+            content=content,
+            content_type=meta.get('content_type'),
+            etag=meta.get('etag'),
+            fresh_until=meta.get('fresh_until', 0),
+        )
+
+    def _save_sync(self, download: CachedDownload) -> None:
+        assert self.directory is not None
+        blobs = self.directory / 'blobs'
+        blobs.mkdir(parents=True, exist_ok=True)
+        sha256 = download.sha256
+        blob = blobs / sha256
+        if not blob.exists():
+            tmp_blob = blobs / f'{sha256}.tmp'
+            tmp_blob.write_bytes(download.content)
+            os.replace(tmp_blob, blob)
+        meta = {
+            'url': download.url,
+            'sha256': sha256,
+            'content_type': download.content_type,
+            'etag': download.etag,
+            'fresh_until': download.fresh_until,
+        }
+        self._meta_path(download.url).write_text(json.dumps(meta))
+        self._evict_from_disk_sync()
+
+    def _evict_from_disk_sync(self) -> None:
+        """Remove the least recently saved files until the content in `directory` fits in `max_disk_size`."""
+        assert self.directory is not None
+        blobs = self.directory / 'blobs'
+        blob_sizes = {p.name: p.stat().st_size for p in blobs.iterdir() if not p.name.endswith('.tmp')}
+        if sum(blob_sizes.values()) <= self.max_disk_size:
+            return
+
+        metas: list[tuple[float, Path, str]] = []
+        for meta_path in self.directory.glob('*.json'):
+            try:
+                sha256 = json.loads(meta_path.read_bytes())['sha256']
+                metas.append((meta_path.stat().st_mtime, meta_path, sha256))
+            except (FileNotFoundError, ValueError, KeyError):  # pragma: no cover
+                continue
+        metas.sort()
+
+        refcounts = Counter(sha256 for _, _, sha256 in metas)
+        total_size = sum(blob_sizes.get(sha256, 0) for sha256 in refcounts)
+        for _, meta_path, sha256 in metas:
+            if total_size <= self.max_disk_size:
+                break
+            meta_path.unlink(missing_ok=True)
+            refcounts[sha256] -= 1
+            if not refcounts[sha256]:
+                del refcounts[sha256]
+                total_size -= blob_sizes.get(sha256, 0)
+
+        for name in blob_sizes:
+            if name not in refcounts:
+                (blobs / name).unlink(missing_ok=True)
+
+
+def _fresh_until(headers: httpx.Headers, now: float) -> float | None:
+    """When a response stops being fresh according to its `Cache-Control` header, or `None` if it can't be stored."""
+    directives: dict[str, str | None] = {}
+    for directive in headers.get('cache-control', '').split(','):
+        name, _, value = directive.strip().partition('=')
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+
+    if 'no-store' in directives:
+        return None
+    if 'no-cache' in directives:
+        return now
+
+    try:
+        max_age = int(directives.get('max-age') or 0)
+        age = int(headers.get('age') or 0)
+    except ValueError:
+        return now
+    return now + max(max_age - age, 0)
@@ -0,0 +1,270 @@
+"""Connection pool configuration for the HTTP clients returned by `pydantic_ai.models.cached_async_http_client`.
+
+All built-in providers share one client per provider, so under high concurrency the size of its connection pool, how
+long idle connections are kept alive, and whether requests can be multiplexed over HTTP/2 decide how many requests wait
+for a connection and how many TLS handshakes are made.
+"""
+
+from __future__ import annotations as _annotations
+
+import socket
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+import anyio
+import httpcore
+import httpx
+
+from .rate_limit import AdaptiveRateLimiter
+
+__all__ = ('HttpPoolSettings', 'HttpPoolStats', 'PooledAsyncClient')
+
+
+@dataclass
+class HttpPoolSettings:
+    """Connection pool settings for the HTTP clients shared by the built-in providers.
+
+    The defaults match those of HTTPX.
+    """
+
+    max_connections: int | None = 100
+    """The maximum number of connections open at the same time, or `None` for no limit."""
+    max_keepalive_connections: int | None = 20
+    """The maximum number of idle connections to keep open for reuse, or `None` for no limit."""
+    keepalive_expiry: float | None = 5.0
+    """How long in seconds an idle connection is kept open for reuse, or `None` to keep it open indefinitely."""
+    max_connections_per_host: int | None = None
+    """The maximum number of requests to a single host that can be in flight at the same time, or `None` for no limit.
+
+    This keeps a single slow host from taking up the whole pool. Requests over the limit wait in the order they were
+    made, counting towards [`HttpPoolStats.requests_waiting`][pydantic_ai.models.HttpPoolStats.requests_waiting].
+    """
+    http2: bool = False
+    """Whether to use HTTP/2 for hosts that support it, which multiplexes concurrent requests over a single connection.
+
+    This requires the `h2` package, which can be installed with `pip install 'httpx[http2]'`.
+    """
+    dns_cache_ttl: float | None = None
+    """How long in seconds to cache the address a host name resolves to when opening new connections, or `None` to
+    resolve it for every new connection.
+
+    Proxies configured using environment variables aren't used when this is set.
+    """
+    rate_limiter: AdaptiveRateLimiter | None = None
+    """A rate limiter that paces requests based on the rate limit headers of the responses, or `None` to not pace them.
+
+    The usage of every model response whose request was sent by one of the shared clients is recorded on the rate
+    limiter, to estimate how many tokens a request will use. Since all providers share the limiter, its budgets are
+    kept per host.
+    """
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass
+class HttpPoolStats:
+    """Usage of the connection pool of the HTTP clients shared by a provider, for exporting as metrics."""
+
+    max_connections: int | None
+    """The configured maximum number of connections."""
+    requests: int = 0
+    """The total number of requests that were sent."""
+    requests_in_flight: int = 0
+    """The number of requests that are currently being sent or whose response is being read."""
+    peak_requests_in_flight: int = 0
+    """The highest number of requests that were in flight at the same time."""
+    requests_waiting: int = 0
+    """The number of requests that are waiting for the per-host limit."""
+    pool_timeouts: int = 0
+    """The number of requests that failed because no connection became available in time."""
+
+    @property
+    def saturation(self) -> float | None:
+        """The number of requests in flight relative to `max_connections`.
+
+        Once this reaches 1 on HTTP/1.1, new requests wait for a connection to become available.
+        """
+        if not self.max_connections:
+            return None
+        return self.requests_in_flight / self.max_connections
+
+
+_rate_limiters_used: ContextVar[set[AdaptiveRateLimiter] | None] = ContextVar('_rate_limiters_used', default=None)
+
+
+@contextmanager
+def record_rate_limiters_used() -> Iterator[set[AdaptiveRateLimiter]]:
+    """Collect the rate limiters of the `PooledAsyncClient`s that send requests during the context.
+
+    This is used to record the usage of a model response on the rate limiter that its request was paced by.
+    """
+    previous = _rate_limiters_used.get()
+    rate_limiters: set[AdaptiveRateLimiter] = set()
+    _rate_limiters_used.set(rate_limiters)
+    try:
+        yield rate_limiters
+    finally:
+        # Restored rather than reset using a token, which fails if a streamed request is closed from another context
+        _rate_limiters_used.set(previous)
+
+
+class PooledAsyncClient(httpx.AsyncClient):
+    """An `httpx.AsyncClient` that applies `HttpPoolSettings` and records `HttpPoolStats`."""
+
+    def __init__(self, *, pool_settings: HttpPoolSettings, stats: HttpPoolStats, **kwargs: Any):
+        if pool_settings.dns_cache_ttl is not None:
+            kwargs.setdefault('transport', _DnsCachingTransport(pool_settings))
+        super().__init__(limits=pool_settings.limits, http2=pool_settings.http2, **kwargs)
+        self.pool_settings = pool_settings
+        self.stats = stats
+        self._host_limiters: dict[str, anyio.Semaphore] = {}
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        rate_limiter = self.pool_settings.rate_limiter
+        tokens = 0.0
+        if rate_limiter is not None:
+            if (rate_limiters_used := _rate_limiters_used.get()) is not None:
+                rate_limiters_used.add(rate_limiter)
+            tokens = rate_limiter.tokens_per_request
+            await rate_limiter.acquire(request.url.host, tokens)
+
+        limiter: anyio.Semaphore | None = None
+        if (max_per_host := self.pool_settings.max_connections_per_host) is not None:
+            limiter = self._host_limiters.get(request.url.host)
+            if limiter is None:
+                limiter = self._host_limiters[request.url.host] = anyio.Semaphore(max_per_host)
+            self.stats.requests_waiting += 1
+            try:
+                await limiter.acquire()
+            except BaseException:
+                if rate_limiter is not None:
+                    rate_limiter.release(request.url.host, tokens)
+                raise
+            finally:
+                self.stats.requests_waiting -= 1
+
+        stats = self.stats
+        stats.requests += 1
+        stats.requests_in_flight += 1
+        stats.peak_requests_in_flight = max(stats.peak_requests_in_flight, stats.requests_in_flight)
+        released = False
+        response: httpx.Response | None = None
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                stats.requests_in_flight -= 1
+                if limiter is not None:
+                    limiter.release()
+                if rate_limiter is not None:
+                    rate_limiter.release(request.url.host, tokens, response)
+
+        try:
+            response = await super().send(request, **kwargs)
+        except httpx.PoolTimeout:
+            stats.pool_timeouts += 1
+            release()
+            raise
+        except BaseException:
+            release()
+            raise
+
+        if response.is_closed:
+            release()
+        else:
+            # The connection is held until a streamed response is closed
+            response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream | httpx.AsyncByteStream, release: Any):
+        assert isinstance(stream, httpx.AsyncByteStream)
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _DnsCachingTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, pool_settings: HttpPoolSettings):
+        super().__init__(limits=pool_settings.limits, http2=pool_settings.http2)
+        assert pool_settings.dns_cache_ttl is not None
+        limits = pool_settings.limits
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=pool_settings.http2,
+            network_backend=_DnsCachingBackend(pool_settings.dns_cache_ttl),
+        )
+
+
+@dataclass
+class _DnsCachingBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that resolves host names at most once per `ttl` seconds.
+
+    The TLS server name is still taken from the URL, so connecting to the resolved address doesn't affect certificate
+    verification.
+    """
+
+    ttl: float
+    _backend: httpcore.AsyncNetworkBackend = field(default_factory=lambda: _anyio_backend())
+    _addresses: dict[tuple[str, int], tuple[str, float]] = field(default_factory=dict)
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        address = await self.resolve(host, port)
+        return await self._backend.connect_tcp(
+            address, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+        )
+
+    async def connect_unix_socket(  # pragma: no cover
+        self, path: str, timeout: float | None = None, socket_options: Iterable[Any] | None = None
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:  # pragma: no cover
+        await self._backend.sleep(seconds)
+
+    async def resolve(self, host: str, port: int) -> str:
+        now = time.monotonic()
+        cached = self._addresses.get((host, port))
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        infos = await anyio.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        address = str(infos[0][4][0])
+        self._addresses[(host, port)] = (address, now + self.ttl)
+        return address
+
+
+def _anyio_backend() -> httpcore.AsyncNetworkBackend:
+    # `httpcore.AnyIOBackend` is defined conditionally, which type checkers can't see through
+    return cast(httpcore.AsyncNetworkBackend, httpcore.AnyIOBackend())
@@ -1,11 +1,15 @@
 from __future__ import annotations as _annotations
 
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Literal
 
+import pydantic_core
+
 from .exceptions import UserError
 
 JsonSchema = dict[str, Any]
@@ -188,3 +192,52 @@ class InlineDefsJsonSchemaTransformer(JsonSchemaTransformer):
 
     def transform(self, schema: JsonSchema) -> JsonSchema:
         return schema
+
+
+@dataclass
+class JsonSchemaTransformCache:
+    """LRU cache of the results of walking JSON schemas with a `JsonSchemaTransformer`.
+
+    Entries are keyed by the transformer class, `strict`, and the serialized content of the schema, so tool definitions
+    that are rebuilt for each request but haven't changed still hit the cache. The transformed schemas are shared
+    between callers and must not be mutated.
+    """
+
+    maxsize: int
+    """The maximum number of transformed schemas to keep, the least recently used are evicted first."""
+    hits: int = 0
+    """The number of transforms that were served from the cache."""
+    misses: int = 0
+    """The number of transforms that had to walk the schema."""
+
+    _entries: OrderedDict[tuple[type[JsonSchemaTransformer], bool | None, bytes], tuple[JsonSchema, bool]] = field(
+        default_factory=OrderedDict, repr=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def transform(
+        self, transformer: type[JsonSchemaTransformer], schema: JsonSchema, *, strict: bool | None
+    ) -> tuple[JsonSchema, bool]:
+        """Return the transformed schema, and whether it is compatible with strict mode."""
+        key = (transformer, strict, pydantic_core.to_json(schema))
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        schema_transformer = transformer(schema, strict=strict)
+        entry = schema_transformer.walk(), schema_transformer.is_strict_compatible
+        with self._lock:
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries from the cache and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
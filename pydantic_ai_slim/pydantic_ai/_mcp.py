@@ -93,6 +93,8 @@ def map_from_pai_messages(pai_messages: list[messages.ModelMessage]) -> tuple[st
                                         mimeType=chunk.media_type,
                                     ),
                                 )
+                            elif isinstance(chunk, messages.CachePoint):
+                                continue
                             # TODO(Marcelo): Add support for audio content.
                             else:
                                 raise NotImplementedError(f'Unsupported content type: {type(chunk)}')
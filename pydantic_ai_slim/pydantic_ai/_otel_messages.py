@@ -41,6 +41,9 @@ class BinaryDataPart(TypedDict):
     type: Literal['binary']
     media_type: str
     content: NotRequired[str]
+    # Not part of the spec, used instead of `content` for binary content larger than `max_binary_content_size`
+    size: NotRequired[int]
+    sha256: NotRequired[str]
 
 
 class ThinkingPart(TypedDict):
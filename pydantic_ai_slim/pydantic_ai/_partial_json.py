@@ -0,0 +1,170 @@
+"""Utilities for incrementally scanning JSON that is being streamed by a model.
+
+These don't build Python objects; parsing and validation are still done by pydantic-core. They track just enough
+tokenizer state to resume scanning where the previous chunk left off, so each newly-arrived character is only looked
+at once, and callers can avoid handing the same (or an equivalent) partial document to pydantic-core repeatedly.
+"""
+
+from __future__ import annotations as _annotations
+
+import re
+from dataclasses import dataclass, field
+
+_STRING_SPECIAL_CHAR_RE = re.compile(r'["\\]')
+_INSIGNIFICANT_CHARS = frozenset(' \t\n\r,:')
+
+
+@dataclass
+class PartialJsonScanner:
+    """Resumable scanner that tracks the stable prefix of a streamed JSON document.
+
+    The stable prefix is the part of the document that determines the result of parsing it with pydantic-core's
+    `allow_partial='trailing-strings'` mode: trailing whitespace and commas, and an object key that doesn't have a value
+    yet, are dropped by partial parsing, so characters like that don't extend the stable prefix until the next value
+    starts. If the stable prefix length hasn't changed since the last validation, the result of validating the
+    document won't have changed either.
+
+    The text passed to successive `feed` calls must each start with the previously fed text; use a new scanner if the
+    document was replaced.
+    """
+
+    text: str = ''
+    """The text scanned so far."""
+    stable_length: int = 0
+    """The length of the stable prefix of `text`."""
+
+    _stack: list[str] = field(default_factory=list, repr=False)
+    """The currently open containers, as `'{'` or `'['`."""
+    _in_string: bool = field(default=False, repr=False)
+    _in_key: bool = field(default=False, repr=False)
+    _escape: bool = field(default=False, repr=False)
+    _expect_key: bool = field(default=False, repr=False)
+
+    def feed(self, text: str) -> int:
+        """Scan the characters of `text` that weren't scanned by a previous call and return the stable prefix length."""
+        pos = len(self.text)
+        end = len(text)
+        stable_length = self.stable_length
+        while pos < end:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    pos += 1
+                else:
+                    match = _STRING_SPECIAL_CHAR_RE.search(text, pos)
+                    pos = end if match is None else match.start()
+                    if pos < end:
+                        if text[pos] == '\\':
+                            self._escape = True
+                        else:
+                            self._in_string = False
+                        pos += 1
+                if not self._in_key:
+                    # Partial string values are kept by `trailing-strings`, so every character counts
+                    stable_length = pos
+                elif not self._in_string:
+                    self._in_key = False
+                continue
+
+            char = text[pos]
+            pos += 1
+            if char in _INSIGNIFICANT_CHARS:
+                if char == ',' and self._stack and self._stack[-1] == '{':
+                    self._expect_key = True
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._expect_key:
+                    # The key only becomes significant once its value starts
+                    self._in_key = True
+                    self._expect_key = False
+                    continue
+            elif char in '{[':
+                self._stack.append(char)
+                self._expect_key = char == '{'
+            elif char in '}]':
+                if self._stack:
+                    self._stack.pop()
+                self._expect_key = False
+            stable_length = pos
+
+        self.text = text
+        self.stable_length = stable_length
+        return stable_length
+
+
+_STRUCTURAL_BYTE_RE = re.compile(rb'[\[\]{}"]')
+_STRING_SPECIAL_BYTE_RE = re.compile(rb'["\\]')
+
+
+@dataclass
+class JsonArraySplitter:
+    """Incrementally splits a streamed top-level JSON array into the raw JSON of its complete items.
+
+    Each item is returned as soon as its closing bracket arrives, so it can be parsed exactly once. Only object and array
+    items are supported, which is all that the streaming APIs that return a JSON array of responses produce.
+
+    Only the bytes of the item currently being received are kept around; everything before it is discarded.
+    """
+
+    _buffer: bytearray = field(default_factory=bytearray, repr=False)
+    _pos: int = field(default=0, repr=False)
+    """The position in `_buffer` up to which it has been scanned."""
+    _item_start: int | None = field(default=None, repr=False)
+    """The position in `_buffer` at which the item currently being received starts."""
+    _depth: int = field(default=0, repr=False)
+    _in_string: bool = field(default=False, repr=False)
+    _escape: bool = field(default=False, repr=False)
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Scan a newly received chunk and return the JSON of any array items that it completed."""
+        buffer = self._buffer
+        buffer.extend(chunk)
+        items: list[bytes] = []
+        pos = self._pos
+        end = len(buffer)
+        while pos < end:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    pos += 1
+                    continue
+                match = _STRING_SPECIAL_BYTE_RE.search(buffer, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.start()
+                if buffer[pos] == ord('\\'):
+                    self._escape = True
+                else:
+                    self._in_string = False
+                pos += 1
+                continue
+
+            match = _STRUCTURAL_BYTE_RE.search(buffer, pos)
+            if match is None:
+                pos = end
+                break
+            pos = match.start()
+            byte = buffer[pos]
+            pos += 1
+            if byte == ord('"'):
+                self._in_string = True
+            elif byte in b'{[':
+                if self._depth == 1:
+                    self._item_start = pos - 1
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 1 and self._item_start is not None:
+                    items.append(bytes(buffer[self._item_start : pos]))
+                    self._item_start = None
+
+        # Discard everything before the item that's currently being received
+        keep_from = pos if self._item_start is None else self._item_start
+        del buffer[:keep_from]
+        self._pos = pos - keep_from
+        if self._item_start is not None:
+            self._item_start = 0
+        return items
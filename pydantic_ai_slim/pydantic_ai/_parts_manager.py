@@ -13,7 +13,7 @@ event-emitting logic.
 
 from __future__ import annotations as _annotations
 
-from collections.abc import Hashable
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass, field, replace
 from typing import Any
 
@@ -59,6 +59,22 @@ class ModelResponsePartsManager:
     """A list of parts (text or tool calls) that make up the current state of the model's response."""
     _vendor_id_to_part_index: dict[VendorId, int] = field(default_factory=dict, init=False)
     """Maps a vendor's "part" ID (if provided) to the index in `_parts` where that part resides."""
+    _pending_chunks: dict[int, list[str]] = field(default_factory=dict, init=False)
+    """Maps the index of a part in `_parts` to streamed string chunks that haven't been joined into it yet.
+
+    For `TextPart`s and `ThinkingPart`s these are content chunks; for `ToolCallPart`s and `BuiltinToolCallPart`s
+    they are JSON args chunks. Concatenating each delta onto the part would make long streams quadratic, so the chunks
+    are only joined when the parts are requested, and the joined string is kept on the part until the next delta.
+    """
+    _ended_part_count: int = field(default=0, init=False)
+    """The number of parts at the start of `_parts` that won't receive any more deltas."""
+
+    tool_call_end_handler: Callable[[ToolCallPart], None] | None = field(default=None, init=False)
+    """A function to call with each `ToolCallPart` as soon as it won't receive any more deltas.
+
+    Parts are assumed to be streamed one after the other, so a part ends when the next part starts,
+    or when the vendor signals its end through `handle_part_end`, which also ends any parts before it.
+    """
 
     def get_parts(self) -> list[ModelResponsePart]:
         """Return only model response parts that are complete (i.e., not ToolCallPartDelta's).
@@ -66,8 +82,66 @@ class ModelResponsePartsManager:
         Returns:
             A list of ModelResponsePart objects. ToolCallPartDelta objects are excluded.
         """
+        self._join_pending_chunks()
         return [p for p in self._parts if not isinstance(p, ToolCallPartDelta)]
 
+    def _append_chunk(self, part_index: int, existing: str, chunk: str) -> None:
+        """Buffer a string delta for the part at `part_index`, whose current (joined) value is `existing`."""
+        chunks = self._pending_chunks.get(part_index)
+        if chunks is None:
+            self._pending_chunks[part_index] = [existing, chunk]
+        else:
+            chunks.append(chunk)
+
+    def _join_pending_chunks(self) -> None:
+        """Join any buffered string chunks into their parts."""
+        for part_index, chunks in self._pending_chunks.items():
+            self._join_chunks(part_index, chunks)
+        self._pending_chunks.clear()
+
+    def _join_chunks(self, part_index: int, chunks: list[str]) -> None:
+        part = self._parts[part_index]
+        if isinstance(part, TextPart | ThinkingPart):
+            self._parts[part_index] = replace(part, content=''.join(chunks))
+        else:
+            assert isinstance(part, ToolCallPart | BuiltinToolCallPart)
+            self._parts[part_index] = replace(part, args=''.join(chunks))
+
+    def _append_part(self, part: ManagedPart) -> int:
+        """Append a new part, which ends all parts before it, and return its index."""
+        new_part_index = len(self._parts)
+        self._end_parts(new_part_index)
+        self._parts.append(part)
+        return new_part_index
+
+    def _end_parts(self, end: int) -> None:
+        """Mark the parts before index `end` as ended, and call `tool_call_end_handler` with the tool calls among them."""
+        start = self._ended_part_count
+        if end <= start:
+            return
+        self._ended_part_count = end
+        if self.tool_call_end_handler is None:
+            return
+        for part_index in range(start, end):
+            if isinstance(self._parts[part_index], ToolCallPart):
+                if (chunks := self._pending_chunks.pop(part_index, None)) is not None:
+                    self._join_chunks(part_index, chunks)
+                part = self._parts[part_index]
+                assert isinstance(part, ToolCallPart)
+                self.tool_call_end_handler(part)
+
+    def handle_part_end(self, *, vendor_part_id: Hashable) -> None:
+        """Handle the vendor signalling that a part won't receive any more deltas.
+
+        Any parts before it are considered to have ended as well.
+
+        Args:
+            vendor_part_id: The ID the vendor uses to identify the part that ended.
+        """
+        part_index = self._vendor_id_to_part_index.get(vendor_part_id)
+        if part_index is not None:
+            self._end_parts(part_index + 1)
+
     def handle_text_delta(
         self,
         *,
@@ -140,17 +214,16 @@ class ModelResponsePartsManager:
                 return None
 
             # There is no existing text part that should be updated, so create a new one
-            new_part_index = len(self._parts)
             part = TextPart(content=content, id=id)
+            new_part_index = self._append_part(part)
             if vendor_part_id is not None:
                 self._vendor_id_to_part_index[vendor_part_id] = new_part_index
-            self._parts.append(part)
             return PartStartEvent(index=new_part_index, part=part)
         else:
             # Update the existing TextPart with the new content delta
             existing_text_part, part_index = existing_text_part_and_index
             part_delta = TextPartDelta(content_delta=content)
-            self._parts[part_index] = part_delta.apply(existing_text_part)
+            self._append_chunk(part_index, existing_text_part.content, content)
             return PartDeltaEvent(index=part_index, delta=part_delta)
 
     def handle_thinking_delta(
@@ -204,11 +277,10 @@ class ModelResponsePartsManager:
         if existing_thinking_part_and_index is None:
             if content is not None or signature is not None:
                 # There is no existing thinking part that should be updated, so create a new one
-                new_part_index = len(self._parts)
                 part = ThinkingPart(content=content or '', id=id, signature=signature, provider_name=provider_name)
+                new_part_index = self._append_part(part)
                 if vendor_part_id is not None:  # pragma: no branch
                     self._vendor_id_to_part_index[vendor_part_id] = new_part_index
-                self._parts.append(part)
                 return PartStartEvent(index=new_part_index, part=part)
             else:
                 raise UnexpectedModelBehavior('Cannot create a ThinkingPart with no content or signature')
@@ -219,7 +291,11 @@ class ModelResponsePartsManager:
                 part_delta = ThinkingPartDelta(
                     content_delta=content, signature_delta=signature, provider_name=provider_name
                 )
-                self._parts[part_index] = part_delta.apply(existing_thinking_part)
+                if content is not None:
+                    self._append_chunk(part_index, existing_thinking_part.content, content)
+                if signature is not None or provider_name is not None:
+                    # The content is buffered separately, so only the signature and provider name are applied here
+                    self._parts[part_index] = replace(part_delta, content_delta=None).apply(existing_thinking_part)
                 return PartDeltaEvent(index=part_index, delta=part_delta)
             else:
                 raise UnexpectedModelBehavior('Cannot update a ThinkingPart with no content or signature')
@@ -283,10 +359,9 @@ class ModelResponsePartsManager:
             # No matching part/delta was found, so create a new ToolCallPartDelta (or ToolCallPart if fully formed)
             delta = ToolCallPartDelta(tool_name_delta=tool_name, args_delta=args, tool_call_id=tool_call_id)
             part = delta.as_part() or delta
+            new_part_index = self._append_part(part)
             if vendor_part_id is not None:
-                self._vendor_id_to_part_index[vendor_part_id] = len(self._parts)
-            new_part_index = len(self._parts)
-            self._parts.append(part)
+                self._vendor_id_to_part_index[vendor_part_id] = new_part_index
             # Only emit a PartStartEvent if we have enough information to produce a full ToolCallPart
             if isinstance(part, ToolCallPart | BuiltinToolCallPart):
                 return PartStartEvent(index=new_part_index, part=part)
@@ -294,7 +369,16 @@ class ModelResponsePartsManager:
             # Update the existing part or delta with the new information
             existing_part, part_index = existing_matching_part_and_index
             delta = ToolCallPartDelta(tool_name_delta=tool_name, args_delta=args, tool_call_id=tool_call_id)
-            updated_part = delta.apply(existing_part)
+            if (
+                isinstance(args, str)
+                and isinstance(existing_part, ToolCallPart | BuiltinToolCallPart)
+                and not isinstance(existing_part.args, dict)
+            ):
+                # JSON args are buffered and only joined into the part when it's requested
+                self._append_chunk(part_index, existing_part.args or '', args)
+                updated_part = replace(delta, args_delta=None).apply(existing_part)
+            else:
+                updated_part = delta.apply(existing_part)
             self._parts[part_index] = updated_part
             if isinstance(updated_part, ToolCallPart | BuiltinToolCallPart):
                 if isinstance(existing_part, ToolCallPartDelta):
@@ -336,17 +420,16 @@ class ModelResponsePartsManager:
         )
         if vendor_part_id is None:
             # vendor_part_id is None, so we unconditionally append a new ToolCallPart to the end of the list
-            new_part_index = len(self._parts)
-            self._parts.append(new_part)
+            new_part_index = self._append_part(new_part)
         else:
             # vendor_part_id is provided, so find and overwrite or create a new ToolCallPart.
             maybe_part_index = self._vendor_id_to_part_index.get(vendor_part_id)
             if maybe_part_index is not None and isinstance(self._parts[maybe_part_index], ToolCallPart):
                 new_part_index = maybe_part_index
+                self._pending_chunks.pop(new_part_index, None)
                 self._parts[new_part_index] = new_part
             else:
-                new_part_index = len(self._parts)
-                self._parts.append(new_part)
+                new_part_index = self._append_part(new_part)
             self._vendor_id_to_part_index[vendor_part_id] = new_part_index
         return PartStartEvent(index=new_part_index, part=new_part)
 
@@ -369,17 +452,16 @@ class ModelResponsePartsManager:
         """
         if vendor_part_id is None:
             # vendor_part_id is None, so we unconditionally append a new BuiltinToolCallPart to the end of the list
-            new_part_index = len(self._parts)
-            self._parts.append(part)
+            new_part_index = self._append_part(part)
         else:
             # vendor_part_id is provided, so find and overwrite or create a new BuiltinToolCallPart.
             maybe_part_index = self._vendor_id_to_part_index.get(vendor_part_id)
             if maybe_part_index is not None and isinstance(self._parts[maybe_part_index], BuiltinToolCallPart):
                 new_part_index = maybe_part_index
+                self._pending_chunks.pop(new_part_index, None)
                 self._parts[new_part_index] = part
             else:
-                new_part_index = len(self._parts)
-                self._parts.append(part)
+                new_part_index = self._append_part(part)
             self._vendor_id_to_part_index[vendor_part_id] = new_part_index
         return PartStartEvent(index=new_part_index, part=part)
 
@@ -402,8 +484,7 @@ class ModelResponsePartsManager:
         """
         if vendor_part_id is None:
             # vendor_part_id is None, so we unconditionally append a new BuiltinToolReturnPart to the end of the list
-            new_part_index = len(self._parts)
-            self._parts.append(part)
+            new_part_index = self._append_part(part)
         else:
             # vendor_part_id is provided, so find and overwrite or create a new BuiltinToolReturnPart.
             maybe_part_index = self._vendor_id_to_part_index.get(vendor_part_id)
@@ -411,7 +492,6 @@ class ModelResponsePartsManager:
                 new_part_index = maybe_part_index
                 self._parts[new_part_index] = part
             else:
-                new_part_index = len(self._parts)
-                self._parts.append(part)
+                new_part_index = self._append_part(part)
             self._vendor_id_to_part_index[vendor_part_id] = new_part_index
         return PartStartEvent(index=new_part_index, part=part)
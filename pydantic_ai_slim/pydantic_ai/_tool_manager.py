@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import json
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -14,7 +16,7 @@ from typing_extensions import assert_never
 from . import messages as _messages
 from ._instrumentation import InstrumentationNames
 from ._run_context import AgentDepsT, RunContext
-from .exceptions import ModelRetry, ToolRetryError, UnexpectedModelBehavior
+from .exceptions import ModelRetry, ToolRetryError, UnexpectedModelBehavior, UsageLimitExceeded
 from .messages import ToolCallPart
 from .tools import ToolDefinition
 from .toolsets.abstract import AbstractToolset, ToolsetTool
@@ -35,6 +37,14 @@ class ToolManager(Generic[AgentDepsT]):
     """The cached tools for this run step."""
     failed_tools: set[str] = field(default_factory=set)
     """Names of tools that failed in this run step."""
+    max_concurrent_calls: int | None = None
+    """The maximum number of tool calls from a single model response to run at the same time, or `None` for no limit."""
+    _speculative_calls: dict[str, tuple[ToolCallPart, asyncio.Task[Any]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """Calls to side-effect-free tools that were started while the model response was being streamed, by tool call ID."""
+    _speculation_blocked: bool = field(default=False, init=False, repr=False)
+    """Whether a call to a sequential tool was seen, which later calls may depend on, so they can't be started early."""
 
     @classmethod
     @contextmanager
@@ -62,6 +72,7 @@ class ToolManager(Generic[AgentDepsT]):
             toolset=self.toolset,
             ctx=ctx,
             tools=await self.toolset.get_tools(ctx),
+            max_concurrent_calls=self.max_concurrent_calls,
         )
 
     @property
@@ -72,11 +83,29 @@ class ToolManager(Generic[AgentDepsT]):
 
         return [tool.tool_def for tool in self.tools.values()]
 
-    def should_call_sequentially(self, calls: list[ToolCallPart]) -> bool:
-        """Whether to require sequential tool calls for a list of tool calls."""
-        return _sequential_tool_calls_ctx_var.get() or any(
-            tool_def.sequential for call in calls if (tool_def := self.get_tool_def(call.tool_name))
-        )
+    def batch_calls(self, calls: list[ToolCallPart]) -> list[list[int]]:
+        """Split a list of tool calls into batches of the indices of calls that can run concurrently.
+
+        Batches are run one after the other. A call to a `sequential` tool acts as a barrier: it gets a batch of its
+        own, so it only starts once all earlier calls have finished, and later calls only start once it's finished.
+        Calls in between sequential calls still run concurrently.
+        """
+        if _sequential_tool_calls_ctx_var.get():
+            return [[index] for index in range(len(calls))]
+
+        batches: list[list[int]] = []
+        current_batch: list[int] = []
+        for index, call in enumerate(calls):
+            if (tool_def := self.get_tool_def(call.tool_name)) and tool_def.sequential:
+                if current_batch:
+                    batches.append(current_batch)
+                    current_batch = []
+                batches.append([index])
+            else:
+                current_batch.append(index)
+        if current_batch:
+            batches.append(current_batch)
+        return batches
 
     def get_tool_def(self, name: str) -> ToolDefinition | None:
         """Get the tool definition for a given tool name, or `None` if the tool is unknown."""
@@ -88,6 +117,73 @@ class ToolManager(Generic[AgentDepsT]):
         except KeyError:
             return None
 
+    def start_speculative_call(
+        self,
+        call: ToolCallPart,
+        usage_limits: UsageLimits | None = None,
+        context: contextvars.Context | None = None,
+    ) -> None:
+        """Start a call to a side-effect-free tool before the rest of the model response has arrived.
+
+        The result is picked up by `handle_call` when the call is handled as usual once the response is complete, so
+        the order in which results are processed doesn't change. If the call's arguments changed in the meantime, the
+        result is discarded and the tool is called again. The call only counts towards the usage, and a failure is only
+        recorded for a retry, once its result is used.
+
+        Calls are only started early if they'd run concurrently with the calls before them anyway: not after a call to
+        a `sequential` tool, nor when tool calls are run sequentially or their concurrency is limited.
+
+        Args:
+            call: The tool call part, with complete arguments.
+            usage_limits: Optional usage limits to check before executing the tool.
+            context: The context to run the call in, so that it's traced like a call that's made once the response is
+                complete rather than as part of the model request. Defaults to the current context.
+        """
+        if self._speculation_blocked or call.tool_call_id in self._speculative_calls:
+            return
+
+        if self.tools is None or self.ctx is None:
+            raise ValueError('ToolManager has not been prepared for a run step yet')  # pragma: no cover
+
+        tool = self.tools.get(call.tool_name)
+        if tool is None:
+            return
+        tool_def = tool.tool_def
+        if tool_def.sequential or _sequential_tool_calls_ctx_var.get() or self.max_concurrent_calls is not None:
+            self._speculation_blocked = True
+            return
+        if tool_def.kind != 'function' or not tool_def.side_effect_free:
+            return
+
+        # Invalid arguments will be retried once the response is complete, so don't record a failure twice
+        validator = tool.args_validator
+        try:
+            if isinstance(call.args, str):
+                validator.validate_json(call.args or '{}')
+            else:
+                validator.validate_python(call.args or {})
+        except ValidationError:
+            return
+
+        # There's no point in making a call that the usage limits wouldn't allow by the time its result is used
+        if usage_limits is not None:
+            try:
+                usage_limits.check_before_tool_call(self.ctx.usage)
+            except UsageLimitExceeded:
+                return
+
+        # The task is created in `context`, and so runs in a copy of it
+        task = (context or contextvars.copy_context()).run(
+            asyncio.create_task, self._handle_call(call, speculative=True), name=call.tool_name
+        )
+        self._speculative_calls[call.tool_call_id] = call, task
+
+    async def cancel_speculative_calls(self) -> None:
+        """Cancel calls started by `start_speculative_call` whose results weren't used, and wait for them to finish."""
+        speculative_calls, self._speculative_calls = self._speculative_calls, {}
+        for _, task in speculative_calls.values():
+            await _cancel(task)
+
     async def handle_call(
         self,
         call: ToolCallPart,
@@ -103,6 +199,45 @@ class ToolManager(Generic[AgentDepsT]):
             wrap_validation_errors: Whether to wrap validation errors in a retry prompt part.
             usage_limits: Optional usage limits to check before executing tools.
         """
+        if (speculative_call := self._speculative_calls.pop(call.tool_call_id, None)) is not None:
+            started_call, task = speculative_call
+            if started_call == call and not allow_partial and wrap_validation_errors:
+                return await self._use_speculative_call(call, task, usage_limits)
+            await _cancel(task)
+
+        return await self._handle_call(call, allow_partial, wrap_validation_errors, usage_limits)
+
+    async def _use_speculative_call(
+        self, call: ToolCallPart, task: asyncio.Task[Any], usage_limits: UsageLimits | None
+    ) -> Any:
+        """Use the result of a call that was started early, and account for it like `_call_tool` does for other calls."""
+        if self.ctx is None:
+            raise ValueError('ToolManager has not been prepared for a run step yet')  # pragma: no cover
+
+        if usage_limits is not None:
+            try:
+                usage_limits.check_before_tool_call(self.ctx.usage)
+            except UsageLimitExceeded:
+                await _cancel(task)
+                raise
+
+        try:
+            result = await task
+        except ToolRetryError:
+            self.failed_tools.add(call.tool_name)
+            raise
+
+        self.ctx.usage.tool_calls += 1
+        return result
+
+    async def _handle_call(
+        self,
+        call: ToolCallPart,
+        allow_partial: bool = False,
+        wrap_validation_errors: bool = True,
+        usage_limits: UsageLimits | None = None,
+        speculative: bool = False,
+    ) -> Any:
         if self.tools is None or self.ctx is None:
             raise ValueError('ToolManager has not been prepared for a run step yet')  # pragma: no cover
 
@@ -118,6 +253,7 @@ class ToolManager(Generic[AgentDepsT]):
                 self.ctx.trace_include_content,
                 self.ctx.instrumentation_version,
                 usage_limits,
+                speculative,
             )
 
     async def _call_tool(
@@ -127,10 +263,14 @@ class ToolManager(Generic[AgentDepsT]):
         wrap_validation_errors: bool,
         usage_limits: UsageLimits | None = None,
         count_tool_usage: bool = True,
+        speculative: bool = False,
     ) -> Any:
         if self.tools is None or self.ctx is None:
             raise ValueError('ToolManager has not been prepared for a run step yet')  # pragma: no cover
 
+        # The usage and failures of calls that were started early are accounted for once their results are used
+        count_tool_usage = count_tool_usage and not speculative
+
         name = call.tool_name
         tool = self.tools.get(name)
         try:
@@ -193,7 +333,7 @@ class ToolManager(Generic[AgentDepsT]):
                     else:
                         assert_never(e)
 
-                if not allow_partial:
+                if not allow_partial and not speculative:
                     # If we're validating partial arguments, we don't want to count this as a failed tool as it may still succeed once the full arguments are received.
                     self.failed_tools.add(name)
 
@@ -208,6 +348,7 @@ class ToolManager(Generic[AgentDepsT]):
         include_content: bool,
         instrumentation_version: int,
         usage_limits: UsageLimits | None = None,
+        speculative: bool = False,
     ) -> Any:
         """See <https://opentelemetry.io/docs/specs/semconv/gen-ai/gen-ai-spans/#execute-tool-span>."""
         instrumentation_names = InstrumentationNames.for_version(instrumentation_version)
@@ -242,7 +383,9 @@ class ToolManager(Generic[AgentDepsT]):
             attributes=span_attributes,
         ) as span:
             try:
-                tool_result = await self._call_tool(call, allow_partial, wrap_validation_errors, usage_limits)
+                tool_result = await self._call_tool(
+                    call, allow_partial, wrap_validation_errors, usage_limits, speculative=speculative
+                )
             except ToolRetryError as e:
                 part = e.tool_retry
                 if include_content and span.is_recording():
@@ -258,3 +401,11 @@ class ToolManager(Generic[AgentDepsT]):
                 )
 
         return tool_result
+
+
+async def _cancel(task: asyncio.Task[Any]) -> None:
+    """Cancel a task and wait for it to finish, without raising its exception."""
+    task.cancel()
+    await asyncio.wait([task])
+    if not task.cancelled():
+        task.exception()  # mark the exception as retrieved so it isn't logged
@@ -234,6 +234,44 @@ def sync_anext(iterator: Iterator[T]) -> T:
         raise StopAsyncIteration() from e
 
 
+def chunk_by_size(items: Iterable[T], sizes: Iterable[int], *, max_count: int, max_size: int) -> list[list[T]]:
+    """Split `items` into consecutive chunks of at most `max_count` items whose `sizes` add up to at most `max_size`.
+
+    An item that's larger than `max_size` by itself gets a chunk of its own.
+    """
+    chunks: list[list[T]] = []
+    chunk: list[T] = []
+    chunk_size = 0
+    for item, size in zip(items, sizes):
+        if chunk and (len(chunk) >= max_count or chunk_size + size > max_size):
+            chunks.append(chunk)
+            chunk, chunk_size = [], 0
+        chunk.append(item)
+        chunk_size += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+async def gather_or_cancel(*aws: Awaitable[T]) -> list[T]:
+    """Like `asyncio.gather`, but once one of the awaitables fails or the caller is cancelled, the others are cancelled.
+
+    The cancelled awaitables are waited for, so that they can clean up before the exception is raised.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    if not tasks:
+        return []
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.wait(tasks)
+        for task in tasks:
+            if not task.cancelled():
+                task.exception()  # mark the exception as retrieved so it isn't logged
+
+
 def now_utc() -> datetime:
     return datetime.now(tz=timezone.utc)
 
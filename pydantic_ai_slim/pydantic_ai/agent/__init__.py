@@ -120,6 +120,9 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
     end_strategy: EndStrategy
     """Strategy for handling tool calls when a final result is found."""
 
+    max_concurrent_tool_calls: int | None
+    """The maximum number of tool calls from a single model response to run at the same time, or `None` for no limit."""
+
     model_settings: ModelSettings | None
     """Optional model request settings to use for this agents's runs, by default.
 
@@ -177,6 +180,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         toolsets: Sequence[AbstractToolset[AgentDepsT] | ToolsetFunc[AgentDepsT]] | None = None,
         defer_model_check: bool = False,
         end_strategy: EndStrategy = 'early',
+        max_concurrent_tool_calls: int | None = None,
         instrument: InstrumentationSettings | bool | None = None,
         history_processors: Sequence[HistoryProcessor[AgentDepsT]] | None = None,
         event_stream_handler: EventStreamHandler[AgentDepsT] | None = None,
@@ -203,6 +207,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         mcp_servers: Sequence[MCPServer] = (),
         defer_model_check: bool = False,
         end_strategy: EndStrategy = 'early',
+        max_concurrent_tool_calls: int | None = None,
         instrument: InstrumentationSettings | bool | None = None,
         history_processors: Sequence[HistoryProcessor[AgentDepsT]] | None = None,
         event_stream_handler: EventStreamHandler[AgentDepsT] | None = None,
@@ -227,6 +232,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         toolsets: Sequence[AbstractToolset[AgentDepsT] | ToolsetFunc[AgentDepsT]] | None = None,
         defer_model_check: bool = False,
         end_strategy: EndStrategy = 'early',
+        max_concurrent_tool_calls: int | None = None,
         instrument: InstrumentationSettings | bool | None = None,
         history_processors: Sequence[HistoryProcessor[AgentDepsT]] | None = None,
         event_stream_handler: EventStreamHandler[AgentDepsT] | None = None,
@@ -272,6 +278,9 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
                 [override the model][pydantic_ai.Agent.override] for testing.
             end_strategy: Strategy for handling tool calls that are requested alongside a final result.
                 See [`EndStrategy`][pydantic_ai.agent.EndStrategy] for more information.
+            max_concurrent_tool_calls: The maximum number of tool calls from a single model response to run at the same time,
+                or `None` for no limit. To limit concurrency across runs, or per tool, see
+                [`ConcurrencyLimitedToolset`][pydantic_ai.toolsets.ConcurrencyLimitedToolset].
             instrument: Set to True to automatically instrument with OpenTelemetry,
                 which will use Logfire if it's configured.
                 Set to an instance of [`InstrumentationSettings`][pydantic_ai.agent.InstrumentationSettings] to customize.
@@ -291,6 +300,9 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
 
         self._name = name
         self.end_strategy = end_strategy
+        if max_concurrent_tool_calls is not None and max_concurrent_tool_calls < 1:
+            raise exceptions.UserError('`max_concurrent_tool_calls` must be at least 1, or `None` for no limit.')
+        self.max_concurrent_tool_calls = max_concurrent_tool_calls
         self.model_settings = model_settings
 
         self._output_type = output_type
@@ -556,7 +568,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
                 output_toolset.max_retries = self._max_result_retries
                 output_toolset.output_validators = output_validators
         toolset = self._get_toolset(output_toolset=output_toolset, additional_toolsets=toolsets)
-        tool_manager = ToolManager[AgentDepsT](toolset)
+        tool_manager = ToolManager[AgentDepsT](toolset, max_concurrent_calls=self.max_concurrent_tool_calls)
 
         # Build the graph
         graph: Graph[_agent_graph.GraphAgentState, _agent_graph.GraphAgentDeps[AgentDepsT, Any], FinalResult[Any]] = (
@@ -648,25 +660,29 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
 
         try:
             async with toolset:
-                async with graph.iter(
-                    start_node,
-                    state=state,
-                    deps=graph_deps,
-                    span=use_span(run_span) if run_span.is_recording() else None,
-                    infer_name=False,
-                ) as graph_run:
-                    agent_run = AgentRun(graph_run)
-                    yield agent_run
-                    if (final_result := agent_run.result) is not None and run_span.is_recording():
-                        if instrumentation_settings and instrumentation_settings.include_content:
-                            run_span.set_attribute(
-                                'final_result',
-                                (
-                                    final_result.output
-                                    if isinstance(final_result.output, str)
-                                    else json.dumps(InstrumentedModel.serialize_any(final_result.output))
-                                ),
-                            )
+                try:
+                    async with graph.iter(
+                        start_node,
+                        state=state,
+                        deps=graph_deps,
+                        span=use_span(run_span) if run_span.is_recording() else None,
+                        infer_name=False,
+                    ) as graph_run:
+                        agent_run = AgentRun(graph_run)
+                        yield agent_run
+                        if (final_result := agent_run.result) is not None and run_span.is_recording():
+                            if instrumentation_settings and instrumentation_settings.include_content:
+                                run_span.set_attribute(
+                                    'final_result',
+                                    (
+                                        final_result.output
+                                        if isinstance(final_result.output, str)
+                                        else json.dumps(InstrumentedModel.serialize_any(final_result.output))
+                                    ),
+                                )
+                finally:
+                    # Tool calls started while a model response was streamed may not have been used if the run ended early
+                    await graph_deps.tool_manager.cancel_speculative_calls()
         finally:
             try:
                 if instrumentation_settings and run_span.is_recording():
@@ -690,7 +706,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
             }
         else:
             attrs = {
-                'pydantic_ai.all_messages': json.dumps(settings.messages_to_otel_messages(state.message_history)),
+                'pydantic_ai.all_messages': settings.serialize_messages(state.message_history),
                 **settings.system_instructions_attributes(literal_instructions),
             }
 
@@ -989,6 +1005,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         schema_generator: type[GenerateJsonSchema] = GenerateToolJsonSchema,
         strict: bool | None = None,
         sequential: bool = False,
+        side_effect_free: bool = False,
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
     ) -> Callable[[ToolFuncContext[AgentDepsT, ToolParams]], ToolFuncContext[AgentDepsT, ToolParams]]: ...
@@ -1006,6 +1023,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         schema_generator: type[GenerateJsonSchema] = GenerateToolJsonSchema,
         strict: bool | None = None,
         sequential: bool = False,
+        side_effect_free: bool = False,
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
     ) -> Any:
@@ -1053,6 +1071,8 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
             strict: Whether to enforce JSON schema compliance (only affects OpenAI).
                 See [`ToolDefinition`][pydantic_ai.tools.ToolDefinition] for more info.
             sequential: Whether the function requires a sequential/serial execution environment. Defaults to False.
+            side_effect_free: Whether the function has no side effects, so it can be called while the model is still streaming the rest of its response. Defaults to False.
+                See the [tools documentation](../tools-advanced.md#speculative-tool-calls) for more info.
             requires_approval: Whether this tool requires human-in-the-loop approval. Defaults to False.
                 See the [tools documentation](../deferred-tools.md#human-in-the-loop-tool-approval) for more info.
             metadata: Optional metadata for the tool. This is not sent to the model but can be used for filtering and tool behavior customization.
@@ -1073,6 +1093,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
                 schema_generator=schema_generator,
                 strict=strict,
                 sequential=sequential,
+                side_effect_free=side_effect_free,
                 requires_approval=requires_approval,
                 metadata=metadata,
             )
@@ -1096,6 +1117,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         schema_generator: type[GenerateJsonSchema] = GenerateToolJsonSchema,
         strict: bool | None = None,
         sequential: bool = False,
+        side_effect_free: bool = False,
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
     ) -> Callable[[ToolFuncPlain[ToolParams]], ToolFuncPlain[ToolParams]]: ...
@@ -1113,6 +1135,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         schema_generator: type[GenerateJsonSchema] = GenerateToolJsonSchema,
         strict: bool | None = None,
         sequential: bool = False,
+        side_effect_free: bool = False,
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
     ) -> Any:
@@ -1160,6 +1183,8 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
             strict: Whether to enforce JSON schema compliance (only affects OpenAI).
                 See [`ToolDefinition`][pydantic_ai.tools.ToolDefinition] for more info.
             sequential: Whether the function requires a sequential/serial execution environment. Defaults to False.
+            side_effect_free: Whether the function has no side effects, so it can be called while the model is still streaming the rest of its response. Defaults to False.
+                See the [tools documentation](../tools-advanced.md#speculative-tool-calls) for more info.
             requires_approval: Whether this tool requires human-in-the-loop approval. Defaults to False.
                 See the [tools documentation](../deferred-tools.md#human-in-the-loop-tool-approval) for more info.
             metadata: Optional metadata for the tool. This is not sent to the model but can be used for filtering and tool behavior customization.
@@ -1178,6 +1203,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
                 schema_generator=schema_generator,
                 strict=strict,
                 sequential=sequential,
+                side_effect_free=side_effect_free,
                 requires_approval=requires_approval,
                 metadata=metadata,
             )
@@ -1,5 +1,6 @@
 from __future__ import annotations as _annotations
 
+import asyncio
 import inspect
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterator, Mapping, Sequence
@@ -14,6 +15,7 @@ from pydantic_graph._utils import get_event_loop
 
 from .. import (
     _agent_graph,
+    _batch,
     _system_prompt,
     _utils,
     exceptions,
@@ -340,6 +342,108 @@ class AbstractAgent(Generic[AgentDepsT, OutputDataT], ABC):
             )
         )
 
+    @overload
+    async def run_batch(
+        self,
+        user_prompts: Sequence[str | Sequence[_messages.UserContent]],
+        *,
+        output_type: None = None,
+        model: models.Model | models.KnownModelName | str | None = None,
+        deps: AgentDepsT = None,
+        model_settings: ModelSettings | None = None,
+        usage_limits: _usage.UsageLimits | None = None,
+        infer_name: bool = True,
+        toolsets: Sequence[AbstractToolset[AgentDepsT]] | None = None,
+        max_batch_size: int | None = None,
+        poll_interval: float = 60,
+    ) -> list[AgentRunResult[OutputDataT] | Exception]: ...
+
+    @overload
+    async def run_batch(
+        self,
+        user_prompts: Sequence[str | Sequence[_messages.UserContent]],
+        *,
+        output_type: OutputSpec[RunOutputDataT],
+        model: models.Model | models.KnownModelName | str | None = None,
+        deps: AgentDepsT = None,
+        model_settings: ModelSettings | None = None,
+        usage_limits: _usage.UsageLimits | None = None,
+        infer_name: bool = True,
+        toolsets: Sequence[AbstractToolset[AgentDepsT]] | None = None,
+        max_batch_size: int | None = None,
+        poll_interval: float = 60,
+    ) -> list[AgentRunResult[RunOutputDataT] | Exception]: ...
+
+    async def run_batch(
+        self,
+        user_prompts: Sequence[str | Sequence[_messages.UserContent]],
+        *,
+        output_type: OutputSpec[RunOutputDataT] | None = None,
+        model: models.Model | models.KnownModelName | str | None = None,
+        deps: AgentDepsT = None,
+        model_settings: ModelSettings | None = None,
+        usage_limits: _usage.UsageLimits | None = None,
+        infer_name: bool = True,
+        toolsets: Sequence[AbstractToolset[AgentDepsT]] | None = None,
+        max_batch_size: int | None = None,
+        poll_interval: float = 60,
+    ) -> list[AgentRunResult[Any] | Exception]:
+        """Run the agent with each of many user prompts, sending the model requests through the model's batch API.
+
+        The runs happen concurrently, and their model requests are collected and submitted together using
+        [`Model.request_batch`][pydantic_ai.models.Model.request_batch]. Once a batch completes, each run continues
+        with its response, and the requests that follow tool calls go into a following batch. Models without a batch
+        API make the requests of a batch concurrently instead.
+
+        See [batch runs](../models/overview.md#batch-runs) for more information.
+
+        Args:
+            user_prompts: The user prompts to start a run with.
+            output_type: Custom output type to use for these runs, `output_type` may only be used if the agent has no
+                output validators since output validators would expect an argument that matches the agent's output type.
+            model: Optional model to use for these runs, required if `model` was not set when creating the agent.
+            deps: Optional dependencies to use for these runs.
+            model_settings: Optional settings to use for this model's requests.
+            usage_limits: Optional limits on model request count or token usage of each run.
+            infer_name: Whether to try to infer the agent name from the call frame if it's not set.
+            toolsets: Optional additional toolsets for these runs.
+            max_batch_size: The maximum number of requests to submit in one batch. By default, there's no limit other
+                than that of the provider: batches that exceed it are split up by the model.
+            poll_interval: How often in seconds to check whether a submitted batch has completed.
+
+        Returns:
+            The result of each run, in the same order as `user_prompts`, or the exception that the run failed with.
+        """
+        if infer_name and self.name is None:
+            self._infer_name(inspect.currentframe())
+
+        model = model or self.model
+        if model is None:
+            raise exceptions.UserError('`model` must either be set on the agent or included when calling it.')
+        batching_model = _batch.BatchingModel(
+            models.infer_model(model), max_batch_size=max_batch_size, poll_interval=poll_interval
+        )
+
+        async def run(user_prompt: str | Sequence[_messages.UserContent]) -> AgentRunResult[Any] | Exception:
+            try:
+                return await self.run(
+                    user_prompt,
+                    output_type=output_type,
+                    model=batching_model,
+                    deps=deps,
+                    model_settings=model_settings,
+                    usage_limits=usage_limits,
+                    infer_name=False,
+                    toolsets=toolsets,
+                )
+            except Exception as e:
+                return e
+            finally:
+                batching_model.run_finished()
+
+        batching_model.runs_started(len(user_prompts))
+        return list(await asyncio.gather(*(run(user_prompt) for user_prompt in user_prompts)))
+
     @overload
     def run_stream(
         self,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 import functools
+import time
 import warnings
 from abc import ABC, abstractmethod
 from asyncio import Lock
@@ -34,6 +35,7 @@ try:
     from mcp.shared.context import RequestContext
     from mcp.shared.exceptions import McpError
     from mcp.shared.message import SessionMessage
+    from mcp.shared.session import RequestResponder
 except ImportError as _import_error:
     raise ImportError(
         'Please install the `mcp` package to use the MCP server, '
@@ -103,6 +105,29 @@ class MCPServer(AbstractToolset[Any], ABC):
     elicitation_callback: ElicitationFnT | None = None
     """Callback function to handle elicitation requests from the server."""
 
+    cache_tools: bool = False
+    """Whether to cache the list of tools retrieved from the server.
+
+    When enabled, the tools are listed once and reused on every run step until the server sends a
+    `notifications/tools/list_changed` notification, [`tools_cache_ttl`][pydantic_ai.mcp.MCPServer.tools_cache_ttl]
+    expires, or [`invalidate_tools_cache()`][pydantic_ai.mcp.MCPServer.invalidate_tools_cache] is called.
+
+    The cache is kept when the connection to the server is closed, but notifications can only be received while
+    it's open, so set a TTL if the server's tools can change while it's not connected.
+    """
+
+    tools_cache_ttl: float | None = None
+    """The time in seconds after which cached tools are listed again, if `cache_tools` is enabled.
+
+    If `None`, cached tools don't expire.
+    """
+
+    tools_cache_hits: int
+    """The number of times the tools were served from the cache."""
+
+    tools_cache_misses: int
+    """The number of times the tools were listed on the server while `cache_tools` was enabled."""
+
     _id: str | None
 
     _enter_lock: Lock = field(compare=False)
@@ -114,6 +139,10 @@ class MCPServer(AbstractToolset[Any], ABC):
     _write_stream: MemoryObjectSendStream[SessionMessage]
     _server_info: mcp_types.Implementation
 
+    _cached_tools: list[mcp_types.Tool] | None
+    _cached_tools_at: float
+    _tools_cache_version: int
+
     def __init__(
         self,
         tool_prefix: str | None = None,
@@ -128,6 +157,8 @@ class MCPServer(AbstractToolset[Any], ABC):
         elicitation_callback: ElicitationFnT | None = None,
         *,
         id: str | None = None,
+        cache_tools: bool = False,
+        tools_cache_ttl: float | None = None,
     ):
         self.tool_prefix = tool_prefix
         self.log_level = log_level
@@ -139,6 +170,8 @@ class MCPServer(AbstractToolset[Any], ABC):
         self.sampling_model = sampling_model
         self.max_retries = max_retries
         self.elicitation_callback = elicitation_callback
+        self.cache_tools = cache_tools
+        self.tools_cache_ttl = tools_cache_ttl
 
         self._id = id or tool_prefix
 
@@ -148,6 +181,11 @@ class MCPServer(AbstractToolset[Any], ABC):
         self._enter_lock = Lock()
         self._running_count = 0
         self._exit_stack = None
+        self._cached_tools = None
+        self._cached_tools_at = 0
+        self._tools_cache_version = 0
+        self.tools_cache_hits = 0
+        self.tools_cache_misses = 0
 
     @abstractmethod
     @asynccontextmanager
@@ -190,14 +228,31 @@ class MCPServer(AbstractToolset[Any], ABC):
     async def list_tools(self) -> list[mcp_types.Tool]:
         """Retrieve tools that are currently active on the server.
 
-        Note:
-        - We don't cache tools as they might change.
-        - We also don't subscribe to the server to avoid complexity.
+        Tools are only cached if [`cache_tools`][pydantic_ai.mcp.MCPServer.cache_tools] is enabled, as they might change.
         """
+        if self.cache_tools:
+            if self._cached_tools is not None and (
+                self.tools_cache_ttl is None or time.monotonic() - self._cached_tools_at < self.tools_cache_ttl
+            ):
+                self.tools_cache_hits += 1
+                return self._cached_tools
+            self.tools_cache_misses += 1
+
+        cache_version = self._tools_cache_version
         async with self:  # Ensure server is running
             result = await self._client.list_tools()
+
+        # Don't cache the tools if the list was changed while they were being listed
+        if self.cache_tools and cache_version == self._tools_cache_version:
+            self._cached_tools = result.tools
+            self._cached_tools_at = time.monotonic()
         return result.tools
 
+    def invalidate_tools_cache(self) -> None:
+        """Discard the cached tools, so they're listed on the server again the next time they're needed."""
+        self._cached_tools = None
+        self._tools_cache_version += 1
+
     async def direct_call_tool(
         self,
         name: str,
@@ -317,6 +372,7 @@ class MCPServer(AbstractToolset[Any], ABC):
                         sampling_callback=self._sampling_callback if self.allow_sampling else None,
                         elicitation_callback=self.elicitation_callback,
                         logging_callback=self.log_handler,
+                        message_handler=self._handle_message,
                         read_timeout_seconds=timedelta(seconds=self.read_timeout),
                     )
                     self._client = await exit_stack.enter_async_context(client)
@@ -345,6 +401,18 @@ class MCPServer(AbstractToolset[Any], ABC):
         """Check if the MCP server is running."""
         return bool(self._running_count)
 
+    async def _handle_message(
+        self,
+        message: RequestResponder[mcp_types.ServerRequest, mcp_types.ClientResult]
+        | mcp_types.ServerNotification
+        | Exception,
+    ) -> None:
+        """Handle messages from the server that aren't handled by the other callbacks."""
+        if isinstance(message, mcp_types.ServerNotification) and isinstance(
+            message.root, mcp_types.ToolListChangedNotification
+        ):
+            self.invalidate_tools_cache()
+
     async def _sampling_callback(
         self, context: RequestContext[ClientSession, Any], params: mcp_types.CreateMessageRequestParams
     ) -> mcp_types.CreateMessageResult | mcp_types.ErrorData:
@@ -471,6 +539,8 @@ class MCPServerStdio(MCPServer):
     sampling_model: models.Model | None
     max_retries: int
     elicitation_callback: ElicitationFnT | None = None
+    cache_tools: bool = False
+    tools_cache_ttl: float | None = None
 
     def __init__(
         self,
@@ -490,6 +560,8 @@ class MCPServerStdio(MCPServer):
         max_retries: int = 1,
         elicitation_callback: ElicitationFnT | None = None,
         id: str | None = None,
+        cache_tools: bool = False,
+        tools_cache_ttl: float | None = None,
     ):
         """Build a new MCP server.
 
@@ -509,6 +581,8 @@ class MCPServerStdio(MCPServer):
             max_retries: The maximum number of times to retry a tool call.
             elicitation_callback: Callback function to handle elicitation requests from the server.
             id: An optional unique ID for the MCP server. An MCP server needs to have an ID in order to be used in a durable execution environment like Temporal, in which case the ID will be used to identify the server's activities within the workflow.
+            cache_tools: Whether to cache the list of tools retrieved from the server.
+            tools_cache_ttl: The time in seconds after which cached tools are listed again. If `None`, they don't expire.
         """
         self.command = command
         self.args = args
@@ -527,6 +601,8 @@ class MCPServerStdio(MCPServer):
             max_retries,
             elicitation_callback,
             id=id,
+            cache_tools=cache_tools,
+            tools_cache_ttl=tools_cache_ttl,
         )
 
     @classmethod
@@ -625,6 +701,8 @@ class _MCPServerHTTP(MCPServer):
     sampling_model: models.Model | None
     max_retries: int
     elicitation_callback: ElicitationFnT | None = None
+    cache_tools: bool = False
+    tools_cache_ttl: float | None = None
 
     def __init__(
         self,
@@ -643,6 +721,8 @@ class _MCPServerHTTP(MCPServer):
         sampling_model: models.Model | None = None,
         max_retries: int = 1,
         elicitation_callback: ElicitationFnT | None = None,
+        cache_tools: bool = False,
+        tools_cache_ttl: float | None = None,
         **_deprecated_kwargs: Any,
     ):
         """Build a new MCP server.
@@ -662,6 +742,8 @@ class _MCPServerHTTP(MCPServer):
             sampling_model: The model to use for sampling.
             max_retries: The maximum number of times to retry a tool call.
             elicitation_callback: Callback function to handle elicitation requests from the server.
+            cache_tools: Whether to cache the list of tools retrieved from the server.
+            tools_cache_ttl: The time in seconds after which cached tools are listed again. If `None`, they don't expire.
         """
         if 'sse_read_timeout' in _deprecated_kwargs:
             if read_timeout is not None:
@@ -693,6 +775,8 @@ class _MCPServerHTTP(MCPServer):
             max_retries,
             elicitation_callback,
             id=id,
+            cache_tools=cache_tools,
+            tools_cache_ttl=tools_cache_ttl,
         )
 
     @property
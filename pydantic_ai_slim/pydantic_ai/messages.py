@@ -534,8 +534,28 @@ class BinaryContent:
     __repr__ = _utils.dataclasses_no_defaults_repr
 
 
+@dataclass
+class CachePoint:
+    """A marker that the content before it can be cached by the model provider.
+
+    It can be included in the content of a user prompt, and following requests that start with the same content, up to
+    the cache point, can then reuse the provider's cached processing of it, which is faster and cheaper.
+
+    Supported by:
+
+    * Anthropic
+    * Bedrock
+
+    Other models ignore it. To add cache points after the instructions, tool definitions or most recent messages
+    instead, see the `anthropic_cache_*` and `bedrock_cache_*` model settings.
+    """
+
+    kind: Literal['cache-point'] = 'cache-point'
+    """Type identifier, this is available on all parts as a discriminator."""
+
+
 MultiModalContent = ImageUrl | AudioUrl | DocumentUrl | VideoUrl | BinaryContent
-UserContent: TypeAlias = str | MultiModalContent
+UserContent: TypeAlias = str | MultiModalContent | CachePoint
 
 
 @dataclass(repr=False)
@@ -649,8 +669,16 @@ class UserPromptPart:
             elif isinstance(part, BinaryContent):
                 converted_part = _otel_messages.BinaryDataPart(type='binary', media_type=part.media_type)
                 if settings.include_content and settings.include_binary_content:
-                    converted_part['content'] = base64.b64encode(part.data).decode()
+                    max_size = settings.max_binary_content_size
+                    if max_size is not None and len(part.data) > max_size:
+                        converted_part['size'] = len(part.data)
+                        converted_part['sha256'] = hashlib.sha256(part.data).hexdigest()
+                    else:
+                        converted_part['content'] = base64.b64encode(part.data).decode()
                 parts.append(converted_part)
+            elif isinstance(part, CachePoint):
+                # Not content, just an instruction for the model provider
+                continue
             else:
                 parts.append({'type': part.kind})  # pragma: no cover
         return parts
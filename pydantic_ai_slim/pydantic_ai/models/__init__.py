@@ -6,21 +6,24 @@ specific LLM being used.
 
 from __future__ import annotations as _annotations
 
-import base64
+import asyncio
 import warnings
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field, replace
 from datetime import datetime
-from functools import cache, cached_property
+from functools import cache, cached_property, partial
 from typing import Any, Generic, Literal, TypeVar, overload
 
 import httpx
 from typing_extensions import TypeAliasType, TypedDict
 
 from .. import _utils
-from .._json_schema import JsonSchemaTransformer
+from .._download_cache import CachedDownload, DownloadCache
+from .._http_pool import HttpPoolSettings, HttpPoolStats, PooledAsyncClient
+from .._json_schema import JsonSchemaTransformCache, JsonSchemaTransformer
 from .._output import OutputObjectDefinition
 from .._parts_manager import ModelResponsePartsManager
 from .._run_context import RunContext
@@ -37,6 +40,8 @@ from ..messages import (
     PartStartEvent,
     TextPart,
     ToolCallPart,
+    UserContent,
+    UserPromptPart,
     VideoUrl,
 )
 from ..output import OutputMode
@@ -308,6 +313,15 @@ class ModelRequestParameters:
     __repr__ = _utils.dataclasses_no_defaults_repr
 
 
+@dataclass
+class BatchModelRequest:
+    """A request that's sent to a model as part of a batch, using [`Model.request_batch`][pydantic_ai.models.Model.request_batch]."""
+
+    messages: list[ModelMessage]
+    model_settings: ModelSettings | None
+    model_request_parameters: ModelRequestParameters
+
+
 class Model(ABC):
     """Abstract class for a model."""
 
@@ -369,6 +383,28 @@ class Model(ABC):
         # noinspection PyUnreachableCode
         yield  # pragma: no cover
 
+    async def request_batch(
+        self, requests: Sequence[BatchModelRequest], *, poll_interval: float = 60
+    ) -> list[ModelResponse | Exception]:
+        """Make a batch of independent requests to the model.
+
+        Models whose API has a batch endpoint, which is usually cheaper and has separate rate limits but can take
+        hours to complete, override this to submit all requests in one batch and poll for its completion every
+        `poll_interval` seconds. By default, the requests are made concurrently using
+        [`request`][pydantic_ai.models.Model.request].
+
+        Returns:
+            The response to each request, in the same order, or the exception that the request failed with.
+        """
+
+        async def request(r: BatchModelRequest) -> ModelResponse | Exception:
+            try:
+                return await self.request(r.messages, r.model_settings, r.model_request_parameters)
+            except Exception as e:
+                return e
+
+        return list(await asyncio.gather(*(request(r) for r in requests)))
+
     def customize_request_parameters(self, model_request_parameters: ModelRequestParameters) -> ModelRequestParameters:
         """Customize the request parameters for the model.
 
@@ -442,6 +478,11 @@ class Model(ABC):
         """The base URL for the provider API, if available."""
         return None
 
+    @cached_property
+    def _user_prompt_mapping_cache(self) -> UserPromptMappingCache[Any]:
+        """Provider-specific params that user prompts were mapped to by this model, see `UserPromptMappingCache`."""
+        return UserPromptMappingCache()
+
     @staticmethod
     def _get_instructions(messages: list[ModelMessage]) -> str | None:
         """Get instructions from the first ModelRequest found when iterating messages in reverse.
@@ -544,6 +585,15 @@ class StreamedResponse(ABC):
         # noinspection PyUnreachableCode
         yield
 
+    def on_tool_call_end(self, handler: Callable[[ToolCallPart], None]) -> None:
+        """Call `handler` with each tool call part as soon as its arguments are complete.
+
+        This can be well before the whole response has been streamed: a tool call part is complete once the next part
+        starts, or once the model signals that it has ended. The last part is complete when the stream ends, at which
+        point `handler` isn't called.
+        """
+        self._parts_manager.tool_call_end_handler = handler
+
     def get(self) -> ModelResponse:
         """Build a [`ModelResponse`][pydantic_ai.messages.ModelResponse] from the data received from the stream so far."""
         return ModelResponse(
@@ -721,7 +771,9 @@ def cached_async_http_client(*, provider: str | None = None, timeout: int = 600,
     The client is cached based on the provider parameter. If provider is None, it's used for non-provider specific
     requests (like downloading images). Multiple agents and calls can share the same client when they use the same provider.
 
-    Each client will get its own transport with its own connection pool. The default pool size is defined by `httpx.DEFAULT_LIMITS`.
+    Each client will get its own transport with its own connection pool. The pool is configured using
+    [`set_http_pool_settings()`][pydantic_ai.models.set_http_pool_settings], and its usage can be monitored using
+    [`http_pool_stats()`][pydantic_ai.models.http_pool_stats].
 
     There are good reasons why in production you should use a `httpx.AsyncClient` as an async context manager as
     described in [encode/httpx#2026](https://github.com/encode/httpx/pull/2026), but when experimenting or showing
@@ -742,12 +794,50 @@ def cached_async_http_client(*, provider: str | None = None, timeout: int = 600,
 
 @cache
 def _cached_async_http_client(provider: str | None, timeout: int = 600, connect: int = 5) -> httpx.AsyncClient:
-    return httpx.AsyncClient(
+    stats = _http_pool_stats.get(provider)
+    if stats is None or stats.max_connections != _http_pool_settings.max_connections:
+        stats = _http_pool_stats[provider] = HttpPoolStats(max_connections=_http_pool_settings.max_connections)
+    return PooledAsyncClient(
+        pool_settings=_http_pool_settings,
+        stats=stats,
         timeout=httpx.Timeout(timeout=timeout, connect=connect),
         headers={'User-Agent': get_user_agent()},
     )
 
 
+_http_pool_settings = HttpPoolSettings()
+_http_pool_stats: dict[str | None, HttpPoolStats] = {}
+
+
+def set_http_pool_settings(settings: HttpPoolSettings) -> None:
+    """Set the connection pool settings of the HTTP clients returned by [`cached_async_http_client`][pydantic_ai.models.cached_async_http_client].
+
+    These are the clients used by all built-in providers that weren't given an `http_client`. Clients that were already
+    created keep their settings, so this should be called before any agents are run.
+
+    Args:
+        settings: The connection pool settings to use.
+    """
+    global _http_pool_settings
+    _http_pool_settings = settings
+    _cached_async_http_client.cache_clear()
+
+
+def http_pool_settings() -> HttpPoolSettings:
+    """Get the connection pool settings of the HTTP clients returned by [`cached_async_http_client`][pydantic_ai.models.cached_async_http_client]."""
+    return _http_pool_settings
+
+
+def http_pool_stats() -> dict[str | None, HttpPoolStats]:
+    """Get the connection pool usage of the HTTP clients returned by [`cached_async_http_client`][pydantic_ai.models.cached_async_http_client].
+
+    Returns:
+        The usage of the pool of each provider's clients, keyed by provider name, with `None` for the client used for
+        requests that aren't specific to a provider, like downloading files.
+    """
+    return dict(_http_pool_stats)
+
+
 DataT = TypeVar('DataT', str, bytes)
 
 
@@ -807,10 +897,16 @@ async def download_item(
         raise UserError('Downloading YouTube videos is not supported.')
 
     client = cached_async_http_client()
-    response = await client.get(item.url, follow_redirects=True)
-    response.raise_for_status()
+    if _download_cache is not None:
+        download = await _download_cache.fetch(item.url, client)
+    else:
+        response = await client.get(item.url, follow_redirects=True)
+        response.raise_for_status()
+        download = CachedDownload(
+            url=item.url, content=response.content, content_type=response.headers.get('content-type')
+        )
 
-    if content_type := response.headers.get('content-type'):
+    if content_type := download.content_type:
         content_type = content_type.split(';')[0]
         if content_type == 'application/octet-stream':
             content_type = None
@@ -821,16 +917,29 @@ async def download_item(
     if type_format == 'extension':
         data_type = item.format
 
-    data = response.content
-    if data_format in ('base64', 'base64_uri'):
-        data = base64.b64encode(data).decode('utf-8')
-        if data_format == 'base64_uri':
-            data = f'data:{media_type};base64,{data}'
-        return DownloadedItem[str](data=data, data_type=data_type)
+    if data_format == 'base64':
+        return DownloadedItem[str](data=download.base64(), data_type=data_type)
+    elif data_format == 'base64_uri':
+        return DownloadedItem[str](data=f'data:{media_type};base64,{download.base64()}', data_type=data_type)
     elif data_format == 'text':
-        return DownloadedItem[str](data=data.decode('utf-8'), data_type=data_type)
+        return DownloadedItem[str](data=download.text(), data_type=data_type)
     else:
-        return DownloadedItem[bytes](data=data, data_type=data_type)
+        return DownloadedItem[bytes](data=download.content, data_type=data_type)
+
+
+_download_cache: DownloadCache | None = None
+
+
+def set_download_cache(cache: DownloadCache | None) -> None:
+    """Set the cache used to download files referenced by URL that the model API can't fetch itself.
+
+    By default, no cache is used, and files are downloaded for every request that includes them.
+
+    Args:
+        cache: The cache to use, or `None` to download files for every request that includes them.
+    """
+    global _download_cache
+    _download_cache = cache
 
 
 @cache
@@ -841,23 +950,83 @@ def get_user_agent() -> str:
     return f'pydantic-ai/{__version__}'
 
 
+MappedT = TypeVar('MappedT')
+
+
+@dataclass
+class UserPromptMappingCache(Generic[MappedT]):
+    """Cache of the provider-specific params that user prompts with multi-modal content were mapped to.
+
+    The whole message history is mapped again for every request of a run, so without this, binary content would be
+    base64-encoded, and files downloaded, again on every step. Entries are keyed by the identity of the
+    `UserPromptPart` and are dropped when it's garbage collected. An entry is only used if the part's content still
+    consists of the same objects it was mapped from.
+
+    The cached params are shared between requests and must not be mutated.
+    """
+
+    hits: int = 0
+    """The number of user prompts whose mapped params were served from the cache."""
+    misses: int = 0
+    """The number of user prompts that had to be mapped."""
+
+    _entries: dict[int, tuple[weakref.ref[UserPromptPart], tuple[UserContent, ...], MappedT]] = field(
+        default_factory=dict, repr=False
+    )
+
+    async def get_or_map(
+        self, part: UserPromptPart, map_part: Callable[[UserPromptPart], Awaitable[MappedT]]
+    ) -> MappedT:
+        """Return the params `part` was previously mapped to, or map it with `map_part` and cache the result."""
+        if isinstance(part.content, str):
+            # nothing expensive to do, so not worth caching
+            return await map_part(part)
+
+        key = id(part)
+        content = tuple(part.content)
+        if (entry := self._entries.get(key)) is not None:
+            part_ref, mapped_content, mapped = entry
+            if (
+                part_ref() is part
+                and len(mapped_content) == len(content)
+                and all(a is b for a, b in zip(mapped_content, content))
+            ):
+                self.hits += 1
+                return mapped
+
+        self.misses += 1
+        mapped = await map_part(part)
+        self._entries[key] = (weakref.ref(part, partial(self._drop_entry, key)), content, mapped)
+        return mapped
+
+    def _drop_entry(self, key: int, _part_ref: weakref.ref[UserPromptPart]) -> None:
+        # the part's ID can't have been reused yet, as this is called when it's garbage collected
+        self._entries.pop(key, None)
+
+
+_json_schema_transform_cache = JsonSchemaTransformCache(maxsize=1024)
+"""Transformed tool and output schemas, which usually don't change between the requests of a run, or between runs."""
+
+
 def _customize_tool_def(transformer: type[JsonSchemaTransformer], t: ToolDefinition):
-    schema_transformer = transformer(t.parameters_json_schema, strict=t.strict)
-    parameters_json_schema = schema_transformer.walk()
+    parameters_json_schema, is_strict_compatible = _json_schema_transform_cache.transform(
+        transformer, t.parameters_json_schema, strict=t.strict
+    )
     return replace(
         t,
         parameters_json_schema=parameters_json_schema,
-        strict=schema_transformer.is_strict_compatible if t.strict is None else t.strict,
+        strict=is_strict_compatible if t.strict is None else t.strict,
     )
 
 
 def _customize_output_object(transformer: type[JsonSchemaTransformer], o: OutputObjectDefinition):
-    schema_transformer = transformer(o.json_schema, strict=o.strict)
-    json_schema = schema_transformer.walk()
+    json_schema, is_strict_compatible = _json_schema_transform_cache.transform(
+        transformer, o.json_schema, strict=o.strict
+    )
     return replace(
         o,
         json_schema=json_schema,
-        strict=schema_transformer.is_strict_compatible if o.strict is None else o.strict,
+        strict=is_strict_compatible if o.strict is None else o.strict,
     )
 
 
@@ -1,14 +1,17 @@
 from __future__ import annotations as _annotations
 
 import io
-from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Sequence
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Literal, cast, overload
 
+import anyio
+from httpx import Timeout
 from pydantic import TypeAdapter
-from typing_extensions import assert_never
+from pydantic_core import to_json
+from typing_extensions import TypedDict, assert_never
 
 from .. import ModelHTTPError, UnexpectedModelBehavior, _utils, usage
 from .._run_context import RunContext
@@ -19,6 +22,7 @@ from ..messages import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     DocumentUrl,
     FinishReason,
     ImageUrl,
@@ -40,7 +44,15 @@ from ..providers import Provider, infer_provider
 from ..providers.anthropic import AsyncAnthropicClient
 from ..settings import ModelSettings
 from ..tools import ToolDefinition
-from . import Model, ModelRequestParameters, StreamedResponse, check_allow_model_requests, download_item, get_user_agent
+from . import (
+    BatchModelRequest,
+    Model,
+    ModelRequestParameters,
+    StreamedResponse,
+    check_allow_model_requests,
+    download_item,
+    get_user_agent,
+)
 
 _FINISH_REASON_MAP: dict[BetaStopReason, FinishReason] = {
     'end_turn': 'stop',
@@ -51,12 +63,17 @@ _FINISH_REASON_MAP: dict[BetaStopReason, FinishReason] = {
     'refusal': 'content_filter',
 }
 
+# The limits of a single message batch, see https://docs.anthropic.com/en/docs/build-with-claude/batch-processing#batch-limitations
+_BATCH_MAX_REQUESTS = 100_000
+_BATCH_MAX_BYTES = 256_000_000
+
 
 try:
-    from anthropic import NOT_GIVEN, APIStatusError, AsyncStream, omit as OMIT
+    from anthropic import NOT_GIVEN, APIError, APIStatusError, AsyncAnthropic, AsyncStream, NotGiven, Omit, omit as OMIT
     from anthropic.types.beta import (
         BetaBase64PDFBlockParam,
         BetaBase64PDFSourceParam,
+        BetaCacheControlEphemeralParam,
         BetaCitationsDelta,
         BetaCodeExecutionTool20250522Param,
         BetaCodeExecutionToolResultBlock,
@@ -105,6 +122,7 @@ try:
         BetaWebSearchToolResultBlockParamContentParam,
     )
     from anthropic.types.beta.beta_web_search_tool_20250305_param import UserLocation
+    from anthropic.types.beta.messages.batch_create_params import Request as BetaBatchRequest
     from anthropic.types.model_param import ModelParam
 
 except ImportError as _import_error:
@@ -142,6 +160,49 @@ class AnthropicModelSettings(ModelSettings, total=False):
     See [the Anthropic docs](https://docs.anthropic.com/en/docs/build-with-claude/extended-thinking) for more information.
     """
 
+    anthropic_cache_tool_definitions: bool
+    """Whether to add a cache point after the tool definitions, so they can be reused by following requests.
+
+    See [the Anthropic docs](https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching) for more information.
+    """
+
+    anthropic_cache_instructions: bool
+    """Whether to add a cache point after the instructions and system prompts, so they (and the tool definitions) can
+    be reused by following requests.
+
+    See [the Anthropic docs](https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching) for more information.
+    """
+
+    anthropic_cache_messages: bool | int
+    """Whether to add a cache point after the last message, or the number of most recent messages to add cache points
+    after, so that the conversation so far can be reused by following requests.
+
+    Anthropic allows at most 4 cache points per request, so fewer message cache points are added if the request
+    already has cache points from the other settings or from [`CachePoint`][pydantic_ai.messages.CachePoint]s in the
+    prompts.
+
+    See [the Anthropic docs](https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching) for more information.
+    """
+
+
+class _BetaMessageCreateParams(TypedDict):
+    """The arguments to `beta.messages.create` that are shared by interactive and batch requests."""
+
+    max_tokens: int
+    system: str | list[BetaTextBlockParam] | Omit
+    messages: list[BetaMessageParam]
+    model: AnthropicModelName
+    tools: list[BetaToolUnionParam] | Omit
+    tool_choice: BetaToolChoiceParam | Omit
+    thinking: BetaThinkingConfigParam | Omit
+    stop_sequences: list[str] | Omit
+    temperature: float | Omit
+    top_p: float | Omit
+    timeout: float | Timeout | NotGiven
+    metadata: BetaMetadataParam | Omit
+    extra_headers: dict[str, str]
+    extra_body: object | None
+
 
 @dataclass(init=False)
 class AnthropicModel(Model):
@@ -234,6 +295,86 @@ class AnthropicModel(Model):
         async with response:
             yield await self._process_streamed_response(response, model_request_parameters)
 
+    async def request_batch(
+        self, requests: Sequence[BatchModelRequest], *, poll_interval: float = 60
+    ) -> list[ModelResponse | Exception]:
+        """Make a batch of requests using the [Message Batches API](https://docs.anthropic.com/en/docs/build-with-claude/batch-processing).
+
+        Requests that don't fit in a single batch are split over multiple batches, which run concurrently. If the
+        request is cancelled, so are the batches. Clients that don't support the Message Batches API, like Bedrock's,
+        make the requests concurrently instead.
+        """
+        if not isinstance(self.client, AsyncAnthropic):  # pragma: no cover
+            return await super().request_batch(requests, poll_interval=poll_interval)
+
+        check_allow_model_requests()
+        batch_requests: list[BetaBatchRequest] = []
+        betas: list[str] = []
+        for i, r in enumerate(requests):
+            model_settings, model_request_parameters = self.prepare_request(
+                r.model_settings, r.model_request_parameters
+            )
+            params = await self._messages_create_params(
+                r.messages, cast(AnthropicModelSettings, model_settings or {}), model_request_parameters
+            )
+            for beta in params['extra_headers'].get('anthropic-beta', '').split(','):
+                if beta and beta not in betas:
+                    betas.append(beta)
+            body: dict[str, Any] = {
+                k: v
+                for k, v in params.items()
+                if not isinstance(v, NotGiven | Omit) and k not in ('timeout', 'extra_headers', 'extra_body')
+            }
+            body.update(cast(dict[str, Any], params['extra_body'] or {}))
+            batch_requests.append({'custom_id': str(i), 'params': cast(Any, body)})
+
+        chunks = _utils.chunk_by_size(
+            batch_requests,
+            [len(to_json(r)) + 1 for r in batch_requests],
+            max_count=_BATCH_MAX_REQUESTS,
+            max_size=_BATCH_MAX_BYTES,
+        )
+        chunk_responses = await _utils.gather_or_cancel(
+            *(self._request_batch_chunk(self.client, chunk, betas, poll_interval) for chunk in chunks)
+        )
+        return [response for responses in chunk_responses for response in responses]
+
+    async def _request_batch_chunk(
+        self, client: AsyncAnthropic, batch_requests: list[BetaBatchRequest], betas: list[str], poll_interval: float
+    ) -> list[ModelResponse | Exception]:
+        batches = client.beta.messages.batches
+        try:
+            batch = await batches.create(requests=batch_requests, betas=betas or OMIT)
+            try:
+                while batch.processing_status != 'ended':
+                    await anyio.sleep(poll_interval)
+                    batch = await batches.retrieve(batch.id)
+            except anyio.get_cancelled_exc_class():
+                # Nobody is waiting for the results anymore, so don't let the batch run to completion
+                with anyio.CancelScope(shield=True), suppress(APIError):
+                    await batches.cancel(batch.id)
+                raise
+            results = {entry.custom_id: entry.result async for entry in await batches.results(batch.id)}
+        except APIStatusError as e:
+            if (status_code := e.status_code) >= 400:
+                raise ModelHTTPError(status_code=status_code, model_name=self.model_name, body=e.body) from e
+            raise  # pragma: lax no cover
+
+        responses: list[ModelResponse | Exception] = []
+        for batch_request in batch_requests:
+            result = results.get(batch_request['custom_id'])
+            if result is None:
+                responses.append(UnexpectedModelBehavior(f'Batch {batch.id} ended without a result for this request'))
+            elif result.type == 'succeeded':
+                responses.append(self._process_response(result.message))
+            else:
+                responses.append(
+                    UnexpectedModelBehavior(
+                        f'Request in batch {batch.id} {result.type}', result.model_dump_json(exclude={'type'})
+                    )
+                )
+        return responses
+
     @overload
     async def _messages_create(
         self,
@@ -262,6 +403,20 @@ class AnthropicModel(Model):
         model_request_parameters: ModelRequestParameters,
     ) -> BetaMessage | AsyncStream[BetaRawMessageStreamEvent]:
         # standalone function to make it easier to override
+        params = await self._messages_create_params(messages, model_settings, model_request_parameters)
+        try:
+            return await self.client.beta.messages.create(stream=stream, **params)
+        except APIStatusError as e:
+            if (status_code := e.status_code) >= 400:
+                raise ModelHTTPError(status_code=status_code, model_name=self.model_name, body=e.body) from e
+            raise  # pragma: lax no cover
+
+    async def _messages_create_params(
+        self,
+        messages: list[ModelMessage],
+        model_settings: AnthropicModelSettings,
+        model_request_parameters: ModelRequestParameters,
+    ) -> _BetaMessageCreateParams:
         tools = self._get_tools(model_request_parameters)
         tools, beta_features = self._add_builtin_tools(tools, model_request_parameters)
 
@@ -283,36 +438,31 @@ class AnthropicModel(Model):
                 tool_choice['disable_parallel_tool_use'] = not allow_parallel_tool_calls
 
         system_prompt, anthropic_messages = await self._map_message(messages)
-
-        try:
-            extra_headers = model_settings.get('extra_headers', {})
-            extra_headers.setdefault('User-Agent', get_user_agent())
-            if beta_features:
-                if 'anthropic-beta' in extra_headers:
-                    beta_features.insert(0, extra_headers['anthropic-beta'])
-                extra_headers['anthropic-beta'] = ','.join(beta_features)
-
-            return await self.client.beta.messages.create(
-                max_tokens=model_settings.get('max_tokens', 4096),
-                system=system_prompt or OMIT,
-                messages=anthropic_messages,
-                model=self._model_name,
-                tools=tools or OMIT,
-                tool_choice=tool_choice or OMIT,
-                stream=stream,
-                thinking=model_settings.get('anthropic_thinking', OMIT),
-                stop_sequences=model_settings.get('stop_sequences', OMIT),
-                temperature=model_settings.get('temperature', OMIT),
-                top_p=model_settings.get('top_p', OMIT),
-                timeout=model_settings.get('timeout', NOT_GIVEN),
-                metadata=model_settings.get('anthropic_metadata', OMIT),
-                extra_headers=extra_headers,
-                extra_body=model_settings.get('extra_body'),
-            )
-        except APIStatusError as e:
-            if (status_code := e.status_code) >= 400:
-                raise ModelHTTPError(status_code=status_code, model_name=self.model_name, body=e.body) from e
-            raise  # pragma: lax no cover
+        system = self._add_cache_points(system_prompt, anthropic_messages, tools, model_settings)
+
+        extra_headers = model_settings.get('extra_headers', {})
+        extra_headers.setdefault('User-Agent', get_user_agent())
+        if beta_features:
+            if 'anthropic-beta' in extra_headers:
+                beta_features.insert(0, extra_headers['anthropic-beta'])
+            extra_headers['anthropic-beta'] = ','.join(beta_features)
+
+        return _BetaMessageCreateParams(
+            max_tokens=model_settings.get('max_tokens', 4096),
+            system=system or OMIT,
+            messages=anthropic_messages,
+            model=self._model_name,
+            tools=tools or OMIT,
+            tool_choice=tool_choice or OMIT,
+            thinking=model_settings.get('anthropic_thinking', OMIT),
+            stop_sequences=model_settings.get('stop_sequences', OMIT),
+            temperature=model_settings.get('temperature', OMIT),
+            top_p=model_settings.get('top_p', OMIT),
+            timeout=model_settings.get('timeout', NOT_GIVEN),
+            metadata=model_settings.get('anthropic_metadata', OMIT),
+            extra_headers=extra_headers,
+            extra_body=model_settings.get('extra_body'),
+        )
 
     def _process_response(self, response: BetaMessage) -> ModelResponse:
         """Process a non-streamed response, and prepare a message to return."""
@@ -376,6 +526,36 @@ class AnthropicModel(Model):
             _provider_name=self._provider.name,
         )
 
+    @staticmethod
+    def _add_cache_points(
+        system_prompt: str,
+        anthropic_messages: list[BetaMessageParam],
+        tools: list[BetaToolUnionParam],
+        model_settings: AnthropicModelSettings,
+    ) -> str | list[BetaTextBlockParam]:
+        """Add the cache points requested by the model settings, and return the system prompt to send."""
+        cache_points = sum(
+            'cache_control' in block for message in anthropic_messages for block in _content_blocks(message)
+        )
+
+        if tools and model_settings.get('anthropic_cache_tool_definitions'):
+            cast(dict[str, Any], tools[-1])['cache_control'] = _CACHE_CONTROL
+            cache_points += 1
+
+        system: str | list[BetaTextBlockParam] = system_prompt
+        if system_prompt and model_settings.get('anthropic_cache_instructions'):
+            system = [BetaTextBlockParam(type='text', text=system_prompt, cache_control=_CACHE_CONTROL)]
+            cache_points += 1
+
+        cache_messages = int(model_settings.get('anthropic_cache_messages', 0))
+        for message in reversed(anthropic_messages[-cache_messages:] if cache_messages > 0 else []):
+            if cache_points >= _MAX_CACHE_POINTS:
+                break
+            if _add_cache_control(_content_blocks(message)):
+                cache_points += 1
+
+        return system
+
     def _get_tools(self, model_request_parameters: ModelRequestParameters) -> list[BetaToolUnionParam]:
         return [self._map_tool_definition(r) for r in model_request_parameters.tool_defs.values()]
 
@@ -424,7 +604,10 @@ class AnthropicModel(Model):
                         system_prompt_parts.append(request_part.content)
                     elif isinstance(request_part, UserPromptPart):
                         async for content in self._map_user_prompt(request_part):
-                            user_content_params.append(content)
+                            if isinstance(content, CachePoint):
+                                _add_cache_control(user_content_params)
+                            else:
+                                user_content_params.append(content)
                     elif isinstance(request_part, ToolReturnPart):
                         tool_result_block_param = BetaToolResultBlockParam(
                             tool_use_id=_guard_tool_call_id(t=request_part),
@@ -559,7 +742,7 @@ class AnthropicModel(Model):
     @staticmethod
     async def _map_user_prompt(
         part: UserPromptPart,
-    ) -> AsyncGenerator[BetaContentBlockParam]:
+    ) -> AsyncGenerator[BetaContentBlockParam | CachePoint]:
         if isinstance(part.content, str):
             if part.content:  # Only yield non-empty text
                 yield BetaTextBlockParam(text=part.content, type='text')
@@ -600,6 +783,8 @@ class AnthropicModel(Model):
                         )
                     else:  # pragma: no cover
                         raise RuntimeError(f'Unsupported media type: {item.media_type}')
+                elif isinstance(item, CachePoint):
+                    yield item
                 else:
                     raise RuntimeError(f'Unsupported content type: {type(item)}')  # pragma: no cover
 
@@ -612,6 +797,29 @@ class AnthropicModel(Model):
         }
 
 
+_MAX_CACHE_POINTS = 4
+_CACHE_CONTROL = BetaCacheControlEphemeralParam(type='ephemeral')
+
+
+def _content_blocks(message: BetaMessageParam) -> list[dict[str, Any]]:
+    content = message['content']
+    return [] if isinstance(content, str) else cast(list[dict[str, Any]], content)
+
+
+def _add_cache_control(blocks: Sequence[Any]) -> bool:
+    """Mark the content up to and including the last block as cacheable, returning whether a cache point was added.
+
+    Thinking blocks can't be marked, so the last block that isn't one is marked instead.
+    """
+    for block in reversed(cast(Sequence[dict[str, Any]], blocks)):
+        if block['type'] not in ('thinking', 'redacted_thinking'):
+            if 'cache_control' in block:
+                return False
+            block['cache_control'] = _CACHE_CONTROL
+            return True
+    return False
+
+
 def _map_usage(message: BetaMessage | BetaRawMessageStartEvent | BetaRawMessageDeltaEvent) -> usage.RequestUsage:
     if isinstance(message, BetaMessage):
         response_usage = message.usage
@@ -744,7 +952,11 @@ class AnthropicStreamedResponse(StreamedResponse):
                     self.provider_details = {'finish_reason': raw_finish_reason}
                     self.finish_reason = _FINISH_REASON_MAP.get(raw_finish_reason)
 
-            elif isinstance(event, BetaRawContentBlockStopEvent | BetaRawMessageStopEvent):  # pragma: no branch
+            elif isinstance(event, BetaRawContentBlockStopEvent):
+                self._parts_manager.handle_part_end(vendor_part_id=event.index)
+                current_block = None
+
+            elif isinstance(event, BetaRawMessageStopEvent):  # pragma: no branch
                 current_block = None
 
     @property
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import functools
+import threading
 import typing
-from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import count
 from typing import TYPE_CHECKING, Any, Generic, Literal, cast, overload
 
-import anyio
-import anyio.to_thread
 from typing_extensions import ParamSpec, assert_never
 
 from pydantic_ai import (
@@ -18,6 +21,7 @@ from pydantic_ai import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     DocumentUrl,
     FinishReason,
     ImageUrl,
@@ -68,6 +72,7 @@ if TYPE_CHECKING:
         PromptVariableValuesTypeDef,
         ReasoningContentBlockOutputTypeDef,
         SystemContentBlockTypeDef,
+        TokenUsageTypeDef,
         ToolChoiceTypeDef,
         ToolConfigurationTypeDef,
         ToolSpecificationTypeDef,
@@ -147,6 +152,10 @@ _FINISH_REASON_MAP: dict[StopReasonType, FinishReason] = {
     'tool_use': 'tool_call',
 }
 
+_MAX_CACHE_POINTS = 4
+# Cache points aren't in the type stubs yet, so they're cast to the type of the block they're added to
+_CACHE_POINT: dict[str, Any] = {'cachePoint': {'type': 'default'}}
+
 
 class BedrockModelSettings(ModelSettings, total=False):
     """Settings for Bedrock models.
@@ -193,12 +202,36 @@ class BedrockModelSettings(ModelSettings, total=False):
     See more about it on <https://docs.aws.amazon.com/bedrock/latest/userguide/model-parameters.html>.
     """
 
+    bedrock_cache_tool_definitions: bool
+    """Whether to add a cache point after the tool definitions, so they can be reused by following requests.
+
+    See more about it on <https://docs.aws.amazon.com/bedrock/latest/userguide/prompt-caching.html>.
+    """
+
+    bedrock_cache_instructions: bool
+    """Whether to add a cache point after the instructions and system prompts, so they can be reused by following requests.
+
+    See more about it on <https://docs.aws.amazon.com/bedrock/latest/userguide/prompt-caching.html>.
+    """
+
+    bedrock_cache_messages: bool | int
+    """Whether to add a cache point after the last message, or the number of most recent messages to add cache points
+    after, so that the conversation so far can be reused by following requests.
+
+    Bedrock allows at most 4 cache points per request, so fewer message cache points are added if the request already
+    has cache points from the other settings or from [`CachePoint`][pydantic_ai.messages.CachePoint]s in the prompts.
+
+    See more about it on <https://docs.aws.amazon.com/bedrock/latest/userguide/prompt-caching.html>.
+    """
+
 
 @dataclass(init=False)
 class BedrockConverseModel(Model):
     """A model that uses the Bedrock Converse API."""
 
     client: BedrockRuntimeClient
+    executor: Executor = field(repr=False)
+    """The executor that the blocking boto3 calls are made in."""
 
     _model_name: BedrockModelName = field(repr=False)
     _provider: Provider[BaseClient] = field(repr=False)
@@ -210,6 +243,7 @@ class BedrockConverseModel(Model):
         provider: Literal['bedrock'] | Provider[BaseClient] = 'bedrock',
         profile: ModelProfileSpec | None = None,
         settings: ModelSettings | None = None,
+        executor: Executor | None = None,
     ):
         """Initialize a Bedrock model.
 
@@ -222,6 +256,9 @@ class BedrockConverseModel(Model):
                 created using the other parameters.
             profile: The model profile to use. Defaults to a profile picked by the provider based on the model name.
             settings: Model-specific settings that will be used as defaults for this model.
+            executor: The executor to make the blocking boto3 calls in. Defaults to a thread pool with
+                `DEFAULT_MAX_WORKERS` threads that's shared by all Bedrock models. Response streams are read in a
+                thread of their own, so streams that are open for a long time don't hold up other requests.
         """
         self._model_name = model_name
 
@@ -229,6 +266,7 @@ class BedrockConverseModel(Model):
             provider = infer_provider(provider)
         self._provider = provider
         self.client = cast('BedrockRuntimeClient', provider.client)
+        self.executor = executor or _default_executor()
 
         super().__init__(settings=settings, profile=profile or provider.model_profile)
 
@@ -328,10 +366,7 @@ class BedrockConverseModel(Model):
                             tool_call_id=tool_use['toolUseId'],
                         ),
                     )
-        u = usage.RequestUsage(
-            input_tokens=response['usage']['inputTokens'],
-            output_tokens=response['usage']['outputTokens'],
-        )
+        u = _map_usage(response['usage'])
         response_id = response.get('ResponseMetadata', {}).get('RequestId', None)
         raw_finish_reason = response['stopReason']
         provider_details = {'finish_reason': raw_finish_reason}
@@ -388,6 +423,9 @@ class BedrockConverseModel(Model):
         if tool_config:
             params['toolConfig'] = tool_config
 
+        if model_settings:
+            self._add_cache_points(system_prompt, bedrock_messages, tool_config, model_settings)
+
         if model_request_parameters.builtin_tools:
             raise UserError('Bedrock does not support built-in tools')
 
@@ -409,11 +447,45 @@ class BedrockConverseModel(Model):
                 params['promptVariables'] = prompt_variables
 
         if stream:
-            model_response = await anyio.to_thread.run_sync(functools.partial(self.client.converse_stream, **params))
+            model_response = await self._run_in_executor(functools.partial(self.client.converse_stream, **params))
         else:
-            model_response = await anyio.to_thread.run_sync(functools.partial(self.client.converse, **params))
+            model_response = await self._run_in_executor(functools.partial(self.client.converse, **params))
         return model_response
 
+    async def _run_in_executor(self, func: Callable[[], T]) -> T:
+        # The context is copied so that instrumentation of the boto3 call sees the current span
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(self.executor, context.run, func)
+
+    @staticmethod
+    def _add_cache_points(
+        system_prompt: list[SystemContentBlockTypeDef],
+        bedrock_messages: list[MessageUnionTypeDef],
+        tool_config: ToolConfigurationTypeDef | None,
+        model_settings: BedrockModelSettings,
+    ) -> None:
+        """Add the cache points requested by the model settings."""
+        cache_points = sum(
+            'cachePoint' in block for message in bedrock_messages for block in cast(list[Any], message['content'])
+        )
+
+        if tool_config and model_settings.get('bedrock_cache_tool_definitions'):
+            cast(list[Any], tool_config['tools']).append(_CACHE_POINT)
+            cache_points += 1
+
+        if system_prompt and model_settings.get('bedrock_cache_instructions'):
+            system_prompt.append(cast('SystemContentBlockTypeDef', _CACHE_POINT))
+            cache_points += 1
+
+        cache_messages = int(model_settings.get('bedrock_cache_messages', 0))
+        for message in reversed(bedrock_messages[-cache_messages:] if cache_messages > 0 else []):
+            if cache_points >= _MAX_CACHE_POINTS:
+                break
+            content = cast(list[Any], message['content'])
+            if content and 'cachePoint' not in content[-1]:
+                content.append(_CACHE_POINT)
+                cache_points += 1
+
     @staticmethod
     def _map_inference_config(
         model_settings: ModelSettings | None,
@@ -624,6 +696,10 @@ class BedrockConverseModel(Model):
                         content.append({'video': video})
                 elif isinstance(item, AudioUrl):  # pragma: no cover
                     raise NotImplementedError('Audio is not supported yet.')
+                elif isinstance(item, CachePoint):
+                    # A cache point that doesn't follow any content can't be sent
+                    if content:
+                        content.append(cast('ContentBlockUnionTypeDef', _CACHE_POINT))
                 else:
                     assert_never(item)
         return [{'role': 'user', 'content': content}]
@@ -656,7 +732,7 @@ class BedrockStreamedResponse(StreamedResponse):
 
         chunk: ConverseStreamOutputTypeDef
         tool_id: str | None = None
-        async for chunk in _AsyncIteratorWrapper(self._event_stream):
+        async for chunk in _StreamPump(self._event_stream):
             match chunk:
                 case {'messageStart': _}:
                     continue
@@ -715,6 +791,8 @@ class BedrockStreamedResponse(StreamedResponse):
                         )
                         if maybe_event:  # pragma: no branch
                             yield maybe_event
+                case {'contentBlockStop': content_block_stop}:
+                    self._parts_manager.handle_part_end(vendor_part_id=content_block_stop['contentBlockIndex'])
                 case _:
                     pass  # pyright wants match statements to be exhaustive
 
@@ -733,26 +811,123 @@ class BedrockStreamedResponse(StreamedResponse):
         return self._timestamp
 
     def _map_usage(self, metadata: ConverseStreamMetadataEventTypeDef) -> usage.RequestUsage:
-        return usage.RequestUsage(
-            input_tokens=metadata['usage']['inputTokens'],
-            output_tokens=metadata['usage']['outputTokens'],
-        )
+        return _map_usage(metadata['usage'])
+
+
+def _map_usage(token_usage: TokenUsageTypeDef) -> usage.RequestUsage:
+    # Cache reads and writes aren't included in `inputTokens`, and aren't in the type stubs yet
+    details = cast(dict[str, int], token_usage)
+    cache_read_tokens = details.get('cacheReadInputTokens', 0)
+    cache_write_tokens = details.get('cacheWriteInputTokens', 0)
+    return usage.RequestUsage(
+        input_tokens=token_usage['inputTokens'] + cache_read_tokens + cache_write_tokens,
+        output_tokens=token_usage['outputTokens'],
+        cache_read_tokens=cache_read_tokens,
+        cache_write_tokens=cache_write_tokens,
+    )
+
+
+DEFAULT_MAX_WORKERS = 64
+"""The number of threads in the executor that's shared by Bedrock models that weren't given one."""
 
+_default_executor_instance: ThreadPoolExecutor | None = None
+_default_executor_lock = threading.Lock()
 
-class _AsyncIteratorWrapper(Generic[T]):
-    """Wrap a synchronous iterator in an async iterator."""
 
-    def __init__(self, sync_iterator: Iterable[T]):
-        self.sync_iterator = iter(sync_iterator)
+def _default_executor() -> ThreadPoolExecutor:
+    global _default_executor_instance
+    with _default_executor_lock:
+        if _default_executor_instance is None:
+            _default_executor_instance = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix='pydantic-ai-bedrock'
+            )
+        return _default_executor_instance
 
-    def __aiter__(self):
-        return self
 
-    async def __anext__(self) -> T:
+class _StreamPump(Generic[T]):
+    """Read a synchronous iterator in a worker thread, and hand its items over to the event loop in batches.
+
+    A single worker reads the whole stream, rather than every item taking a trip to a thread and back. The items that
+    arrived while the event loop was busy are then all handled at once. At most `max_buffered` items are read ahead;
+    after that the worker waits for the event loop to catch up.
+
+    The worker is held until the stream has been read or closed, so by default it's a thread of its own rather than
+    one from an executor that's shared with other blocking calls, which open streams could otherwise use up.
+    """
+
+    def __init__(self, sync_iterable: Iterable[T], executor: Executor | None = None, max_buffered: int = 1024):
+        self.sync_iterable = sync_iterable
+        self.executor = executor
+        self.max_buffered = max_buffered
+        self._buffer: deque[T] = deque()
+        self._condition = threading.Condition()
+        self._finished = False
+        self._closed = False
+        self._error: BaseException | None = None
+
+    async def __aiter__(self) -> AsyncGenerator[T]:
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        context = contextvars.copy_context()
+        pump = functools.partial(self._pump, loop, wakeup)
+        if self.executor is not None:
+            loop.run_in_executor(self.executor, context.run, pump)
+        else:
+            threading.Thread(target=context.run, args=(pump,), name='pydantic-ai-bedrock-stream', daemon=True).start()
         try:
-            return await anyio.to_thread.run_sync(next, self.sync_iterator)
-        except RuntimeError as e:
-            if type(e.__cause__) is StopIteration:
-                raise StopAsyncIteration
-            else:
-                raise e  # pragma: lax no cover
+            while True:
+                with self._condition:
+                    batch = list(self._buffer)
+                    self._buffer.clear()
+                    finished, error = self._finished, self._error
+                    self._condition.notify()
+                    if not batch and not finished:
+                        # Cleared while holding the lock, so an item added after this will set it again
+                        wakeup.clear()
+
+                for item in batch:
+                    yield item
+
+                if not batch:
+                    if error is not None:
+                        raise error
+                    if finished:
+                        return
+                    await wakeup.wait()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify()
+                finished = self._finished
+            if not finished and (close := getattr(self.sync_iterable, 'close', None)):
+                # Stop the worker from waiting for the rest of a stream that won't be read
+                close()
+
+    def _pump(self, loop: asyncio.AbstractEventLoop, wakeup: asyncio.Event) -> None:
+        error: BaseException | None = None
+        try:
+            for item in self.sync_iterable:
+                with self._condition:
+                    while len(self._buffer) >= self.max_buffered and not self._closed:
+                        self._condition.wait()
+                    if self._closed:
+                        return
+                    was_empty = not self._buffer
+                    self._buffer.append(item)
+                if was_empty:
+                    _call_soon_threadsafe(loop, wakeup.set)
+        except BaseException as e:
+            error = e
+        finally:
+            with self._condition:
+                self._finished = True
+                self._error = error
+            _call_soon_threadsafe(loop, wakeup.set)
+
+
+def _call_soon_threadsafe(loop: asyncio.AbstractEventLoop, callback: Callable[[], Any]) -> None:
+    try:
+        loop.call_soon_threadsafe(callback)
+    except RuntimeError:  # pragma: no cover
+        # The event loop was closed while the stream was being read
+        pass
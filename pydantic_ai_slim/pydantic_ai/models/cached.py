@@ -0,0 +1,380 @@
+from __future__ import annotations as _annotations
+
+import hashlib
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager, closing
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Protocol
+
+from pydantic_core import to_jsonable_python
+
+from .. import _utils
+from .._run_context import RunContext
+from ..messages import (
+    BuiltinToolCallPart,
+    FinalResultEvent,
+    ModelMessage,
+    ModelMessagesTypeAdapter,
+    ModelResponse,
+    ModelResponseStreamEvent,
+    TextPart,
+    ThinkingPart,
+    ToolCallPart,
+)
+from ..settings import ModelSettings
+from ..usage import RequestUsage
+from . import BatchModelRequest, KnownModelName, Model, ModelRequestParameters, StreamedResponse
+from .wrapper import WrapperModel
+
+__all__ = (
+    'CachedModel',
+    'ResponseCache',
+    'InMemoryResponseCache',
+    'SQLiteResponseCache',
+    'AsyncKeyValueStore',
+    'KeyValueResponseCache',
+    'CachedStreamedResponse',
+    'request_key',
+)
+
+
+@dataclass(init=False)
+class CachedModel(WrapperModel):
+    """Model which returns a stored response when it's sent a request identical to one it has seen before.
+
+    Requests are identified by the model name and provider, the messages, and the model settings and request parameters
+    after they've been prepared by the wrapped model. Timestamps in the messages are ignored, so the same conversation
+    sent at a different time is still a hit.
+
+    A hit doesn't make a request at all, and reports zero usage. When streaming, the stored response is replayed as one
+    event per part. Streamed responses are only stored if the stream was consumed to the end.
+
+    See [model docs](../../models/overview.md#cached-model) for more information.
+    """
+
+    cache: ResponseCache
+    """The cache that responses are stored in."""
+
+    def __init__(self, wrapped: Model | KnownModelName, cache: ResponseCache | None = None):
+        """Create a cached model.
+
+        Args:
+            wrapped: The model to send requests to on a cache miss.
+            cache: The cache to store responses in. Defaults to an [`InMemoryResponseCache`][pydantic_ai.models.cached.InMemoryResponseCache].
+        """
+        super().__init__(wrapped)
+        self.cache = cache if cache is not None else InMemoryResponseCache()
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        key = self.cache_key(messages, model_settings, model_request_parameters)
+        if (cached := await self.cache.get(key)) is not None:
+            return _from_cache(cached)
+
+        response = await self.wrapped.request(messages, model_settings, model_request_parameters)
+        await self.cache.set(key, response)
+        return response
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        key = self.cache_key(messages, model_settings, model_request_parameters)
+        if (cached := await self.cache.get(key)) is not None:
+            _, prepared_parameters = self.wrapped.prepare_request(model_settings, model_request_parameters)
+            yield CachedStreamedResponse(prepared_parameters, _from_cache(cached))
+            return
+
+        async with self.wrapped.request_stream(
+            messages, model_settings, model_request_parameters, run_context
+        ) as response_stream:
+            tracked_stream = _TrackedStreamedResponse(response_stream.model_request_parameters, response_stream)
+            yield tracked_stream
+            if tracked_stream.complete:
+                await self.cache.set(key, response_stream.get())
+
+    async def request_batch(
+        self, requests: Sequence[BatchModelRequest], *, poll_interval: float = 60
+    ) -> list[ModelResponse | Exception]:
+        keys = [self.cache_key(r.messages, r.model_settings, r.model_request_parameters) for r in requests]
+        responses: dict[int, ModelResponse | Exception] = {}
+        for i, key in enumerate(keys):
+            if (cached := await self.cache.get(key)) is not None:
+                responses[i] = _from_cache(cached)
+
+        if misses := [i for i in range(len(requests)) if i not in responses]:
+            results = await self.wrapped.request_batch([requests[i] for i in misses], poll_interval=poll_interval)
+            for i, result in zip(misses, results):
+                if isinstance(result, ModelResponse):
+                    await self.cache.set(keys[i], result)
+                responses[i] = result
+        return [responses[i] for i in range(len(requests))]
+
+    def cache_key(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> str:
+        """Compute the key that identifies a request in the cache.
+
+        Override this to include or ignore other parts of the request.
+        """
+        return request_key(self.wrapped, messages, model_settings, model_request_parameters)
+
+
+def request_key(
+    model: Model,
+    messages: list[ModelMessage],
+    model_settings: ModelSettings | None,
+    model_request_parameters: ModelRequestParameters,
+) -> str:
+    """Compute a key that identifies a request to `model`.
+
+    The key is built from the model name and provider, the messages without their timestamps and the usage and other
+    per-call metadata of earlier responses, and the model settings and request parameters after they've been prepared
+    by `model`. This way the requests of a run that's replayed from the cache have the same keys as the original run.
+    """
+    prepared_settings, prepared_parameters = model.prepare_request(model_settings, model_request_parameters)
+    request = {
+        'model_name': model.model_name,
+        'system': model.system,
+        'messages': [
+            _without_call_metadata(message) for message in ModelMessagesTypeAdapter.dump_python(messages, mode='json')
+        ],
+        'model_settings': to_jsonable_python(prepared_settings or {}, bytes_mode='base64', fallback=repr),
+        'model_request_parameters': to_jsonable_python(prepared_parameters, bytes_mode='base64', fallback=repr),
+    }
+    serialized = json.dumps(request, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+# Response fields that differ from call to call, including between a response and its copy returned from the cache
+_RESPONSE_CALL_METADATA = frozenset({'usage', 'provider_response_id', 'provider_details'})
+
+
+def _without_call_metadata(message: dict[str, Any]) -> dict[str, Any]:
+    excluded = _RESPONSE_CALL_METADATA if message.get('kind') == 'response' else frozenset[str]()
+    message = {k: v for k, v in message.items() if k not in excluded and k != 'timestamp'}
+    # Only the timestamps of the message and its parts are dropped, not those in tool arguments, returns or content
+    message['parts'] = [{k: v for k, v in part.items() if k != 'timestamp'} for part in message['parts']]
+    return message
+
+
+def _from_cache(response: ModelResponse) -> ModelResponse:
+    return replace(response, usage=RequestUsage(), timestamp=_utils.now_utc())
+
+
+class ResponseCache(ABC):
+    """Abstract base class for the storage used by [`CachedModel`][pydantic_ai.models.cached.CachedModel]."""
+
+    @abstractmethod
+    async def get(self, key: str) -> ModelResponse | None:
+        """Get the response stored under `key`, or `None` if there isn't one.
+
+        The returned response may be shared with other callers and must not be mutated.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def set(self, key: str, response: ModelResponse) -> None:
+        """Store `response` under `key`."""
+        raise NotImplementedError()
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Stores responses in memory, evicting the least recently used ones once there are more than `max_size`."""
+
+    def __init__(self, max_size: int = 1024):
+        """Create an in-memory response cache.
+
+        Args:
+            max_size: The maximum number of responses to keep.
+        """
+        self.max_size = max_size
+        self._responses: OrderedDict[str, ModelResponse] = OrderedDict()
+
+    async def get(self, key: str) -> ModelResponse | None:
+        response = self._responses.get(key)
+        if response is not None:
+            self._responses.move_to_end(key)
+        return response
+
+    async def set(self, key: str, response: ModelResponse) -> None:
+        self._responses[key] = response
+        self._responses.move_to_end(key)
+        while len(self._responses) > self.max_size:
+            self._responses.popitem(last=False)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Stores responses in a SQLite database file, so they're reused across processes and restarts."""
+
+    def __init__(self, path: Path | str):
+        """Create a SQLite response cache.
+
+        Args:
+            path: The path of the database file. It's created if it doesn't exist.
+        """
+        self.path = Path(path)
+        self._initialized = False
+
+    async def get(self, key: str) -> ModelResponse | None:
+        data = await _utils.run_in_executor(self._get_sync, key)
+        return None if data is None else _deserialize(data)
+
+    async def set(self, key: str, response: ModelResponse) -> None:
+        await _utils.run_in_executor(self._set_sync, key, _serialize(response))
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        if not self._initialized:
+            with connection:
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response BLOB NOT NULL)'
+                )
+            self._initialized = True
+        return connection
+
+    def _get_sync(self, key: str) -> bytes | None:
+        with closing(self._connect()) as connection:
+            row = connection.execute('SELECT response FROM responses WHERE key = ?', (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def _set_sync(self, key: str, data: bytes) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute('INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)', (key, data))
+
+
+class AsyncKeyValueStore(Protocol):
+    """An async key-value store, like a Redis client, that [`KeyValueResponseCache`][pydantic_ai.models.cached.KeyValueResponseCache] can store responses in."""
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes) -> Any: ...
+
+
+@dataclass
+class KeyValueResponseCache(ResponseCache):
+    """Stores responses as JSON in an async key-value store."""
+
+    store: AsyncKeyValueStore
+    """The store to keep responses in."""
+    prefix: str = 'pydantic-ai:response:'
+    """The prefix of the keys that responses are stored under."""
+
+    async def get(self, key: str) -> ModelResponse | None:
+        data = await self.store.get(self.prefix + key)
+        return None if data is None else _deserialize(data)
+
+    async def set(self, key: str, response: ModelResponse) -> None:
+        await self.store.set(self.prefix + key, _serialize(response))
+
+
+def _serialize(response: ModelResponse) -> bytes:
+    return ModelMessagesTypeAdapter.dump_json([response])
+
+
+def _deserialize(data: bytes) -> ModelResponse:
+    [response] = ModelMessagesTypeAdapter.validate_json(data)
+    assert isinstance(response, ModelResponse)
+    return response
+
+
+@dataclass
+class CachedStreamedResponse(StreamedResponse):
+    """A streamed response that replays a stored response, with one event per part."""
+
+    response: ModelResponse
+    _timestamp: datetime = field(default_factory=_utils.now_utc, init=False)
+
+    def __post_init__(self):
+        self.provider_response_id = self.response.provider_response_id
+        self.provider_details = self.response.provider_details
+        self.finish_reason = self.response.finish_reason
+        self._usage = self.response.usage
+
+    async def _get_event_iterator(self) -> AsyncIterator[ModelResponseStreamEvent]:
+        for i, part in enumerate(self.response.parts):
+            if isinstance(part, TextPart):
+                event = self._parts_manager.handle_text_delta(vendor_part_id=i, content=part.content, id=part.id)
+            elif isinstance(part, ThinkingPart):
+                event = self._parts_manager.handle_thinking_delta(
+                    vendor_part_id=i,
+                    content=part.content,
+                    id=part.id,
+                    signature=part.signature,
+                    provider_name=part.provider_name,
+                )
+            elif isinstance(part, ToolCallPart):
+                event = self._parts_manager.handle_tool_call_part(
+                    vendor_part_id=i, tool_name=part.tool_name, args=part.args, tool_call_id=part.tool_call_id
+                )
+            elif isinstance(part, BuiltinToolCallPart):
+                event = self._parts_manager.handle_builtin_tool_call_part(vendor_part_id=i, part=part)
+            else:
+                event = self._parts_manager.handle_builtin_tool_return_part(vendor_part_id=i, part=part)
+            if event is not None:  # pragma: no branch
+                yield event
+
+    @property
+    def model_name(self) -> str:
+        return self.response.model_name or ''
+
+    @property
+    def provider_name(self) -> str | None:
+        return self.response.provider_name
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._timestamp
+
+
+@dataclass
+class _TrackedStreamedResponse(StreamedResponse):
+    """A streamed response from the wrapped model whose events are passed on, noting whether it was read to the end."""
+
+    source: StreamedResponse
+    complete: bool = field(default=False, init=False)
+
+    async def _get_event_iterator(self) -> AsyncIterator[ModelResponseStreamEvent]:
+        async for event in self.source:
+            # this response emits its own final result event
+            if not isinstance(event, FinalResultEvent):
+                yield event
+        self.complete = True
+
+    def on_tool_call_end(self, handler: Callable[[ToolCallPart], None]) -> None:
+        self.source.on_tool_call_end(handler)
+
+    def get(self) -> ModelResponse:
+        return self.source.get()
+
+    def usage(self) -> RequestUsage:
+        return self.source.usage()
+
+    @property
+    def model_name(self) -> str:
+        return self.source.model_name
+
+    @property
+    def provider_name(self) -> str | None:
+        return self.source.provider_name
+
+    @property
+    def timestamp(self) -> datetime:
+        return self.source.timestamp
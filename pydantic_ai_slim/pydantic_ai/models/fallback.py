@@ -1,7 +1,11 @@
 from __future__ import annotations as _annotations
 
+import asyncio
+import math
+import time
+from collections import deque
 from collections.abc import AsyncIterator, Callable
-from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager, suppress
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -11,10 +15,11 @@ from pydantic_ai._run_context import RunContext
 from pydantic_ai.models.instrumented import InstrumentedModel
 
 from ..exceptions import FallbackExceptionGroup, ModelHTTPError
+from ..usage import RequestUsage, RunUsage
 from . import KnownModelName, Model, ModelRequestParameters, StreamedResponse, infer_model
 
 if TYPE_CHECKING:
-    from ..messages import ModelMessage, ModelResponse
+    from ..messages import ModelMessage, ModelResponse, ModelResponseStreamEvent
     from ..settings import ModelSettings
 
 
@@ -26,6 +31,11 @@ class FallbackModel(Model):
     """
 
     models: list[Model]
+    hedging: HedgingPolicy | None
+    latencies: list[LatencyHistogram]
+    """The latencies of each model's successful requests, used to decide when to send a hedged request."""
+    hedging_stats: HedgingStats
+    """How often requests were hedged, and the usage of the requests that were cancelled."""
 
     _model_name: str = field(repr=False)
     _fallback_on: Callable[[Exception], bool]
@@ -35,6 +45,7 @@ class FallbackModel(Model):
         default_model: Model | KnownModelName | str,
         *fallback_models: Model | KnownModelName | str,
         fallback_on: Callable[[Exception], bool] | tuple[type[Exception], ...] = (ModelHTTPError,),
+        hedging: HedgingPolicy | None = None,
     ):
         """Initialize a fallback model instance.
 
@@ -42,9 +53,14 @@ class FallbackModel(Model):
             default_model: The name or instance of the default model to use.
             fallback_models: The names or instances of the fallback models to use upon failure.
             fallback_on: A callable or tuple of exceptions that should trigger a fallback.
+            hedging: When to also send the request to the next model if the previous one is slow to respond, instead
+                of only when it fails. By default, requests aren't hedged.
         """
         super().__init__()
         self.models = [infer_model(default_model), *[infer_model(m) for m in fallback_models]]
+        self.hedging = hedging
+        self.latencies = [LatencyHistogram(hedging.window if hedging else 1000) for _ in self.models]
+        self.hedging_stats = HedgingStats()
 
         if isinstance(fallback_on, tuple):
             self._fallback_on = _default_fallback_condition_factory(fallback_on)
@@ -74,6 +90,9 @@ class FallbackModel(Model):
 
         In case of failure, raise a FallbackExceptionGroup with all exceptions.
         """
+        if self.hedging is not None:
+            return await self._hedged_request(self.hedging, messages, model_settings, model_request_parameters)
+
         exceptions: list[Exception] = []
 
         for model in self.models:
@@ -99,6 +118,13 @@ class FallbackModel(Model):
         run_context: RunContext[Any] | None = None,
     ) -> AsyncIterator[StreamedResponse]:
         """Try each model in sequence until one succeeds."""
+        if self.hedging is not None:
+            async with self._hedged_request_stream(
+                self.hedging, messages, model_settings, model_request_parameters, run_context
+            ) as response:
+                yield response
+            return
+
         exceptions: list[Exception] = []
 
         for model in self.models:
@@ -119,6 +145,122 @@ class FallbackModel(Model):
 
         raise FallbackExceptionGroup('All models from FallbackModel failed', exceptions)
 
+    async def _hedged_request(
+        self,
+        hedging: HedgingPolicy,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        async def request(index: int) -> ModelResponse:
+            start = time.monotonic()
+            response = await self.models[index].request(messages, model_settings, model_request_parameters)
+            self.latencies[index].record(time.monotonic() - start)
+            return response
+
+        attempts: dict[asyncio.Task[ModelResponse], int] = {}
+        try:
+            index, response = await self._race(hedging, attempts, lambda i: asyncio.create_task(request(i)))
+        finally:
+            for task, loser in attempts.items():
+                if task.cancel():
+                    self.hedging_stats.record_cancelled(self.models[loser])
+                elif not task.cancelled() and task.exception() is None:
+                    # it responded at the same time as the winner
+                    self.hedging_stats.record_cancelled(self.models[loser], task.result().usage)
+
+        self._set_span_attributes(self.models[index])
+        return response
+
+    @asynccontextmanager
+    async def _hedged_request_stream(
+        self,
+        hedging: HedgingPolicy,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None,
+    ) -> AsyncIterator[StreamedResponse]:
+        streams: dict[int, _HedgedStream] = {}
+
+        def open_stream(index: int) -> asyncio.Task[StreamedResponse]:
+            stream = streams[index] = _HedgedStream()
+            model = self.models[index]
+            return asyncio.create_task(
+                stream.run(
+                    model.request_stream(messages, model_settings, model_request_parameters, run_context),
+                    self.latencies[index],
+                )
+            )
+
+        attempts: dict[asyncio.Task[StreamedResponse], int] = {}
+        try:
+            index, response = await self._race(hedging, attempts, open_stream)
+        finally:
+            # The streams that lost are closed as soon as the winner is known
+            for task, loser in attempts.items():
+                task.cancel()
+                stream = streams[loser]
+                await stream.close()
+                self.hedging_stats.record_cancelled(
+                    self.models[loser], stream.response.usage() if stream.response is not None else None
+                )
+
+        self._set_span_attributes(self.models[index])
+        try:
+            yield response
+        finally:
+            await streams[index].close()
+
+    async def _race(
+        self,
+        hedging: HedgingPolicy,
+        attempts: dict[asyncio.Task[Any], int],
+        start: Callable[[int], asyncio.Task[Any]],
+    ) -> tuple[int, Any]:
+        """Start the models' attempts in order until one succeeds.
+
+        The next model is started when the previous attempt fails, or when it hasn't succeeded within the hedging
+        delay of its model. The attempts that are still running are left in `attempts` for the caller to cancel.
+        """
+        exceptions: list[Exception] = []
+        next_index = 0
+        hedge_at = math.inf
+
+        def start_next() -> None:
+            nonlocal next_index, hedge_at
+            attempts[start(next_index)] = next_index
+            hedge_at = time.monotonic() + hedging.delay(self.latencies[next_index])
+            next_index += 1
+
+        start_next()
+        while attempts:
+            timeout = None
+            if next_index < len(self.models) and hedge_at < math.inf:
+                timeout = max(0, hedge_at - time.monotonic())
+            done, _ = await asyncio.wait(attempts, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                self.hedging_stats.hedged_requests += 1
+                start_next()
+                continue
+
+            for task in done:
+                index = attempts.pop(task)
+                try:
+                    result = task.result()
+                except Exception as exc:
+                    if not self._fallback_on(exc):
+                        raise exc
+                    exceptions.append(exc)
+                    if not attempts and next_index < len(self.models):
+                        start_next()
+                    continue
+                if index > min(attempts.values(), default=index):
+                    self.hedging_stats.hedge_wins += 1
+                return index, result
+
+        raise FallbackExceptionGroup('All models from FallbackModel failed', exceptions)
+
     def _set_span_attributes(self, model: Model):
         with suppress(Exception):
             span = get_current_span()
@@ -135,3 +277,151 @@ def _default_fallback_condition_factory(exceptions: tuple[type[Exception], ...])
         return isinstance(exception, exceptions)
 
     return fallback_condition
+
+
+@dataclass
+class HedgingPolicy:
+    """When a [`FallbackModel`][pydantic_ai.models.fallback.FallbackModel] sends a request to the next model before the previous one failed.
+
+    If a model hasn't responded, or when streaming, hasn't produced the first event of its response, within its
+    hedging delay, the request is also sent to the next model. The first model to respond wins, and the other requests
+    are cancelled.
+
+    The hedging delay of a model is the given percentile of its recent latencies, so that only requests that are
+    slower than usual are hedged. Until enough latencies have been recorded, `initial_delay` is used.
+    """
+
+    percentile: float = 95
+    """The percentile of a model's latencies after which the request is also sent to the next model."""
+    initial_delay: float = 10.0
+    """The hedging delay in seconds of a model with fewer than `min_samples` recorded latencies."""
+    min_delay: float = 0.0
+    """The shortest hedging delay in seconds, to limit how many requests are hedged when latencies are very stable."""
+    max_delay: float | None = None
+    """The longest hedging delay in seconds, or `None` for no maximum."""
+    min_samples: int = 20
+    """The number of latencies that need to be recorded before the percentile is used."""
+    window: int = 1000
+    """The number of most recent latencies of each model to keep."""
+
+    def delay(self, latencies: LatencyHistogram) -> float:
+        """Get the hedging delay in seconds for a model with the given latencies."""
+        if latencies.count < self.min_samples:
+            delay = self.initial_delay
+        else:
+            delay = latencies.percentile(self.percentile)
+        delay = max(delay, self.min_delay)
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return delay
+
+
+class LatencyHistogram:
+    """The most recent latencies of a model, in seconds."""
+
+    def __init__(self, window: int = 1000):
+        """Create a latency histogram.
+
+        Args:
+            window: The number of most recent latencies to keep.
+        """
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    @property
+    def count(self) -> int:
+        """The number of latencies that are kept."""
+        return len(self._latencies)
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a request."""
+        self._latencies.append(latency)
+
+    def percentile(self, percentile: float) -> float:
+        """Get the given percentile, between 0 and 100, of the latencies, or infinity if none were recorded."""
+        if not self._latencies:
+            return math.inf
+        latencies = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, math.ceil(percentile / 100 * len(latencies)) - 1)]
+
+
+@dataclass
+class HedgingStats:
+    """How often [`FallbackModel`][pydantic_ai.models.fallback.FallbackModel] hedged requests, for exporting as metrics."""
+
+    hedged_requests: int = 0
+    """The number of times a request was also sent to the next model because the previous one was slow to respond."""
+    hedge_wins: int = 0
+    """The number of times a model that was sent a hedged request responded before the models before it."""
+    cancelled_usage: dict[str, RunUsage] = field(default_factory=dict)
+    """The usage of the requests that were cancelled because another model responded first, by model name.
+
+    The provider may still charge for these. A cancelled request is counted in `requests`, but its tokens are only
+    known for streamed responses, up to the point where they were cancelled.
+    """
+
+    def record_cancelled(self, model: Model, usage: RequestUsage | None = None) -> None:
+        """Record that a request to `model` was cancelled, with the usage it reported, if any."""
+        model_usage = self.cancelled_usage.get(model.model_name)
+        if model_usage is None:
+            model_usage = self.cancelled_usage[model.model_name] = RunUsage()
+        model_usage.requests += 1
+        if usage is not None:
+            model_usage.incr(usage)
+
+
+class _HedgedStream:
+    """Holds a streamed response open in its own task, once its first event has been received."""
+
+    def __init__(self):
+        self.response: StreamedResponse | None = None
+        self._close = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def run(
+        self, stream: AbstractAsyncContextManager[StreamedResponse], latencies: LatencyHistogram
+    ) -> StreamedResponse:
+        """Open the stream and wait for its first event, then keep it open in the background until `close()`."""
+        opened: asyncio.Future[StreamedResponse] = asyncio.get_running_loop().create_future()
+        start = time.monotonic()
+
+        async def hold() -> None:
+            try:
+                async with stream as response:
+                    self.response = response
+                    events = response.__aiter__()
+                    try:
+                        first_event = await events.__anext__()
+                    except StopAsyncIteration:
+                        first_event = None
+                    latencies.record(time.monotonic() - start)
+                    response._event_iterator = _prepend(first_event, events)  # pyright: ignore[reportPrivateUsage]
+                    opened.set_result(response)
+                    await self._close.wait()
+            except Exception as exc:
+                if not opened.done():
+                    opened.set_exception(exc)
+            finally:
+                if not opened.done():
+                    opened.cancel()
+
+        self._task = asyncio.create_task(hold())
+        try:
+            return await asyncio.shield(opened)
+        except asyncio.CancelledError:
+            self._task.cancel()
+            raise
+
+    async def close(self) -> None:
+        """Close the stream, and wait for it to be closed."""
+        self._close.set()
+        if self._task is not None:
+            await asyncio.wait([self._task])
+
+
+async def _prepend(
+    first_event: ModelResponseStreamEvent | None, events: AsyncIterator[ModelResponseStreamEvent]
+) -> AsyncIterator[ModelResponseStreamEvent]:
+    if first_event is not None:
+        yield first_event
+    async for event in events:
+        yield event
@@ -15,12 +15,14 @@ from typing_extensions import NotRequired, TypedDict, assert_never, deprecated
 
 from .. import ModelHTTPError, UnexpectedModelBehavior, _utils, usage
 from .._output import OutputObjectDefinition
+from .._partial_json import JsonArraySplitter
 from .._run_context import RunContext
 from ..exceptions import UserError
 from ..messages import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     FileUrl,
     ModelMessage,
     ModelRequest,
@@ -292,28 +294,27 @@ class GeminiModel(Model):
     ) -> StreamedResponse:
         """Process a streamed response, and prepare a streaming response to return."""
         aiter_bytes = http_response.aiter_bytes()
-        start_response: _GeminiResponse | None = None
-        content = bytearray()
+        splitter = JsonArraySplitter()
+        responses: list[_GeminiResponse] = []
+        has_content = False
 
         async for chunk in aiter_bytes:
-            content.extend(chunk)
-            responses = _gemini_streamed_response_ta.validate_json(
-                _ensure_decodeable(content),
-                experimental_allow_partial='trailing-strings',
-            )
-            if responses:  # pragma: no branch
-                last = responses[-1]
-                if last['candidates'] and last['candidates'][0].get('content', {}).get('parts'):
-                    start_response = last
-                    break
-
-        if start_response is None:
+            for item in splitter.feed(chunk):
+                response = _gemini_response_ta.validate_json(item)
+                responses.append(response)
+                if response['candidates'] and response['candidates'][0].get('content', {}).get('parts'):
+                    has_content = True
+            if has_content:
+                break
+
+        if not has_content:
             raise UnexpectedModelBehavior('Streamed response ended without content or tool calls')
 
         return GeminiStreamedResponse(
             model_request_parameters=model_request_parameters,
             _model_name=self._model_name,
-            _content=content,
+            _responses=responses,
+            _splitter=splitter,
             _stream=aiter_bytes,
             _provider_name=self._provider.name,
         )
@@ -331,7 +332,9 @@ class GeminiModel(Model):
                     if isinstance(part, SystemPromptPart):
                         sys_prompt_parts.append(_GeminiTextPart(text=part.content))
                     elif isinstance(part, UserPromptPart):
-                        message_parts.extend(await self._map_user_prompt(part))
+                        message_parts.extend(
+                            await self._user_prompt_mapping_cache.get_or_map(part, self._map_user_prompt)
+                        )
                     elif isinstance(part, ToolReturnPart):
                         message_parts.append(_response_part_from_response(part.tool_name, part.model_response_object()))
                     elif isinstance(part, RetryPromptPart):
@@ -379,6 +382,9 @@ class GeminiModel(Model):
                     else:  # pragma: lax no cover
                         file_data = _GeminiFileDataPart(file_data={'file_uri': item.url, 'mime_type': item.media_type})
                         content.append(file_data)
+                elif isinstance(item, CachePoint):
+                    # Gemini doesn't support cache points in the prompt
+                    pass
                 else:
                     assert_never(item)  # pragma: lax no cover
         return content
@@ -434,7 +440,9 @@ class GeminiStreamedResponse(StreamedResponse):
     """Implementation of `StreamedResponse` for the Gemini model."""
 
     _model_name: GeminiModelName
-    _content: bytearray
+    _responses: list[_GeminiResponse]
+    """Responses that were already received before streaming started."""
+    _splitter: JsonArraySplitter
     _stream: AsyncIterator[bytes]
     _provider_name: str
     _timestamp: datetime = field(default_factory=_utils.now_utc, init=False)
@@ -474,34 +482,18 @@ class GeminiStreamedResponse(StreamedResponse):
 
     async def _get_gemini_responses(self) -> AsyncIterator[_GeminiResponse]:
         # This method exists to ensure we only yield completed items, so we don't need to worry about
-        # partial gemini responses, which would make everything more complicated
+        # partial gemini responses, which would make everything more complicated.
+        # Each response in the streamed JSON array is split off and validated once, as soon as it's complete.
+        for r in self._responses:
+            self._usage = _metadata_as_usage(r)
+            yield r
 
-        gemini_responses: list[_GeminiResponse] = []
-        current_gemini_response_index = 0
-        # Right now, there are some circumstances where we will have information that could be yielded sooner than it is
-        # But changing that would make things a lot more complicated.
         async for chunk in self._stream:
-            self._content.extend(chunk)
-
-            gemini_responses = _gemini_streamed_response_ta.validate_json(
-                _ensure_decodeable(self._content),
-                experimental_allow_partial='trailing-strings',
-            )
-
-            # The idea: yield only up to the latest response, which might still be partial.
-            # Note that if the latest response is complete, we could yield it immediately, but there's not a good
-            # allow_partial API to determine if the last item in the list is complete.
-            responses_to_yield = gemini_responses[:-1]
-            for r in responses_to_yield[current_gemini_response_index:]:
-                current_gemini_response_index += 1
+            for item in self._splitter.feed(chunk):
+                r = _gemini_response_ta.validate_json(item)
+                self._usage = _metadata_as_usage(r)
                 yield r
 
-        # Now yield the final response, which should be complete
-        if gemini_responses:  # pragma: no branch
-            r = gemini_responses[-1]
-            self._usage = _metadata_as_usage(r)
-            yield r
-
     @property
     def model_name(self) -> GeminiModelName:
         """Get the model name of the response."""
@@ -929,22 +921,3 @@ class _GeminiPromptFeedback(TypedDict):
 
 _gemini_request_ta = pydantic.TypeAdapter(_GeminiRequest)
 _gemini_response_ta = pydantic.TypeAdapter(_GeminiResponse)
-
-# steam requests return a list of https://ai.google.dev/api/generate-content#method:-models.streamgeneratecontent
-_gemini_streamed_response_ta = pydantic.TypeAdapter(list[_GeminiResponse], config=pydantic.ConfigDict(defer_build=True))
-
-
-def _ensure_decodeable(content: bytearray) -> bytearray:
-    """Trim any invalid unicode point bytes off the end of a bytearray.
-
-    This is necessary before attempting to parse streaming JSON bytes.
-
-    This is a temporary workaround until https://github.com/pydantic/pydantic-core/issues/1633 is resolved
-    """
-    try:
-        content.decode()
-    except UnicodeDecodeError as e:
-        # e.start marks the start of the invalid decoded bytes, so cut up to before the first invalid byte
-        return content[: e.start]
-    else:
-        return content
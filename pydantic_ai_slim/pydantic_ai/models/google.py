@@ -19,6 +19,7 @@ from ..messages import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     FileUrl,
     FinishReason,
     ModelMessage,
@@ -491,7 +492,9 @@ class GoogleModel(Model):
                     if isinstance(part, SystemPromptPart):
                         system_parts.append({'text': part.content})
                     elif isinstance(part, UserPromptPart):
-                        message_parts.extend(await self._map_user_prompt(part))
+                        message_parts.extend(
+                            await self._user_prompt_mapping_cache.get_or_map(part, self._map_user_prompt)
+                        )
                     elif isinstance(part, ToolReturnPart):
                         message_parts.append(
                             {
@@ -567,6 +570,9 @@ class GoogleModel(Model):
                     else:
                         file_data_dict: FileDataDict = {'file_uri': item.url, 'mime_type': item.media_type}
                         content.append({'file_data': file_data_dict})  # pragma: lax no cover
+                elif isinstance(item, CachePoint):
+                    # Gemini doesn't support cache points in the prompt
+                    pass
                 else:
                     assert_never(item)
         return content
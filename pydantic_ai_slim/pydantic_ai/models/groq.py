@@ -22,6 +22,7 @@ from ..messages import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     DocumentUrl,
     FinishReason,
     ImageUrl,
@@ -499,6 +500,9 @@ class GroqModel(Model):
                         raise RuntimeError('Only images are supported for binary content in Groq.')
                 elif isinstance(item, DocumentUrl):  # pragma: no cover
                     raise RuntimeError('DocumentUrl is not supported in Groq.')
+                elif isinstance(item, CachePoint):
+                    # Groq doesn't support cache points in the prompt
+                    pass
                 else:  # pragma: no cover
                     raise RuntimeError(f'Unsupported content type: {type(item)}')
 
@@ -3,10 +3,12 @@ from __future__ import annotations
 import itertools
 import json
 import warnings
+import weakref
 from collections.abc import AsyncIterator, Callable, Iterator, Mapping
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Literal, cast
+from functools import partial
+from typing import Any, Generic, Literal, TypeVar, cast
 from urllib.parse import urlparse
 
 from genai_prices.types import PriceCalculation
@@ -17,7 +19,15 @@ from opentelemetry._events import (
     get_event_logger_provider,  # pyright: ignore[reportPrivateImportUsage]
 )
 from opentelemetry.metrics import MeterProvider, get_meter_provider
-from opentelemetry.trace import Span, Tracer, TracerProvider, get_tracer_provider
+from opentelemetry.trace import (
+    Span,
+    SpanContext,
+    Tracer,
+    TracerProvider,
+    format_span_id,
+    format_trace_id,
+    get_tracer_provider,
+)
 from opentelemetry.util.types import AttributeValue
 from pydantic import TypeAdapter
 
@@ -93,6 +103,8 @@ class InstrumentationSettings:
     include_binary_content: bool = True
     include_content: bool = True
     version: Literal[1, 2, 3] = DEFAULT_INSTRUMENTATION_VERSION
+    incremental_messages: bool = False
+    max_binary_content_size: int | None = None
 
     def __init__(
         self,
@@ -104,6 +116,8 @@ class InstrumentationSettings:
         version: Literal[1, 2, 3] = DEFAULT_INSTRUMENTATION_VERSION,
         event_mode: Literal['attributes', 'logs'] = 'attributes',
         event_logger_provider: EventLoggerProvider | None = None,
+        incremental_messages: bool = False,
+        max_binary_content_size: int | None = None,
     ):
         """Create instrumentation options.
 
@@ -132,6 +146,17 @@ class InstrumentationSettings:
                 If not provided, the global event logger provider is used.
                 Calling `logfire.configure()` sets the global event logger provider, so most users don't need this.
                 This is only used if `event_mode='logs'` and `version=1`.
+            incremental_messages: Whether model request spans should only record the input messages that are new since
+                the previous request in the conversation, instead of the whole message history.
+                The span of the previous request is linked, and its IDs are set in the
+                `pydantic_ai.previous_request.trace_id` and `pydantic_ai.previous_request.span_id` attributes,
+                so the full history can be reconstructed by following the links.
+                Messages are also serialized only once, with the result kept until the message is garbage collected,
+                so messages must not be modified after they've been sent to a model.
+                This is only relevant for version 2 and above.
+            max_binary_content_size: The maximum size in bytes of binary content to include in the instrumentation
+                events. Larger binary content is replaced by its size and SHA-256 hash.
+                If `None`, binary content of any size is included, unless `include_binary_content` is `False`.
         """
         from pydantic_ai import __version__
 
@@ -145,6 +170,8 @@ class InstrumentationSettings:
         self.event_mode = event_mode
         self.include_binary_content = include_binary_content
         self.include_content = include_content
+        self.incremental_messages = incremental_messages
+        self.max_binary_content_size = max_binary_content_size
 
         if event_mode == 'logs' and version != 1:
             warnings.warn(
@@ -235,6 +262,23 @@ class InstrumentationSettings:
                 result.append(otel_message)
         return result
 
+    def serialize_messages(self, messages: list[ModelMessage]) -> str:
+        """Serialize messages to a JSON array of OpenTelemetry GenAI chat messages.
+
+        If `incremental_messages` is enabled, each message is only serialized once.
+        """
+        if not self.incremental_messages:
+            return json.dumps(self.messages_to_otel_messages(messages))
+        return '[' + ', '.join(itertools.chain.from_iterable(self._serialize_message(m) for m in messages)) + ']'
+
+    def _serialize_message(self, message: ModelMessage) -> list[str]:
+        key = (self.include_content, self.include_binary_content, self.max_binary_content_size)
+        cached = _serialized_messages.get(message)
+        if cached is None or cached[0] != key:
+            cached = key, [json.dumps(m) for m in self.messages_to_otel_messages([message])]
+            _serialized_messages.set(message, cached)
+        return cached[1]
+
     def handle_messages(self, input_messages: list[ModelMessage], response: ModelResponse, system: str, span: Span):
         if self.version == 1:
             events = self.messages_to_otel_events(input_messages)
@@ -260,9 +304,26 @@ class InstrumentationSettings:
             output_message = output_messages[0]
             instructions = InstrumentedModel._get_instructions(input_messages)  # pyright: ignore [reportPrivateUsage]
             system_instructions_attributes = self.system_instructions_attributes(instructions)
+            new_messages = input_messages
+            previous_request_attributes: dict[str, AttributeValue] = {}
+            if self.incremental_messages:
+                if previous := _find_previous_request(input_messages):
+                    index, previous_span_context = previous
+                    # The previous request's span has the messages up to and including its response
+                    new_messages = input_messages[index + 2 :]
+                    span.add_link(previous_span_context)
+                    previous_request_attributes = {
+                        'pydantic_ai.previous_request.trace_id': format_trace_id(previous_span_context.trace_id),
+                        'pydantic_ai.previous_request.span_id': format_span_id(previous_span_context.span_id),
+                    }
+                if input_messages:  # pragma: no branch
+                    _request_spans.set(
+                        input_messages[-1], (span.get_span_context(), tuple(id(m) for m in input_messages))
+                    )
             attributes: dict[str, AttributeValue] = {
-                'gen_ai.input.messages': json.dumps(self.messages_to_otel_messages(input_messages)),
+                'gen_ai.input.messages': self.serialize_messages(new_messages),
                 'gen_ai.output.messages': json.dumps([output_message]),
+                **previous_request_attributes,
                 **system_instructions_attributes,
                 'logfire.json_schema': json.dumps(
                     {
@@ -329,6 +390,58 @@ class InstrumentationSettings:
 GEN_AI_SYSTEM_ATTRIBUTE = 'gen_ai.system'
 GEN_AI_REQUEST_MODEL_ATTRIBUTE = 'gen_ai.request.model'
 
+ValueT = TypeVar('ValueT')
+
+
+class _MessageMap(Generic[ValueT]):
+    """Values associated with messages, without storing anything on the messages themselves.
+
+    Messages are unhashable, so entries are keyed by the identity of the message and are dropped when it's garbage
+    collected.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[weakref.ref[ModelMessage], ValueT]] = {}
+
+    def get(self, message: ModelMessage) -> ValueT | None:
+        if (entry := self._entries.get(id(message))) is not None and entry[0]() is message:
+            return entry[1]
+        return None
+
+    def set(self, message: ModelMessage, value: ValueT) -> None:
+        key = id(message)
+        self._entries[key] = (weakref.ref(message, partial(self._drop_entry, key)), value)
+
+    def _drop_entry(self, key: int, _message_ref: weakref.ref[ModelMessage]) -> None:
+        # the message's ID can't have been reused yet, as this is called when it's garbage collected
+        self._entries.pop(key, None)
+
+
+# Used when `InstrumentationSettings.incremental_messages` is enabled
+_serialized_messages: _MessageMap[tuple[Any, list[str]]] = _MessageMap()
+"""Each message's serialized OpenTelemetry messages, along with the settings they were serialized with."""
+_request_spans: _MessageMap[tuple[SpanContext, tuple[int, ...]]] = _MessageMap()
+"""The span of the request that each message was the last one sent in, and the IDs of the messages it was sent with."""
+
+
+def _find_previous_request(messages: list[ModelMessage]) -> tuple[int, SpanContext] | None:
+    """Find the last message that was sent to a model in an instrumented request and followed by its response.
+
+    The request only counts if the messages leading up to it are the ones it was sent with, so that the messages that
+    are new since then are exactly the ones after its response.
+    """
+    for index in range(len(messages) - 2, -1, -1):
+        request_span = _request_spans.get(messages[index])
+        if request_span is None:
+            continue
+        span_context, message_ids = request_span
+        if isinstance(messages[index + 1], ModelResponse) and message_ids == tuple(
+            id(m) for m in messages[: index + 1]
+        ):
+            return index, span_context
+        return None
+    return None
+
 
 @dataclass(init=False)
 class InstrumentedModel(WrapperModel):
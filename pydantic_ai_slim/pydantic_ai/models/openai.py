@@ -3,14 +3,16 @@ from __future__ import annotations as _annotations
 import base64
 import warnings
 from collections.abc import AsyncIterable, AsyncIterator, Sequence
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any, Literal, cast, overload
 
+import anyio
+from httpx import Timeout
 from pydantic import ValidationError
-from pydantic_core import to_json
-from typing_extensions import assert_never, deprecated
+from pydantic_core import from_json, to_json
+from typing_extensions import TypedDict, assert_never, deprecated
 
 from .. import ModelHTTPError, UnexpectedModelBehavior, _utils, usage
 from .._output import DEFAULT_OUTPUT_TOOL_NAME, OutputObjectDefinition
@@ -24,6 +26,7 @@ from ..messages import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     DocumentUrl,
     FinishReason,
     ImageUrl,
@@ -47,10 +50,18 @@ from ..profiles.openai import OpenAIModelProfile, OpenAISystemPromptRole
 from ..providers import Provider, infer_provider
 from ..settings import ModelSettings
 from ..tools import ToolDefinition
-from . import Model, ModelRequestParameters, StreamedResponse, check_allow_model_requests, download_item, get_user_agent
+from . import (
+    BatchModelRequest,
+    Model,
+    ModelRequestParameters,
+    StreamedResponse,
+    check_allow_model_requests,
+    download_item,
+    get_user_agent,
+)
 
 try:
-    from openai import NOT_GIVEN, APIStatusError, AsyncOpenAI, AsyncStream, NotGiven
+    from openai import NOT_GIVEN, APIError, APIStatusError, AsyncOpenAI, AsyncStream, NotGiven
     from openai.types import AllModels, chat, responses
     from openai.types.chat import (
         ChatCompletionChunk,
@@ -126,6 +137,10 @@ _RESPONSES_FINISH_REASON_MAP: dict[Literal['max_output_tokens', 'content_filter'
     'failed': 'error',
 }
 
+# The limits of a single batch of the Batch API, see https://platform.openai.com/docs/guides/batch#rate-limits
+_BATCH_MAX_REQUESTS = 50_000
+_BATCH_MAX_BYTES = 200_000_000
+
 
 class OpenAIChatModelSettings(ModelSettings, total=False):
     """Settings used for an OpenAI model request."""
@@ -247,6 +262,35 @@ class OpenAIResponsesModelSettings(OpenAIChatModelSettings, total=False):
     """
 
 
+class _ChatCompletionCreateParams(TypedDict):
+    """The arguments to `chat.completions.create` that are shared by interactive and batch requests."""
+
+    model: OpenAIModelName
+    messages: list[chat.ChatCompletionMessageParam]
+    parallel_tool_calls: bool | NotGiven
+    tools: list[chat.ChatCompletionToolParam] | NotGiven
+    tool_choice: Literal['none', 'required', 'auto'] | NotGiven
+    stop: list[str] | NotGiven
+    max_completion_tokens: int | NotGiven
+    timeout: float | Timeout | NotGiven
+    response_format: chat.completion_create_params.ResponseFormat | NotGiven
+    seed: int | NotGiven
+    reasoning_effort: ReasoningEffort | NotGiven
+    user: str | NotGiven
+    web_search_options: WebSearchOptions | NotGiven
+    service_tier: Literal['auto', 'default', 'flex', 'priority'] | NotGiven
+    prediction: ChatCompletionPredictionContentParam | NotGiven
+    temperature: float | NotGiven
+    top_p: float | NotGiven
+    presence_penalty: float | NotGiven
+    frequency_penalty: float | NotGiven
+    logit_bias: dict[str, int] | NotGiven
+    logprobs: bool | NotGiven
+    top_logprobs: int | NotGiven
+    extra_headers: dict[str, str]
+    extra_body: object | None
+
+
 @dataclass(init=False)
 class OpenAIChatModel(Model):
     """A model that uses the OpenAI API.
@@ -422,6 +466,97 @@ class OpenAIChatModel(Model):
         async with response:
             yield await self._process_streamed_response(response, model_request_parameters)
 
+    async def request_batch(
+        self, requests: Sequence[BatchModelRequest], *, poll_interval: float = 60
+    ) -> list[ModelResponse | Exception]:
+        """Make a batch of requests using the [Batch API](https://platform.openai.com/docs/guides/batch).
+
+        Requests that don't fit in a single batch are split over multiple batches, which run concurrently. If the
+        request is cancelled, so are the batches.
+        """
+        check_allow_model_requests()
+        lines: list[bytes] = []
+        for i, r in enumerate(requests):
+            model_settings, model_request_parameters = self.prepare_request(
+                r.model_settings, r.model_request_parameters
+            )
+            params = await self._completions_create_params(
+                r.messages, cast(OpenAIChatModelSettings, model_settings or {}), model_request_parameters
+            )
+            body: dict[str, Any] = {
+                k: v
+                for k, v in params.items()
+                if not isinstance(v, NotGiven) and k not in ('timeout', 'extra_headers', 'extra_body')
+            }
+            body.update(cast(dict[str, Any], params['extra_body'] or {}))
+            lines.append(to_json({'custom_id': str(i), 'method': 'POST', 'url': '/v1/chat/completions', 'body': body}))
+
+        chunks = _utils.chunk_by_size(
+            range(len(lines)),
+            [len(line) + 1 for line in lines],
+            max_count=_BATCH_MAX_REQUESTS,
+            max_size=_BATCH_MAX_BYTES,
+        )
+        chunk_responses = await _utils.gather_or_cancel(
+            *(self._request_batch_chunk(chunk, [lines[i] for i in chunk], poll_interval) for chunk in chunks)
+        )
+        return [response for responses in chunk_responses for response in responses]
+
+    async def _request_batch_chunk(
+        self, indices: list[int], lines: list[bytes], poll_interval: float
+    ) -> list[ModelResponse | Exception]:
+        try:
+            input_file = await self.client.files.create(file=('batch.jsonl', b'\n'.join(lines)), purpose='batch')
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id, endpoint='/v1/chat/completions', completion_window='24h'
+            )
+            try:
+                while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+                    await anyio.sleep(poll_interval)
+                    batch = await self.client.batches.retrieve(batch.id)
+            except anyio.get_cancelled_exc_class():
+                # Nobody is waiting for the results anymore, so don't let the batch run to completion
+                with anyio.CancelScope(shield=True), suppress(APIError):
+                    await self.client.batches.cancel(batch.id)
+                raise
+
+            results: dict[str, dict[str, Any]] = {}
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id:
+                    content = await self.client.files.content(file_id)
+                    for line in content.text.splitlines():
+                        result = from_json(line)
+                        results[result['custom_id']] = result
+        except APIStatusError as e:
+            if (status_code := e.status_code) >= 400:
+                raise ModelHTTPError(status_code=status_code, model_name=self.model_name, body=e.body) from e
+            raise  # pragma: lax no cover
+
+        responses: list[ModelResponse | Exception] = []
+        for i in indices:
+            result = results.get(str(i))
+            response = result and result.get('response')
+            if not response:
+                error = result and result.get('error')
+                responses.append(
+                    UnexpectedModelBehavior(
+                        f'Batch {batch.id} ended with status {batch.status!r} without a result for this request',
+                        to_json(error).decode() if error else None,
+                    )
+                )
+            elif response['status_code'] != 200:
+                responses.append(
+                    ModelHTTPError(
+                        status_code=response['status_code'], model_name=self.model_name, body=response.get('body')
+                    )
+                )
+            else:
+                try:
+                    responses.append(self._process_response(chat.ChatCompletion.model_validate(response['body'])))
+                except Exception as e:
+                    responses.append(e)
+        return responses
+
     @overload
     async def _completions_create(
         self,
@@ -447,6 +582,24 @@ class OpenAIChatModel(Model):
         model_settings: OpenAIChatModelSettings,
         model_request_parameters: ModelRequestParameters,
     ) -> chat.ChatCompletion | AsyncStream[ChatCompletionChunk]:
+        params = await self._completions_create_params(messages, model_settings, model_request_parameters)
+        try:
+            return await self.client.chat.completions.create(
+                stream=stream,
+                stream_options={'include_usage': True} if stream else NOT_GIVEN,
+                **params,
+            )
+        except APIStatusError as e:
+            if (status_code := e.status_code) >= 400:
+                raise ModelHTTPError(status_code=status_code, model_name=self.model_name, body=e.body) from e
+            raise  # pragma: lax no cover
+
+    async def _completions_create_params(
+        self,
+        messages: list[ModelMessage],
+        model_settings: OpenAIChatModelSettings,
+        model_request_parameters: ModelRequestParameters,
+    ) -> _ChatCompletionCreateParams:
         tools = self._get_tools(model_request_parameters)
         web_search_options = self._get_web_search_options(model_request_parameters)
 
@@ -476,41 +629,34 @@ class OpenAIChatModel(Model):
         for setting in unsupported_model_settings:
             model_settings.pop(setting, None)
 
-        try:
-            extra_headers = model_settings.get('extra_headers', {})
-            extra_headers.setdefault('User-Agent', get_user_agent())
-            return await self.client.chat.completions.create(
-                model=self._model_name,
-                messages=openai_messages,
-                parallel_tool_calls=model_settings.get('parallel_tool_calls', NOT_GIVEN),
-                tools=tools or NOT_GIVEN,
-                tool_choice=tool_choice or NOT_GIVEN,
-                stream=stream,
-                stream_options={'include_usage': True} if stream else NOT_GIVEN,
-                stop=model_settings.get('stop_sequences', NOT_GIVEN),
-                max_completion_tokens=model_settings.get('max_tokens', NOT_GIVEN),
-                timeout=model_settings.get('timeout', NOT_GIVEN),
-                response_format=response_format or NOT_GIVEN,
-                seed=model_settings.get('seed', NOT_GIVEN),
-                reasoning_effort=model_settings.get('openai_reasoning_effort', NOT_GIVEN),
-                user=model_settings.get('openai_user', NOT_GIVEN),
-                web_search_options=web_search_options or NOT_GIVEN,
-                service_tier=model_settings.get('openai_service_tier', NOT_GIVEN),
-                prediction=model_settings.get('openai_prediction', NOT_GIVEN),
-                temperature=model_settings.get('temperature', NOT_GIVEN),
-                top_p=model_settings.get('top_p', NOT_GIVEN),
-                presence_penalty=model_settings.get('presence_penalty', NOT_GIVEN),
-                frequency_penalty=model_settings.get('frequency_penalty', NOT_GIVEN),
-                logit_bias=model_settings.get('logit_bias', NOT_GIVEN),
-                logprobs=model_settings.get('openai_logprobs', NOT_GIVEN),
-                top_logprobs=model_settings.get('openai_top_logprobs', NOT_GIVEN),
-                extra_headers=extra_headers,
-                extra_body=model_settings.get('extra_body'),
-            )
-        except APIStatusError as e:
-            if (status_code := e.status_code) >= 400:
-                raise ModelHTTPError(status_code=status_code, model_name=self.model_name, body=e.body) from e
-            raise  # pragma: lax no cover
+        extra_headers = model_settings.get('extra_headers', {})
+        extra_headers.setdefault('User-Agent', get_user_agent())
+        return _ChatCompletionCreateParams(
+            model=self._model_name,
+            messages=openai_messages,
+            parallel_tool_calls=model_settings.get('parallel_tool_calls', NOT_GIVEN),
+            tools=tools or NOT_GIVEN,
+            tool_choice=tool_choice or NOT_GIVEN,
+            stop=model_settings.get('stop_sequences', NOT_GIVEN),
+            max_completion_tokens=model_settings.get('max_tokens', NOT_GIVEN),
+            timeout=model_settings.get('timeout', NOT_GIVEN),
+            response_format=response_format or NOT_GIVEN,
+            seed=model_settings.get('seed', NOT_GIVEN),
+            reasoning_effort=model_settings.get('openai_reasoning_effort', NOT_GIVEN),
+            user=model_settings.get('openai_user', NOT_GIVEN),
+            web_search_options=web_search_options or NOT_GIVEN,
+            service_tier=model_settings.get('openai_service_tier', NOT_GIVEN),
+            prediction=model_settings.get('openai_prediction', NOT_GIVEN),
+            temperature=model_settings.get('temperature', NOT_GIVEN),
+            top_p=model_settings.get('top_p', NOT_GIVEN),
+            presence_penalty=model_settings.get('presence_penalty', NOT_GIVEN),
+            frequency_penalty=model_settings.get('frequency_penalty', NOT_GIVEN),
+            logit_bias=model_settings.get('logit_bias', NOT_GIVEN),
+            logprobs=model_settings.get('openai_logprobs', NOT_GIVEN),
+            top_logprobs=model_settings.get('openai_top_logprobs', NOT_GIVEN),
+            extra_headers=extra_headers,
+            extra_body=model_settings.get('extra_body'),
+        )
 
     def _process_response(self, response: chat.ChatCompletion | str) -> ModelResponse:
         """Process a non-streamed response, and prepare a message to return."""
@@ -739,7 +885,7 @@ class OpenAIChatModel(Model):
                 else:
                     yield chat.ChatCompletionSystemMessageParam(role='system', content=part.content)
             elif isinstance(part, UserPromptPart):
-                yield await self._map_user_prompt(part)
+                yield await self._user_prompt_mapping_cache.get_or_map(part, self._map_user_prompt)
             elif isinstance(part, ToolReturnPart):
                 yield chat.ChatCompletionToolMessageParam(
                     role='tool',
@@ -838,6 +984,9 @@ class OpenAIChatModel(Model):
                         )
                 elif isinstance(item, VideoUrl):  # pragma: no cover
                     raise NotImplementedError('VideoUrl is not supported for OpenAI')
+                elif isinstance(item, CachePoint):
+                    # OpenAI caches prompt prefixes automatically
+                    pass
                 else:
                     assert_never(item)
         return chat.ChatCompletionUserMessageParam(role='user', content=content)
@@ -1271,7 +1420,9 @@ class OpenAIResponsesModel(Model):
                     if isinstance(part, SystemPromptPart):
                         openai_messages.append(responses.EasyInputMessageParam(role='system', content=part.content))
                     elif isinstance(part, UserPromptPart):
-                        openai_messages.append(await self._map_user_prompt(part))
+                        openai_messages.append(
+                            await self._user_prompt_mapping_cache.get_or_map(part, self._map_user_prompt)
+                        )
                     elif isinstance(part, ToolReturnPart):
                         call_id = _guard_tool_call_id(t=part)
                         call_id, _ = _split_combined_tool_call_id(call_id)
@@ -1515,6 +1666,9 @@ class OpenAIResponsesModel(Model):
                     )
                 elif isinstance(item, VideoUrl):  # pragma: no cover
                     raise NotImplementedError('VideoUrl is not supported for OpenAI.')
+                elif isinstance(item, CachePoint):
+                    # OpenAI caches prompt prefixes automatically
+                    pass
                 else:
                     assert_never(item)
         return responses.EasyInputMessageParam(role='user', content=content)
@@ -0,0 +1,261 @@
+from __future__ import annotations as _annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any
+
+from .._parts_manager import ModelResponsePartsManager
+from .._run_context import RunContext
+from ..messages import (
+    BuiltinToolCallPart,
+    FinalResultEvent,
+    ModelMessage,
+    ModelResponse,
+    ModelResponseStreamEvent,
+    PartDeltaEvent,
+    PartStartEvent,
+    TextPart,
+    TextPartDelta,
+    ThinkingPart,
+    ThinkingPartDelta,
+    ToolCallPart,
+)
+from ..settings import ModelSettings
+from ..usage import RequestUsage
+from . import KnownModelName, Model, ModelRequestParameters, StreamedResponse
+from .cached import request_key
+from .wrapper import WrapperModel
+
+__all__ = ('SingleFlightModel',)
+
+
+@dataclass(init=False)
+class SingleFlightModel(WrapperModel):
+    """Model which sends a request only once when identical requests are made while it's still in flight.
+
+    Concurrent runs that make the same request, for example because they were started with the same instructions and
+    prompt, wait for the response to the first one instead of making their own. Requests are identified like they are
+    by [`CachedModel`][pydantic_ai.models.cached.CachedModel], but nothing is kept once the response has arrived.
+
+    The run that made the request reports its usage, and the runs that waited for it report zero usage. When streaming,
+    the events of the response are passed on to every run as they arrive, including to runs that joined after the
+    response started streaming.
+
+    See [model docs](../../models/overview.md#single-flight-requests) for more information.
+    """
+
+    coalesced_requests: int
+    """The number of requests that were answered by an identical request that was already in flight."""
+
+    _requests: dict[str, asyncio.Task[ModelResponse]] = field(repr=False)
+    _streams: dict[str, _StreamFlight] = field(repr=False)
+
+    def __init__(self, wrapped: Model | KnownModelName):
+        """Create a single-flight model.
+
+        Args:
+            wrapped: The model to send requests to.
+        """
+        super().__init__(wrapped)
+        self.coalesced_requests = 0
+        self._requests = {}
+        self._streams = {}
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        key = self.request_key(messages, model_settings, model_request_parameters)
+        task = self._requests.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self.wrapped.request(messages, model_settings, model_request_parameters))
+            self._requests[key] = task
+            task.add_done_callback(lambda t: self._requests.pop(key, None) if self._requests.get(key) is t else None)
+            # shielded so that the runs waiting for the same response aren't affected if this one is cancelled
+            return await asyncio.shield(task)
+
+        self.coalesced_requests += 1
+        response = await asyncio.shield(task)
+        return replace(response, usage=RequestUsage())
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        key = self.request_key(messages, model_settings, model_request_parameters)
+        flight = self._streams.get(key)
+        first = flight is None or flight.task.get_loop() is not asyncio.get_running_loop()
+        if flight is None or first:
+            flight = _StreamFlight(
+                self.wrapped.request_stream(messages, model_settings, model_request_parameters, run_context)
+            )
+            self._streams[key] = flight
+            flight.task.add_done_callback(
+                lambda _: self._streams.pop(key, None) if self._streams.get(key) is flight else None
+            )
+        else:
+            self.coalesced_requests += 1
+
+        flight.consumers += 1
+        try:
+            source = await asyncio.shield(flight.opened)
+            yield _TeeStreamedResponse(source.model_request_parameters, flight, source, first)
+        finally:
+            flight.consumers -= 1
+            if flight.consumers == 0:
+                # nobody is reading the response anymore, so a new request shouldn't join it
+                flight.task.cancel()
+                if self._streams.get(key) is flight:
+                    del self._streams[key]
+
+    def request_key(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> str:
+        """Compute the key that identifies a request, so that requests with the same key are only sent once.
+
+        Override this to include or ignore other parts of the request.
+        """
+        return request_key(self.wrapped, messages, model_settings, model_request_parameters)
+
+
+class _StreamFlight:
+    """A streamed response from the wrapped model, whose events are collected for all runs waiting for it."""
+
+    def __init__(self, stream: AbstractAsyncContextManager[StreamedResponse]):
+        self.opened: asyncio.Future[StreamedResponse] = asyncio.get_running_loop().create_future()
+        self.events: list[ModelResponseStreamEvent] = []
+        self.error: Exception | None = None
+        self.done = False
+        self.consumers = 0
+        self._changed = asyncio.Event()
+        self.task = asyncio.create_task(self._run(stream))
+
+    async def wait(self) -> None:
+        """Wait until more events have arrived or the stream has ended."""
+        await self._changed.wait()
+
+    async def _run(self, stream: AbstractAsyncContextManager[StreamedResponse]) -> None:
+        try:
+            async with stream as response:
+                self.opened.set_result(response)
+                async for event in response:
+                    # each run's own `StreamedResponse` emits a final result event based on its own output settings
+                    if not isinstance(event, FinalResultEvent):
+                        self.events.append(event)
+                        self._notify()
+        except Exception as e:
+            if self.opened.done():
+                self.error = e
+            else:
+                self.opened.set_exception(e)
+        finally:
+            if not self.opened.done():
+                self.opened.cancel()
+            self.done = True
+            self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
+@dataclass
+class _TeeStreamedResponse(StreamedResponse):
+    """A streamed response that passes on the events collected by a `_StreamFlight` as they arrive."""
+
+    flight: _StreamFlight
+    source: StreamedResponse
+    report_usage: bool
+
+    async def _get_event_iterator(self) -> AsyncIterator[ModelResponseStreamEvent]:
+        seen = 0
+        while True:
+            while seen < len(self.flight.events):
+                event = _replay_event(self._parts_manager, self.flight.events[seen])
+                seen += 1
+                self._update_from_source()
+                if event is not None:  # pragma: no branch
+                    yield event
+            if self.flight.done:
+                break
+            await self.flight.wait()
+
+        self._update_from_source()
+        if self.flight.error is not None:
+            raise self.flight.error
+
+    def _update_from_source(self) -> None:
+        self.provider_response_id = self.source.provider_response_id
+        self.provider_details = self.source.provider_details
+        self.finish_reason = self.source.finish_reason
+        if self.report_usage:
+            self._usage = self.source.usage()
+
+    @property
+    def model_name(self) -> str:
+        return self.source.model_name
+
+    @property
+    def provider_name(self) -> str | None:
+        return self.source.provider_name
+
+    @property
+    def timestamp(self) -> datetime:
+        return self.source.timestamp
+
+
+def _replay_event(
+    parts_manager: ModelResponsePartsManager, event: ModelResponseStreamEvent
+) -> ModelResponseStreamEvent | None:
+    """Apply an event emitted by another parts manager, using the index of its part as the vendor part ID."""
+    if isinstance(event, PartStartEvent):
+        part = event.part
+        if isinstance(part, TextPart):
+            return parts_manager.handle_text_delta(vendor_part_id=event.index, content=part.content, id=part.id)
+        elif isinstance(part, ThinkingPart):
+            return parts_manager.handle_thinking_delta(
+                vendor_part_id=event.index,
+                content=part.content,
+                id=part.id,
+                signature=part.signature,
+                provider_name=part.provider_name,
+            )
+        elif isinstance(part, ToolCallPart):
+            return parts_manager.handle_tool_call_part(
+                vendor_part_id=event.index, tool_name=part.tool_name, args=part.args, tool_call_id=part.tool_call_id
+            )
+        elif isinstance(part, BuiltinToolCallPart):
+            return parts_manager.handle_builtin_tool_call_part(vendor_part_id=event.index, part=part)
+        else:
+            return parts_manager.handle_builtin_tool_return_part(vendor_part_id=event.index, part=part)
+    elif isinstance(event, PartDeltaEvent):
+        delta = event.delta
+        if isinstance(delta, TextPartDelta):
+            return parts_manager.handle_text_delta(vendor_part_id=event.index, content=delta.content_delta)
+        elif isinstance(delta, ThinkingPartDelta):
+            return parts_manager.handle_thinking_delta(
+                vendor_part_id=event.index,
+                content=delta.content_delta,
+                signature=delta.signature_delta,
+                provider_name=delta.provider_name,
+            )
+        else:
+            return parts_manager.handle_tool_call_delta(
+                vendor_part_id=event.index,
+                tool_name=delta.tool_name_delta,
+                args=delta.args_delta,
+                tool_call_id=delta.tool_call_id,
+            )
+    return None  # pragma: no cover
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from functools import cached_property
@@ -10,7 +10,7 @@ from .._run_context import RunContext
 from ..messages import ModelMessage, ModelResponse
 from ..profiles import ModelProfile
 from ..settings import ModelSettings
-from . import KnownModelName, Model, ModelRequestParameters, StreamedResponse, infer_model
+from . import BatchModelRequest, KnownModelName, Model, ModelRequestParameters, StreamedResponse, infer_model
 
 
 @dataclass(init=False)
@@ -43,6 +43,11 @@ class WrapperModel(Model):
         ) as response_stream:
             yield response_stream
 
+    async def request_batch(
+        self, requests: Sequence[BatchModelRequest], *, poll_interval: float = 60
+    ) -> list[ModelResponse | Exception]:
+        return await self.wrapped.request_batch(requests, poll_interval=poll_interval)
+
     def customize_request_parameters(self, model_request_parameters: ModelRequestParameters) -> ModelRequestParameters:
         return self.wrapped.customize_request_parameters(model_request_parameters)
 
@@ -0,0 +1,339 @@
+"""Client-side rate limiting for HTTP requests to model providers, based on the rate limit headers they return.
+
+Retrying only reacts to a `429 Too Many Requests` after it happened. The rate limiter in this module paces requests
+before they're sent instead, using the remaining request and token budgets that OpenAI and Anthropic report in the
+headers of every response, so that many concurrent agent runs share the budget without running into the limit.
+
+The module includes:
+- AdaptiveRateLimiter: Token buckets per host that are kept in sync with the provider's rate limit headers
+- RateLimitStats: How long requests waited for the rate limiter, for exporting as metrics
+- AsyncRateLimitTransport: Asynchronous HTTP transport that sends requests through a rate limiter
+"""
+
+from __future__ import annotations as _annotations
+
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import TracebackType
+from typing import cast
+
+import anyio
+from httpx import AsyncBaseTransport, AsyncHTTPTransport, Headers, Request, Response
+
+from .usage import RequestUsage
+
+__all__ = ['AdaptiveRateLimiter', 'RateLimitStats', 'AsyncRateLimitTransport']
+
+
+@dataclass
+class RateLimitStats:
+    """How requests were paced by an [`AdaptiveRateLimiter`][pydantic_ai.rate_limit.AdaptiveRateLimiter], for exporting as metrics."""
+
+    requests: int = 0
+    """The total number of requests that were let through."""
+    delayed_requests: int = 0
+    """The number of requests that had to wait for the budget to be replenished."""
+    requests_waiting: int = 0
+    """The number of requests that are currently waiting."""
+    total_wait_time: float = 0.0
+    """The total time in seconds that requests waited."""
+    max_wait_time: float = 0.0
+    """The longest time in seconds that a single request waited."""
+    rate_limited_responses: int = 0
+    """The number of responses with status code 429, which means the limiter let a request through too early."""
+
+    @property
+    def average_wait_time(self) -> float:
+        """The average time in seconds that a request waited."""
+        return self.total_wait_time / self.requests if self.requests else 0.0
+
+
+class AdaptiveRateLimiter:
+    """Paces requests so they stay within the rate limits reported by the provider.
+
+    Each host gets a token bucket for requests and one for tokens. They start out unlimited, and after each response the
+    level, capacity and refill rate of each bucket are set from the provider's rate limit headers: OpenAI's
+    `x-ratelimit-{limit,remaining,reset}-{requests,tokens}` and Anthropic's
+    `anthropic-ratelimit-{requests,tokens,input-tokens}-{limit,remaining,reset}`. A request waits until both buckets
+    have enough budget for it, in the order the requests were made. When a response has status code 429, all requests
+    to the host wait until its `Retry-After` has passed.
+
+    The number of tokens a request will use isn't known before it's sent, so it's estimated from the
+    [`RequestUsage`][pydantic_ai.usage.RequestUsage] of earlier responses, which are passed to
+    [`record_usage()`][pydantic_ai.rate_limit.AdaptiveRateLimiter.record_usage]. This happens automatically for the
+    rate limiter in [`HttpPoolSettings.rate_limiter`][pydantic_ai.models.HttpPoolSettings.rate_limiter], for model
+    requests sent by the shared HTTP clients.
+
+    A single limiter is meant to be shared by all HTTP clients that send requests with the same API key, so that all
+    agent runs in the process share the same budget.
+    """
+
+    def __init__(self, *, tokens_per_request: int = 1000, usage_smoothing: float = 0.1, max_wait: float | None = None):
+        """Create an adaptive rate limiter.
+
+        Args:
+            tokens_per_request: The number of tokens a request is assumed to use before any usage has been recorded.
+            usage_smoothing: How much weight the usage of the latest response gets in the estimate of the number of
+                tokens a request will use, between 0 and 1.
+            max_wait: The maximum time in seconds a request waits before it's let through anyway, or `None` to wait as
+                long as needed.
+        """
+        self.tokens_per_request = float(tokens_per_request)
+        self.usage_smoothing = usage_smoothing
+        self.max_wait = max_wait
+        self.stats = RateLimitStats()
+        self._budgets: dict[str, _HostBudget] = {}
+
+    async def acquire(self, host: str, tokens: float | None = None) -> float:
+        """Wait until there's budget for a request to `host`, and reserve it.
+
+        Every call must be followed by a call to [`release()`][pydantic_ai.rate_limit.AdaptiveRateLimiter.release] with
+        the same `tokens`.
+
+        Args:
+            host: The host the request is sent to.
+            tokens: The number of tokens the request is expected to use. Defaults to the current estimate.
+
+        Returns:
+            The time in seconds the request waited.
+        """
+        if tokens is None:
+            tokens = self.tokens_per_request
+        budget = self._budgets.get(host)
+        if budget is None:
+            budget = self._budgets[host] = _HostBudget()
+
+        start = time.monotonic()
+        delayed = False
+        self.stats.requests_waiting += 1
+        try:
+            # requests wait in the order they were made
+            async with budget.lock:
+                while (delay := budget.delay(time.monotonic(), tokens)) > 0:
+                    if self.max_wait is not None:
+                        delay = min(delay, start + self.max_wait - time.monotonic())
+                        if delay <= 0:
+                            break
+                    delayed = True
+                    await anyio.sleep(delay)
+                budget.reserve(time.monotonic(), tokens)
+        finally:
+            self.stats.requests_waiting -= 1
+
+        waited = time.monotonic() - start
+        stats = self.stats
+        stats.requests += 1
+        stats.total_wait_time += waited
+        stats.max_wait_time = max(stats.max_wait_time, waited)
+        if delayed:
+            stats.delayed_requests += 1
+        return waited
+
+    def release(self, host: str, tokens: float | None = None, response: Response | None = None) -> None:
+        """Release the reservation of a request to `host` once it's done, and update the budget from its `response`.
+
+        Args:
+            host: The host the request was sent to.
+            tokens: The number of tokens that were passed to `acquire()`.
+            response: The response, if one was received.
+        """
+        if tokens is None:
+            tokens = self.tokens_per_request
+        budget = self._budgets.get(host)
+        if budget is None:  # pragma: no cover
+            return
+        budget.unreserve(tokens)
+        if response is not None:
+            now = time.monotonic()
+            budget.update(now, response.headers)
+            if response.status_code == 429:
+                self.stats.rate_limited_responses += 1
+                budget.block_until(now + _retry_after(response.headers))
+
+    def record_usage(self, usage: RequestUsage) -> None:
+        """Update the estimate of the number of tokens a request will use with the usage of a response."""
+        if total_tokens := usage.total_tokens:
+            self.tokens_per_request += self.usage_smoothing * (total_tokens - self.tokens_per_request)
+
+
+class AsyncRateLimitTransport(AsyncBaseTransport):
+    """Asynchronous HTTP transport that waits for an [`AdaptiveRateLimiter`][pydantic_ai.rate_limit.AdaptiveRateLimiter] before sending each request.
+
+    Args:
+        limiter: The rate limiter to use. Share it between all clients that use the same API key.
+        wrapped: The underlying async transport to send requests with.
+
+    Example:
+        ```python
+        from httpx import AsyncClient
+
+        from pydantic_ai.rate_limit import AdaptiveRateLimiter, AsyncRateLimitTransport
+
+        limiter = AdaptiveRateLimiter()
+        client = AsyncClient(transport=AsyncRateLimitTransport(limiter))
+        ```
+    """
+
+    def __init__(self, limiter: AdaptiveRateLimiter, wrapped: AsyncBaseTransport | None = None):
+        self.limiter = limiter
+        self.wrapped = wrapped or AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: Request) -> Response:
+        host = request.url.host
+        tokens = self.limiter.tokens_per_request
+        await self.limiter.acquire(host, tokens)
+        response: Response | None = None
+        try:
+            response = await self.wrapped.handle_async_request(request)
+            return response
+        finally:
+            self.limiter.release(host, tokens, response)
+
+    async def __aenter__(self) -> AsyncRateLimitTransport:
+        await self.wrapped.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        await self.wrapped.__aexit__(exc_type, exc_value, traceback)
+
+    async def aclose(self) -> None:
+        await self.wrapped.aclose()
+
+
+@dataclass
+class _Bucket:
+    """A token bucket that refills at `rate` per second up to `capacity`."""
+
+    capacity: float
+    level: float
+    rate: float
+    updated_at: float
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def delay(self, amount: float) -> float:
+        # A request that needs more than the capacity goes once the bucket is full
+        missing = min(amount, self.capacity) - self.level
+        if missing <= 0:
+            return 0.0
+        return missing / self.rate if self.rate > 0 else math.inf
+
+
+@dataclass
+class _HostBudget:
+    requests: _Bucket | None = None
+    tokens: _Bucket | None = None
+    blocked_until: float = 0.0
+    requests_in_flight: int = 0
+    tokens_in_flight: float = 0.0
+    lock: anyio.Lock = field(default_factory=anyio.Lock)
+
+    def delay(self, now: float, tokens: float) -> float:
+        delay = max(self.blocked_until - now, 0.0)
+        if self.requests is not None:
+            self.requests.refill(now)
+            delay = max(delay, self.requests.delay(1))
+        if self.tokens is not None:
+            self.tokens.refill(now)
+            delay = max(delay, self.tokens.delay(tokens))
+        return delay
+
+    def reserve(self, now: float, tokens: float) -> None:
+        self.requests_in_flight += 1
+        self.tokens_in_flight += tokens
+        if self.requests is not None:
+            self.requests.refill(now)
+            self.requests.level -= 1
+        if self.tokens is not None:
+            self.tokens.refill(now)
+            self.tokens.level -= tokens
+
+    def unreserve(self, tokens: float) -> None:
+        self.requests_in_flight -= 1
+        self.tokens_in_flight -= tokens
+
+    def update(self, now: float, headers: Headers) -> None:
+        # The remaining budget reported by the provider doesn't include the requests that are still in flight
+        if (requests := _parse_limit(headers, 'requests')) is not None:
+            self.requests = _Bucket(*requests, updated_at=now)
+            self.requests.level -= self.requests_in_flight
+        for name in ('tokens', 'input-tokens'):
+            if (tokens := _parse_limit(headers, name)) is not None:
+                self.tokens = _Bucket(*tokens, updated_at=now)
+                self.tokens.level -= self.tokens_in_flight
+                break
+
+    def block_until(self, until: float) -> None:
+        self.blocked_until = max(self.blocked_until, until)
+
+
+_DEFAULT_WINDOW = 60.0
+"""The window in seconds a limit is assumed to apply to when the provider doesn't say when the budget is reset."""
+
+
+def _parse_limit(headers: Headers, name: str) -> tuple[float, float, float] | None:
+    """Parse the capacity, remaining level and refill rate of a limit from OpenAI or Anthropic rate limit headers."""
+    anthropic_prefix = f'anthropic-ratelimit-{name}'
+    for limit_header, remaining_header, reset_header in (
+        (f'x-ratelimit-limit-{name}', f'x-ratelimit-remaining-{name}', f'x-ratelimit-reset-{name}'),
+        (f'{anthropic_prefix}-limit', f'{anthropic_prefix}-remaining', f'{anthropic_prefix}-reset'),
+    ):
+        try:
+            capacity = float(headers[limit_header])
+            remaining = float(headers[remaining_header])
+        except (KeyError, ValueError):
+            continue
+        reset = _parse_reset(headers.get(reset_header))
+        # The budget is assumed to be replenished evenly, so that it's full again when it's reset
+        if reset is not None and reset > 0 and remaining < capacity:
+            rate = (capacity - remaining) / reset
+        else:
+            rate = capacity / _DEFAULT_WINDOW
+        return capacity, remaining, rate
+    return None
+
+
+_DURATION_RE = re.compile(r'(?:(\d+(?:\.\d+)?)h)?(?:(\d+(?:\.\d+)?)m(?!s))?(?:(\d+(?:\.\d+)?)s)?(?:(\d+(?:\.\d+)?)ms)?')
+
+
+def _parse_reset(value: str | None) -> float | None:
+    """Parse the time in seconds until a limit is reset, from an OpenAI duration like `6m0s` or an RFC 3339 time."""
+    if not value:
+        return None
+    match = _DURATION_RE.fullmatch(value)
+    if match and any(match.groups()):
+        hours, minutes, seconds, milliseconds = (float(g) if g else 0.0 for g in match.groups())
+        return hours * 3600 + minutes * 60 + seconds + milliseconds / 1000
+    try:
+        reset_at = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max((reset_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _retry_after(headers: Headers) -> float:
+    """Parse the time in seconds to wait after a 429 response, from its `Retry-After` header."""
+    retry_after = headers.get('retry-after')
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                retry_at = cast(datetime, parsedate_to_datetime(retry_after))
+                return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+            except (ValueError, TypeError):
+                pass
+    return 1.0
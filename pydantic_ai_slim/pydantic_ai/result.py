@@ -19,6 +19,7 @@ from ._output import (
     TextOutputSchema,
     ToolOutputSchema,
 )
+from ._partial_json import PartialJsonScanner
 from ._run_context import AgentDepsT, RunContext
 from ._tool_manager import ToolManager
 from .messages import ModelResponseStreamEvent
@@ -54,6 +55,7 @@ class AgentStream(Generic[AgentDepsT, OutputDataT]):
 
     _agent_stream_iterator: AsyncIterator[ModelResponseStreamEvent] | None = field(default=None, init=False)
     _initial_run_ctx_usage: RunUsage = field(init=False)
+    _partial_tool_output: _PartialToolOutput[OutputDataT] | None = field(default=None, init=False)
 
     def __post_init__(self):
         self._initial_run_ctx_usage = deepcopy(self._run_ctx.usage)
@@ -153,6 +155,8 @@ class AgentStream(Generic[AgentDepsT, OutputDataT]):
                 raise exceptions.UnexpectedModelBehavior(  # pragma: no cover
                     f'Invalid response, unable to find tool call for {output_tool_name!r}'
                 )
+            if allow_partial and isinstance(tool_call.args, str):
+                return await self._validate_partial_tool_output(tool_call, tool_call.args)
             return await self._tool_manager.handle_call(
                 tool_call, allow_partial=allow_partial, wrap_validation_errors=False
             )
@@ -183,6 +187,29 @@ class AgentStream(Generic[AgentDepsT, OutputDataT]):
                 'Invalid response, unable to process text output'
             )
 
+    async def _validate_partial_tool_output(self, tool_call: _messages.ToolCallPart, args: str) -> OutputDataT:
+        """Validate the partial args of a streamed output tool call, unless they haven't meaningfully changed.
+
+        The JSON args are scanned incrementally as they come in, and if the stable prefix that partial validation
+        actually depends on is the same as the last time the tool call was validated, the previous output is reused.
+        """
+        previous = self._partial_tool_output
+        if (
+            previous is not None
+            and previous.tool_call_id == tool_call.tool_call_id
+            and args.startswith(previous.scanner.text)
+        ):
+            scanner = previous.scanner
+            if scanner.feed(args) == previous.stable_length:
+                return previous.output
+        else:
+            scanner = PartialJsonScanner()
+            scanner.feed(args)
+
+        output = await self._tool_manager.handle_call(tool_call, allow_partial=True, wrap_validation_errors=False)
+        self._partial_tool_output = _PartialToolOutput(tool_call.tool_call_id, scanner, scanner.stable_length, output)
+        return output
+
     async def _stream_response_text(
         self, *, delta: bool = False, debounce_by: float | None = 0.1
     ) -> AsyncIterator[str]:
@@ -252,6 +279,18 @@ class AgentStream(Generic[AgentDepsT, OutputDataT]):
         return self._agent_stream_iterator
 
 
+@dataclass
+class _PartialToolOutput(Generic[T]):
+    """The output of the last partial validation of a streamed output tool call."""
+
+    tool_call_id: str
+    scanner: PartialJsonScanner
+    """The scanner tracking the stable prefix of the tool call's JSON args."""
+    stable_length: int
+    """The length of the stable prefix of the args that were validated."""
+    output: T
+
+
 @dataclass(init=False)
 class StreamedRunResult(Generic[AgentDepsT, OutputDataT]):
     """Result of a streamed run that returns structured data via a tool call."""
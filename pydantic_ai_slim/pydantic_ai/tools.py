@@ -254,6 +254,7 @@ class Tool(Generic[AgentDepsT]):
     require_parameter_descriptions: bool
     strict: bool | None
     sequential: bool
+    side_effect_free: bool
     requires_approval: bool
     metadata: dict[str, Any] | None
     function_schema: _function_schema.FunctionSchema
@@ -277,6 +278,7 @@ class Tool(Generic[AgentDepsT]):
         schema_generator: type[GenerateJsonSchema] = GenerateToolJsonSchema,
         strict: bool | None = None,
         sequential: bool = False,
+        side_effect_free: bool = False,
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
         function_schema: _function_schema.FunctionSchema | None = None,
@@ -332,6 +334,8 @@ class Tool(Generic[AgentDepsT]):
             strict: Whether to enforce JSON schema compliance (only affects OpenAI).
                 See [`ToolDefinition`][pydantic_ai.tools.ToolDefinition] for more info.
             sequential: Whether the function requires a sequential/serial execution environment. Defaults to False.
+            side_effect_free: Whether the function has no side effects, so it can be called while the model is still streaming the rest of its response. Defaults to False.
+                See the [tools documentation](../tools-advanced.md#speculative-tool-calls) for more info.
             requires_approval: Whether this tool requires human-in-the-loop approval. Defaults to False.
                 See the [tools documentation](../deferred-tools.md#human-in-the-loop-tool-approval) for more info.
             metadata: Optional metadata for the tool. This is not sent to the model but can be used for filtering and tool behavior customization.
@@ -354,6 +358,7 @@ class Tool(Generic[AgentDepsT]):
         self.require_parameter_descriptions = require_parameter_descriptions
         self.strict = strict
         self.sequential = sequential
+        self.side_effect_free = side_effect_free
         self.requires_approval = requires_approval
         self.metadata = metadata
 
@@ -410,6 +415,7 @@ class Tool(Generic[AgentDepsT]):
             parameters_json_schema=self.function_schema.json_schema,
             strict=self.strict,
             sequential=self.sequential,
+            side_effect_free=self.side_effect_free,
             metadata=self.metadata,
         )
 
@@ -482,6 +488,12 @@ class ToolDefinition:
     sequential: bool = False
     """Whether this tool requires a sequential/serial execution environment."""
 
+    side_effect_free: bool = False
+    """Whether calls to this tool have no side effects, so they can be started before the model has finished its response.
+
+    See the [tools documentation](../tools-advanced.md#speculative-tool-calls) for more info.
+    """
+
     kind: ToolKind = field(default='function')
     """The kind of tool:
 
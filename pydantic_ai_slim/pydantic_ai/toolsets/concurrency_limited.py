@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import anyio
+
+from .._run_context import AgentDepsT, RunContext
+from .abstract import ToolsetTool
+from .wrapper import WrapperToolset
+
+
+@dataclass
+class ConcurrencyLimitedToolset(WrapperToolset[AgentDepsT]):
+    """A toolset that limits how many calls to the tools it contains can run at the same time.
+
+    The limits apply across all runs of the agents using the toolset, which makes this useful to protect a
+    rate-limited service that the tools call. Calls that can't start yet wait in the order they were made.
+
+    See [toolset docs](../toolsets.md#limiting-concurrency) for more information.
+    """
+
+    max_concurrency: int
+    """The maximum total weight of calls to this toolset's tools that can run at the same time."""
+    tool_max_concurrency: dict[str, int] = field(default_factory=dict)
+    """The maximum number of calls to specific tools that can run at the same time, keyed by tool name."""
+    tool_weights: dict[str, int] = field(default_factory=dict)
+    """How much of `max_concurrency` a call to a specific tool takes up, keyed by tool name.
+
+    Tools that aren't listed have a weight of 1. Weights larger than `max_concurrency` are capped to it, so the call
+    runs once no other calls are running.
+    """
+
+    _limiter: WeightedLimiter = field(init=False, repr=False)
+    _tool_limiters: dict[str, WeightedLimiter] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._limiter = WeightedLimiter(self.max_concurrency)
+        self._tool_limiters = {name: WeightedLimiter(limit) for name, limit in self.tool_max_concurrency.items()}
+
+    async def call_tool(
+        self, name: str, tool_args: dict[str, Any], ctx: RunContext[AgentDepsT], tool: ToolsetTool[AgentDepsT]
+    ) -> Any:
+        if tool_limiter := self._tool_limiters.get(name):
+            # Wait for a slot for this tool first, so the calls waiting for it don't hold up other tools
+            async with tool_limiter.acquire(1):
+                async with self._limiter.acquire(self.tool_weights.get(name, 1)):
+                    return await super().call_tool(name, tool_args, ctx, tool)
+        else:
+            async with self._limiter.acquire(self.tool_weights.get(name, 1)):
+                return await super().call_tool(name, tool_args, ctx, tool)
+
+
+class WeightedLimiter:
+    """A semaphore where each holder takes up a given weight of the total capacity.
+
+    Waiters are served in first-in, first-out order, so heavy holders aren't starved by a stream of light ones.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._used = 0
+        self._waiters: deque[tuple[int, anyio.Event]] = deque()
+
+    @property
+    def used(self) -> int:
+        """The total weight of the current holders."""
+        return self._used
+
+    @asynccontextmanager
+    async def acquire(self, weight: int) -> AsyncIterator[None]:
+        """Wait until `weight` of the capacity is available, and hold it for the duration of the context."""
+        weight = max(min(weight, self.capacity), 0)
+        if not self._waiters and self._used + weight <= self.capacity:
+            self._used += weight
+        else:
+            waiter = (weight, anyio.Event())
+            self._waiters.append(waiter)
+            try:
+                await waiter[1].wait()
+            except BaseException:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    self._wake_waiters()
+                else:  # pragma: no cover
+                    # The capacity was handed to us just as we were cancelled
+                    self._release(weight)
+                raise
+
+        try:
+            yield
+        finally:
+            self._release(weight)
+
+    def _release(self, weight: int) -> None:
+        self._used -= weight
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._used + self._waiters[0][0] <= self.capacity:
+            weight, event = self._waiters.popleft()
+            self._used += weight
+            event.set()
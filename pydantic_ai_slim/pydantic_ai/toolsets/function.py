@@ -50,6 +50,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
         schema_generator: type[GenerateJsonSchema] = GenerateToolJsonSchema,
         strict: bool | None = None,
         sequential: bool = False,
+        side_effect_free: bool = False,
         requires_approval: bool = False,
         metadata: dict[str, Any] | None = None,
         id: str | None = None,
@@ -71,6 +72,9 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
                 See [`ToolDefinition`][pydantic_ai.tools.ToolDefinition] for more info.
             sequential: Whether the function requires a sequential/serial execution environment. Defaults to False.
                 Applies to all tools, unless overridden when adding a tool.
+            side_effect_free: Whether the function has no side effects, so it can be called while the model is still streaming the rest of its response. Defaults to False.
+                See the [tools documentation](../tools-advanced.md#speculative-tool-calls) for more info.
+                Applies to all tools, unless overridden when adding a tool.
             requires_approval: Whether this tool requires human-in-the-loop approval. Defaults to False.
                 See the [tools documentation](../deferred-tools.md#human-in-the-loop-tool-approval) for more info.
                 Applies to all tools, unless overridden when adding a tool.
@@ -86,6 +90,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
         self.schema_generator = schema_generator
         self.strict = strict
         self.sequential = sequential
+        self.side_effect_free = side_effect_free
         self.requires_approval = requires_approval
         self.metadata = metadata
 
@@ -116,6 +121,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
         schema_generator: type[GenerateJsonSchema] | None = None,
         strict: bool | None = None,
         sequential: bool | None = None,
+        side_effect_free: bool | None = None,
         requires_approval: bool | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> Callable[[ToolFuncEither[AgentDepsT, ToolParams]], ToolFuncEither[AgentDepsT, ToolParams]]: ...
@@ -133,6 +139,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
         schema_generator: type[GenerateJsonSchema] | None = None,
         strict: bool | None = None,
         sequential: bool | None = None,
+        side_effect_free: bool | None = None,
         requires_approval: bool | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> Any:
@@ -185,6 +192,9 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
                 If `None`, the default value is determined by the toolset.
             sequential: Whether the function requires a sequential/serial execution environment. Defaults to False.
                 If `None`, the default value is determined by the toolset.
+            side_effect_free: Whether the function has no side effects, so it can be called while the model is still streaming the rest of its response. Defaults to False.
+                See the [tools documentation](../tools-advanced.md#speculative-tool-calls) for more info.
+                If `None`, the default value is determined by the toolset.
             requires_approval: Whether this tool requires human-in-the-loop approval. Defaults to False.
                 See the [tools documentation](../deferred-tools.md#human-in-the-loop-tool-approval) for more info.
                 If `None`, the default value is determined by the toolset.
@@ -209,6 +219,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
                 sequential,
                 requires_approval,
                 metadata,
+                side_effect_free=side_effect_free,
             )
             return func_
 
@@ -228,6 +239,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
         sequential: bool | None = None,
         requires_approval: bool | None = None,
         metadata: dict[str, Any] | None = None,
+        side_effect_free: bool | None = None,
     ) -> None:
         """Add a function as a tool to the toolset.
 
@@ -261,6 +273,9 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
                 If `None`, the default value is determined by the toolset.
             metadata: Optional metadata for the tool. This is not sent to the model but can be used for filtering and tool behavior customization.
                 If `None`, the default value is determined by the toolset. If provided, it will be merged with the toolset's metadata.
+            side_effect_free: Whether the function has no side effects, so it can be called while the model is still streaming the rest of its response. Defaults to False.
+                See the [tools documentation](../tools-advanced.md#speculative-tool-calls) for more info.
+                If `None`, the default value is determined by the toolset.
         """
         if docstring_format is None:
             docstring_format = self.docstring_format
@@ -272,6 +287,8 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
             strict = self.strict
         if sequential is None:
             sequential = self.sequential
+        if side_effect_free is None:
+            side_effect_free = self.side_effect_free
         if requires_approval is None:
             requires_approval = self.requires_approval
 
@@ -286,6 +303,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
             schema_generator=schema_generator,
             strict=strict,
             sequential=sequential,
+            side_effect_free=side_effect_free,
             requires_approval=requires_approval,
             metadata=metadata,
         )
@@ -0,0 +1,83 @@
+from __future__ import annotations as _annotations
+
+import hashlib
+import json
+import os
+import warnings
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import PydanticSerializationError, to_json
+
+from .reporting import ReportCase, ReportCaseAdapter
+
+__all__ = ('CheckpointJournal',)
+
+
+class CheckpointJournal:
+    """An append-only journal of the cases that were completed in evaluation runs, so that a run can be resumed.
+
+    Each line of the journal is a JSON object with the task name, the case name, a hash of the case inputs, and the
+    report case. Every line is written with a single `write` to a file opened in append mode, so that several
+    processes can share a journal without their lines getting mixed up. Lines that can't be read, like one that was
+    cut off because a process was killed while writing it, are ignored.
+    """
+
+    def __init__(self, path: Path | str, task_name: str):
+        self.path = Path(path)
+        self.task_name = task_name
+
+    def load(
+        self, case_adapter: TypeAdapter[ReportCase[Any, Any, Any]]
+    ) -> dict[tuple[str, str], ReportCase[Any, Any, Any]]:
+        """Load the cases completed for this journal's task, keyed by `(case name, inputs hash)`."""
+        completed: dict[tuple[str, str], ReportCase[Any, Any, Any]] = {}
+        if not self.path.exists():
+            return completed
+
+        line = b'\n'
+        with self.path.open('rb') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    if entry['task_name'] != self.task_name:
+                        continue
+                    case = case_adapter.validate_python(entry['case'])
+                    completed[(entry['case_name'], entry['inputs_hash'])] = case
+                except (ValueError, KeyError, TypeError, ValidationError):
+                    continue
+
+        if not line.endswith(b'\n'):
+            # end the line that was cut off, so that the next case is written to a line of its own
+            self._append(b'\n')
+        return completed
+
+    def record(self, case_name: str, inputs_hash: str, case: ReportCase[Any, Any, Any]) -> None:
+        """Append a completed case to the journal."""
+        try:
+            line = to_json(
+                {
+                    'task_name': self.task_name,
+                    'case_name': case_name,
+                    'inputs_hash': inputs_hash,
+                    'case': ReportCaseAdapter.dump_python(case, mode='json'),
+                }
+            )
+        except PydanticSerializationError as e:
+            warnings.warn(f'Case {case_name!r} could not be written to the checkpoint journal: {e}', stacklevel=2)
+            return
+
+        self._append(line + b'\n')
+
+    def _append(self, data: bytes) -> None:
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def inputs_hash(inputs: Any) -> str:
+        """Hash the inputs of a case, so that a case whose inputs changed since it was journaled is run again."""
+        return hashlib.sha256(to_json(inputs, fallback=repr)).hexdigest()
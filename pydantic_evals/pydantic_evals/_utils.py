@@ -3,7 +3,7 @@ from __future__ import annotations as _annotations
 import asyncio
 import inspect
 import warnings
-from collections.abc import Awaitable, Callable, Generator, Sequence
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Generator, Iterable, Sequence
 from contextlib import contextmanager
 from functools import partial
 from pathlib import Path
@@ -110,6 +110,55 @@ async def task_group_gather(tasks: Sequence[Callable[[], Awaitable[T]]]) -> list
     return results
 
 
+async def task_group_map(
+    items: Iterable[T] | AsyncIterable[T],
+    func: Callable[[T], Awaitable[None]],
+    max_concurrency: int | None = None,
+) -> None:
+    """Call an async function on each item concurrently using an AnyIO task group.
+
+    Items are only pulled from `items` when a call can be started, so that no more than `max_concurrency` items
+    are in memory at once.
+
+    Args:
+        items: The items to call the function on, which may be an iterator that produces them lazily.
+        func: The async function to call on each item.
+        max_concurrency: The maximum number of concurrent calls. If None, all calls are started at once.
+    """
+    iterator = _as_async_iterator(items)
+
+    async with anyio.create_task_group() as tg:
+        if max_concurrency is None:
+            async for item in iterator:
+                tg.start_soon(func, item)
+            return
+
+        lock = anyio.Lock()
+
+        async def _worker() -> None:
+            while True:
+                async with lock:
+                    try:
+                        item = await anext(iterator)
+                    except StopAsyncIteration:
+                        return
+                await func(item)
+
+        for _ in range(max_concurrency):
+            tg.start_soon(_worker)
+
+
+def _as_async_iterator(items: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        return aiter(items)
+
+    async def _iterate() -> AsyncIterator[T]:
+        for item in items:
+            yield item
+
+    return _iterate()
+
+
 try:
     from logfire._internal.config import (
         LogfireNotConfiguredWarning,  # pyright: ignore[reportAssignmentType,reportPrivateImportUsage]
@@ -9,24 +9,27 @@ a task function to produce an evaluation report.
 
 from __future__ import annotations as _annotations
 
+import asyncio
 import functools
 import inspect
+import multiprocessing
+import os
 import sys
 import time
 import traceback
 import warnings
-from collections.abc import Awaitable, Callable, Mapping, Sequence
-from contextlib import AsyncExitStack, nullcontext
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Mapping, Sequence, Sized
+from contextlib import nullcontext
 from contextvars import ContextVar
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from inspect import iscoroutinefunction
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, Literal, Union, cast
 
-import anyio
 import logfire_api
 import yaml
 from anyio import to_thread
+from opentelemetry import context as otel_context, propagate
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, model_serializer
 from pydantic._internal import _typing_extra
 from pydantic_core import to_json
@@ -36,7 +39,8 @@ from typing_extensions import NotRequired, Self, TypedDict, TypeVar
 
 from pydantic_evals._utils import get_event_loop
 
-from ._utils import get_unwrapped_function_name, logfire_span, task_group_gather
+from ._checkpoint import CheckpointJournal
+from ._utils import get_unwrapped_function_name, logfire_span, task_group_gather, task_group_map
 from .evaluators import EvaluationResult, Evaluator
 from .evaluators._run_evaluator import run_evaluator
 from .evaluators.common import DEFAULT_EVALUATORS
@@ -45,7 +49,17 @@ from .evaluators.evaluator import EvaluatorFailure
 from .evaluators.spec import EvaluatorSpec
 from .otel import SpanTree
 from .otel._context_subtree import context_subtree
-from .reporting import EvaluationReport, ReportCase, ReportCaseAggregate, ReportCaseFailure
+from .reporting import (
+    EvaluationReport,
+    EvaluationReportAdapter,
+    EvaluationSummary,
+    JSONLReportCaseSink,
+    ReportCase,
+    ReportCaseAggregate,
+    ReportCaseAggregator,
+    ReportCaseFailure,
+    ReportCaseSink,
+)
 
 if TYPE_CHECKING:
     from pydantic_ai.retries import RetryConfig
@@ -265,12 +279,18 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
         retry_evaluators: RetryConfig | None = None,
         *,
         task_name: str | None = None,
+        checkpoint: Path | str | None = None,
     ) -> EvaluationReport[InputsT, OutputT, MetadataT]:
         """Evaluates the test cases in the dataset using the given task.
 
         This method runs the task on each case in the dataset, applies evaluators,
         and collects results into a report. Cases are run concurrently, limited by `max_concurrency` if specified.
 
+        If a `checkpoint` path is given, every case that's evaluated successfully is appended to a journal at that path.
+        When the evaluation is run again with the same checkpoint, for example after it was interrupted, the cases
+        found in the journal for the same task name, case name and inputs aren't run again, and their journaled results
+        are included in the report instead. Cases whose task raised an exception are run again.
+
         Args:
             task: The task to evaluate. This should be a callable that takes the inputs of the case
                 and returns the output.
@@ -283,6 +303,8 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             retry_evaluators: Optional retry configuration for evaluator execution.
             task_name: Optional override to the name of the task being executed, otherwise the name of the task
                 function will be used.
+            checkpoint: Optional path of a journal to record completed cases in and to resume the evaluation from.
+                The journal is append-only and can be shared by evaluations running concurrently.
 
         Returns:
             A report containing the results of the evaluation.
@@ -290,10 +312,10 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
         task_name = task_name or get_unwrapped_function_name(task)
         name = name or task_name
         total_cases = len(self.cases)
+        journal = CheckpointJournal(checkpoint, task_name) if checkpoint is not None else None
+        completed = journal.load(self._report_case_adapter()) if journal is not None else {}
         progress_bar = Progress() if progress else None
 
-        limiter = anyio.Semaphore(max_concurrency) if max_concurrency is not None else AsyncExitStack()
-
         with (
             logfire_span(
                 'evaluate {name}',
@@ -306,31 +328,32 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             progress_bar or nullcontext(),
         ):
             task_id = progress_bar.add_task(f'Evaluating {task_name}', total=total_cases) if progress_bar else None
-
-            async def _handle_case(case: Case[InputsT, OutputT, MetadataT], report_case_name: str):
-                async with limiter:
+            results: list[ReportCase | ReportCaseFailure | None] = [None] * total_cases
+
+            async def _handle_case(item: tuple[int, Case[InputsT, OutputT, MetadataT]]) -> None:
+                i, case = item
+                report_case_name = case.name or f'Case {i}'
+                inputs_hash = CheckpointJournal.inputs_hash(case.inputs) if journal is not None else ''
+                if (journaled := completed.get((report_case_name, inputs_hash))) is not None:
+                    results[i - 1] = replace(
+                        journaled, inputs=case.inputs, metadata=case.metadata, expected_output=case.expected_output
+                    )
+                else:
                     result = await _run_task_and_evaluators(
                         task, case, report_case_name, self.evaluators, retry_task, retry_evaluators
                     )
-                    if progress_bar and task_id is not None:  # pragma: no branch
-                        progress_bar.update(task_id, advance=1)
-                    return result
-
-            if (context := eval_span.context) is None:  # pragma: no cover
-                trace_id = None
-                span_id = None
-            else:
-                trace_id = f'{context.trace_id:032x}'
-                span_id = f'{context.span_id:016x}'
-            cases_and_failures = await task_group_gather(
-                [
-                    lambda case=case, i=i: _handle_case(case, case.name or f'Case {i}')
-                    for i, case in enumerate(self.cases, 1)
-                ]
-            )
+                    if journal is not None and isinstance(result, ReportCase):
+                        journal.record(report_case_name, inputs_hash, result)
+                    results[i - 1] = result
+                if progress_bar and task_id is not None:  # pragma: no branch
+                    progress_bar.update(task_id, advance=1)
+
+            trace_id, span_id = _get_span_ids(eval_span)
+            await task_group_map(enumerate(self.cases, 1), _handle_case, max_concurrency)
             cases: list[ReportCase] = []
             failures: list[ReportCaseFailure] = []
-            for item in cases_and_failures:
+            for item in results:
+                assert item is not None, 'every case has a result once the task group is done'
                 if isinstance(item, ReportCase):
                     cases.append(item)
                 else:
@@ -346,6 +369,223 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
                 eval_span.set_attribute('assertion_pass_rate', averages.assertions)
         return report
 
+    async def evaluate_streaming(
+        self,
+        task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
+        sink: ReportCaseSink | Path | str,
+        *,
+        cases: Iterable[Case[InputsT, OutputT, MetadataT]]
+        | AsyncIterable[Case[InputsT, OutputT, MetadataT]]
+        | None = None,
+        name: str | None = None,
+        task_name: str | None = None,
+        max_concurrency: int = 10,
+        progress: bool = True,
+        retry_task: RetryConfig | None = None,
+        retry_evaluators: RetryConfig | None = None,
+    ) -> EvaluationSummary:
+        """Evaluates the test cases using the given task, writing the result of each case to a sink as it completes.
+
+        Unlike [`evaluate`][pydantic_evals.Dataset.evaluate], the results aren't kept in memory, so this can be used for
+        datasets that are too large to hold a report of. Cases are pulled from `cases` only when one of the
+        `max_concurrency` workers is free to run them, and the averages of the results are updated as they complete.
+
+        Results are written in the order in which they complete, which isn't necessarily the order of the cases.
+
+        Args:
+            task: The task to evaluate. This should be a callable that takes the inputs of the case
+                and returns the output.
+            sink: Where to write the result of each case. If a path is given, the results are appended to a JSON Lines
+                file using a [`JSONLReportCaseSink`][pydantic_evals.reporting.JSONLReportCaseSink].
+            cases: The cases to evaluate, which may be a (sync or async) iterator that produces them lazily.
+                If omitted, the cases of the dataset are evaluated. Cases without a name are named by their position.
+            name: The name of the experiment being run, this is used to identify the experiment in the summary.
+                If omitted, the task_name will be used; if that is not specified, the name of the task function is used.
+            task_name: Optional override to the name of the task being executed, otherwise the name of the task
+                function will be used.
+            max_concurrency: The maximum number of concurrent evaluations of the task to allow.
+            progress: Whether to show a progress bar for the evaluation. Defaults to `True`.
+            retry_task: Optional retry configuration for the task execution.
+            retry_evaluators: Optional retry configuration for evaluator execution.
+
+        Returns:
+            A summary of the evaluation, with the averages of the cases that were evaluated successfully.
+        """
+        task_name = task_name or get_unwrapped_function_name(task)
+        name = name or task_name
+        if cases is None:
+            cases = self.cases
+        total_cases = len(cases) if isinstance(cases, Sized) else None
+        progress_bar = Progress() if progress else None
+        aggregator = ReportCaseAggregator()
+        n_failures = 0
+
+        with (
+            logfire_span(
+                'evaluate {name}',
+                name=name,
+                task_name=task_name,
+                dataset_name=self.name,
+                n_cases=total_cases,
+                **{'gen_ai.operation.name': 'experiment'},  # pyright: ignore[reportArgumentType]
+            ) as eval_span,
+            progress_bar or nullcontext(),
+            JSONLReportCaseSink(sink) if isinstance(sink, Path | str) else nullcontext(sink) as case_sink,
+        ):
+            task_id = progress_bar.add_task(f'Evaluating {task_name}', total=total_cases) if progress_bar else None
+
+            async def _handle_case(item: tuple[int, Case[InputsT, OutputT, MetadataT]]) -> None:
+                nonlocal n_failures
+                i, case = item
+                result = await _run_task_and_evaluators(
+                    task, case, case.name or f'Case {i}', self.evaluators, retry_task, retry_evaluators
+                )
+                case_sink.write(result)
+                if isinstance(result, ReportCase):
+                    aggregator.add(result)
+                else:
+                    n_failures += 1
+                if progress_bar and task_id is not None:  # pragma: no branch
+                    progress_bar.update(task_id, advance=1)
+
+            trace_id, span_id = _get_span_ids(eval_span)
+            await task_group_map(_enumerate_cases(cases), _handle_case, max_concurrency)
+            averages = aggregator.aggregate() if aggregator.count else None
+            if averages is not None and averages.assertions is not None:
+                eval_span.set_attribute('assertion_pass_rate', averages.assertions)
+        return EvaluationSummary(
+            name=name,
+            n_cases=aggregator.count,
+            n_failures=n_failures,
+            averages=averages,
+            trace_id=trace_id,
+            span_id=span_id,
+        )
+
+    async def evaluate_sharded(
+        self,
+        task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
+        *,
+        processes: int | None = None,
+        name: str | None = None,
+        task_name: str | None = None,
+        max_concurrency: int | None = None,
+        retry_task: RetryConfig | None = None,
+        retry_evaluators: RetryConfig | None = None,
+        checkpoint: Path | str | None = None,
+    ) -> EvaluationReport[InputsT, OutputT, MetadataT]:
+        """Evaluates the test cases in the dataset using the given task, split into shards that run in a process pool.
+
+        Each process evaluates one [shard][pydantic_evals.Dataset.shard] of the cases with
+        [`evaluate`][pydantic_evals.Dataset.evaluate] in its own event loop, so that CPU-heavy tasks and evaluators
+        aren't limited by the GIL. The reports of the shards are sent back serialized as JSON and merged into one
+        report, with the cases in the order of the dataset.
+
+        The processes are started with the `spawn` method, so the task, the dataset's cases and evaluators need to be
+        picklable, which means defined at the top level of a module, and the outputs of the task need to be
+        serializable by Pydantic. The spans of the shards are children of this evaluation's span, as long as
+        OpenTelemetry or Logfire is also configured at the top level of the module, so that it's configured in every
+        process.
+
+        Args:
+            task: The task to evaluate. This should be a callable that takes the inputs of the case
+                and returns the output.
+            processes: The number of processes, and so shards, to use. Defaults to the number of CPUs.
+            name: The name of the experiment being run, this is used to identify the experiment in the report.
+                If omitted, the task_name will be used; if that is not specified, the name of the task function is used.
+            task_name: Optional override to the name of the task being executed, otherwise the name of the task
+                function will be used.
+            max_concurrency: The maximum number of concurrent evaluations of the task to allow in each process.
+                If None, all cases of a shard will be evaluated concurrently.
+            retry_task: Optional retry configuration for the task execution.
+            retry_evaluators: Optional retry configuration for evaluator execution.
+            checkpoint: Optional path of a journal to record completed cases in and to resume the evaluation from,
+                shared by all processes. See [`evaluate`][pydantic_evals.Dataset.evaluate].
+
+        Returns:
+            A report containing the results of the evaluation.
+        """
+        task_name = task_name or get_unwrapped_function_name(task)
+        name = name or task_name
+        processes = min(processes or os.cpu_count() or 1, max(len(self.cases), 1))
+
+        with logfire_span(
+            'evaluate {name}',
+            name=name,
+            task_name=task_name,
+            dataset_name=self.name,
+            n_cases=len(self.cases),
+            n_shards=processes,
+            **{'gen_ai.operation.name': 'experiment'},  # pyright: ignore[reportArgumentType]
+        ) as eval_span:
+            trace_id, span_id = _get_span_ids(eval_span)
+            carrier: dict[str, str] = {}
+            propagate.inject(carrier)
+            evaluate_kwargs: dict[str, Any] = dict(
+                task_name=task_name,
+                max_concurrency=max_concurrency,
+                retry_task=retry_task,
+                retry_evaluators=retry_evaluators,
+                checkpoint=checkpoint,
+            )
+
+            with multiprocessing.get_context('spawn').Pool(processes) as pool:
+                results = [
+                    pool.apply_async(
+                        _evaluate_shard,
+                        (
+                            self.name,
+                            self.shard(index, processes).cases,
+                            self.evaluators,
+                            task,
+                            evaluate_kwargs,
+                            carrier,
+                        ),
+                    )
+                    for index in range(processes)
+                ]
+                shard_reports = await task_group_gather(
+                    [lambda result=result: to_thread.run_sync(result.get) for result in results]
+                )
+
+            report_adapter = TypeAdapter(EvaluationReport[self._typed_params()])
+            report = EvaluationReport.merge(
+                [report_adapter.validate_json(shard_report) for shard_report in shard_reports], name=name
+            )
+            # put the cases back in the order of the dataset
+            positions = {case.name or f'Case {i}': i for i, case in enumerate(self.cases, 1)}
+            report.cases.sort(key=lambda case: positions.get(case.name, 0))
+            report.failures.sort(key=lambda failure: positions.get(failure.name, 0))
+            report.trace_id = trace_id
+            report.span_id = span_id
+            if (averages := report.averages()) is not None and averages.assertions is not None:
+                eval_span.set_attribute('assertion_pass_rate', averages.assertions)
+        return report
+
+    def shard(self, index: int, count: int) -> Self:
+        """Get one of `count` shards of this dataset, to evaluate a large dataset in several processes or on several hosts.
+
+        Cases are assigned to shards round-robin by their position in the dataset, so every case is in exactly one
+        shard. Cases without a name are named by their position in the whole dataset, so they have the same name in
+        the report of their shard as in a report of the whole dataset, and the reports of the shards can be combined
+        with [`EvaluationReport.merge`][pydantic_evals.reporting.EvaluationReport.merge].
+
+        Args:
+            index: The index of the shard, from 0 to `count - 1`.
+            count: The number of shards.
+
+        Returns:
+            A dataset with the cases of the shard and the same evaluators as this dataset.
+        """
+        if count < 1 or not 0 <= index < count:
+            raise ValueError(f'Shard index must be between 0 and {count - 1}, got {index}')
+        cases = [
+            case if case.name is not None else replace(case, name=f'Case {i}')
+            for i, case in enumerate(self.cases, 1)
+            if (i - 1) % count == index
+        ]
+        return type(self)(name=self.name, cases=cases, evaluators=self.evaluators)
+
     def evaluate_sync(
         self,
         task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
@@ -354,6 +594,8 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
         progress: bool = True,
         retry_task: RetryConfig | None = None,
         retry_evaluators: RetryConfig | None = None,
+        *,
+        checkpoint: Path | str | None = None,
     ) -> EvaluationReport[InputsT, OutputT, MetadataT]:
         """Evaluates the test cases in the dataset using the given task.
 
@@ -369,6 +611,7 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             progress: Whether to show a progress bar for the evaluation. Defaults to True.
             retry_task: Optional retry configuration for the task execution.
             retry_evaluators: Optional retry configuration for evaluator execution.
+            checkpoint: Optional path of a journal to record completed cases in and to resume the evaluation from.
 
         Returns:
             A report containing the results of the evaluation.
@@ -381,6 +624,7 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
                 progress=progress,
                 retry_task=retry_task,
                 retry_evaluators=retry_evaluators,
+                checkpoint=checkpoint,
             )
         )
 
@@ -465,6 +709,17 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             )
             return Any, Any, Any  # type: ignore
 
+    @classmethod
+    def _typed_params(cls) -> tuple[type[InputsT], type[OutputT], type[MetadataT]]:
+        """Get the type parameters for validating results, which are `Any` if the class isn't parametrized."""
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            return cls._params()
+
+    @classmethod
+    def _report_case_adapter(cls) -> TypeAdapter[ReportCase[InputsT, OutputT, MetadataT]]:
+        return TypeAdapter(ReportCase[cls._typed_params()])  # pyright: ignore
+
     @classmethod
     def from_file(
         cls,
@@ -951,6 +1206,46 @@ async def _run_task(
     )
 
 
+def _evaluate_shard(
+    name: str | None,
+    cases: list[Case[Any, Any, Any]],
+    evaluators: list[Evaluator[Any, Any, Any]],
+    task: Callable[[Any], Awaitable[Any]] | Callable[[Any], Any],
+    evaluate_kwargs: dict[str, Any],
+    carrier: dict[str, str],
+) -> bytes:
+    """Evaluate a shard of a dataset in a worker process, and return the report serialized as JSON."""
+    dataset = Dataset[Any, Any, Any](name=name, cases=cases, evaluators=evaluators)
+    token = otel_context.attach(propagate.extract(carrier))
+    try:
+        report = asyncio.run(dataset.evaluate(task, progress=False, **evaluate_kwargs))
+    finally:
+        otel_context.detach(token)
+    return EvaluationReportAdapter.dump_json(report)
+
+
+def _get_span_ids(span: logfire_api.LogfireSpan) -> tuple[str | None, str | None]:
+    """Get the trace ID and span ID of a span as hex strings."""
+    if (context := span.context) is None:  # pragma: no cover
+        return None, None
+    return f'{context.trace_id:032x}', f'{context.span_id:016x}'
+
+
+async def _enumerate_cases(
+    cases: Iterable[Case[InputsT, OutputT, MetadataT]] | AsyncIterable[Case[InputsT, OutputT, MetadataT]],
+) -> AsyncIterator[tuple[int, Case[InputsT, OutputT, MetadataT]]]:
+    """Number the cases from 1, so that cases without a name can be named by their position."""
+    i = 0
+    if isinstance(cases, AsyncIterable):
+        async for case in cases:
+            i += 1
+            yield i, case
+    else:
+        for case in cases:
+            i += 1
+            yield i, case
+
+
 async def _run_task_and_evaluators(
     task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
     case: Case[InputsT, OutputT, MetadataT],
@@ -1,7 +1,9 @@
-from .span_tree import SpanNode, SpanQuery, SpanTree
+from .span_tree import CompiledSpanQuery, SpanNode, SpanQuery, SpanTree, compile_span_query
 
 __all__ = (
     'SpanTree',
     'SpanNode',
     'SpanQuery',
+    'CompiledSpanQuery',
+    'compile_span_query',
 )
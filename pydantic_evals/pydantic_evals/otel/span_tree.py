@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import bisect
+import heapq
 import re
-from collections.abc import Callable, Iterator, Sequence
+import weakref
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from functools import cache
 from textwrap import indent
 from typing import TYPE_CHECKING, Any
 
@@ -19,7 +21,7 @@ if TYPE_CHECKING:  # pragma: no cover
 AttributeValue = str | bool | int | float | Sequence[str] | Sequence[bool] | Sequence[int] | Sequence[float]
 
 
-__all__ = 'SpanNode', 'SpanTree', 'SpanQuery'
+__all__ = 'SpanNode', 'SpanTree', 'SpanQuery', 'CompiledSpanQuery', 'compile_span_query'
 
 
 class SpanQuery(TypedDict, total=False):
@@ -28,7 +30,7 @@ class SpanQuery(TypedDict, total=False):
     All fields are optional and combined with AND logic by default.
     """
 
-    # These fields are ordered to match the implementation of SpanNode.matches_query for easy review.
+    # These fields are ordered to match the implementation of CompiledSpanQuery for easy review.
     # * Individual span conditions come first because these are generally the cheapest to evaluate
     # * Logical combinations come next because they may just be combinations of individual span conditions
     # * Related-span conditions come last because they may require the most work to evaluate
@@ -97,17 +99,39 @@ class SpanNode:
 
     @property
     def children(self) -> list[SpanNode]:
-        return list(self.children_by_id.values())
+        """Return the children of this node, ordered by start time.
+
+        The list is cached until a child is added, so it shouldn't be modified.
+        """
+        if self._children is None:
+            self._children = list(self.children_by_id.values())
+        return self._children
 
     @property
     def descendants(self) -> list[SpanNode]:
-        """Return all descendants of this node in DFS order."""
-        return self.find_descendants(lambda _: True)
+        """Return all descendants of this node in DFS order.
+
+        The list is cached until a descendant is added, so it shouldn't be modified.
+        """
+        if self._descendants is None:
+            index = self.tree_index
+            subtree = index.subtree_range(self) if index is not None else None
+            if index is not None and subtree is not None:
+                start, end = subtree
+                self._descendants = index.euler_tour()[start + 1 : end]
+            else:
+                self._descendants = list(self._walk_descendants(None))
+        return self._descendants
 
     @property
     def ancestors(self) -> list[SpanNode]:
-        """Return all ancestors of this node."""
-        return self.find_ancestors(lambda _: True)
+        """Return all ancestors of this node.
+
+        The list is cached until this node or one of its ancestors is added to a parent, so it shouldn't be modified.
+        """
+        if self._ancestors is None:
+            self._ancestors = list(self._filter_ancestors(lambda _: True, None))
+        return self._ancestors
 
     @property
     def node_key(self) -> str:
@@ -123,6 +147,11 @@ class SpanNode:
     def __post_init__(self):
         self.parent: SpanNode | None = None
         self.children_by_id: dict[str, SpanNode] = {}
+        self._children: list[SpanNode] | None = None
+        self._descendants: list[SpanNode] | None = None
+        self._ancestors: list[SpanNode] | None = None
+        # The indexes of the tree this node was added to, which are used to speed up descendant queries
+        self.tree_index: _TreeIndex | None = None
 
     @staticmethod
     def from_readable_span(span: ReadableSpan) -> SpanNode:
@@ -145,9 +174,31 @@ class SpanNode:
         assert child.parent_span_id == self.span_id, (
             f'parent span mismatch: {child.parent_span_id:016x} != {self.span_id:016x}'
         )
-        self.children_by_id[child.node_key] = child
+        key = child.node_key
+        children = self.children
+        if key not in self.children_by_id and children and child.start_timestamp < children[-1].start_timestamp:
+            # keep the children ordered by start time when a child arrives late
+            index = bisect.bisect_right(children, child.start_timestamp, key=_start_timestamp)
+            items = list(self.children_by_id.items())
+            items.insert(index, (key, child))
+            self.children_by_id = dict(items)
+        else:
+            self.children_by_id[key] = child
         child.parent = self
 
+        self._children = None
+        node: SpanNode | None = self
+        while node is not None:
+            node._descendants = None
+            node = node.parent
+        stack = [child]
+        while stack:
+            node = stack.pop()
+            node._ancestors = None
+            stack.extend(node.children_by_id.values())
+        if self.tree_index is not None:
+            self.tree_index.changed()
+
     # -------------------------------------------------------------------------
     # Child queries
     # -------------------------------------------------------------------------
@@ -164,7 +215,8 @@ class SpanNode:
         return self.first_child(predicate) is not None
 
     def _filter_children(self, predicate: SpanQuery | SpanPredicate) -> Iterator[SpanNode]:
-        return (child for child in self.children if child.matches(predicate))
+        predicate = _as_predicate(predicate)
+        return (child for child in self.children if predicate(child))
 
     # -------------------------------------------------------------------------
     # Descendant queries (DFS)
@@ -185,20 +237,44 @@ class SpanNode:
         self, predicate: SpanQuery | SpanPredicate, stop_recursing_when: SpanQuery | SpanPredicate | None = None
     ) -> bool:
         """Returns `True` if there is at least one descendant that satisfies the predicate."""
+        predicate = _as_predicate(predicate)
+        if stop_recursing_when is None and isinstance(predicate, CompiledSpanQuery):
+            # the order doesn't matter, so the tree's indexes can be used to find a matching descendant
+            return next(self._descendants_matching(predicate), None) is not None
         return self.first_descendant(predicate, stop_recursing_when) is not None
 
     def _filter_descendants(
         self, predicate: SpanQuery | SpanPredicate, stop_recursing_when: SpanQuery | SpanPredicate | None
     ) -> Iterator[SpanNode]:
+        predicate = _as_predicate(predicate)
+        nodes = self.descendants if stop_recursing_when is None else self._walk_descendants(stop_recursing_when)
+        return (node for node in nodes if predicate(node))
+
+    def _walk_descendants(self, stop_recursing_when: SpanQuery | SpanPredicate | None) -> Iterator[SpanNode]:
+        stop = None if stop_recursing_when is None else _as_predicate(stop_recursing_when)
         stack = list(self.children)
         while stack:
             node = stack.pop()
-            if node.matches(predicate):
-                yield node
-            if stop_recursing_when is not None and node.matches(stop_recursing_when):
+            yield node
+            if stop is not None and stop(node):
                 continue
             stack.extend(node.children)
 
+    def _descendants_matching(self, query: CompiledSpanQuery) -> Iterator[SpanNode]:
+        """Yield the descendants that match a query.
+
+        If this node belongs to a tree, the tree's indexes narrow down the nodes to check, and the Euler tour of the
+        tree tells which of them are descendants of this node.
+        """
+        index = self.tree_index
+        subtree = index.subtree_range(self) if index is not None else None
+        candidates = index.query_candidates(query) if index is not None and subtree is not None else None
+        if index is None or subtree is None or candidates is None or len(candidates) >= subtree[1] - subtree[0] - 1:
+            return (node for node in self.descendants if query(node))
+        start, end = subtree
+        subtrees = index.subtrees
+        return (node for node in candidates if start < subtrees[id(node)][0] < end and query(node))
+
     # -------------------------------------------------------------------------
     # Ancestor queries (DFS "up" the chain)
     # -------------------------------------------------------------------------
@@ -223,11 +299,13 @@ class SpanNode:
     def _filter_ancestors(
         self, predicate: SpanQuery | SpanPredicate, stop_recursing_when: SpanQuery | SpanPredicate | None
     ) -> Iterator[SpanNode]:
+        predicate = _as_predicate(predicate)
+        stop = None if stop_recursing_when is None else _as_predicate(stop_recursing_when)
         node = self.parent
         while node:
-            if node.matches(predicate):
+            if predicate(node):
                 yield node
-            if stop_recursing_when is not None and node.matches(stop_recursing_when):
+            if stop is not None and stop(node):
                 break
             node = node.parent
 
@@ -235,135 +313,15 @@ class SpanNode:
     # Query matching
     # -------------------------------------------------------------------------
     def matches(self, query: SpanQuery | SpanPredicate) -> bool:
-        """Check if the span node matches the query conditions or predicate."""
+        """Check if the span node matches the query conditions or predicate.
+
+        To check many nodes against the same query, compile it once with
+        [`compile_span_query`][pydantic_evals.otel.span_tree.compile_span_query] and pass the result instead.
+        """
         if callable(query):
             return query(self)
 
-        return self._matches_query(query)
-
-    def _matches_query(self, query: SpanQuery) -> bool:  # noqa C901
-        """Check if the span matches the query conditions."""
-        # Logical combinations
-        if or_ := query.get('or_'):
-            if len(query) > 1:
-                raise ValueError("Cannot combine 'or_' conditions with other conditions at the same level")
-            return any(self._matches_query(q) for q in or_)
-        if not_ := query.get('not_'):
-            if self._matches_query(not_):
-                return False
-        if and_ := query.get('and_'):
-            results = [self._matches_query(q) for q in and_]
-            if not all(results):
-                return False
-        # At this point, all existing ANDs and no existing ORs have passed, so it comes down to this condition
-
-        # Name conditions
-        if (name_equals := query.get('name_equals')) and self.name != name_equals:
-            return False
-        if (name_contains := query.get('name_contains')) and name_contains not in self.name:
-            return False
-        if (name_matches_regex := query.get('name_matches_regex')) and not re.match(name_matches_regex, self.name):
-            return False
-
-        # Attribute conditions
-        if (has_attributes := query.get('has_attributes')) and not all(
-            self.attributes.get(key) == value for key, value in has_attributes.items()
-        ):
-            return False
-        if (has_attributes_keys := query.get('has_attribute_keys')) and not all(
-            key in self.attributes for key in has_attributes_keys
-        ):
-            return False
-
-        # Timing conditions
-        if (min_duration := query.get('min_duration')) is not None:
-            if not isinstance(min_duration, timedelta):
-                min_duration = timedelta(seconds=min_duration)
-            if self.duration < min_duration:
-                return False
-        if (max_duration := query.get('max_duration')) is not None:
-            if not isinstance(max_duration, timedelta):
-                max_duration = timedelta(seconds=max_duration)
-            if self.duration > max_duration:
-                return False
-
-        # Children conditions
-        if (min_child_count := query.get('min_child_count')) and len(self.children) < min_child_count:
-            return False
-        if (max_child_count := query.get('max_child_count')) and len(self.children) > max_child_count:
-            return False
-        if (some_child_has := query.get('some_child_has')) and not any(
-            child._matches_query(some_child_has) for child in self.children
-        ):
-            return False
-        if (all_children_have := query.get('all_children_have')) and not all(
-            child._matches_query(all_children_have) for child in self.children
-        ):
-            return False
-        if (no_child_has := query.get('no_child_has')) and any(
-            child._matches_query(no_child_has) for child in self.children
-        ):
-            return False
-
-        # Descendant conditions
-        # The following local functions with cache decorators are used to avoid repeatedly evaluating these properties
-        @cache
-        def descendants():
-            return self.descendants
-
-        @cache
-        def pruned_descendants():
-            stop_recursing_when = query.get('stop_recursing_when')
-            return (
-                self._filter_descendants(lambda _: True, stop_recursing_when) if stop_recursing_when else descendants()
-            )
-
-        if (min_descendant_count := query.get('min_descendant_count')) and len(descendants()) < min_descendant_count:
-            return False
-        if (max_descendant_count := query.get('max_descendant_count')) and len(descendants()) > max_descendant_count:
-            return False
-        if (some_descendant_has := query.get('some_descendant_has')) and not any(
-            descendant._matches_query(some_descendant_has) for descendant in pruned_descendants()
-        ):
-            return False
-        if (all_descendants_have := query.get('all_descendants_have')) and not all(
-            descendant._matches_query(all_descendants_have) for descendant in pruned_descendants()
-        ):
-            return False
-        if (no_descendant_has := query.get('no_descendant_has')) and any(
-            descendant._matches_query(no_descendant_has) for descendant in pruned_descendants()
-        ):
-            return False
-
-        # Ancestor conditions
-        # The following local functions with cache decorators are used to avoid repeatedly evaluating these properties
-        @cache
-        def ancestors():
-            return self.ancestors
-
-        @cache
-        def pruned_ancestors():
-            stop_recursing_when = query.get('stop_recursing_when')
-            return self._filter_ancestors(lambda _: True, stop_recursing_when) if stop_recursing_when else ancestors()
-
-        if (min_depth := query.get('min_depth')) and len(ancestors()) < min_depth:
-            return False
-        if (max_depth := query.get('max_depth')) and len(ancestors()) > max_depth:
-            return False
-        if (some_ancestor_has := query.get('some_ancestor_has')) and not any(
-            ancestor._matches_query(some_ancestor_has) for ancestor in pruned_ancestors()
-        ):
-            return False
-        if (all_ancestors_have := query.get('all_ancestors_have')) and not all(
-            ancestor._matches_query(all_ancestors_have) for ancestor in pruned_ancestors()
-        ):
-            return False
-        if (no_ancestor_has := query.get('no_ancestor_has')) and any(
-            ancestor._matches_query(no_ancestor_has) for ancestor in pruned_ancestors()
-        ):
-            return False
-
-        return True
+        return compile_span_query(query)(self)
 
     # -------------------------------------------------------------------------
     # String representation
@@ -426,11 +384,355 @@ class SpanNode:
 SpanPredicate = Callable[[SpanNode], bool]
 
 
+def _start_timestamp(node: SpanNode) -> datetime:
+    return node.start_timestamp or datetime.min
+
+
+# The order in which the conditions of a compiled query are checked, from cheapest to most expensive
+_NAME_COST, _ATTRIBUTES_COST, _DURATION_COST, _CHILDREN_COST, _ANCESTORS_COST, _DESCENDANTS_COST = range(6)
+
+_SpanCheck = tuple[int, SpanPredicate]
+
+
+class CompiledSpanQuery:
+    """A [`SpanQuery`][pydantic_evals.otel.span_tree.SpanQuery] compiled into a predicate that checks many nodes.
+
+    Regular expressions are compiled and durations converted once, and the conditions are checked cheapest-first, so a
+    node's name and attributes can rule it out before its children, ancestors or descendants are looked at.
+
+    The results of queries with conditions on related spans are remembered for the nodes of the tree they belong to,
+    until a span is added to the tree, so that subqueries like the one in `some_descendant_has` are evaluated at most
+    once per node when checking all nodes of a tree.
+
+    Use [`compile_span_query`][pydantic_evals.otel.span_tree.compile_span_query] to create one.
+    """
+
+    def __init__(self, query: SpanQuery):
+        self.query = query
+        checks = _compile_checks(query)
+        checks.sort(key=lambda check: check[0])
+        self._predicates = [predicate for _, predicate in checks]
+        # how expensive the query is to check, so that cheaper subqueries are checked first
+        self.cost = max((cost for cost, _ in checks), default=_NAME_COST)
+
+        self._memoize = self.cost >= _CHILDREN_COST
+        self._memo_index: weakref.ref[_TreeIndex] | None = None
+        self._memo_version = -1
+        self._memo: dict[int, bool] = {}
+
+    def __call__(self, node: SpanNode) -> bool:
+        index = node.tree_index
+        if not self._memoize or index is None:
+            return self._evaluate(node)
+
+        memo = self._memo_for(index)
+        result = memo.get(id(node))
+        if result is None:
+            result = memo[id(node)] = self._evaluate(node)
+        return result
+
+    def _memo_for(self, index: _TreeIndex) -> dict[int, bool]:
+        if self._memo_index is None or self._memo_index() is not index or self._memo_version != index.version:
+            self._memo_index = weakref.ref(index)
+            self._memo_version = index.version
+            self._memo = {}
+        return self._memo
+
+    def _evaluate(self, node: SpanNode) -> bool:
+        for predicate in self._predicates:
+            if not predicate(node):
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        return f'CompiledSpanQuery({self.query!r})'
+
+
+def compile_span_query(query: SpanQuery) -> CompiledSpanQuery:
+    """Compile a query into a predicate that can be reused to check many nodes.
+
+    The result can be passed anywhere a `SpanQuery` or predicate is accepted, like
+    [`SpanTree.find`][pydantic_evals.otel.span_tree.SpanTree.find] or
+    [`SpanNode.matches`][pydantic_evals.otel.span_tree.SpanNode.matches].
+
+    Raises:
+        ValueError: If `or_` is combined with other conditions at the same level.
+    """
+    return CompiledSpanQuery(query)
+
+
+def _as_predicate(predicate: SpanQuery | SpanPredicate) -> SpanPredicate:
+    return predicate if callable(predicate) else compile_span_query(predicate)
+
+
+def _compile_checks(query: SpanQuery) -> list[_SpanCheck]:  # noqa C901
+    """Turn the conditions of a query into predicates, each paired with how expensive it is to check."""
+    checks: list[_SpanCheck] = []
+
+    # Logical combinations
+    if or_ := query.get('or_'):
+        if len(query) > 1:
+            raise ValueError("Cannot combine 'or_' conditions with other conditions at the same level")
+        alternatives = sorted((compile_span_query(q) for q in or_), key=lambda q: q.cost)
+        checks.append(
+            (max(q.cost for q in alternatives), lambda node: any(alternative(node) for alternative in alternatives))
+        )
+        return checks
+    if not_ := query.get('not_'):
+        negated = compile_span_query(not_)
+        checks.append((negated.cost, lambda node: not negated(node)))
+    if and_ := query.get('and_'):
+        for q in and_:
+            checks.extend(_compile_checks(q))
+
+    # Name conditions
+    if name_equals := query.get('name_equals'):
+        checks.append((_NAME_COST, lambda node: node.name == name_equals))
+    if name_contains := query.get('name_contains'):
+        checks.append((_NAME_COST, lambda node: name_contains in node.name))
+    if name_matches_regex := query.get('name_matches_regex'):
+        match = re.compile(name_matches_regex).match
+        checks.append((_NAME_COST, lambda node: match(node.name) is not None))
+
+    # Attribute conditions
+    if has_attributes := query.get('has_attributes'):
+        attributes = tuple(has_attributes.items())
+        checks.append(
+            (_ATTRIBUTES_COST, lambda node: all(node.attributes.get(key) == value for key, value in attributes))
+        )
+    if has_attribute_keys := query.get('has_attribute_keys'):
+        keys = tuple(has_attribute_keys)
+        checks.append((_ATTRIBUTES_COST, lambda node: all(key in node.attributes for key in keys)))
+
+    # Timing conditions
+    if (min_duration := query.get('min_duration')) is not None:
+        min_timedelta = min_duration if isinstance(min_duration, timedelta) else timedelta(seconds=min_duration)
+        checks.append((_DURATION_COST, lambda node: node.duration >= min_timedelta))
+    if (max_duration := query.get('max_duration')) is not None:
+        max_timedelta = max_duration if isinstance(max_duration, timedelta) else timedelta(seconds=max_duration)
+        checks.append((_DURATION_COST, lambda node: node.duration <= max_timedelta))
+
+    # Children conditions
+    if min_child_count := query.get('min_child_count'):
+        checks.append((_CHILDREN_COST, lambda node: len(node.children) >= min_child_count))
+    if max_child_count := query.get('max_child_count'):
+        checks.append((_CHILDREN_COST, lambda node: len(node.children) <= max_child_count))
+    if some_child_has := query.get('some_child_has'):
+        some_child = compile_span_query(some_child_has)
+        checks.append((_CHILDREN_COST, lambda node: any(some_child(child) for child in node.children)))
+    if all_children_have := query.get('all_children_have'):
+        all_children = compile_span_query(all_children_have)
+        checks.append((_CHILDREN_COST, lambda node: all(all_children(child) for child in node.children)))
+    if no_child_has := query.get('no_child_has'):
+        no_child = compile_span_query(no_child_has)
+        checks.append((_CHILDREN_COST, lambda node: not any(no_child(child) for child in node.children)))
+
+    stop_recursing_when = query.get('stop_recursing_when')
+    stop = compile_span_query(stop_recursing_when) if stop_recursing_when else None
+    if check := _compile_ancestor_check(query, stop):
+        checks.append((_ANCESTORS_COST, check))
+    if check := _compile_descendant_check(query, stop):
+        checks.append((_DESCENDANTS_COST, check))
+    return checks
+
+
+def _compile_descendant_check(query: SpanQuery, stop: CompiledSpanQuery | None) -> SpanPredicate | None:
+    min_descendant_count = query.get('min_descendant_count')
+    max_descendant_count = query.get('max_descendant_count')
+    some_descendant_has = query.get('some_descendant_has')
+    all_descendants_have = query.get('all_descendants_have')
+    no_descendant_has = query.get('no_descendant_has')
+    if not (
+        min_descendant_count or max_descendant_count or some_descendant_has or all_descendants_have or no_descendant_has
+    ):
+        return None
+
+    some_descendant = compile_span_query(some_descendant_has) if some_descendant_has else None
+    all_descendants = compile_span_query(all_descendants_have) if all_descendants_have else None
+    no_descendant = compile_span_query(no_descendant_has) if no_descendant_has else None
+
+    def check(node: SpanNode) -> bool:
+        if min_descendant_count and len(node.descendants) < min_descendant_count:
+            return False
+        if max_descendant_count and len(node.descendants) > max_descendant_count:
+            return False
+
+        if stop is None:
+            # without pruning, the tree's indexes can be used to find matching descendants
+            if some_descendant is not None and not node.any_descendant(some_descendant):
+                return False
+            if all_descendants is not None and not all(all_descendants(d) for d in node.descendants):
+                return False
+            if no_descendant is not None and node.any_descendant(no_descendant):
+                return False
+            return True
+
+        pruned_descendants = node.find_descendants(lambda _: True, stop)
+        if some_descendant is not None and not any(some_descendant(d) for d in pruned_descendants):
+            return False
+        if all_descendants is not None and not all(all_descendants(d) for d in pruned_descendants):
+            return False
+        if no_descendant is not None and any(no_descendant(d) for d in pruned_descendants):
+            return False
+        return True
+
+    return check
+
+
+def _compile_ancestor_check(query: SpanQuery, stop: CompiledSpanQuery | None) -> SpanPredicate | None:
+    min_depth = query.get('min_depth')
+    max_depth = query.get('max_depth')
+    some_ancestor_has = query.get('some_ancestor_has')
+    all_ancestors_have = query.get('all_ancestors_have')
+    no_ancestor_has = query.get('no_ancestor_has')
+    if not (min_depth or max_depth or some_ancestor_has or all_ancestors_have or no_ancestor_has):
+        return None
+
+    some_ancestor = compile_span_query(some_ancestor_has) if some_ancestor_has else None
+    all_ancestors = compile_span_query(all_ancestors_have) if all_ancestors_have else None
+    no_ancestor = compile_span_query(no_ancestor_has) if no_ancestor_has else None
+
+    def check(node: SpanNode) -> bool:
+        if min_depth and len(node.ancestors) < min_depth:
+            return False
+        if max_depth and len(node.ancestors) > max_depth:
+            return False
+
+        pruned_ancestors = node.ancestors if stop is None else node.find_ancestors(lambda _: True, stop)
+        if some_ancestor is not None and not any(some_ancestor(a) for a in pruned_ancestors):
+            return False
+        if all_ancestors is not None and not all(all_ancestors(a) for a in pruned_ancestors):
+            return False
+        if no_ancestor is not None and any(no_ancestor(a) for a in pruned_ancestors):
+            return False
+        return True
+
+    return check
+
+
+class _TreeIndex:
+    """The indexes of a [`SpanTree`][pydantic_evals.otel.span_tree.SpanTree], shared by its nodes and the compiled queries that check them.
+
+    Nodes are indexed by name, attribute key and attribute key/value pair, and the Euler tour of the tree tells which
+    nodes are descendants of a node.
+    """
+
+    def __init__(self, tree: SpanTree):
+        self.tree = tree
+        self.by_name: dict[str, list[SpanNode]] = {}
+        self.by_attribute_key: dict[str, list[SpanNode]] = {}
+        self.by_attribute: dict[tuple[str, Any], list[SpanNode]] = {}
+        # Incremented whenever the structure of the tree changes, so that compiled queries know to forget their results
+        self.version = 0
+        self.tour: list[SpanNode] | None = None
+        # Where the subtree of each node starts and ends in `tour`, by the id of the node
+        self.subtrees: dict[int, tuple[int, int]] = {}
+        self.query_candidates_cache: weakref.WeakKeyDictionary[CompiledSpanQuery, list[SpanNode] | None] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The query cache holds weak references, which can't be pickled, and the Euler tour is looked up by the ids of
+        # the nodes, which change when they're unpickled, so both are left out and rebuilt when needed
+        return {**self.__dict__, 'tour': None, 'subtrees': {}, 'query_candidates_cache': None}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.query_candidates_cache = weakref.WeakKeyDictionary()
+
+    def add(self, node: SpanNode) -> None:
+        self.by_name.setdefault(node.name, []).append(node)
+        for key, value in node.attributes.items():
+            self.by_attribute_key.setdefault(key, []).append(node)
+            try:
+                self.by_attribute.setdefault((key, value), []).append(node)
+            except TypeError:  # unhashable values, like lists, are only indexed by key
+                pass
+
+    def changed(self) -> None:
+        self.tour = None
+        self.version += 1
+        self.query_candidates_cache.clear()
+
+    def candidates(self, query: SpanQuery) -> list[SpanNode] | None:
+        """Return the nodes that can match a query according to the indexes, or `None` if every node needs checking.
+
+        The candidates still need to be checked against the query, and aren't in any particular order.
+        """
+        if or_ := query.get('or_'):
+            if len(query) > 1:
+                return None  # checking the nodes raises the appropriate error
+            union: dict[int, SpanNode] = {}
+            for subquery in or_:
+                candidates = self.candidates(subquery)
+                if candidates is None:
+                    return None
+                union.update((id(node), node) for node in candidates)
+            return list(union.values())
+
+        options: list[list[SpanNode]] = []
+        if name_equals := query.get('name_equals'):
+            options.append(self.by_name.get(name_equals, []))
+        for key, value in (query.get('has_attributes') or {}).items():
+            if value is None:
+                continue  # a missing attribute is equal to `None`
+            try:
+                options.append(self.by_attribute.get((key, value), []))
+            except TypeError:
+                options.append(self.by_attribute_key.get(key, []))
+        for key in query.get('has_attribute_keys') or ():
+            options.append(self.by_attribute_key.get(key, []))
+        for subquery in query.get('and_') or ():
+            if (candidates := self.candidates(subquery)) is not None:
+                options.append(candidates)
+        return min(options, key=len) if options else None
+
+    def query_candidates(self, query: CompiledSpanQuery) -> list[SpanNode] | None:
+        """Return the candidates for a compiled query, which are remembered until the structure of the tree changes."""
+        try:
+            return self.query_candidates_cache[query]
+        except KeyError:
+            candidates = self.query_candidates_cache[query] = self.candidates(query.query)
+            return candidates
+
+    def euler_tour(self) -> list[SpanNode]:
+        """Return all nodes in DFS order, recording in `subtrees` where the subtree of each node starts and ends.
+
+        The descendants of a node are then the nodes between the start and end of its subtree, in the same order as
+        [`SpanNode.descendants`][pydantic_evals.otel.span_tree.SpanNode.descendants].
+        """
+        if self.tour is None:
+            tour: list[SpanNode] = []
+            for root in self.tree.roots:
+                stack = [root]
+                while stack:
+                    node = stack.pop()
+                    tour.append(node)
+                    stack.extend(node.children)
+            sizes: dict[int, int] = {}
+            for node in reversed(tour):
+                sizes[id(node)] = 1 + sum(sizes[id(child)] for child in node.children)
+            self.subtrees = {id(node): (start, start + sizes[id(node)]) for start, node in enumerate(tour)}
+            self.tour = tour
+        return self.tour
+
+    def subtree_range(self, node: SpanNode) -> tuple[int, int] | None:
+        """Return where the subtree of a node starts and ends in the Euler tour, or `None` if it isn't in the tour."""
+        tour = self.euler_tour()
+        subtree = self.subtrees.get(id(node))
+        if subtree is not None and tour[subtree[0]] is node:
+            return subtree
+        return None
+
+
 @dataclass(repr=False, kw_only=True)
 class SpanTree:
     """A container that builds a hierarchy of SpanNode objects from a list of finished spans.
 
     You can then search or iterate the tree to make your assertions (using DFS for traversal).
+
+    Nodes are indexed by name, attribute key and attribute key/value pair, so that queries with `name_equals`,
+    `has_attributes` or `has_attribute_keys` conditions only check the nodes that can match them.
     """
 
     roots: list[SpanNode] = field(default_factory=list)
@@ -442,11 +744,37 @@ class SpanTree:
     def __post_init__(self):
         self._rebuild_tree()
 
+    def __getstate__(self) -> dict[str, Any]:
+        # The positions of the nodes are looked up by their ids, which change when they're unpickled
+        return {**self.__dict__, '_positions': None}
+
     def add_spans(self, spans: list[SpanNode]) -> None:
-        """Add a list of spans to the tree, rebuilding the tree structure."""
-        for span in spans:
-            self.nodes_by_id[span.node_key] = span
-        self._rebuild_tree()
+        """Add a list of spans to the tree, attaching them to their parents and adopting their children."""
+        keys = {span.node_key for span in spans}
+        if len(keys) < len(spans) or any(key in self.nodes_by_id for key in keys):
+            # spans are being replaced, so the parent/child relationships need to be worked out again
+            for span in spans:
+                replaced = self.nodes_by_id.get(span.node_key)
+                if replaced is not None and replaced is not span:
+                    replaced.tree_index = None
+                self.nodes_by_id[span.node_key] = span
+            self._rebuild_tree()
+            return
+
+        new_nodes = sorted(spans, key=_start_timestamp)
+        if not new_nodes:
+            return
+        last_node = next(reversed(self.nodes_by_id.values()), None)
+        if last_node is not None and _start_timestamp(new_nodes[0]) < _start_timestamp(last_node):
+            merged = heapq.merge(self.nodes_by_id.values(), new_nodes, key=_start_timestamp)
+            self.nodes_by_id = {node.node_key: node for node in merged}
+        else:
+            self.nodes_by_id.update((node.node_key, node) for node in new_nodes)
+        self._positions = None
+        self._tree_index.changed()
+
+        for node in new_nodes:
+            self._add_node(node)
 
     def add_readable_spans(self, readable_spans: list[ReadableSpan]):
         self.add_spans([SpanNode.from_readable_span(span) for span in readable_spans])
@@ -454,25 +782,49 @@ class SpanTree:
     def _rebuild_tree(self):
         # Ensure spans are ordered by start_timestamp so that roots and children end up in the right order
         nodes = list(self.nodes_by_id.values())
-        nodes.sort(key=lambda node: node.start_timestamp or datetime.min)
+        nodes.sort(key=_start_timestamp)
         self.nodes_by_id = {node.node_key: node for node in nodes}
 
+        self.roots = []
+        self._tree_index = _TreeIndex(self)
+        # Nodes whose parent isn't in the tree (yet), by the key of their parent
+        self._orphans: dict[str, list[SpanNode]] = {}
+        self._positions: dict[int, int] | None = None
+
         # Build the parent/child relationships
         for node in self.nodes_by_id.values():
+            node.tree_index = self._tree_index
+            self._tree_index.add(node)
             parent_node_key = node.parent_node_key
             if parent_node_key is not None:
                 parent_node = self.nodes_by_id.get(parent_node_key)
                 if parent_node is not None:
                     parent_node.add_child(node)
-
-        # Determine the roots
-        # A node is a "root" if its parent is None or if its parent's span_id is not in the current set of spans.
-        self.roots = []
-        for node in self.nodes_by_id.values():
-            parent_node_key = node.parent_node_key
-            if parent_node_key is None or parent_node_key not in self.nodes_by_id:
+                    continue
+                self._orphans.setdefault(parent_node_key, []).append(node)
+            # A node is a "root" if its parent is None or if its parent's span_id is not in the current set of spans.
+            self.roots.append(node)
+
+    def _add_node(self, node: SpanNode) -> None:
+        """Attach a node that was just added to `nodes_by_id` to its parent, and adopt the children waiting for it."""
+        node.tree_index = self._tree_index
+        self._tree_index.add(node)
+        parent_node_key = node.parent_node_key
+        parent_node = self.nodes_by_id.get(parent_node_key) if parent_node_key is not None else None
+        if parent_node is not None:
+            parent_node.add_child(node)
+        else:
+            if parent_node_key is not None:
+                self._orphans.setdefault(parent_node_key, []).append(node)
+            if self.roots and _start_timestamp(node) < _start_timestamp(self.roots[-1]):
+                bisect.insort_right(self.roots, node, key=_start_timestamp)
+            else:
                 self.roots.append(node)
 
+        for orphan in self._orphans.pop(node.node_key, ()):
+            self.roots.remove(orphan)
+            node.add_child(orphan)
+
     # -------------------------------------------------------------------------
     # Node filtering and iteration
     # -------------------------------------------------------------------------
@@ -489,8 +841,16 @@ class SpanTree:
         return self.first(predicate) is not None
 
     def _filter(self, predicate: SpanQuery | SpanPredicate) -> Iterator[SpanNode]:
-        for node in self:
-            if node.matches(predicate):
+        predicate = _as_predicate(predicate)
+        candidates = self._tree_index.query_candidates(predicate) if isinstance(predicate, CompiledSpanQuery) else None
+        nodes: Iterable[SpanNode] = self
+        if candidates is not None:
+            if self._positions is None:
+                self._positions = {id(node): i for i, node in enumerate(self.nodes_by_id.values())}
+            positions = self._positions
+            nodes = sorted(candidates, key=lambda node: positions[id(node)])
+        for node in nodes:
+            if predicate(node):
                 yield node
 
     def __iter__(self) -> Iterator[SpanNode]:
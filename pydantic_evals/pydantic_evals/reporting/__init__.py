@@ -1,15 +1,16 @@
 from __future__ import annotations as _annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from io import StringIO
+from pathlib import Path
 from typing import Any, Generic, Literal, Protocol, cast
 
 from pydantic import BaseModel, TypeAdapter
 from rich.console import Console
 from rich.table import Table
-from typing_extensions import TypedDict, TypeVar
+from typing_extensions import Self, TypedDict, TypeVar
 
 from pydantic_evals._utils import UNSET, Unset
 
@@ -33,6 +34,11 @@ __all__ = (
     'RenderValueConfig',
     'RenderNumberConfig',
     'ReportCaseAggregate',
+    'ReportCaseAggregator',
+    'EvaluationSummary',
+    'ReportCaseSink',
+    'JSONLReportCaseSink',
+    'read_report_cases',
 )
 
 from ..evaluators.evaluator import EvaluatorFailure
@@ -122,10 +128,56 @@ class ReportCaseAggregate(BaseModel):
     @staticmethod
     def average(cases: list[ReportCase]) -> ReportCaseAggregate:
         """Produce a synthetic "summary" case by averaging quantitative attributes."""
-        num_cases = len(cases)
-        if num_cases == 0:
+        aggregator = ReportCaseAggregator()
+        for case in cases:
+            aggregator.add(case)
+        return aggregator.aggregate()
+
+
+class ReportCaseAggregator:
+    """Running averages of the cases in a report, for summarizing cases without keeping them all in memory.
+
+    Cases are added one at a time with [`add`][pydantic_evals.reporting.ReportCaseAggregator.add], and
+    [`aggregate`][pydantic_evals.reporting.ReportCaseAggregator.aggregate] produces the same summary as
+    [`ReportCaseAggregate.average`][pydantic_evals.reporting.ReportCaseAggregate.average] would for all of them.
+    """
+
+    def __init__(self, name: str = 'Averages'):
+        self.name = name
+        self.count = 0
+        self._task_duration = 0.0
+        self._total_duration = 0.0
+        self._score_sums: dict[str, float] = defaultdict(float)
+        self._score_counts: dict[str, int] = defaultdict(int)
+        self._label_counts: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._label_totals: dict[str, int] = defaultdict(int)
+        self._metric_sums: dict[str, float] = defaultdict(float)
+        self._metric_counts: dict[str, int] = defaultdict(int)
+        self._n_assertions = 0
+        self._n_passing = 0
+
+    def add(self, case: ReportCase) -> None:
+        """Add a case to the averages."""
+        self.count += 1
+        self._task_duration += case.task_duration
+        self._total_duration += case.total_duration
+        for name, score in case.scores.items():
+            self._score_counts[name] += 1
+            self._score_sums[name] += score.value
+        for name, label in case.labels.items():
+            self._label_totals[name] += 1
+            self._label_counts[name][label.value] += 1
+        for name, metric in case.metrics.items():
+            self._metric_counts[name] += 1
+            self._metric_sums[name] += metric
+        self._n_assertions += len(case.assertions)
+        self._n_passing += sum(1 for assertion in case.assertions.values() if assertion.value)
+
+    def aggregate(self) -> ReportCaseAggregate:
+        """Produce a synthetic "summary" case by averaging quantitative attributes of the cases added so far."""
+        if self.count == 0:
             return ReportCaseAggregate(
-                name='Averages',
+                name=self.name,
                 scores={},
                 labels={},
                 metrics={},
@@ -134,53 +186,17 @@ class ReportCaseAggregate(BaseModel):
                 total_duration=0.0,
             )
 
-        def _scores_averages(scores_by_name: list[dict[str, int | float | bool]]) -> dict[str, float]:
-            counts_by_name: dict[str, int] = defaultdict(int)
-            sums_by_name: dict[str, float] = defaultdict(float)
-            for sbn in scores_by_name:
-                for name, score in sbn.items():
-                    counts_by_name[name] += 1
-                    sums_by_name[name] += score
-            return {name: sums_by_name[name] / counts_by_name[name] for name in sums_by_name}
-
-        def _labels_averages(labels_by_name: list[dict[str, str]]) -> dict[str, dict[str, float]]:
-            counts_by_name: dict[str, int] = defaultdict(int)
-            sums_by_name: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
-            for lbn in labels_by_name:
-                for name, label in lbn.items():
-                    counts_by_name[name] += 1
-                    sums_by_name[name][label] += 1
-            return {
-                name: {value: count / counts_by_name[name] for value, count in sums_by_name[name].items()}
-                for name in sums_by_name
-            }
-
-        average_task_duration = sum(case.task_duration for case in cases) / num_cases
-        average_total_duration = sum(case.total_duration for case in cases) / num_cases
-
-        # average_assertions: dict[str, float] = _scores_averages([{k: v.value for k, v in case.scores.items()} for case in cases])
-        average_scores: dict[str, float] = _scores_averages(
-            [{k: v.value for k, v in case.scores.items()} for case in cases]
-        )
-        average_labels: dict[str, dict[str, float]] = _labels_averages(
-            [{k: v.value for k, v in case.labels.items()} for case in cases]
-        )
-        average_metrics: dict[str, float] = _scores_averages([case.metrics for case in cases])
-
-        average_assertions: float | None = None
-        n_assertions = sum(len(case.assertions) for case in cases)
-        if n_assertions > 0:
-            n_passing = sum(1 for case in cases for assertion in case.assertions.values() if assertion.value)
-            average_assertions = n_passing / n_assertions
-
         return ReportCaseAggregate(
-            name='Averages',
-            scores=average_scores,
-            labels=average_labels,
-            metrics=average_metrics,
-            assertions=average_assertions,
-            task_duration=average_task_duration,
-            total_duration=average_total_duration,
+            name=self.name,
+            scores={name: total / self._score_counts[name] for name, total in self._score_sums.items()},
+            labels={
+                name: {value: count / self._label_totals[name] for value, count in counts.items()}
+                for name, counts in self._label_counts.items()
+            },
+            metrics={name: total / self._metric_counts[name] for name, total in self._metric_sums.items()},
+            assertions=self._n_passing / self._n_assertions if self._n_assertions > 0 else None,
+            task_duration=self._task_duration / self.count,
+            total_duration=self._total_duration / self.count,
         )
 
 
@@ -206,6 +222,31 @@ class EvaluationReport(Generic[InputsT, OutputT, MetadataT]):
             return ReportCaseAggregate.average(self.cases)
         return None
 
+    @staticmethod
+    def merge(
+        reports: Sequence[EvaluationReport[InputsT, OutputT, MetadataT]], *, name: str | None = None
+    ) -> EvaluationReport[InputsT, OutputT, MetadataT]:
+        """Merge the reports of evaluations of different cases, like the shards of a dataset, into one report.
+
+        The cases and failures of the reports are concatenated in order, so the averages of the merged report are
+        those of all cases. The trace ID is kept if all reports have the same one, and the span ID if there's
+        only one report.
+
+        Args:
+            reports: The reports to merge.
+            name: The name of the merged report. If omitted, the name of the first report is used.
+        """
+        if not reports:
+            raise ValueError('At least one report is required to merge')
+        trace_ids = {report.trace_id for report in reports}
+        return EvaluationReport(
+            name=name or reports[0].name,
+            cases=[case for report in reports for case in report.cases],
+            failures=[failure for report in reports for failure in report.failures],
+            trace_id=trace_ids.pop() if len(trace_ids) == 1 else None,
+            span_id=reports[0].span_id if len(reports) == 1 else None,
+        )
+
     def print(
         self,
         width: int | None = None,
@@ -367,6 +408,83 @@ class EvaluationReport(Generic[InputsT, OutputT, MetadataT]):
 EvaluationReportAdapter = TypeAdapter(EvaluationReport[Any, Any, Any])
 
 
+@dataclass(kw_only=True)
+class EvaluationSummary:
+    """A summary of an evaluation whose cases were written to a sink instead of being kept in a report.
+
+    See [`Dataset.evaluate_streaming`][pydantic_evals.Dataset.evaluate_streaming].
+    """
+
+    name: str
+    """The name of the evaluation."""
+    n_cases: int
+    """The number of cases whose task ran successfully."""
+    n_failures: int
+    """The number of cases whose task raised an exception."""
+    averages: ReportCaseAggregate | None
+    """The averages of the cases whose task ran successfully, or `None` if there were none."""
+
+    trace_id: str | None = None
+    """The trace ID of the evaluation."""
+    span_id: str | None = None
+    """The span ID of the evaluation."""
+
+
+class ReportCaseSink(Protocol):
+    """Somewhere to write the results of cases as they're evaluated."""
+
+    def write(self, case: ReportCase[Any, Any, Any] | ReportCaseFailure[Any, Any, Any]) -> None:
+        """Write the result of a case."""
+        ...
+
+
+_REPORT_CASE_OR_FAILURE_ADAPTER: TypeAdapter[ReportCase[Any, Any, Any] | ReportCaseFailure[Any, Any, Any]] = (
+    TypeAdapter(ReportCase[Any, Any, Any] | ReportCaseFailure[Any, Any, Any])
+)
+
+
+class JSONLReportCaseSink:
+    """A [`ReportCaseSink`][pydantic_evals.reporting.ReportCaseSink] that appends each case to a JSON Lines file.
+
+    Use [`read_report_cases`][pydantic_evals.reporting.read_report_cases] to read the cases back.
+    """
+
+    def __init__(self, path: Path | str):
+        """Open the file to append cases to.
+
+        Args:
+            path: The path of the JSON Lines file, which is created if it doesn't exist.
+        """
+        self.path = Path(path)
+        self._file = self.path.open('ab')
+
+    def write(self, case: ReportCase[Any, Any, Any] | ReportCaseFailure[Any, Any, Any]) -> None:
+        """Append the case to the file as a line of JSON."""
+        self._file.write(_REPORT_CASE_OR_FAILURE_ADAPTER.dump_json(case) + b'\n')
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def read_report_cases(path: Path | str) -> Iterator[ReportCase[Any, Any, Any] | ReportCaseFailure[Any, Any, Any]]:
+    """Read the cases written to a JSON Lines file by a [`JSONLReportCaseSink`][pydantic_evals.reporting.JSONLReportCaseSink], one at a time.
+
+    Inputs, outputs and metadata are read back as plain JSON values.
+    """
+    with Path(path).open('rb') as f:
+        for line in f:
+            if line.strip():
+                yield _REPORT_CASE_OR_FAILURE_ADAPTER.validate_json(line)
+
+
 class RenderValueConfig(TypedDict, total=False):
     """A configuration for rendering a values in an Evaluation report."""
 
@@ -1,15 +1,18 @@
 from __future__ import annotations as _annotations
 
+import os
 import secrets
 from collections.abc import AsyncIterator
 from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from time import perf_counter
-from typing import Any
+from typing import Annotated, Any, Literal
 
 import anyio
 import pydantic
+import pydantic_core
 
 from .. import _utils as _graph_utils, exceptions
 from ..nodes import BaseNode, End
@@ -153,17 +156,301 @@ class FileStatePersistence(BaseStatePersistence[StateT, RunEndT]):
 
         Returns: an async context manager that holds the lock
         """
-        lock_file = self.json_file.parent / f'{self.json_file.name}.pydantic-graph-persistence-lock'
-        lock_id = secrets.token_urlsafe().encode()
+        async with _file_lock(self.json_file, timeout=timeout):
+            yield
+
+
+@dataclass
+class JsonlFileStatePersistence(BaseStatePersistence[StateT, RunEndT]):
+    """File based state persistence that holds graph run state in an append-only JSON lines file.
+
+    Unlike [`FileStatePersistence`][pydantic_graph.persistence.file.FileStatePersistence], which reads and rewrites
+    the whole list of snapshots on every operation, each snapshot is written once as its own line, and changes to a
+    snapshot's status are appended as small status records. An in-memory index of where each snapshot is stored in
+    the file means [`load_next`][pydantic_graph.persistence.BaseStatePersistence.load_next] and
+    [`record_run`][pydantic_graph.persistence.BaseStatePersistence.record_run] only deserialize the snapshot they
+    need, so the cost of each step doesn't grow with the length of the run.
+
+    The file is periodically compacted by merging status records into the snapshots they apply to,
+    see [`compact_after`][pydantic_graph.persistence.file.JsonlFileStatePersistence.compact_after].
+    Like `FileStatePersistence`, the file can be shared between processes, the index is brought up to date with
+    changes made by other processes before it's used.
+    """
+
+    jsonl_file: Path
+    """Path to the JSON lines file where the snapshots are stored.
+
+    As with [`FileStatePersistence`][pydantic_graph.persistence.file.FileStatePersistence], you should use a different
+    file for each graph run, but a single file should be reused for multiple steps of the same run.
+    """
+    compact_after: int | None = 100
+    """Compact the file once it contains at least this many status records, and at least as many status records as
+    snapshots, or `None` to never compact automatically.
+
+    Requiring as many status records as snapshots means the cost of compaction is amortized across the steps of the
+    run, however long it gets.
+    """
+    _record_type_adapter: pydantic.TypeAdapter[Snapshot[StateT, RunEndT] | _SnapshotStatusRecord] | None = field(
+        default=None, init=False, repr=False
+    )
+    _index: dict[str, _SnapshotIndexEntry] = field(default_factory=dict, init=False, repr=False)
+    """Where each snapshot is stored in the file, in the order they were written, keyed by snapshot ID."""
+    _status_record_count: int = field(default=0, init=False, repr=False)
+    _indexed_size: int = field(default=0, init=False, repr=False)
+    """How many bytes of the file have been indexed."""
+    _indexed_inode: int | None = field(default=None, init=False, repr=False)
+    """The inode of the file that was indexed, used to detect the file being replaced by compaction."""
+
+    async def snapshot_node(self, state: StateT, next_node: BaseNode[StateT, Any, RunEndT]) -> None:
+        async with self._lock():
+            await _graph_utils.run_in_executor(self._append_snapshot_sync, NodeSnapshot(state=state, node=next_node))
+
+    async def snapshot_node_if_new(
+        self, snapshot_id: str, state: StateT, next_node: BaseNode[StateT, Any, RunEndT]
+    ) -> None:
+        async with self._lock():
+            await _graph_utils.run_in_executor(
+                self._append_snapshot_sync, NodeSnapshot(state=state, node=next_node), if_new_id=snapshot_id
+            )
 
-        with anyio.fail_after(timeout):
-            while not await _file_append_check(lock_file, lock_id):
-                await anyio.sleep(0.01)
+    async def snapshot_end(self, state: StateT, end: End[RunEndT]) -> None:
+        async with self._lock():
+            await _graph_utils.run_in_executor(self._append_snapshot_sync, EndSnapshot(state=state, result=end))
+
+    @asynccontextmanager
+    async def record_run(self, snapshot_id: str) -> AsyncIterator[None]:
+        async with self._lock():
+            await _graph_utils.run_in_executor(self._start_run_sync, snapshot_id)
 
+        start = perf_counter()
         try:
             yield
-        finally:
-            await _graph_utils.run_in_executor(lock_file.unlink, missing_ok=True)
+        except Exception:
+            duration = perf_counter() - start
+            async with self._lock():
+                await _graph_utils.run_in_executor(
+                    self._append_status_sync, _SnapshotStatusRecord(id=snapshot_id, status='error', duration=duration)
+                )
+            raise
+        else:
+            duration = perf_counter() - start
+            async with self._lock():
+                await _graph_utils.run_in_executor(
+                    self._append_status_sync, _SnapshotStatusRecord(id=snapshot_id, status='success', duration=duration)
+                )
+
+    async def load_next(self) -> NodeSnapshot[StateT, RunEndT] | None:
+        async with self._lock():
+            return await _graph_utils.run_in_executor(self._load_next_sync)
+
+    def should_set_types(self) -> bool:
+        """Whether types need to be set."""
+        return self._record_type_adapter is None
+
+    def set_types(self, state_type: type[StateT], run_end_type: type[RunEndT]) -> None:
+        self._record_type_adapter = pydantic.TypeAdapter(
+            Annotated[
+                NodeSnapshot[state_type, run_end_type] | EndSnapshot[state_type, run_end_type] | _SnapshotStatusRecord,
+                pydantic.Discriminator('kind'),
+            ]
+        )
+
+    async def load_all(self) -> list[Snapshot[StateT, RunEndT]]:
+        return await _graph_utils.run_in_executor(self._load_all_sync)
+
+    async def compact(self) -> None:
+        """Rewrite the file with status records merged into the snapshots they apply to."""
+        async with self._lock():
+            await _graph_utils.run_in_executor(self._compact_sync)
+
+    def _load_all_sync(self) -> list[Snapshot[StateT, RunEndT]]:
+        type_adapter = self._get_type_adapter()
+        try:
+            content = self.jsonl_file.read_bytes()
+        except FileNotFoundError:
+            return []
+
+        snapshots: dict[str, Snapshot[StateT, RunEndT]] = {}
+        for line in content.splitlines():
+            if not line:
+                continue
+            record = type_adapter.validate_json(line)
+            if isinstance(record, _SnapshotStatusRecord):
+                snapshot = snapshots[record.id]
+                assert isinstance(snapshot, NodeSnapshot), 'Only NodeSnapshot can be recorded'
+                record.apply(snapshot)
+            else:
+                snapshots[record.id] = record
+        return list(snapshots.values())
+
+    def _load_next_sync(self) -> NodeSnapshot[StateT, RunEndT] | None:
+        self._update_index_sync()
+        snapshot_id = next((k for k, e in self._index.items() if e.kind == 'node' and e.status == 'created'), None)
+        if snapshot_id is None:
+            return None
+
+        snapshot = self._read_snapshot_sync(snapshot_id)
+        assert isinstance(snapshot, NodeSnapshot), 'Only NodeSnapshot can be loaded'
+        self._append_status_sync(_SnapshotStatusRecord(id=snapshot_id, status='pending'), update_index=False)
+        snapshot.status = 'pending'
+        return snapshot
+
+    def _start_run_sync(self, snapshot_id: str) -> None:
+        self._update_index_sync()
+        try:
+            entry = self._index[snapshot_id]
+        except KeyError as e:
+            raise LookupError(f'No snapshot found with id={snapshot_id!r}') from e
+
+        assert entry.kind == 'node', 'Only NodeSnapshot can be recorded'
+        exceptions.GraphNodeStatusError.check(entry.status)
+        self._append_status_sync(
+            _SnapshotStatusRecord(id=snapshot_id, status='running', start_ts=_utils.now_utc()), update_index=False
+        )
+
+    def _read_snapshot_sync(self, snapshot_id: str) -> Snapshot[StateT, RunEndT]:
+        """Deserialize a single snapshot, with its status taken from the index."""
+        entry = self._index[snapshot_id]
+        with self.jsonl_file.open('rb') as f:
+            f.seek(entry.offset)
+            line = f.read(entry.length)
+        snapshot = self._get_type_adapter().validate_json(line)
+        assert not isinstance(snapshot, _SnapshotStatusRecord), 'index should only point to snapshots'
+        if isinstance(snapshot, NodeSnapshot):
+            snapshot.status = entry.status
+        return snapshot
+
+    def _append_snapshot_sync(self, snapshot: Snapshot[StateT, RunEndT], *, if_new_id: str | None = None) -> None:
+        self._update_index_sync()
+        if if_new_id is not None and if_new_id in self._index:
+            return
+        self._append_line_sync(self._get_type_adapter().dump_json(snapshot))
+
+    def _append_status_sync(self, record: _SnapshotStatusRecord, *, update_index: bool = True) -> None:
+        if update_index:
+            self._update_index_sync()
+        self._append_line_sync(self._get_type_adapter().dump_json(record))
+        if (
+            self.compact_after is not None
+            and self._status_record_count >= self.compact_after
+            and self._status_record_count >= len(self._index)
+        ):
+            self._compact_sync()
+
+    def _append_line_sync(self, line: bytes) -> None:
+        """Append a line to the file and add it to the index; the index must be up to date."""
+        line += b'\n'
+        with self.jsonl_file.open('ab') as f:
+            f.write(line)
+        if self._indexed_inode is None:
+            self._indexed_inode = self.jsonl_file.stat().st_ino
+        self._index_line(line, self._indexed_size)
+        self._indexed_size += len(line)
+
+    def _compact_sync(self) -> None:
+        snapshots = self._load_all_sync()
+        type_adapter = self._get_type_adapter()
+        tmp_file = self.jsonl_file.with_name(f'{self.jsonl_file.name}.compact-tmp')
+        tmp_file.write_bytes(b''.join(type_adapter.dump_json(s) + b'\n' for s in snapshots))
+        os.replace(tmp_file, self.jsonl_file)
+        self._update_index_sync()
+
+    def _update_index_sync(self) -> None:
+        """Bring the index up to date with the file, including any changes made by other processes."""
+        try:
+            stat = self.jsonl_file.stat()
+        except FileNotFoundError:
+            self._reset_index(None)
+            return
+
+        if stat.st_ino != self._indexed_inode or stat.st_size < self._indexed_size:
+            # the file has been replaced, e.g. by compaction in another process
+            self._reset_index(stat.st_ino)
+        if stat.st_size == self._indexed_size:
+            return
+
+        with self.jsonl_file.open('rb') as f:
+            f.seek(self._indexed_size)
+            content = f.read(stat.st_size - self._indexed_size)
+        offset = self._indexed_size
+        for line in content.splitlines(keepends=True):
+            if not line.endswith(b'\n'):
+                # incomplete line, will be indexed once it's been fully written
+                break
+            self._index_line(line, offset)
+            offset += len(line)
+        self._indexed_size = offset
+
+    def _reset_index(self, inode: int | None) -> None:
+        self._index.clear()
+        self._status_record_count = 0
+        self._indexed_size = 0
+        self._indexed_inode = inode
+
+    def _index_line(self, line: bytes, offset: int) -> None:
+        if not line.strip():
+            return
+        # only the few fields needed for the index are used, the snapshot itself is validated when it's read
+        record = pydantic_core.from_json(line, cache_strings=False)
+        if record['kind'] == 'status':
+            self._index[record['id']].status = record['status']
+            self._status_record_count += 1
+        else:
+            self._index[record['id']] = _SnapshotIndexEntry(
+                offset=offset, length=len(line), kind=record['kind'], status=record.get('status', 'created')
+            )
+
+    def _get_type_adapter(self) -> pydantic.TypeAdapter[Snapshot[StateT, RunEndT] | _SnapshotStatusRecord]:
+        assert self._record_type_adapter is not None, 'snapshots type adapter must be set'
+        return self._record_type_adapter
+
+    @asynccontextmanager
+    async def _lock(self, *, timeout: float = 1.0) -> AsyncIterator[None]:
+        async with _file_lock(self.jsonl_file, timeout=timeout):
+            yield
+
+
+@dataclass(kw_only=True)
+class _SnapshotStatusRecord:
+    """A change to the status of a snapshot, appended to the file by `JsonlFileStatePersistence`."""
+
+    id: str
+    status: SnapshotStatus
+    start_ts: datetime | None = None
+    duration: float | None = None
+    kind: Literal['status'] = 'status'
+
+    def apply(self, snapshot: NodeSnapshot[Any, Any]) -> None:
+        snapshot.status = self.status
+        if self.start_ts is not None:
+            snapshot.start_ts = self.start_ts
+        if self.duration is not None:
+            snapshot.duration = self.duration
+
+
+@dataclass
+class _SnapshotIndexEntry:
+    offset: int
+    """The offset of the snapshot's line in the file."""
+    length: int
+    kind: Literal['node', 'end']
+    status: SnapshotStatus
+    """The current status of the snapshot, taking status records into account."""
+
+
+@asynccontextmanager
+async def _file_lock(file: Path, *, timeout: float) -> AsyncIterator[None]:
+    lock_file = file.parent / f'{file.name}.pydantic-graph-persistence-lock'
+    lock_id = secrets.token_urlsafe().encode()
+
+    with anyio.fail_after(timeout):
+        while not await _file_append_check(lock_file, lock_id):
+            await anyio.sleep(0.01)
+
+    try:
+        yield
+    finally:
+        await _graph_utils.run_in_executor(lock_file.unlink, missing_ok=True)
 
 
 async def _file_append_check(file: Path, content: bytes) -> bool:
@@ -2,7 +2,7 @@ from __future__ import annotations as _annotations
 
 import json
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
@@ -30,7 +30,14 @@ with try_import() as imports_successful:
         LLMJudge,
     )
     from pydantic_evals.evaluators.context import EvaluatorContext
-    from pydantic_evals.reporting import EvaluationReport, ReportCase, ReportCaseAdapter, ReportCaseFailure
+    from pydantic_evals.reporting import (
+        EvaluationReport,
+        EvaluationSummary,
+        ReportCase,
+        ReportCaseAdapter,
+        ReportCaseFailure,
+        read_report_cases,
+    )
 
     @dataclass
     class MockEvaluator(Evaluator[object, object, object]):
@@ -499,6 +506,169 @@ async def test_evaluate_with_failing_task(
     )
 
 
+async def test_evaluate_with_checkpoint(
+    example_dataset: Dataset[TaskInput, TaskOutput, TaskMetadata],
+    simple_evaluator: type[Evaluator[TaskInput, TaskOutput, TaskMetadata]],
+    tmp_path: Path,
+):
+    """Test resuming an evaluation from a checkpoint journal."""
+    example_dataset.add_evaluator(simple_evaluator())
+    checkpoint = tmp_path / 'checkpoint.jsonl'
+    calls: list[str] = []
+    fail = True
+
+    async def my_task(inputs: TaskInput) -> TaskOutput:
+        calls.append(inputs.query)
+        if inputs.query == 'What is 2+2?' and fail:
+            raise ValueError('Task error')
+        return TaskOutput(answer='Paris' if 'France' in inputs.query else '4')
+
+    first_report = await example_dataset.evaluate(my_task, checkpoint=checkpoint)
+    assert [failure.name for failure in first_report.failures] == ['case1']
+    assert len(checkpoint.read_text().splitlines()) == 1
+
+    # A line that was cut off by a crash is ignored
+    with checkpoint.open('a') as f:
+        f.write('{"task_name": "my_task", "case_na')
+    calls.clear()
+    fail = False
+
+    # Only the case that failed is run again, and the journaled case is included in the report
+    report = await example_dataset.evaluate(my_task, checkpoint=checkpoint)
+    assert calls == ['What is 2+2?']
+    assert report.failures == []
+    assert [case.name for case in report.cases] == ['case1', 'case2']
+    assert report.cases[1] == first_report.cases[0]
+    assert isinstance(report.cases[1].output, TaskOutput)
+
+    # Cases are run again for another task, or when their inputs changed
+    calls.clear()
+    await example_dataset.evaluate(my_task, checkpoint=checkpoint, task_name='other_task')
+    assert len(calls) == 2
+
+    calls.clear()
+    example_dataset.cases[1].inputs = TaskInput(query='What is the capital of Germany?')
+    await example_dataset.evaluate(my_task, checkpoint=checkpoint)
+    assert calls == ['What is the capital of Germany?']
+
+
+def test_shard():
+    dataset = Dataset[TaskInput, TaskOutput, TaskMetadata](
+        name='shards',
+        cases=[Case(name=None if i % 2 else f'case {i}', inputs=TaskInput(query=str(i))) for i in range(5)],
+        evaluators=[MockEvaluator(True)],
+    )
+
+    shards = [dataset.shard(index, 2) for index in range(2)]
+    assert [[case.name for case in shard.cases] for shard in shards] == snapshot(
+        [['case 0', 'case 2', 'case 4'], ['Case 2', 'Case 4']]
+    )
+    assert all(shard.name == 'shards' and shard.evaluators == dataset.evaluators for shard in shards)
+    # the cases of the dataset itself aren't renamed
+    assert dataset.cases[1].name is None
+
+    with pytest.raises(ValueError, match='Shard index must be between 0 and 1, got 2'):
+        dataset.shard(2, 2)
+
+
+async def shard_task(inputs: TaskInput) -> TaskOutput:
+    if inputs.query == 'fail':
+        raise ValueError('Task error')
+    return TaskOutput(answer=inputs.query.upper())
+
+
+async def test_evaluate_sharded():
+    """Test evaluating a dataset in shards that run in a process pool."""
+    dataset = Dataset[TaskInput, TaskOutput, TaskMetadata](
+        cases=[
+            *[Case(name=f'case {i}', inputs=TaskInput(query=f'query {i}')) for i in range(4)],
+            Case(inputs=TaskInput(query='fail')),
+        ],
+        evaluators=[Python('ctx.output.answer == ctx.inputs.query.upper()', evaluation_name='upper')],
+    )
+
+    report = await dataset.evaluate_sharded(shard_task, processes=2)
+    assert report.name == 'shard_task'
+    assert [case.name for case in report.cases] == ['case 0', 'case 1', 'case 2', 'case 3']
+    assert [case.output for case in report.cases] == [TaskOutput(answer=f'QUERY {i}') for i in range(4)]
+    assert [failure.name for failure in report.failures] == ['Case 5']
+    averages = report.averages()
+    assert averages is not None and averages.assertions == 1.0
+    assert report.trace_id is not None and report.span_id is not None
+
+
+async def test_evaluate_streaming(
+    example_dataset: Dataset[TaskInput, TaskOutput, TaskMetadata],
+    simple_evaluator: type[Evaluator[TaskInput, TaskOutput, TaskMetadata]],
+    tmp_path: Path,
+):
+    """Test evaluating a dataset with the results written to a JSON Lines file."""
+    example_dataset.add_evaluator(simple_evaluator())
+
+    async def failing_task(inputs: TaskInput) -> TaskOutput:
+        if inputs.query == 'What is 2+2?':
+            raise ValueError('Task error')
+        return TaskOutput(answer='Paris')
+
+    path = tmp_path / 'results.jsonl'
+    summary = await example_dataset.evaluate_streaming(failing_task, path, max_concurrency=1)
+    averages = summary.averages
+    assert averages is not None
+    assert averages.task_duration >= 0 and averages.total_duration >= 0
+    assert averages.model_dump(exclude={'task_duration', 'total_duration'}) == snapshot(
+        {'name': 'Averages', 'scores': {'confidence': 1.0}, 'labels': {}, 'metrics': {}, 'assertions': 1.0}
+    )
+    assert replace(summary, averages=None) == snapshot(
+        EvaluationSummary(
+            name='failing_task',
+            n_cases=1,
+            n_failures=1,
+            averages=None,
+            trace_id='00000000000000000000000000000001',
+            span_id='0000000000000001',
+        )
+    )
+
+    results = list(read_report_cases(path))
+    assert [(type(result).__name__, result.name) for result in results] == snapshot(
+        [('ReportCaseFailure', 'case1'), ('ReportCase', 'case2')]
+    )
+    assert isinstance(results[0], ReportCaseFailure)
+    assert results[0].error_message == 'ValueError: Task error'
+    assert isinstance(results[1], ReportCase)
+    assert results[1].output == {'answer': 'Paris', 'confidence': 1.0}
+    assert results[1].assertions['correct'].value is True
+
+
+async def test_evaluate_streaming_lazy_cases(example_dataset: Dataset[TaskInput, TaskOutput, TaskMetadata]):
+    """Test evaluating cases produced by a generator, with a custom sink."""
+    pulled = 0
+
+    def cases():
+        nonlocal pulled
+        for i in range(5):
+            pulled += 1
+            yield Case(name=None if i % 2 else f'case {i}', inputs=TaskInput(query=str(i)))
+
+    written: list[ReportCase | ReportCaseFailure] = []
+
+    class ListSink:
+        def write(self, case: ReportCase | ReportCaseFailure) -> None:
+            written.append(case)
+
+    async def task(inputs: TaskInput) -> TaskOutput:
+        # cases are only pulled once a worker is free to run them
+        assert pulled <= len(written) + 2
+        return TaskOutput(answer=inputs.query)
+
+    summary = await example_dataset.evaluate_streaming(
+        task, ListSink(), cases=cases(), max_concurrency=2, progress=False
+    )
+    assert (summary.n_cases, summary.n_failures) == (5, 0)
+    assert sorted(case.name for case in written) == ['Case 2', 'Case 4', 'case 0', 'case 2', 'case 4']
+    assert summary.averages is not None and summary.averages.assertions is None
+
+
 async def test_evaluate_with_failing_evaluator(example_dataset: Dataset[TaskInput, TaskOutput, TaskMetadata]):
     """Test evaluating a dataset with a failing evaluator."""
 
@@ -1,6 +1,8 @@
 from __future__ import annotations as _annotations
 
 import asyncio
+import pickle
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from inline_snapshot import snapshot
@@ -15,7 +17,7 @@ with try_import() as imports_successful:
     from pydantic_evals.otel._context_subtree import (
         context_subtree,
     )
-    from pydantic_evals.otel.span_tree import SpanQuery, SpanTree
+    from pydantic_evals.otel.span_tree import AttributeValue, SpanNode, SpanQuery, SpanTree, compile_span_query
 
 pytestmark = [pytest.mark.skipif(not imports_successful(), reason='pydantic-evals not installed'), pytest.mark.anyio]
 
@@ -865,6 +867,114 @@ async def test_or_cannot_be_mixed(span_tree: SpanTree):
     assert str(exc_info.value) == snapshot("Cannot combine 'or_' conditions with other conditions at the same level")
 
 
+async def test_span_tree_add_spans_incrementally():
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def span(
+        name: str, span_id: int, parent_span_id: int | None, offset: int, **attributes: AttributeValue
+    ) -> SpanNode:
+        return SpanNode(
+            name=name,
+            trace_id=1,
+            span_id=span_id,
+            parent_span_id=parent_span_id,
+            start_timestamp=start + timedelta(seconds=offset),
+            end_timestamp=start + timedelta(seconds=offset + 1),
+            attributes=attributes,
+        )
+
+    tree = SpanTree()
+    # The children arrive before their parent, and out of order
+    tree.add_spans([span('child2', 3, 1, 2, kind='tool'), span('grandchild', 4, 3, 3, kind='tool')])
+    assert [node.name for node in tree.roots] == ['child2']
+    child2 = tree.roots[0]
+    assert [node.name for node in child2.descendants] == ['grandchild']
+
+    tree.add_spans([span('root', 1, None, 0), span('child1', 2, 1, 1, kind='model')])
+    root = tree.roots[0]
+    assert [node.name for node in tree.roots] == ['root']
+    assert [node.name for node in tree] == ['root', 'child1', 'child2', 'grandchild']
+    assert [node.name for node in root.children] == ['child1', 'child2']
+    assert [node.name for node in root.descendants] == ['child2', 'grandchild', 'child1']
+    assert [node.name for node in root.descendants] == [node.name for node in root.find_descendants(lambda _: True)]
+    assert [node.name for node in child2.children[0].ancestors] == ['child2', 'root']
+
+    # Queries that can use the indexes return the same nodes in the same order as queries that can't
+    assert [node.name for node in tree.find({'has_attributes': {'kind': 'tool'}})] == ['child2', 'grandchild']
+    assert [node.name for node in tree.find({'or_': [{'name_equals': 'grandchild'}, {'name_equals': 'root'}]})] == [
+        'root',
+        'grandchild',
+    ]
+    assert [node.name for node in tree.find({'has_attribute_keys': ['kind'], 'name_contains': 'child'})] == [
+        'child1',
+        'child2',
+        'grandchild',
+    ]
+    assert [node.name for node in tree.find({'has_attributes': {'kind': None}})] == ['root']
+    assert [node.name for node in tree.find({'some_descendant_has': {'has_attributes': {'kind': 'tool'}}})] == [
+        'root',
+        'child2',
+    ]
+    assert [node.name for node in tree.find({'no_descendant_has': {'name_equals': 'child1'}})] == [
+        'child1',
+        'child2',
+        'grandchild',
+    ]
+
+
+async def test_compile_span_query(span_tree: SpanTree):
+    query = compile_span_query(
+        {'has_attributes': {'type': 'normal'}, 'some_ancestor_has': {'name_equals': 'root'}, 'max_duration': 10}
+    )
+    assert [node.name for node in span_tree.find(query)] == ['grandchild2', 'child2', 'grandchild3']
+    assert [node.name for node in span_tree.find(query)] == ['grandchild2', 'child2', 'grandchild3']
+    assert [node.name for node in span_tree.roots[0].find_descendants(query)] == [
+        'child2',
+        'grandchild3',
+        'grandchild2',
+    ]
+    assert not span_tree.roots[0].matches(query)
+    assert repr(compile_span_query({'name_equals': 'root'})) == snapshot("CompiledSpanQuery({'name_equals': 'root'})")
+
+    leaves = compile_span_query({'no_child_has': {'min_duration': 0}, 'min_depth': 1})
+    assert [node.name for node in span_tree.find(leaves)] == ['grandchild1', 'grandchild2', 'grandchild3']
+
+    # Remembered results are forgotten when the tree changes
+    grandchild3 = span_tree.first({'name_equals': 'grandchild3'})
+    assert grandchild3 is not None
+    span_tree.add_spans(
+        [
+            SpanNode(
+                name='great_grandchild',
+                trace_id=grandchild3.trace_id,
+                span_id=1000,
+                parent_span_id=grandchild3.span_id,
+                start_timestamp=grandchild3.start_timestamp,
+                end_timestamp=grandchild3.end_timestamp,
+                attributes={},
+            )
+        ]
+    )
+    assert [node.name for node in span_tree.find(leaves)] == ['grandchild1', 'grandchild2', 'great_grandchild']
+
+    with pytest.raises(ValueError, match="Cannot combine 'or_' conditions with other conditions at the same level"):
+        compile_span_query({'some_child_has': {'name_equals': 'child1', 'or_': [{'name_equals': 'child2'}]}})
+
+
+async def test_span_tree_pickle(span_tree: SpanTree):
+    query = compile_span_query({'has_attributes': {'type': 'normal'}, 'some_ancestor_has': {'name_equals': 'root'}})
+    descendants = compile_span_query({'some_descendant_has': {'name_equals': 'grandchild1'}})
+    expected = [node.name for node in span_tree.find(query)]
+    assert [node.name for node in span_tree.find(descendants)] == ['root', 'child1']
+
+    unpickled = pickle.loads(pickle.dumps(span_tree))
+    assert [node.name for node in unpickled.find(query)] == expected
+    assert [node.name for node in unpickled.find(descendants)] == ['root', 'child1']
+    assert [node.name for node in unpickled.roots[0].descendants] == [
+        node.name for node in span_tree.roots[0].descendants
+    ]
+
+
 async def test_context_subtree_invalid_tracer_provider(mocker: MockerFixture):
     """Test that context_subtree correctly records spans in independent async contexts."""
     # from opentelemetry import trace
@@ -18,6 +18,7 @@ with try_import() as imports_successful:
         ReportCase,
         ReportCaseAdapter,
         ReportCaseAggregate,
+        ReportCaseAggregator,
     )
 
 pytestmark = [pytest.mark.skipif(not imports_successful(), reason='pydantic-evals not installed'), pytest.mark.anyio]
@@ -156,6 +157,81 @@ async def test_report_case_aggregate():
     assert aggregate.total_duration == 0.2
 
 
+async def test_report_case_aggregator(sample_report_case: ReportCase, mock_evaluator: Evaluator[Any, Any, Any]):
+    """Test that ReportCaseAggregator produces the same averages as ReportCaseAggregate.average."""
+    source = mock_evaluator.as_spec()
+    other_case = ReportCase(
+        name='other_case',
+        inputs={'query': 'What is 3+3?'},
+        output={'answer': '5'},
+        expected_output={'answer': '6'},
+        metadata={'difficulty': 'medium'},
+        metrics={'tokens': 10},
+        attributes={},
+        scores={'accuracy': EvaluationResult(name='accuracy', value=0.5, reason=None, source=source)},
+        labels={'grade': EvaluationResult(name='grade', value='B', reason=None, source=source)},
+        assertions={'correct': EvaluationResult(name='correct', value=False, reason=None, source=source)},
+        task_duration=0.3,
+        total_duration=0.4,
+    )
+    cases = [sample_report_case, other_case]
+
+    aggregator = ReportCaseAggregator()
+    assert aggregator.aggregate() == ReportCaseAggregate.average([])
+    for case in cases:
+        aggregator.add(case)
+
+    assert aggregator.count == 2
+    assert aggregator.aggregate() == ReportCaseAggregate.average(cases)
+    assert aggregator.aggregate() == snapshot(
+        ReportCaseAggregate(
+            name='Averages',
+            scores={'accuracy': 0.5},
+            labels={'grade': {'B': 1.0}},
+            metrics={'tokens': 10.0},
+            assertions=0.5,
+            task_duration=0.2,
+            total_duration=0.30000000000000004,
+        )
+    )
+
+
+async def test_report_merge(sample_report_case: ReportCase):
+    """Test merging the reports of shards of a dataset."""
+    other_case = ReportCase(
+        name='other_case',
+        inputs={'query': 'What is 3+3?'},
+        output={'answer': '6'},
+        expected_output={'answer': '6'},
+        metadata={'difficulty': 'medium'},
+        metrics={},
+        attributes={},
+        scores={},
+        labels={},
+        assertions={},
+        task_duration=0.3,
+        total_duration=0.4,
+        trace_id='test-trace-id',
+        span_id='other-span-id',
+    )
+    reports = [
+        EvaluationReport(name='shard', cases=[sample_report_case], trace_id='test-trace-id', span_id='span-1'),
+        EvaluationReport(name='shard', cases=[other_case], trace_id='test-trace-id', span_id='span-2'),
+    ]
+
+    merged = EvaluationReport.merge(reports, name='merged')
+    assert merged == EvaluationReport(
+        name='merged', cases=[sample_report_case, other_case], trace_id='test-trace-id', span_id=None
+    )
+    assert merged.averages() == ReportCaseAggregate.average([sample_report_case, other_case])
+
+    assert EvaluationReport.merge(reports[:1]) == reports[0]
+    reports[1].trace_id = 'other-trace-id'
+    assert EvaluationReport.merge(reports).trace_id is None
+    with pytest.raises(ValueError, match='At least one report is required to merge'):
+        EvaluationReport.merge([])
+
+
 async def test_report_serialization(sample_report: EvaluationReport):
     """Test serializing a report to dict."""
     # Serialize the report
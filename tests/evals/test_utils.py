@@ -2,10 +2,11 @@ from __future__ import annotations as _annotations
 
 import functools
 import sys
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterator
 from functools import partial
 from typing import Any
 
+import anyio
 import pytest
 from dirty_equals import HasRepr
 
@@ -24,6 +25,7 @@ with try_import() as imports_successful:
         get_unwrapped_function_name,
         is_set,
         task_group_gather,
+        task_group_map,
     )
 
 pytestmark = [pytest.mark.skipif(not imports_successful(), reason='pydantic-evals not installed'), pytest.mark.anyio]
@@ -149,3 +151,50 @@ async def test_task_group_gather_with_error():
     assert exc_info.value == HasRepr(
         repr(ExceptionGroup('unhandled errors in a TaskGroup', [ValueError('Task 2 failed')]))
     )
+
+
+async def test_task_group_map_pulls_items_lazily():
+    """Test that task_group_map only pulls items when a call can be started."""
+    pulled: list[int] = []
+    running = 0
+    max_running = 0
+
+    def items() -> Iterator[int]:
+        for i in range(10):
+            pulled.append(i)
+            yield i
+
+    results: list[int] = []
+
+    async def double(item: int) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # items are only pulled for calls that are running or have completed
+        assert len(pulled) <= len(results) + 3
+        await anyio.sleep(0.001)
+        results.append(item * 2)
+        running -= 1
+
+    await task_group_map(items(), double, max_concurrency=3)
+    assert sorted(results) == [i * 2 for i in range(10)]
+    assert max_running == 3
+
+
+async def test_task_group_map_async_iterable():
+    """Test task_group_map with an async iterable and unlimited concurrency."""
+
+    async def items() -> AsyncIterator[int]:
+        for i in range(3):
+            yield i
+
+    results: list[int] = []
+
+    async def record(item: int) -> None:
+        results.append(item)
+
+    await task_group_map(items(), record)
+    assert sorted(results) == [0, 1, 2]
+
+    await task_group_map(items(), record, max_concurrency=2)
+    assert sorted(results) == [0, 0, 1, 1, 2, 2]
@@ -1,5 +1,6 @@
 from __future__ import annotations as _annotations
 
+import json
 from dataclasses import dataclass
 from datetime import timezone
 from pathlib import Path
@@ -16,7 +17,8 @@ from pydantic_graph import (
     GraphRunContext,
     NodeSnapshot,
 )
-from pydantic_graph.persistence.file import FileStatePersistence
+from pydantic_graph.exceptions import GraphNodeStatusError
+from pydantic_graph.persistence.file import FileStatePersistence, JsonlFileStatePersistence
 
 from ..conftest import IsFloat, IsNow
 
@@ -201,3 +203,205 @@ async def test_record_lookup_error(tmp_path: Path):
     with pytest.raises(LookupError, match="No snapshot found with id='foobar'"):
         async with persistence.record_run('foobar'):
             pass
+
+
+async def test_jsonl_run(tmp_path: Path, mock_snapshot_id: object):
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JsonlFileStatePersistence(p)
+    result = await my_graph.run(Float2String(3.14), persistence=persistence)
+    assert result.output == 8
+    assert await persistence.load_all() == snapshot(
+        [
+            NodeSnapshot(
+                state=None,
+                node=Float2String(input_data=3.14),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='success',
+                id='Float2String:1',
+            ),
+            NodeSnapshot(
+                state=None,
+                node=String2Length(input_data='3.14'),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='success',
+                id='String2Length:2',
+            ),
+            NodeSnapshot(
+                state=None,
+                node=Double(input_data=4),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='success',
+                id='Double:3',
+            ),
+            EndSnapshot(state=None, result=End(data=8), ts=IsNow(tz=timezone.utc), id='end:4'),
+        ]
+    )
+    lines = p.read_bytes().splitlines()
+    assert [json.loads(line)['kind'] for line in lines] == snapshot(
+        ['node', 'status', 'status', 'node', 'status', 'status', 'node', 'status', 'status', 'end']
+    )
+
+
+async def test_jsonl_next_from_persistence(tmp_path: Path, mock_snapshot_id: object):
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JsonlFileStatePersistence(p)
+
+    async with my_graph.iter(Float2String(3.14), persistence=persistence) as run:
+        node = await run.next()
+        assert node == snapshot(String2Length(input_data='3.14'))
+
+    # a new instance, e.g. in another process, builds its index from the file
+    persistence = JsonlFileStatePersistence(p)
+    async with my_graph.iter_from_persistence(persistence) as run:
+        node = await run.next()
+        assert node == snapshot(Double(input_data=4))
+        assert node.get_snapshot_id() == snapshot('Double:3')
+
+        node = await run.next()
+        assert node == snapshot(End(data=8))
+        assert node.get_snapshot_id() == snapshot('end:4')
+
+    assert [
+        (s.id, s.status if isinstance(s, NodeSnapshot) else None) for s in await persistence.load_all()
+    ] == snapshot(
+        [
+            ('Float2String:1', 'success'),
+            ('String2Length:2', 'success'),
+            ('Double:3', 'success'),
+            ('end:4', None),
+        ]
+    )
+    assert await persistence.load_next() is None
+
+
+async def test_jsonl_node_error(tmp_path: Path, mock_snapshot_id: object):
+    @dataclass
+    class Foo(BaseNode):
+        async def run(self, ctx: GraphRunContext) -> Bar:
+            return Bar()
+
+    @dataclass
+    class Bar(BaseNode[None, None, None]):
+        async def run(self, ctx: GraphRunContext) -> End[None]:
+            raise RuntimeError('test error')
+
+    g = Graph(nodes=(Foo, Bar))
+    persistence = JsonlFileStatePersistence(tmp_path / 'test_graph.jsonl')
+    with pytest.raises(RuntimeError, match='test error'):
+        await g.run(Foo(), persistence=persistence)
+
+    assert await persistence.load_all() == snapshot(
+        [
+            NodeSnapshot(
+                state=None,
+                node=Foo(),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='success',
+                id='Foo:1',
+            ),
+            NodeSnapshot(
+                state=None,
+                node=Bar(),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='error',
+                id='Bar:2',
+            ),
+        ]
+    )
+
+    with pytest.raises(GraphNodeStatusError, match="Incorrect snapshot status 'error'"):
+        async with persistence.record_run('Bar:2'):
+            pass
+
+
+async def test_jsonl_record_lookup_error(tmp_path: Path):
+    persistence = JsonlFileStatePersistence(tmp_path / 'test_graph.jsonl')
+    persistence.set_graph_types(Graph(nodes=(Float2String, String2Length, Double)))
+
+    with pytest.raises(LookupError, match="No snapshot found with id='foobar'"):
+        async with persistence.record_run('foobar'):
+            pass
+
+
+def _float2string(input_data: float, snapshot_id: str) -> Float2String:
+    node = Float2String(input_data)
+    node.set_snapshot_id(snapshot_id)
+    return node
+
+
+async def test_jsonl_snapshot_node_if_new(tmp_path: Path):
+    persistence = JsonlFileStatePersistence(tmp_path / 'test_graph.jsonl')
+    persistence.set_graph_types(Graph(nodes=(Float2String, String2Length, Double)))
+
+    await persistence.snapshot_node_if_new('a', None, _float2string(1.0, 'a'))
+    await persistence.snapshot_node_if_new('a', None, _float2string(2.0, 'a'))
+    assert [s.node for s in await persistence.load_all()] == snapshot([Float2String(input_data=1.0)])
+
+
+async def test_jsonl_compaction(tmp_path: Path, mock_snapshot_id: object):
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JsonlFileStatePersistence(p, compact_after=4)
+    await my_graph.run(Float2String(3.14), persistence=persistence)
+
+    # the file was compacted when the 4th status record was written, after the first 2 snapshots
+    assert [json.loads(line)['kind'] for line in p.read_bytes().splitlines()] == snapshot(
+        ['node', 'node', 'node', 'status', 'status', 'end']
+    )
+    first = json.loads(p.read_bytes().splitlines()[0])
+    assert first['status'] == 'success'
+    assert first['duration'] is not None
+
+    await persistence.compact()
+    assert [json.loads(line)['kind'] for line in p.read_bytes().splitlines()] == snapshot(
+        ['node', 'node', 'node', 'end']
+    )
+    assert [
+        (s.id, s.status if isinstance(s, NodeSnapshot) else None) for s in await persistence.load_all()
+    ] == snapshot(
+        [
+            ('Float2String:1', 'success'),
+            ('String2Length:2', 'success'),
+            ('Double:3', 'success'),
+            ('end:4', None),
+        ]
+    )
+
+
+async def test_jsonl_index_tracks_other_instances(tmp_path: Path):
+    p = tmp_path / 'test_graph.jsonl'
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    persistence1 = JsonlFileStatePersistence(p)
+    persistence1.set_graph_types(my_graph)
+    persistence2 = JsonlFileStatePersistence(p)
+    persistence2.set_graph_types(my_graph)
+
+    await persistence1.snapshot_node(None, _float2string(1.0, 'a'))
+    await persistence2.snapshot_node(None, _float2string(2.0, 'b'))
+
+    snapshot_a = await persistence1.load_next()
+    assert snapshot_a is not None
+    assert snapshot_a.id == 'a'
+    assert snapshot_a.status == 'pending'
+
+    # the status record written by the first instance is picked up by the second
+    snapshot_b = await persistence2.load_next()
+    assert snapshot_b is not None
+    assert snapshot_b.id == 'b'
+
+    # after the file is replaced by compaction, the other instance rebuilds its index
+    await persistence2.compact()
+    await persistence1.snapshot_node(None, _float2string(3.0, 'c'))
+    async with persistence1.record_run('c'):
+        pass
+    assert [(s.id, s.status) for s in await persistence2.load_all() if isinstance(s, NodeSnapshot)] == snapshot(
+        [('a', 'pending'), ('b', 'pending'), ('c', 'success')]
+    )
+    assert await persistence2.load_next() is None
@@ -20,6 +20,7 @@ from pydantic_ai import (
     BinaryContent,
     BuiltinToolCallPart,
     BuiltinToolReturnPart,
+    CachePoint,
     DocumentUrl,
     FinalResultEvent,
     ImageUrl,
@@ -92,6 +93,7 @@ with try_import() as imports_successful:
     from pydantic_ai.models.anthropic import (
         AnthropicModel,
         AnthropicModelSettings,
+        _add_cache_control,  # pyright: ignore[reportPrivateUsage]
         _map_usage,  # pyright: ignore[reportPrivateUsage]
     )
     from pydantic_ai.models.openai import OpenAIResponsesModel, OpenAIResponsesModelSettings
@@ -282,6 +284,82 @@ async def test_async_request_prompt_caching(allow_model_requests: None):
     assert last_message.cost().total_price == snapshot(Decimal('0.00002688'))
 
 
+async def test_cache_points(allow_model_requests: None):
+    c = completion_message([BetaTextBlock(text='world', type='text')], BetaUsage(input_tokens=5, output_tokens=10))
+    mock_client = MockAnthropic.create_mock(c)
+    m = AnthropicModel('claude-3-5-haiku-latest', provider=AnthropicProvider(anthropic_client=mock_client))
+    agent = Agent(m, instructions='You are a helpful assistant.')
+
+    @agent.tool_plain
+    def get_location(loc_name: str) -> str:
+        raise NotImplementedError  # pragma: no cover
+
+    await agent.run([CachePoint(), 'a long document', CachePoint(), 'a question'])
+    kwargs = get_mock_chat_completion_kwargs(mock_client)[-1]
+    assert kwargs['system'] == 'You are a helpful assistant.'
+    assert 'cache_control' not in kwargs['tools'][-1]
+    assert kwargs['messages'] == snapshot(
+        [
+            {
+                'role': 'user',
+                'content': [
+                    {'text': 'a long document', 'type': 'text', 'cache_control': {'type': 'ephemeral'}},
+                    {'text': 'a question', 'type': 'text'},
+                ],
+            }
+        ]
+    )
+
+    mock_client.index = 0  # type: ignore
+    settings = AnthropicModelSettings(
+        anthropic_cache_tool_definitions=True, anthropic_cache_instructions=True, anthropic_cache_messages=True
+    )
+    result = await agent.run('hello', model_settings=settings)
+    kwargs = get_mock_chat_completion_kwargs(mock_client)[-1]
+    assert kwargs['system'] == snapshot(
+        [{'type': 'text', 'text': 'You are a helpful assistant.', 'cache_control': {'type': 'ephemeral'}}]
+    )
+    assert kwargs['tools'][-1]['cache_control'] == {'type': 'ephemeral'}
+    assert kwargs['messages'] == snapshot(
+        [{'role': 'user', 'content': [{'text': 'hello', 'type': 'text', 'cache_control': {'type': 'ephemeral'}}]}]
+    )
+
+    # Message cache points are limited so that there are at most 4 in total
+    mock_client.index = 0  # type: ignore
+    await agent.run(
+        ['another question', CachePoint()],
+        message_history=result.all_messages(),
+        model_settings=AnthropicModelSettings(
+            anthropic_cache_tool_definitions=True, anthropic_cache_instructions=True, anthropic_cache_messages=3
+        ),
+    )
+    kwargs = get_mock_chat_completion_kwargs(mock_client)[-1]
+    assert kwargs['messages'] == snapshot(
+        [
+            {'role': 'user', 'content': [{'text': 'hello', 'type': 'text'}]},
+            {
+                'role': 'assistant',
+                'content': [{'text': 'world', 'type': 'text', 'cache_control': {'type': 'ephemeral'}}],
+            },
+            {
+                'role': 'user',
+                'content': [{'text': 'another question', 'type': 'text', 'cache_control': {'type': 'ephemeral'}}],
+            },
+        ]
+    )
+
+
+def test_add_cache_control_skips_thinking():
+    blocks: list[dict[str, Any]] = [
+        {'type': 'text', 'text': 'answer'},
+        {'type': 'thinking', 'thinking': 'hmm', 'signature': 'sig'},
+    ]
+    assert _add_cache_control(blocks)
+    assert blocks[0]['cache_control'] == {'type': 'ephemeral'}
+    assert not _add_cache_control(blocks)
+    assert not _add_cache_control([{'type': 'redacted_thinking', 'data': 'abc'}])
+
+
 async def test_async_request_text_response(allow_model_requests: None):
     c = completion_message(
         [BetaTextBlock(text='world', type='text')],
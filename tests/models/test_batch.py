@@ -0,0 +1,531 @@
+from __future__ import annotations as _annotations
+
+import asyncio
+import json
+import re
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+from inline_snapshot import snapshot
+from pydantic import ValidationError
+
+from pydantic_ai import (
+    Agent,
+    CodeExecutionTool,
+    ModelHTTPError,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    UnexpectedModelBehavior,
+)
+from pydantic_ai.models import BatchModelRequest, ModelRequestParameters
+from pydantic_ai.usage import RequestUsage
+
+from ..conftest import try_import
+
+with try_import() as openai_imports_successful:
+    from openai import AsyncOpenAI
+
+    from pydantic_ai.models.openai import OpenAIChatModel
+    from pydantic_ai.providers.openai import OpenAIProvider
+
+with try_import() as anthropic_imports_successful:
+    from anthropic import AsyncAnthropic
+
+    from pydantic_ai.models.anthropic import AnthropicModel
+    from pydantic_ai.providers.anthropic import AnthropicProvider
+
+pytestmark = pytest.mark.anyio
+
+requires_openai = pytest.mark.skipif(not openai_imports_successful(), reason='openai not installed')
+requires_anthropic = pytest.mark.skipif(not anthropic_imports_successful(), reason='anthropic not installed')
+
+
+class FakeOpenAIBatchServer:
+    """Implements the parts of the OpenAI Files and Batch APIs that `OpenAIChatModel.request_batch` uses.
+
+    `respond` is called with the body of each request in a batch, and returns the status code and body of its result.
+    Batches are reported as `status` when they're retrieved.
+    """
+
+    def __init__(self, respond: Callable[[dict[str, Any]], tuple[int, dict[str, Any]]], status: str = 'completed'):
+        self.respond = respond
+        self.status = status
+        self.files: dict[str, bytes] = {}
+        self.batches: list[list[dict[str, Any]]] = []
+        self.output_files: dict[str, str] = {}
+        self.cancelled: list[str] = []
+        self.retrievals = 0
+
+    def client(self) -> AsyncOpenAI:
+        return AsyncOpenAI(
+            api_key='test', base_url='https://fake.test/v1', http_client=httpx.AsyncClient(transport=self.transport())
+        )
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == 'POST' and path == '/v1/files':
+            boundary = request.headers['content-type'].split('boundary=')[1].encode()
+            [file_part] = [p for p in request.content.split(b'--' + boundary) if b'name="file"' in p]
+            file_id = f'file-{len(self.files)}'
+            self.files[file_id] = file_part.split(b'\r\n\r\n', 1)[1].removesuffix(b'\r\n')
+            return httpx.Response(200, json=self._file(file_id, 'batch'))
+        elif request.method == 'POST' and path == '/v1/batches':
+            body = json.loads(request.content)
+            requests = [json.loads(line) for line in self.files[body['input_file_id']].splitlines()]
+            self.batches.append([r['body'] for r in requests])
+            output: list[str] = []
+            for r in requests:
+                status_code, response_body = self.respond(r['body'])
+                output.append(
+                    json.dumps(
+                        {
+                            'id': f'batch_req_{r["custom_id"]}',
+                            'custom_id': r['custom_id'],
+                            'response': {'status_code': status_code, 'request_id': 'req', 'body': response_body},
+                            'error': None,
+                        }
+                    )
+                )
+            output_file_id = f'file-{len(self.files)}'
+            self.files[output_file_id] = '\n'.join(output).encode()
+            batch_id = f'batch_{len(self.batches)}'
+            self.output_files[batch_id] = output_file_id
+            return httpx.Response(200, json=self._batch(batch_id, body['input_file_id'], 'in_progress'))
+        elif request.method == 'GET' and (match := re.fullmatch(r'/v1/batches/(\w+)', path)):
+            self.retrievals += 1
+            batch_id = match.group(1)
+            return httpx.Response(200, json=self._batch(batch_id, 'file-0', self.status, self.output_files[batch_id]))
+        elif request.method == 'POST' and (match := re.fullmatch(r'/v1/batches/(\w+)/cancel', path)):
+            self.cancelled.append(match.group(1))
+            return httpx.Response(200, json=self._batch(match.group(1), 'file-0', 'cancelling'))
+        elif request.method == 'GET' and (match := re.fullmatch(r'/v1/files/(.+)/content', path)):
+            return httpx.Response(200, content=self.files[match.group(1)])
+        return httpx.Response(404, json={'error': {'message': 'Not found'}})  # pragma: no cover
+
+    def _file(self, file_id: str, purpose: str) -> dict[str, Any]:
+        return {
+            'id': file_id,
+            'object': 'file',
+            'bytes': len(self.files[file_id]),
+            'created_at': 1704067200,
+            'filename': 'batch.jsonl',
+            'purpose': purpose,
+            'status': 'processed',
+        }
+
+    def _batch(
+        self, batch_id: str, input_file_id: str, status: str, output_file_id: str | None = None
+    ) -> dict[str, Any]:
+        return {
+            'id': batch_id,
+            'object': 'batch',
+            'endpoint': '/v1/chat/completions',
+            'input_file_id': input_file_id,
+            'completion_window': '24h',
+            'status': status,
+            'created_at': 1704067200,
+            'output_file_id': output_file_id,
+        }
+
+
+def chat_completion(content: str) -> dict[str, Any]:
+    return {
+        'id': 'chatcmpl-123',
+        'object': 'chat.completion',
+        'created': 1704067200,
+        'model': 'gpt-4o-123',
+        'choices': [
+            {'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': content}},
+        ],
+        'usage': {'prompt_tokens': 10, 'completion_tokens': 2, 'total_tokens': 12},
+    }
+
+
+class FakeAnthropicBatchServer:
+    """Implements the parts of the Anthropic Message Batches API that `AnthropicModel.request_batch` uses.
+
+    `respond` is called with the params of each request in a batch, and returns its result. Batches are reported as
+    `status` when they're retrieved.
+    """
+
+    def __init__(self, respond: Callable[[dict[str, Any]], dict[str, Any]], status: str = 'ended'):
+        self.respond = respond
+        self.status = status
+        self.cancelled: list[str] = []
+        self.batches: list[list[dict[str, Any]]] = []
+        self.betas: list[str | None] = []
+        self.results: dict[str, list[dict[str, Any]]] = {}
+
+    def client(self) -> AsyncAnthropic:
+        return AsyncAnthropic(
+            api_key='test', base_url='https://fake.test', http_client=httpx.AsyncClient(transport=self.transport())
+        )
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == 'POST' and path == '/v1/messages/batches':
+            requests = json.loads(request.content)['requests']
+            self.batches.append([r['params'] for r in requests])
+            self.betas.append(request.headers.get('anthropic-beta'))
+            batch_id = f'msgbatch_{len(self.batches)}'
+            self.results[batch_id] = [
+                {'custom_id': r['custom_id'], 'result': self.respond(r['params'])} for r in reversed(requests)
+            ]
+            return httpx.Response(200, json=self._batch(batch_id, 'in_progress'))
+        elif request.method == 'GET' and (match := re.fullmatch(r'/v1/messages/batches/(\w+)', path)):
+            return httpx.Response(200, json=self._batch(match.group(1), self.status))
+        elif request.method == 'POST' and (match := re.fullmatch(r'/v1/messages/batches/(\w+)/cancel', path)):
+            self.cancelled.append(match.group(1))
+            return httpx.Response(200, json=self._batch(match.group(1), 'canceling'))
+        elif request.method == 'GET' and (match := re.fullmatch(r'/v1/messages/batches/(\w+)/results', path)):
+            return httpx.Response(200, content='\n'.join(json.dumps(r) for r in self.results[match.group(1)]))
+        return httpx.Response(404, json={'error': {'message': 'Not found'}})  # pragma: no cover
+
+    def _batch(self, batch_id: str, status: str) -> dict[str, Any]:
+        return {
+            'id': batch_id,
+            'type': 'message_batch',
+            'processing_status': status,
+            'request_counts': {'processing': 0, 'succeeded': 0, 'errored': 0, 'canceled': 0, 'expired': 0},
+            'created_at': '2024-01-01T00:00:00Z',
+            'expires_at': '2024-01-02T00:00:00Z',
+            'ended_at': None,
+            'cancel_initiated_at': None,
+            'archived_at': None,
+            'results_url': f'https://fake.test/v1/messages/batches/{batch_id}/results' if status == 'ended' else None,
+        }
+
+
+def anthropic_message(text: str) -> dict[str, Any]:
+    return {
+        'id': 'msg_123',
+        'type': 'message',
+        'role': 'assistant',
+        'model': 'claude-sonnet-4-0',
+        'content': [{'type': 'text', 'text': text}],
+        'stop_reason': 'end_turn',
+        'stop_sequence': None,
+        'usage': {'input_tokens': 10, 'output_tokens': 2},
+    }
+
+
+def last_user_prompt(messages: list[dict[str, Any]]) -> str:
+    content = messages[-1]['content']
+    return content if isinstance(content, str) else content[-1]['text']
+
+
+@requires_openai
+async def test_openai_request_batch(allow_model_requests: None):
+    def respond(body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        prompt = last_user_prompt(body['messages'])
+        if prompt == 'fail':
+            return 400, {'error': {'message': 'Invalid request'}}
+        elif prompt == 'invalid':
+            return 200, {'unexpected': 'response'}
+        return 200, chat_completion(prompt.upper())
+
+    server = FakeOpenAIBatchServer(respond)
+    model = OpenAIChatModel('gpt-4o', provider=OpenAIProvider(openai_client=server.client()))
+    requests = [
+        BatchModelRequest([ModelRequest.user_text_prompt(p)], {'temperature': 0.5}, ModelRequestParameters())
+        for p in ['hello', 'fail', 'world', 'invalid']
+    ]
+
+    responses = await model.request_batch(requests, poll_interval=0)
+
+    hello, fail, world, invalid = responses
+    assert isinstance(hello, ModelResponse) and isinstance(world, ModelResponse)
+    assert hello.parts == [TextPart('HELLO')]
+    assert hello.usage == RequestUsage(input_tokens=10, output_tokens=2)
+    assert world.parts == [TextPart('WORLD')]
+    assert isinstance(fail, ModelHTTPError)
+    assert fail.status_code == 400
+    assert isinstance(invalid, ValidationError)
+    assert server.batches == snapshot(
+        [
+            [
+                {'model': 'gpt-4o', 'messages': [{'role': 'user', 'content': 'hello'}], 'temperature': 0.5},
+                {'model': 'gpt-4o', 'messages': [{'role': 'user', 'content': 'fail'}], 'temperature': 0.5},
+                {'model': 'gpt-4o', 'messages': [{'role': 'user', 'content': 'world'}], 'temperature': 0.5},
+                {'model': 'gpt-4o', 'messages': [{'role': 'user', 'content': 'invalid'}], 'temperature': 0.5},
+            ]
+        ]
+    )
+    assert server.retrievals == 1
+
+
+@requires_openai
+async def test_openai_request_batch_missing_result(allow_model_requests: None):
+    server = FakeOpenAIBatchServer(lambda body: (200, chat_completion('hi')))
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        response = server.handle(request)
+        if request.url.path == '/v1/batches/batch_1':
+            batch = json.loads(response.content)
+            return httpx.Response(200, json={**batch, 'status': 'expired', 'output_file_id': None})
+        return response
+
+    client = AsyncOpenAI(
+        api_key='test',
+        base_url='https://fake.test/v1',
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handle)),
+    )
+    model = OpenAIChatModel('gpt-4o', provider=OpenAIProvider(openai_client=client))
+
+    [response] = await model.request_batch(
+        [BatchModelRequest([ModelRequest.user_text_prompt('hi')], None, ModelRequestParameters())], poll_interval=0
+    )
+    assert isinstance(response, UnexpectedModelBehavior)
+    assert response.message == snapshot("Batch batch_1 ended with status 'expired' without a result for this request")
+
+
+@requires_openai
+async def test_openai_request_batch_api_error(allow_model_requests: None):
+    client = AsyncOpenAI(
+        api_key='test',
+        base_url='https://fake.test/v1',
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(403, json={'error': {'message': 'Nope'}}))
+        ),
+        max_retries=0,
+    )
+    model = OpenAIChatModel('gpt-4o', provider=OpenAIProvider(openai_client=client))
+    with pytest.raises(ModelHTTPError) as exc_info:
+        await model.request_batch(
+            [BatchModelRequest([ModelRequest.user_text_prompt('hi')], None, ModelRequestParameters())]
+        )
+    assert exc_info.value.status_code == 403
+
+
+@requires_openai
+async def test_openai_request_batch_split(allow_model_requests: None, monkeypatch: pytest.MonkeyPatch):
+    server = FakeOpenAIBatchServer(lambda body: (200, chat_completion(last_user_prompt(body['messages']).upper())))
+    model = OpenAIChatModel('gpt-4o', provider=OpenAIProvider(openai_client=server.client()))
+    requests = [BatchModelRequest([ModelRequest.user_text_prompt(p)], None, ModelRequestParameters()) for p in 'abcde']
+
+    # Requests that don't fit in one batch are split over multiple batches, and their responses are kept in order
+    monkeypatch.setattr('pydantic_ai.models.openai._BATCH_MAX_REQUESTS', 2)
+    responses = await model.request_batch(requests, poll_interval=0)
+    assert [r.parts for r in responses if isinstance(r, ModelResponse)] == [[TextPart(p.upper())] for p in 'abcde']
+    assert sorted(len(batch) for batch in server.batches) == [1, 2, 2]
+
+    # The size of the batch input file is limited too
+    monkeypatch.setattr('pydantic_ai.models.openai._BATCH_MAX_REQUESTS', 50_000)
+    monkeypatch.setattr('pydantic_ai.models.openai._BATCH_MAX_BYTES', 300)
+    server.batches.clear()
+    responses = await model.request_batch(requests, poll_interval=0)
+    assert [r.parts for r in responses if isinstance(r, ModelResponse)] == [[TextPart(p.upper())] for p in 'abcde']
+    assert sorted(len(batch) for batch in server.batches) == [1, 2, 2]
+
+
+@requires_openai
+async def test_openai_request_batch_cancelled(allow_model_requests: None):
+    server = FakeOpenAIBatchServer(lambda body: (200, chat_completion('hi')), status='in_progress')
+    model = OpenAIChatModel('gpt-4o', provider=OpenAIProvider(openai_client=server.client()))
+    task = asyncio.create_task(
+        model.request_batch(
+            [BatchModelRequest([ModelRequest.user_text_prompt('hi')], None, ModelRequestParameters())],
+            poll_interval=0.01,
+        )
+    )
+    while not server.retrievals:
+        await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert server.cancelled == ['batch_1']
+
+
+@requires_openai
+async def test_openai_run_batch_with_tools(allow_model_requests: None):
+    def respond(body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        last = body['messages'][-1]
+        if last['role'] == 'tool':
+            return 200, chat_completion(f'The answer is {last["content"]}')
+        prompt = last['content']
+        if prompt.startswith('double'):
+            completion = chat_completion('')
+            completion['choices'][0]['message'] = {
+                'role': 'assistant',
+                'content': None,
+                'tool_calls': [
+                    {
+                        'id': '1',
+                        'type': 'function',
+                        'function': {'name': 'double', 'arguments': json.dumps({'x': int(prompt.split()[1])})},
+                    }
+                ],
+            }
+            completion['choices'][0]['finish_reason'] = 'tool_calls'
+            return 200, completion
+        return 200, chat_completion(prompt.upper())
+
+    server = FakeOpenAIBatchServer(respond)
+    agent = Agent(OpenAIChatModel('gpt-4o', provider=OpenAIProvider(openai_client=server.client())))
+
+    @agent.tool_plain
+    def double(x: int) -> int:
+        return x * 2
+
+    results = await agent.run_batch(['double 2', 'hello', 'double 5'], poll_interval=0)
+
+    assert [r if isinstance(r, Exception) else r.output for r in results] == snapshot(
+        ['The answer is 4', 'HELLO', 'The answer is 10']
+    )
+    # The first batch has all prompts, the second the tool results
+    assert [len(batch) for batch in server.batches] == [3, 2]
+
+
+@requires_anthropic
+async def test_anthropic_request_batch(allow_model_requests: None):
+    def respond(params: dict[str, Any]) -> dict[str, Any]:
+        prompt = last_user_prompt(params['messages'])
+        if prompt == 'fail':
+            return {
+                'type': 'errored',
+                'error': {'type': 'error', 'error': {'type': 'invalid_request_error', 'message': 'Bad'}},
+            }
+        return {'type': 'succeeded', 'message': anthropic_message(prompt.upper())}
+
+    server = FakeAnthropicBatchServer(respond)
+    model = AnthropicModel('claude-sonnet-4-0', provider=AnthropicProvider(anthropic_client=server.client()))
+    requests = [
+        BatchModelRequest([ModelRequest.user_text_prompt(p)], {'max_tokens': 100}, ModelRequestParameters())
+        for p in ['hello', 'fail', 'world']
+    ]
+
+    hello, fail, world = await model.request_batch(requests, poll_interval=0)
+
+    assert isinstance(hello, ModelResponse) and isinstance(world, ModelResponse)
+    assert hello.parts == [TextPart('HELLO')]
+    assert world.parts == [TextPart('WORLD')]
+    assert isinstance(fail, UnexpectedModelBehavior)
+    assert fail.message == snapshot('Request in batch msgbatch_1 errored')
+    assert fail.body is not None
+    assert json.loads(fail.body) == snapshot(
+        {'error': {'type': 'error', 'error': {'type': 'invalid_request_error', 'message': 'Bad'}, 'request_id': None}}
+    )
+    assert server.batches == snapshot(
+        [
+            [
+                {
+                    'max_tokens': 100,
+                    'messages': [{'role': 'user', 'content': [{'text': 'hello', 'type': 'text'}]}],
+                    'model': 'claude-sonnet-4-0',
+                },
+                {
+                    'max_tokens': 100,
+                    'messages': [{'role': 'user', 'content': [{'text': 'fail', 'type': 'text'}]}],
+                    'model': 'claude-sonnet-4-0',
+                },
+                {
+                    'max_tokens': 100,
+                    'messages': [{'role': 'user', 'content': [{'text': 'world', 'type': 'text'}]}],
+                    'model': 'claude-sonnet-4-0',
+                },
+            ]
+        ]
+    )
+    assert server.betas == snapshot(['message-batches-2024-09-24'])
+
+
+@requires_anthropic
+async def test_anthropic_request_batch_missing_result(allow_model_requests: None):
+    server = FakeAnthropicBatchServer(lambda params: {'type': 'expired'})
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith('/results'):
+            return httpx.Response(200, content='')
+        return server.handle(request)
+
+    client = AsyncAnthropic(
+        api_key='test',
+        base_url='https://fake.test',
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handle)),
+    )
+    model = AnthropicModel('claude-sonnet-4-0', provider=AnthropicProvider(anthropic_client=client))
+    [response] = await model.request_batch(
+        [BatchModelRequest([ModelRequest.user_text_prompt('hi')], None, ModelRequestParameters())], poll_interval=0
+    )
+    assert isinstance(response, UnexpectedModelBehavior)
+    assert response.message == snapshot('Batch msgbatch_1 ended without a result for this request')
+
+
+@requires_anthropic
+async def test_anthropic_request_batch_api_error(allow_model_requests: None):
+    client = AsyncAnthropic(
+        api_key='test',
+        base_url='https://fake.test',
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(403, json={'error': {'message': 'Nope'}}))
+        ),
+        max_retries=0,
+    )
+    model = AnthropicModel('claude-sonnet-4-0', provider=AnthropicProvider(anthropic_client=client))
+    with pytest.raises(ModelHTTPError) as exc_info:
+        await model.request_batch(
+            [BatchModelRequest([ModelRequest.user_text_prompt('hi')], None, ModelRequestParameters())]
+        )
+    assert exc_info.value.status_code == 403
+
+
+@requires_anthropic
+async def test_anthropic_request_batch_betas(allow_model_requests: None):
+    server = FakeAnthropicBatchServer(lambda params: {'type': 'succeeded', 'message': anthropic_message('hi')})
+    model = AnthropicModel('claude-sonnet-4-0', provider=AnthropicProvider(anthropic_client=server.client()))
+    parameters = ModelRequestParameters(builtin_tools=[CodeExecutionTool()])
+    requests = [BatchModelRequest([ModelRequest.user_text_prompt('hi')], None, parameters) for _ in range(2)]
+
+    await model.request_batch(requests, poll_interval=0)
+
+    assert server.betas == snapshot(['code-execution-2025-05-22,message-batches-2024-09-24'])
+
+
+@requires_anthropic
+async def test_anthropic_request_batch_split(allow_model_requests: None, monkeypatch: pytest.MonkeyPatch):
+    server = FakeAnthropicBatchServer(
+        lambda params: {'type': 'succeeded', 'message': anthropic_message(last_user_prompt(params['messages']).upper())}
+    )
+    model = AnthropicModel('claude-sonnet-4-0', provider=AnthropicProvider(anthropic_client=server.client()))
+    requests = [BatchModelRequest([ModelRequest.user_text_prompt(p)], None, ModelRequestParameters()) for p in 'abcde']
+
+    monkeypatch.setattr('pydantic_ai.models.anthropic._BATCH_MAX_REQUESTS', 2)
+    responses = await model.request_batch(requests, poll_interval=0)
+    assert [r.parts for r in responses if isinstance(r, ModelResponse)] == [[TextPart(p.upper())] for p in 'abcde']
+    assert sorted(len(batch) for batch in server.batches) == [1, 2, 2]
+
+    monkeypatch.setattr('pydantic_ai.models.anthropic._BATCH_MAX_REQUESTS', 100_000)
+    monkeypatch.setattr('pydantic_ai.models.anthropic._BATCH_MAX_BYTES', 300)
+    server.batches.clear()
+    responses = await model.request_batch(requests, poll_interval=0)
+    assert [r.parts for r in responses if isinstance(r, ModelResponse)] == [[TextPart(p.upper())] for p in 'abcde']
+    assert sorted(len(batch) for batch in server.batches) == [1, 2, 2]
+
+
+@requires_anthropic
+async def test_anthropic_request_batch_cancelled(allow_model_requests: None):
+    server = FakeAnthropicBatchServer(lambda params: {'type': 'expired'}, status='in_progress')
+    model = AnthropicModel('claude-sonnet-4-0', provider=AnthropicProvider(anthropic_client=server.client()))
+    task = asyncio.create_task(
+        model.request_batch(
+            [BatchModelRequest([ModelRequest.user_text_prompt('hi')], None, ModelRequestParameters())],
+            poll_interval=0.01,
+        )
+    )
+    while not server.batches:
+        await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert server.cancelled == ['msgbatch_1']
@@ -1,19 +1,27 @@
 from __future__ import annotations as _annotations
 
 import datetime
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack, aclosing
 from typing import Any
 
+import anyio
 import pytest
 from inline_snapshot import snapshot
 from typing_extensions import TypedDict
 
 from pydantic_ai import (
     BinaryContent,
+    CachePoint,
     DocumentUrl,
     FinalResultEvent,
     FunctionToolCallEvent,
     FunctionToolResultEvent,
     ImageUrl,
+    ModelMessage,
     ModelRequest,
     ModelResponse,
     PartDeltaEvent,
@@ -39,7 +47,12 @@ from pydantic_ai.usage import RequestUsage, RunUsage
 from ..conftest import IsDatetime, IsInstance, IsStr, try_import
 
 with try_import() as imports_successful:
-    from pydantic_ai.models.bedrock import BedrockConverseModel, BedrockModelSettings
+    from pydantic_ai.models.bedrock import (
+        BedrockConverseModel,
+        BedrockModelSettings,
+        _map_usage,  # pyright: ignore[reportPrivateUsage]
+        _StreamPump,  # pyright: ignore[reportPrivateUsage]
+    )
     from pydantic_ai.models.openai import OpenAIResponsesModel, OpenAIResponsesModelSettings
     from pydantic_ai.providers.bedrock import BedrockProvider
     from pydantic_ai.providers.openai import OpenAIProvider
@@ -1272,3 +1285,172 @@ async def test_bedrock_no_tool_choice(bedrock_provider: BedrockProvider):
             ]
         }
     )
+
+
+async def test_bedrock_cache_points(bedrock_provider: BedrockProvider):
+    model = BedrockConverseModel('us.anthropic.claude-sonnet-4-20250514-v1:0', provider=bedrock_provider)
+    my_tool = ToolDefinition(name='my_tool', parameters_json_schema={'type': 'object', 'properties': {}})
+    mrp = ModelRequestParameters(function_tools=[my_tool])
+    req = [
+        ModelRequest(
+            parts=[
+                SystemPromptPart(content='You are a helpful assistant.'),
+                UserPromptPart(content=[CachePoint(), 'a long document', CachePoint(), 'a question']),
+            ]
+        ),
+        ModelResponse(parts=[TextPart(content='an answer')]),
+        ModelRequest(parts=[UserPromptPart(content='another question')]),
+    ]
+
+    system_prompt, bedrock_messages = await model._map_messages(req)  # type: ignore[reportPrivateUsage]
+    tool_config = model._map_tool_config(mrp)  # type: ignore[reportPrivateUsage]
+    settings = BedrockModelSettings(
+        bedrock_cache_tool_definitions=True, bedrock_cache_instructions=True, bedrock_cache_messages=3
+    )
+    model._add_cache_points(system_prompt, bedrock_messages, tool_config, settings)  # type: ignore[reportPrivateUsage]
+
+    assert system_prompt == snapshot([{'text': 'You are a helpful assistant.'}, {'cachePoint': {'type': 'default'}}])
+    assert tool_config is not None
+    assert tool_config['tools'][-1] == snapshot({'cachePoint': {'type': 'default'}})
+    # Only one message cache point fits next to the explicit one, the tools one and the instructions one
+    assert bedrock_messages == snapshot(
+        [
+            {
+                'role': 'user',
+                'content': [{'text': 'a long document'}, {'cachePoint': {'type': 'default'}}, {'text': 'a question'}],
+            },
+            {'role': 'assistant', 'content': [{'text': 'an answer'}]},
+            {'role': 'user', 'content': [{'text': 'another question'}, {'cachePoint': {'type': 'default'}}]},
+        ]
+    )
+
+
+def test_bedrock_cache_usage():
+    assert _map_usage(
+        {'inputTokens': 3, 'outputTokens': 5, 'totalTokens': 18, 'cacheReadInputTokens': 6, 'cacheWriteInputTokens': 4}  # type: ignore[typeddict-unknown-key]
+    ) == snapshot(RequestUsage(input_tokens=13, cache_write_tokens=4, cache_read_tokens=6, output_tokens=5))
+    assert _map_usage({'inputTokens': 3, 'outputTokens': 5, 'totalTokens': 8}) == snapshot(
+        RequestUsage(input_tokens=3, output_tokens=5)
+    )
+
+
+async def test_stream_pump():
+    executor = ThreadPoolExecutor(max_workers=1)
+    assert [item async for item in _StreamPump(range(5), executor)] == [0, 1, 2, 3, 4]
+
+    def failing() -> Iterator[int]:
+        yield 1
+        raise ValueError('stream broke')
+
+    items: list[int] = []
+    with pytest.raises(ValueError, match='stream broke'):
+        async for item in _StreamPump(failing(), executor):
+            items.append(item)
+    assert items == [1]
+
+
+async def test_stream_pump_backpressure_and_close():
+    read = 0
+    closed = threading.Event()
+
+    class FakeEventStream:
+        def __iter__(self) -> Iterator[int]:
+            nonlocal read
+            while not closed.is_set():
+                read += 1
+                yield read
+                time.sleep(0.001)
+
+        def close(self) -> None:
+            closed.set()
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    async with aclosing(aiter(_StreamPump(FakeEventStream(), executor, max_buffered=10))) as stream:
+        async for item in stream:
+            if item == 1:
+                # The worker reads ahead until the buffer is full, then waits for the event loop
+                time.sleep(0.1)
+            elif item == 5:
+                break
+    assert read <= 1 + 10 + 1
+
+    assert closed.is_set()
+    # The worker is freed up once the stream is closed
+    executor.submit(lambda: None).result(timeout=1)
+
+
+async def test_stream_pump_single_worker():
+    """Reading a stream shouldn't take a trip to a thread and back for every event."""
+    event = {'contentBlockDelta': {'delta': {'text': 'tok '}, 'contentBlockIndex': 0}}
+
+    class CountingExecutor(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Any:
+            self.submitted += 1
+            return super().submit(fn, *args, **kwargs)
+
+    executor = CountingExecutor(max_workers=1)
+    count = 0
+    async for _ in _StreamPump((event for _ in range(20_000)), executor, max_buffered=100):
+        count += 1
+
+    assert count == 20_000
+    # A single worker reads the whole stream, even though it has to wait for the event loop to catch up
+    assert executor.submitted == 1
+
+
+def test_bedrock_executor(bedrock_provider: BedrockProvider):
+    executor = ThreadPoolExecutor(max_workers=1)
+    model = BedrockConverseModel('us.amazon.nova-micro-v1:0', provider=bedrock_provider, executor=executor)
+    assert model.executor is executor
+
+    # Models that weren't given an executor share one
+    model1 = BedrockConverseModel('us.amazon.nova-micro-v1:0', provider=bedrock_provider)
+    model2 = BedrockConverseModel('us.amazon.nova-pro-v1:0', provider=bedrock_provider)
+    assert model1.executor is model2.executor
+
+
+async def test_bedrock_streams_dont_hold_executor(bedrock_provider: BedrockProvider):
+    """Open streams are read in threads of their own, so they can't starve requests of executor workers."""
+    released = threading.Event()
+
+    class FakeEventStream:
+        def __iter__(self) -> Iterator[dict[str, Any]]:
+            yield {'messageStart': {'role': 'assistant'}}
+            yield {'contentBlockDelta': {'delta': {'text': 'Hello'}, 'contentBlockIndex': 0}}
+            released.wait()
+
+        def close(self) -> None:
+            released.set()
+
+    class FakeClient:
+        def converse_stream(self, **kwargs: Any) -> dict[str, Any]:
+            return {'stream': FakeEventStream(), 'ResponseMetadata': {'RequestId': 'stream'}}
+
+        def converse(self, **kwargs: Any) -> dict[str, Any]:
+            return {
+                'output': {'message': {'role': 'assistant', 'content': [{'text': 'Hi'}]}},
+                'usage': {'inputTokens': 1, 'outputTokens': 1, 'totalTokens': 2},
+                'stopReason': 'end_turn',
+            }
+
+    model = BedrockConverseModel(
+        'us.amazon.nova-micro-v1:0', provider=bedrock_provider, executor=ThreadPoolExecutor(max_workers=1)
+    )
+    model.client = FakeClient()  # type: ignore[assignment]
+    messages: list[ModelMessage] = [ModelRequest.user_text_prompt('Hello')]
+    params = ModelRequestParameters()
+
+    async with AsyncExitStack() as stack:
+        for _ in range(3):
+            response = await stack.enter_async_context(model.request_stream(messages, None, params))
+            event = await anext(aiter(response))
+            assert isinstance(event, PartStartEvent)
+
+        # Three streams are open, but the executor's only worker is still free for other requests
+        with anyio.fail_after(5):
+            model_response = await model.request(messages, None, params)
+        assert model_response.parts == [TextPart(content='Hi')]
+
+        released.set()
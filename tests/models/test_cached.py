@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from inline_snapshot import snapshot
+
+from pydantic_ai import (
+    Agent,
+    BuiltinToolCallPart,
+    BuiltinToolReturnPart,
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    PartStartEvent,
+    TextPart,
+    ThinkingPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.cached import (
+    CachedModel,
+    InMemoryResponseCache,
+    KeyValueResponseCache,
+    ResponseCache,
+    SQLiteResponseCache,
+)
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.usage import RequestUsage, RunUsage
+
+pytestmark = pytest.mark.anyio
+
+
+class DictStore:
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        self.data[key] = value
+
+
+def counting_model() -> tuple[FunctionModel, list[int]]:
+    calls: list[int] = []
+
+    def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        calls.append(len(messages))
+        return ModelResponse(parts=[TextPart(f'response {len(calls)}')], usage=RequestUsage(input_tokens=10))
+
+    async def stream(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+        calls.append(len(messages))
+        yield 'streamed '
+        yield f'response {len(calls)}'
+
+    return FunctionModel(respond, stream_function=stream), calls
+
+
+async def test_request_hit():
+    model, calls = counting_model()
+    cached_model = CachedModel(model)
+    agent = Agent(cached_model)
+
+    result = await agent.run('Hello')
+    assert result.output == 'response 1'
+    assert result.usage() == snapshot(RunUsage(requests=1, input_tokens=10))
+
+    # The timestamps of the messages differ, but they're ignored
+    result = await agent.run('Hello')
+    assert result.output == 'response 1'
+    assert result.usage() == snapshot(RunUsage(requests=1))
+    assert calls == [1]
+
+    # A different prompt, settings or instructions make a different request
+    assert (await agent.run('Goodbye')).output == 'response 2'
+    assert (await agent.run('Hello', model_settings={'temperature': 0.5})).output == 'response 3'
+    assert (await Agent(cached_model, instructions='Be brief').run('Hello')).output == 'response 4'
+    assert calls == [1, 1, 1, 1]
+
+
+async def test_multi_turn_rerun_hit():
+    calls: list[int] = []
+
+    def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        calls.append(len(messages))
+        usage = RequestUsage(input_tokens=10 * len(calls))
+        if len(messages) == 1:
+            return ModelResponse(
+                parts=[ToolCallPart('get_weather', {'city': 'Paris'}, tool_call_id='call_1')],
+                usage=usage,
+                provider_response_id=f'resp_{len(calls)}',
+            )
+        return ModelResponse(parts=[TextPart('Sunny')], usage=usage, provider_response_id=f'resp_{len(calls)}')
+
+    agent = Agent(CachedModel(FunctionModel(respond)))
+
+    @agent.tool_plain
+    def get_weather(city: str) -> str:
+        return f'Sunny in {city}'
+
+    assert (await agent.run('Weather?')).output == 'Sunny'
+    assert calls == [1, 3]
+
+    # The replayed tool call response has no usage, but the request that follows it still hits the cache
+    result = await agent.run('Weather?')
+    assert result.output == 'Sunny'
+    assert result.usage() == snapshot(RunUsage(requests=2, tool_calls=1))
+    assert calls == [1, 3]
+
+
+async def test_request_stream_hit():
+    model, calls = counting_model()
+    agent = Agent(CachedModel(model))
+
+    async with agent.run_stream('Hello') as result:
+        assert await result.get_output() == 'streamed response 1'
+
+    async with agent.run_stream('Hello') as result:
+        assert [c async for c in result.stream_text(debounce_by=None)] == snapshot(['streamed response 1'])
+    assert result.usage() == snapshot(RunUsage(requests=1))
+    assert calls == [1]
+
+    # Responses to non-streamed requests are replayed as streams too
+    assert (await agent.run('Goodbye')).output == 'response 2'
+    async with agent.run_stream('Goodbye') as result:
+        assert await result.get_output() == 'response 2'
+    assert calls == [1, 1]
+
+
+async def test_incomplete_stream_not_stored():
+    model, calls = counting_model()
+    cached_model = CachedModel(model)
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('Hello')])]
+    parameters = ModelRequestParameters()
+
+    async with cached_model.request_stream(messages, None, parameters) as stream:
+        async for _ in stream:
+            break
+    async with cached_model.request_stream(messages, None, parameters) as stream:
+        async for _ in stream:
+            pass
+    assert calls == [1, 1]
+
+    async with cached_model.request_stream(messages, None, parameters) as stream:
+        async for _ in stream:
+            pass
+    assert calls == [1, 1]
+
+
+async def test_incomplete_stream_not_read_further():
+    chunks: list[str] = []
+
+    async def stream(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+        for chunk in ['one ', 'two ', 'three']:
+            chunks.append(chunk)
+            yield chunk
+
+    cached_model = CachedModel(FunctionModel(stream_function=stream))
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('Hello')])]
+
+    async with cached_model.request_stream(messages, None, ModelRequestParameters()) as response:
+        async for _ in response:
+            break
+    # The rest of the response isn't requested from the model once the consumer stopped reading it
+    assert chunks == ['one ']
+    assert response.get().parts == snapshot([TextPart(content='one ')])
+
+
+async def test_stream_replays_all_part_kinds():
+    response = ModelResponse(
+        parts=[
+            ThinkingPart('Thinking', signature='sig'),
+            BuiltinToolCallPart('web_search', {'query': 'weather'}, tool_call_id='builtin_1', provider_name='test'),
+            BuiltinToolReturnPart('web_search', 'sunny', tool_call_id='builtin_1', provider_name='test'),
+            TextPart('It is sunny.'),
+            ToolCallPart('get_forecast', {'days': 3}, tool_call_id='call_1'),
+        ],
+        model_name='test-model',
+        provider_name='test',
+        provider_response_id='resp_1',
+        finish_reason='tool_call',
+    )
+    model, calls = counting_model()
+    cached_model = CachedModel(model)
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('Hello')])]
+    parameters = ModelRequestParameters()
+
+    await cached_model.cache.set(cached_model.cache_key(messages, None, parameters), response)
+    async with cached_model.request_stream(messages, None, parameters) as stream:
+        events = [event async for event in stream]
+
+    assert [event.part for event in events if isinstance(event, PartStartEvent)] == response.parts
+    replayed = stream.get()
+    assert replayed.parts == response.parts
+    assert (replayed.model_name, replayed.provider_name, replayed.provider_response_id, replayed.finish_reason) == (
+        'test-model',
+        'test',
+        'resp_1',
+        'tool_call',
+    )
+    assert replayed.usage == RequestUsage()
+    assert stream.timestamp == replayed.timestamp
+    assert calls == []
+
+
+async def test_in_memory_cache_eviction():
+    cache = InMemoryResponseCache(max_size=2)
+    for key in ['a', 'b', 'c']:
+        await cache.set(key, ModelResponse(parts=[TextPart(key)]))
+        # Using `b` keeps it from being evicted
+        await cache.get('b')
+    assert await cache.get('a') is None
+    assert await cache.get('b') is not None
+    assert await cache.get('c') is not None
+
+
+@pytest.mark.parametrize('backend', ['sqlite', 'kv'])
+async def test_persistent_caches(tmp_path: Path, backend: str):
+    def make_cache() -> ResponseCache:
+        if backend == 'sqlite':
+            return SQLiteResponseCache(tmp_path / 'responses.sqlite')
+        return KeyValueResponseCache(store)
+
+    store = DictStore()
+    response = ModelResponse(
+        parts=[TextPart('Hello'), ToolCallPart('tool', {'a': 1}, tool_call_id='call_1')], model_name='test-model'
+    )
+    cache = make_cache()
+    assert await cache.get('key') is None
+    await cache.set('key', response)
+    assert await cache.get('key') == response
+
+    # A new instance sees responses stored by another one
+    assert await make_cache().get('key') == response
+
+
+async def test_cache_key():
+    model, _ = counting_model()
+    cached_model = CachedModel(model)
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('Hello')])]
+    key = cached_model.cache_key(messages, None, ModelRequestParameters())
+    assert key == cached_model.cache_key([ModelRequest(parts=[UserPromptPart('Hello')])], {}, ModelRequestParameters())
+    assert key != cached_model.cache_key(messages, {'max_tokens': 10}, ModelRequestParameters())
+    assert key != CachedModel(FunctionModel(lambda m, i: ModelResponse(parts=[]))).cache_key(
+        messages, None, ModelRequestParameters()
+    )
+    assert cached_model.model_name == model.model_name
+
+    # Timestamps of messages and parts are ignored, but not those in tool arguments or returns
+    def conversation(timestamp: datetime, value: str) -> list[ModelMessage]:
+        return [
+            ModelRequest(parts=[UserPromptPart('Hello', timestamp=timestamp)]),
+            ModelResponse(
+                parts=[ToolCallPart('lookup', {'timestamp': value}, tool_call_id='call_1')], timestamp=timestamp
+            ),
+            ModelRequest(
+                parts=[ToolReturnPart('lookup', {'timestamp': value}, tool_call_id='call_1', timestamp=timestamp)]
+            ),
+        ]
+
+    key = cached_model.cache_key(conversation(datetime(2025, 1, 1), 'a'), None, ModelRequestParameters())
+    assert key == cached_model.cache_key(conversation(datetime(2025, 1, 2), 'a'), None, ModelRequestParameters())
+    assert key != cached_model.cache_key(conversation(datetime(2025, 1, 1), 'b'), None, ModelRequestParameters())
+
+
+async def test_request_batch():
+    model, calls = counting_model()
+    agent = Agent(CachedModel(model))
+
+    assert (await agent.run('Hello')).output == 'response 1'
+
+    results = await agent.run_batch(['Hello', 'Goodbye', 'Hello again'])
+    assert [r if isinstance(r, Exception) else r.output for r in results] == ['response 1', 'response 2', 'response 3']
+    assert calls == [1, 1, 1]
+
+    results = await agent.run_batch(['Goodbye'])
+    assert [r if isinstance(r, Exception) else r.output for r in results] == ['response 2']
+    assert calls == [1, 1, 1]
+
+    def fail(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        raise ValueError('Failed')
+
+    cache = InMemoryResponseCache()
+    results = await Agent(CachedModel(FunctionModel(fail), cache=cache)).run_batch(['Hello'])
+    assert [repr(r) for r in results] == ["ValueError('Failed')"]
+    assert cache._responses == {}  # pyright: ignore[reportPrivateUsage]
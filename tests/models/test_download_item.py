@@ -1,7 +1,14 @@
+import asyncio
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import anyio
+import httpx
 import pytest
 
-from pydantic_ai import AudioUrl, DocumentUrl, ImageUrl, VideoUrl
-from pydantic_ai.models import UserError, download_item
+from pydantic_ai import AudioUrl, DocumentUrl, ImageUrl, VideoUrl, models
+from pydantic_ai.models import DownloadCache, UserError, download_item, set_download_cache
 
 from ..conftest import IsInstance, IsStr
 
@@ -59,3 +66,161 @@ async def test_download_item_no_content_type() -> None:
     )
     assert downloaded_item['data_type'] == 'text/markdown'
     assert downloaded_item['data'] == IsStr()
+
+
+@dataclass
+class MockServer:
+    content: bytes = b'file content'
+    headers: dict[str, str] = field(default_factory=lambda: {'content-type': 'text/plain'})
+    requests: list[httpx.Request] = field(default_factory=list)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await anyio.sleep(0.01)
+        etag = self.headers.get('etag')
+        if etag is not None and request.headers.get('if-none-match') == etag:
+            return httpx.Response(304, headers=self.headers)
+        return httpx.Response(200, content=self.content, headers=self.headers)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+
+async def test_download_cache_fresh():
+    server = MockServer(headers={'content-type': 'text/plain', 'cache-control': 'public, max-age=60'})
+    cache = DownloadCache()
+    async with server.client() as client:
+        first = await cache.fetch('https://example.com/file.txt', client)
+        second = await cache.fetch('https://example.com/file.txt', client)
+
+    assert second is first
+    assert first.content == b'file content'
+    assert len(server.requests) == 1
+    assert (cache.hits, cache.revalidations, cache.misses) == (1, 0, 1)
+
+    # encoded variants are only computed once
+    assert first.base64() == 'ZmlsZSBjb250ZW50'
+    assert first.base64() is first.base64()
+    assert first.size == len(b'file content') + len('ZmlsZSBjb250ZW50')
+
+
+async def test_download_cache_revalidate_etag():
+    server = MockServer(headers={'content-type': 'text/plain', 'cache-control': 'no-cache', 'etag': '"abc"'})
+    cache = DownloadCache()
+    async with server.client() as client:
+        first = await cache.fetch('https://example.com/file.txt', client)
+        second = await cache.fetch('https://example.com/file.txt', client)
+
+    assert second is first
+    assert [r.headers.get('if-none-match') for r in server.requests] == [None, '"abc"']
+    assert (cache.hits, cache.revalidations, cache.misses) == (0, 1, 1)
+
+
+@pytest.mark.parametrize(
+    'headers',
+    [
+        {'cache-control': 'no-store, max-age=60', 'etag': '"abc"'},
+        {'cache-control': 'max-age=60', 'age': '60'},
+        {'cache-control': 'max-age=invalid'},
+        {},
+    ],
+)
+async def test_download_cache_not_cacheable(headers: dict[str, str]):
+    server = MockServer(headers=headers)
+    cache = DownloadCache()
+    async with server.client() as client:
+        await cache.fetch('https://example.com/file.txt', client)
+        await cache.fetch('https://example.com/file.txt', client)
+
+    assert len(server.requests) == 2
+    assert (cache.hits, cache.revalidations, cache.misses) == (0, 0, 2)
+
+
+async def test_download_cache_concurrent_fetches():
+    server = MockServer()
+    cache = DownloadCache()
+    async with server.client() as client:
+        downloads = await asyncio.gather(*(cache.fetch('https://example.com/file.txt', client) for _ in range(5)))
+
+    assert len(server.requests) == 1
+    assert all(d is downloads[0] for d in downloads)
+
+
+async def test_download_cache_memory_lru():
+    server = MockServer(content=b'x' * 10, headers={'cache-control': 'max-age=60'})
+    cache = DownloadCache(max_size=25)
+    async with server.client() as client:
+        await cache.fetch('https://example.com/a', client)
+        await cache.fetch('https://example.com/b', client)
+        await cache.fetch('https://example.com/a', client)
+        # evicts b, the least recently used
+        await cache.fetch('https://example.com/c', client)
+        await cache.fetch('https://example.com/a', client)
+        await cache.fetch('https://example.com/b', client)
+
+    assert [r.url.path for r in server.requests] == ['/a', '/b', '/c', '/b']
+
+    cache.clear()
+    assert (cache.hits, cache.revalidations, cache.misses) == (0, 0, 0)
+
+
+async def test_download_cache_directory(tmp_path: Path):
+    server = MockServer(headers={'content-type': 'text/plain', 'cache-control': 'max-age=60'})
+    async with server.client() as client:
+        cache = DownloadCache(directory=tmp_path)
+        await cache.fetch('https://example.com/a', client)
+        await cache.fetch('https://example.com/b', client)
+        assert len(server.requests) == 2
+
+        # files are loaded from disk by a new cache, e.g. in a new process
+        cache = DownloadCache(directory=tmp_path)
+        download = await cache.fetch('https://example.com/a', client)
+        assert download.content == b'file content'
+        assert download.content_type == 'text/plain'
+        assert len(server.requests) == 2
+
+    # the same content at multiple URLs is only stored once
+    assert len(list((tmp_path / 'blobs').iterdir())) == 1
+    assert len(list(tmp_path.glob('*.json'))) == 2
+
+
+async def test_download_cache_directory_eviction(tmp_path: Path):
+    server = MockServer(headers={'cache-control': 'max-age=60'})
+    cache = DownloadCache(directory=tmp_path, max_disk_size=25)
+    async with server.client() as client:
+        for i in range(3):
+            server.content = f'file content {i}'.encode()
+            await cache.fetch(f'https://example.com/{i}', client)
+            os.utime(cache._meta_path(f'https://example.com/{i}'), (i, i))  # pyright: ignore[reportPrivateUsage]
+
+        # only the most recently saved file fits
+        cache = DownloadCache(directory=tmp_path)
+        assert await cache.load('https://example.com/0') is None
+        assert await cache.load('https://example.com/1') is None
+        download = await cache.load('https://example.com/2')
+        assert download is not None
+        assert download.content == b'file content 2'
+
+    assert len(list((tmp_path / 'blobs').iterdir())) == 1
+
+
+async def test_download_item_uses_download_cache(monkeypatch: pytest.MonkeyPatch):
+    server = MockServer(content=b'%PDF-1.4', headers={'content-type': 'application/pdf', 'cache-control': 'max-age=60'})
+    # caching downloads is opt-in
+    assert models._download_cache is None  # pyright: ignore[reportPrivateUsage]
+    cache = DownloadCache()
+    monkeypatch.setattr(models, '_download_cache', cache)
+    async with server.client() as client:
+        monkeypatch.setattr(models, 'cached_async_http_client', lambda: client)
+        item = DocumentUrl(url='https://example.com/doc.pdf')
+        first = await download_item(item, data_format='base64_uri', type_format='extension')
+        second = await download_item(item, data_format='base64')
+
+        set_download_cache(None)
+        third = await download_item(item, data_format='bytes')
+
+    assert first == {'data': 'data:application/pdf;base64,JVBERi0xLjQ=', 'data_type': 'pdf'}
+    assert second == {'data': 'JVBERi0xLjQ=', 'data_type': 'application/pdf'}
+    assert third == {'data': b'%PDF-1.4', 'data_type': 'application/pdf'}
+    assert len(server.requests) == 2
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import sys
 from collections.abc import AsyncIterator
@@ -12,10 +13,11 @@ from inline_snapshot import snapshot
 from pydantic_core import to_json
 
 from pydantic_ai import Agent, ModelHTTPError, ModelMessage, ModelRequest, ModelResponse, TextPart, UserPromptPart
-from pydantic_ai.models.fallback import FallbackModel
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.fallback import FallbackModel, HedgingPolicy, LatencyHistogram
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 from pydantic_ai.settings import ModelSettings
-from pydantic_ai.usage import RequestUsage
+from pydantic_ai.usage import RequestUsage, RunUsage
 
 from ..conftest import IsNow, try_import
 
@@ -583,3 +585,174 @@ async def test_fallback_model_settings_merge_streaming():
 
     expected = {'extra_headers': {'anthropic-beta': 'context-1m-2025-08-07'}, 'temperature': 0.5}
     assert json.loads(output) == expected
+
+
+def slow_model(name: str, delay: float) -> FunctionModel:
+    async def respond(_model_messages: list[ModelMessage], _agent_info: AgentInfo) -> ModelResponse:
+        await asyncio.sleep(delay)
+        return ModelResponse(parts=[TextPart(name)])
+
+    async def stream(_model_messages: list[ModelMessage], _agent_info: AgentInfo) -> AsyncIterator[str]:
+        await asyncio.sleep(delay)
+        yield f'{name} '
+        yield 'streamed'
+
+    return FunctionModel(respond, stream_function=stream, model_name=name)
+
+
+def test_hedging_policy_delay() -> None:
+    policy = HedgingPolicy(percentile=50, initial_delay=5, min_delay=0.5, max_delay=2, min_samples=3)
+    latencies = LatencyHistogram(window=4)
+    assert latencies.percentile(50) == float('inf')
+
+    latencies.record(1)
+    latencies.record(1.5)
+    assert policy.delay(latencies) == 2
+
+    latencies.record(0.1)
+    assert latencies.percentile(50) == 1
+    assert policy.delay(latencies) == 1
+
+    # Only the most recent latencies are kept
+    for _ in range(3):
+        latencies.record(0.2)
+    assert latencies.count == 4
+    assert latencies.percentile(100) == 0.2
+    assert policy.delay(latencies) == 0.5
+
+
+async def test_hedged_request_to_next_model() -> None:
+    fallback_model = FallbackModel(
+        slow_model('slow', 1), slow_model('fast', 0), hedging=HedgingPolicy(initial_delay=0.01)
+    )
+    agent = Agent(fallback_model)
+
+    result = await agent.run('hello')
+    assert result.output == 'fast'
+    response = result.all_messages()[-1]
+    assert isinstance(response, ModelResponse)
+    assert response.model_name == 'fast'
+    assert fallback_model.hedging_stats.hedged_requests == 1
+    assert fallback_model.hedging_stats.hedge_wins == 1
+    # The slow request was cancelled, and its tokens are unknown
+    assert fallback_model.hedging_stats.cancelled_usage == snapshot({'slow': RunUsage(requests=1)})
+    assert fallback_model.latencies[0].count == 0
+    assert fallback_model.latencies[1].count == 1
+
+
+async def test_no_hedge_when_fast_enough() -> None:
+    fallback_model = FallbackModel(
+        slow_model('primary', 0), slow_model('backup', 0), hedging=HedgingPolicy(initial_delay=1)
+    )
+
+    result = await Agent(fallback_model).run('hello')
+    assert result.output == 'primary'
+    assert fallback_model.hedging_stats.hedged_requests == 0
+    assert fallback_model.hedging_stats.cancelled_usage == {}
+    assert fallback_model.latencies[0].count == 1
+
+
+async def test_hedging_delay_from_recorded_latencies() -> None:
+    fallback_model = FallbackModel(
+        slow_model('primary', 0.05),
+        slow_model('backup', 0),
+        hedging=HedgingPolicy(initial_delay=1, min_samples=2),
+    )
+    agent = Agent(fallback_model)
+
+    for _ in range(2):
+        assert (await agent.run('hello')).output == 'primary'
+    assert fallback_model.hedging_stats.hedged_requests == 0
+
+    # Requests that are slower than the primary model's recorded latencies are hedged
+    fallback_model.models[0] = slow_model('primary', 1)
+    assert (await agent.run('hello')).output == 'backup'
+    assert fallback_model.hedging_stats.hedged_requests == 1
+
+
+async def test_hedged_request_falls_back_on_failure() -> None:
+    fallback_model = FallbackModel(failure_model, slow_model('backup', 0), hedging=HedgingPolicy(initial_delay=1))
+
+    result = await Agent(fallback_model).run('hello')
+    assert result.output == 'backup'
+    assert fallback_model.hedging_stats.hedged_requests == 0
+    assert fallback_model.hedging_stats.hedge_wins == 0
+
+
+async def test_hedged_request_all_failed() -> None:
+    async def slow_failure(_model_messages: list[ModelMessage], _agent_info: AgentInfo) -> ModelResponse:
+        await asyncio.sleep(0.05)
+        raise ModelHTTPError(status_code=500, model_name='slow', body={'error': 'test error'})
+
+    fallback_model = FallbackModel(
+        FunctionModel(slow_failure), failure_model, hedging=HedgingPolicy(initial_delay=0.01)
+    )
+
+    # The first model is still waited for after the hedged request failed
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await Agent(fallback_model).run('hello')
+    exceptions = exc_info.value.exceptions
+    assert len(exceptions) == 2
+    assert isinstance(exceptions[0], ModelHTTPError) and isinstance(exceptions[1], ModelHTTPError)
+    assert [exceptions[0].model_name, exceptions[1].model_name] == ['test-function-model', 'slow']
+    assert fallback_model.hedging_stats.hedged_requests == 1
+
+
+async def test_hedged_request_first_model_wins_after_hedge() -> None:
+    fallback_model = FallbackModel(
+        slow_model('primary', 0.05), slow_model('backup', 1), hedging=HedgingPolicy(initial_delay=0.01)
+    )
+
+    assert (await Agent(fallback_model).run('hello')).output == 'primary'
+    assert fallback_model.hedging_stats.hedged_requests == 1
+    assert fallback_model.hedging_stats.hedge_wins == 0
+    assert fallback_model.hedging_stats.cancelled_usage == snapshot({'backup': RunUsage(requests=1)})
+
+
+async def test_hedged_stream() -> None:
+    fallback_model = FallbackModel(
+        slow_model('slow', 1), slow_model('fast', 0), hedging=HedgingPolicy(initial_delay=0.01)
+    )
+    agent = Agent(fallback_model)
+
+    async with agent.run_stream('hello') as result:
+        assert [text async for text in result.stream_text(debounce_by=None)] == snapshot(['fast ', 'fast streamed'])
+    response = result.all_messages()[-1]
+    assert isinstance(response, ModelResponse)
+    assert response.model_name == 'fast'
+    assert fallback_model.hedging_stats.hedged_requests == 1
+    assert fallback_model.hedging_stats.hedge_wins == 1
+    assert fallback_model.hedging_stats.cancelled_usage == snapshot({'slow': RunUsage(requests=1)})
+
+
+async def test_hedged_stream_wins_with_first_event() -> None:
+    closed: list[str] = []
+
+    async def stream(_model_messages: list[ModelMessage], _agent_info: AgentInfo) -> AsyncIterator[str]:
+        try:
+            await asyncio.sleep(0.05)
+            yield 'slow '
+            await asyncio.sleep(0.1)
+            yield 'streamed'
+        finally:
+            closed.append('slow')
+
+    fallback_model = FallbackModel(
+        FunctionModel(stream_function=stream, model_name='slow'),
+        slow_model('fast', 0.1),
+        hedging=HedgingPolicy(initial_delay=0.01),
+    )
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('hello')])]
+
+    async with fallback_model.request_stream(messages, None, ModelRequestParameters()) as response:
+        # The first model produced its first event before the hedged request did, so it wins
+        assert response.model_name == 'slow'
+        assert closed == []
+        async for _ in response:
+            pass
+
+    assert closed == ['slow']
+    assert response.get().parts == [TextPart('slow streamed')]
+    assert fallback_model.hedging_stats.hedged_requests == 1
+    assert fallback_model.hedging_stats.hedge_wins == 0
+    assert fallback_model.hedging_stats.cancelled_usage == snapshot({'fast': RunUsage(requests=1)})
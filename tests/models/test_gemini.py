@@ -15,6 +15,7 @@ import httpx
 import pytest
 from inline_snapshot import snapshot
 from pydantic import BaseModel, Field
+from pytest_mock import MockerFixture
 
 from pydantic_ai import (
     Agent,
@@ -42,7 +43,6 @@ from pydantic_ai.models.gemini import (
     GeminiModelSettings,
     _content_model_response,
     _gemini_response_ta,
-    _gemini_streamed_response_ta,
     _GeminiCandidates,
     _GeminiContent,
     _GeminiFunction,
@@ -608,6 +608,11 @@ def gemini_response(content: _GeminiContent, finish_reason: Literal['STOP'] | No
     return _GeminiResponse(candidates=[candidate], usage_metadata=example_usage(), model_version='gemini-1.5-flash-123')
 
 
+def gemini_stream_json(responses: list[_GeminiResponse]) -> bytes:
+    """Serialize responses as the JSON array that stream requests return."""
+    return b'[' + b','.join(_gemini_response_ta.dump_json(r, by_alias=True) for r in responses) + b']'
+
+
 def example_usage() -> _GeminiUsageMetaData:
     return _GeminiUsageMetaData(prompt_token_count=1, candidates_token_count=2, total_token_count=3)
 
@@ -810,7 +815,7 @@ async def test_stream_text(get_gemini_client: GetGeminiClient):
         gemini_response(_content_model_response(ModelResponse(parts=[TextPart('Hello ')]))),
         gemini_response(_content_model_response(ModelResponse(parts=[TextPart('world')]))),
     ]
-    json_data = _gemini_streamed_response_ta.dump_json(responses, by_alias=True)
+    json_data = gemini_stream_json(responses)
     stream = AsyncByteStreamList([json_data[:100], json_data[100:200], json_data[200:]])
     gemini_client = get_gemini_client(stream)
     m = GeminiModel('gemini-1.5-flash', provider=GoogleGLAProvider(http_client=gemini_client))
@@ -841,7 +846,7 @@ async def test_stream_invalid_unicode_text(get_gemini_client: GetGeminiClient):
         gemini_response(_content_model_response(ModelResponse(parts=[TextPart('abc')]))),
         gemini_response(_content_model_response(ModelResponse(parts=[TextPart('€def')]))),
     ]
-    json_data = _gemini_streamed_response_ta.dump_json(responses, by_alias=True)
+    json_data = gemini_stream_json(responses)
 
     for i in range(10, 1000):
         parts = [json_data[:i], json_data[i:]]
@@ -867,9 +872,31 @@ async def test_stream_invalid_unicode_text(get_gemini_client: GetGeminiClient):
     assert result.usage() == snapshot(RunUsage(requests=1, input_tokens=1, output_tokens=2))
 
 
+async def test_stream_large_response(get_gemini_client: GetGeminiClient, mocker: MockerFixture):
+    """Each response in a long stream is parsed exactly once, instead of re-parsing the whole buffer for every chunk."""
+    texts = [f'{i:04d} ' + 'lorem ipsum dolor sit amet ' * 40 for i in range(200)]
+    responses = [gemini_response(_content_model_response(ModelResponse(parts=[TextPart(text)]))) for text in texts]
+    json_data = gemini_stream_json(responses)
+    # Chunks that don't line up with the responses, so that most responses are split across chunks
+    stream = AsyncByteStreamList([json_data[i : i + 1000] for i in range(0, len(json_data), 1000)])
+    gemini_client = get_gemini_client(stream)
+    m = GeminiModel('gemini-1.5-flash', provider=GoogleGLAProvider(http_client=gemini_client))
+    agent = Agent(m)
+    validate_json = mocker.spy(_gemini_response_ta, 'validate_json')
+
+    async with agent.run_stream('Hello') as result:
+        chunks = [chunk async for chunk in result.stream_text(delta=True, debounce_by=None)]
+
+    assert ''.join(chunks) == ''.join(texts)
+    assert result.usage() == snapshot(RunUsage(requests=1, input_tokens=1, output_tokens=2))
+    # Every byte of the stream is validated once, so the parsing cost grows linearly with the length of the stream
+    assert validate_json.call_count == len(responses)
+    assert sum(len(call.args[0]) for call in validate_json.call_args_list) < len(json_data)
+
+
 async def test_stream_text_no_data(get_gemini_client: GetGeminiClient):
     responses = [_GeminiResponse(candidates=[], usage_metadata=example_usage())]
-    json_data = _gemini_streamed_response_ta.dump_json(responses, by_alias=True)
+    json_data = gemini_stream_json(responses)
     stream = AsyncByteStreamList([json_data[:100], json_data[100:200], json_data[200:]])
     gemini_client = get_gemini_client(stream)
     m = GeminiModel('gemini-1.5-flash', provider=GoogleGLAProvider(http_client=gemini_client))
@@ -885,7 +912,7 @@ async def test_stream_structured(get_gemini_client: GetGeminiClient):
             _content_model_response(ModelResponse(parts=[ToolCallPart('final_result', {'response': [1, 2]})])),
         ),
     ]
-    json_data = _gemini_streamed_response_ta.dump_json(responses, by_alias=True)
+    json_data = gemini_stream_json(responses)
     stream = AsyncByteStreamList([json_data[:100], json_data[100:200], json_data[200:]])
     gemini_client = get_gemini_client(stream)
     model = GeminiModel('gemini-1.5-flash', provider=GoogleGLAProvider(http_client=gemini_client))
@@ -906,7 +933,7 @@ async def test_stream_structured_tool_calls(get_gemini_client: GetGeminiClient):
             _content_model_response(ModelResponse(parts=[ToolCallPart('bar', {'y': 'b'})])),
         ),
     ]
-    d1 = _gemini_streamed_response_ta.dump_json(first_responses, by_alias=True)
+    d1 = gemini_stream_json(first_responses)
     first_stream = AsyncByteStreamList([d1[:100], d1[100:200], d1[200:300], d1[300:]])
 
     second_responses = [
@@ -914,7 +941,7 @@ async def test_stream_structured_tool_calls(get_gemini_client: GetGeminiClient):
             _content_model_response(ModelResponse(parts=[ToolCallPart('final_result', {'response': [1, 2]})])),
         ),
     ]
-    d2 = _gemini_streamed_response_ta.dump_json(second_responses, by_alias=True)
+    d2 = gemini_stream_json(second_responses)
     second_stream = AsyncByteStreamList([d2[:100], d2[100:]])
 
     gemini_client = get_gemini_client([first_stream, second_stream])
@@ -997,7 +1024,7 @@ async def test_stream_text_heterogeneous(get_gemini_client: GetGeminiClient):
             )
         ),
     ]
-    json_data = _gemini_streamed_response_ta.dump_json(responses, by_alias=True)
+    json_data = gemini_stream_json(responses)
     stream = AsyncByteStreamList([json_data[:100], json_data[100:200], json_data[200:]])
     gemini_client = get_gemini_client(stream)
     m = GeminiModel('gemini-1.5-flash', provider=GoogleGLAProvider(http_client=gemini_client))
@@ -0,0 +1,139 @@
+from collections.abc import AsyncIterator, Iterator
+
+import anyio
+import httpx
+import pytest
+from anyio.abc import SocketAttribute
+
+from pydantic_ai import _http_pool
+from pydantic_ai._http_pool import PooledAsyncClient
+from pydantic_ai.models import (
+    HttpPoolSettings,
+    HttpPoolStats,
+    cached_async_http_client,
+    http_pool_stats,
+    set_http_pool_settings,
+)
+
+pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+def pool_settings() -> Iterator[None]:
+    yield
+    set_http_pool_settings(HttpPoolSettings())
+
+
+async def test_set_http_pool_settings(pool_settings: None):
+    default_client = cached_async_http_client(provider='pool-test')
+    assert isinstance(default_client, PooledAsyncClient)
+    assert default_client.pool_settings == HttpPoolSettings()
+
+    set_http_pool_settings(HttpPoolSettings(max_connections=500, max_connections_per_host=50, dns_cache_ttl=60))
+    client = cached_async_http_client(provider='pool-test')
+    assert client is not default_client
+    assert isinstance(client, PooledAsyncClient)
+    assert client.pool_settings.max_connections == 500
+    assert client is cached_async_http_client(provider='pool-test')
+    assert http_pool_stats()['pool-test'] == HttpPoolStats(max_connections=500)
+
+    await default_client.aclose()
+    await client.aclose()
+
+
+async def test_stats_and_per_host_limit():
+    release = anyio.Event()
+    hosts_in_flight: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hosts_in_flight.append(request.url.host)
+        await release.wait()
+        return httpx.Response(200, text='ok')
+
+    stats = HttpPoolStats(max_connections=4)
+    settings = HttpPoolSettings(max_connections=4, max_connections_per_host=2)
+    async with PooledAsyncClient(pool_settings=settings, stats=stats, transport=httpx.MockTransport(handler)) as client:
+        responses: list[httpx.Response] = []
+
+        async def get(url: str) -> None:
+            responses.append(await client.get(url))
+
+        async with anyio.create_task_group() as tg:
+            for url in ['https://a.test/1', 'https://a.test/2', 'https://a.test/3', 'https://b.test/1']:
+                tg.start_soon(get, url)
+            await anyio.wait_all_tasks_blocked()
+
+            # The third request to the same host waits for one of the others to finish
+            assert sorted(hosts_in_flight) == ['a.test', 'a.test', 'b.test']
+            assert stats.requests_in_flight == 3
+            assert stats.requests_waiting == 1
+            assert stats.saturation == 0.75
+            release.set()
+
+    assert len(responses) == 4
+    assert stats == HttpPoolStats(
+        max_connections=4, requests=4, requests_in_flight=0, peak_requests_in_flight=3, requests_waiting=0
+    )
+    assert HttpPoolStats(max_connections=None).saturation is None
+
+
+async def test_streamed_response_held_until_closed():
+    stats = HttpPoolStats(max_connections=1)
+    settings = HttpPoolSettings(max_connections=1, max_connections_per_host=1)
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b'chunk'
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=chunks()))
+    async with PooledAsyncClient(pool_settings=settings, stats=stats, transport=transport) as client:
+        async with client.stream('GET', 'https://a.test/') as response:
+            assert stats.requests_in_flight == 1
+            assert [chunk async for chunk in response.aiter_bytes()] == [b'chunk']
+        assert stats.requests_in_flight == 0
+
+        # The per-host limit was released too
+        with anyio.fail_after(1):
+            assert (await client.get('https://a.test/')).content == b'chunk'
+
+
+async def test_failed_requests():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == '/timeout':
+            raise httpx.PoolTimeout('no connection available')
+        raise httpx.ConnectError('connection refused')
+
+    stats = HttpPoolStats(max_connections=1)
+    async with PooledAsyncClient(
+        pool_settings=HttpPoolSettings(), stats=stats, transport=httpx.MockTransport(handler)
+    ) as client:
+        with pytest.raises(httpx.PoolTimeout):
+            await client.get('https://a.test/timeout')
+        with pytest.raises(httpx.ConnectError):
+            await client.get('https://a.test/refused')
+
+    assert stats == HttpPoolStats(max_connections=1, requests=2, peak_requests_in_flight=1, pool_timeouts=1)
+
+
+async def test_dns_cache(monkeypatch: pytest.MonkeyPatch):
+    resolved: list[str] = []
+    getaddrinfo = anyio.getaddrinfo
+
+    async def counting_getaddrinfo(host: str, port: int, **kwargs: object):
+        resolved.append(host)
+        return await getaddrinfo(host, port)
+
+    monkeypatch.setattr(anyio, 'getaddrinfo', counting_getaddrinfo)
+
+    listener = await anyio.create_tcp_listener(local_host='127.0.0.1')
+    port = listener.extra(SocketAttribute.local_port)
+    backend = _http_pool._DnsCachingBackend(ttl=60)  # pyright: ignore[reportPrivateUsage]
+    async with listener:
+        for _ in range(2):
+            stream = await backend.connect_tcp('127.0.0.1', port)
+            await stream.aclose()
+    assert resolved == ['127.0.0.1']
+
+    backend = _http_pool._DnsCachingBackend(ttl=0)  # pyright: ignore[reportPrivateUsage]
+    assert await backend.resolve('127.0.0.1', port) == '127.0.0.1'
+    assert await backend.resolve('127.0.0.1', port) == '127.0.0.1'
+    assert resolved == ['127.0.0.1', '127.0.0.1', '127.0.0.1']
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from copy import deepcopy
 from datetime import datetime
 from typing import Literal
 
@@ -21,6 +22,7 @@ from pydantic_ai import (
     FinalResultEvent,
     ImageUrl,
     ModelMessage,
+    ModelMessagesTypeAdapter,
     ModelRequest,
     ModelResponse,
     ModelResponseStreamEvent,
@@ -38,7 +40,11 @@ from pydantic_ai import (
 )
 from pydantic_ai._run_context import RunContext
 from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
-from pydantic_ai.models.instrumented import InstrumentationSettings, InstrumentedModel
+from pydantic_ai.models.instrumented import (
+    InstrumentationSettings,
+    InstrumentedModel,
+    _serialized_messages,  # pyright: ignore[reportPrivateUsage]
+)
 from pydantic_ai.settings import ModelSettings
 from pydantic_ai.usage import RequestUsage
 
@@ -1536,3 +1542,151 @@ def test_message_with_builtin_tool_calls():
             }
         ]
     )
+
+
+async def test_incremental_messages(capfire: CaptureLogfire):
+    model = InstrumentedModel(MyModel(), InstrumentationSettings(incremental_messages=True))
+    params = ModelRequestParameters()
+
+    messages: list[ModelMessage] = [
+        ModelRequest(parts=[SystemPromptPart('system_prompt'), UserPromptPart('user_prompt1')]),
+    ]
+    messages.append(await model.request(messages, None, params))
+    messages.append(ModelRequest(parts=[UserPromptPart('user_prompt2')]))
+    messages.append(await model.request(messages, None, params))
+    messages.append(ModelRequest(parts=[UserPromptPart('user_prompt3')]))
+    # History processors may drop messages, in which case the previous request's span can't be referenced
+    await model.request(messages[2:], None, params)
+
+    spans = capfire.exporter.exported_spans_as_dict(parse_json_attributes=True)
+    assert [span['attributes']['gen_ai.input.messages'] for span in spans] == snapshot(
+        [
+            [
+                {'role': 'system', 'parts': [{'type': 'text', 'content': 'system_prompt'}]},
+                {'role': 'user', 'parts': [{'type': 'text', 'content': 'user_prompt1'}]},
+            ],
+            [{'role': 'user', 'parts': [{'type': 'text', 'content': 'user_prompt2'}]}],
+            [
+                {'role': 'user', 'parts': [{'type': 'text', 'content': 'user_prompt2'}]},
+                {
+                    'role': 'assistant',
+                    'parts': [
+                        {'type': 'text', 'content': 'text1'},
+                        {'type': 'tool_call', 'id': 'tool_call_1', 'name': 'tool1', 'arguments': 'args1'},
+                        {'type': 'tool_call', 'id': 'tool_call_2', 'name': 'tool2', 'arguments': {'args2': 3}},
+                        {'type': 'text', 'content': 'text2'},
+                    ],
+                },
+                {'role': 'user', 'parts': [{'type': 'text', 'content': 'user_prompt3'}]},
+            ],
+        ]
+    )
+    assert [
+        (
+            span['attributes'].get('pydantic_ai.previous_request.trace_id'),
+            span['attributes'].get('pydantic_ai.previous_request.span_id'),
+        )
+        for span in spans
+    ] == snapshot(
+        [
+            (None, None),
+            ('00000000000000000000000000000001', '0000000000000001'),
+            (None, None),
+        ]
+    )
+    assert [[link.context.span_id for link in span.links] for span in capfire.exporter.exported_spans] == snapshot(
+        [[], [], [], [1], [], []]
+    )
+
+
+def test_serialize_messages_cache(document_content: BinaryContent):
+    messages: list[ModelMessage] = [
+        ModelRequest(parts=[SystemPromptPart('system_prompt'), UserPromptPart(['user_prompt', document_content])]),
+        ModelResponse(parts=[TextPart('text')], finish_reason='stop'),
+    ]
+    original_messages = deepcopy(messages)
+    settings = InstrumentationSettings(incremental_messages=True)
+    serialized = settings.serialize_messages(messages)
+    assert serialized == InstrumentationSettings().serialize_messages(messages)
+    assert settings.serialize_messages(messages) is not serialized
+
+    # The serialized messages are kept alongside the messages, rather than being stored on them
+    cached = _serialized_messages.get(messages[0])
+    assert cached is not None
+    assert cached[1] == snapshot(
+        [
+            '{"role": "system", "parts": [{"type": "text", "content": "system_prompt"}]}',
+            IsStr(
+                regex=r'\{"role": "user", "parts": \[.*"type": "binary", "media_type": "application/pdf", "content": ".+"\}\]\}'
+            ),
+        ]
+    )
+    assert messages == original_messages
+    assert repr(messages) == repr(original_messages)
+    assert vars(messages[0]).keys() == vars(original_messages[0]).keys()
+    assert ModelMessagesTypeAdapter.validate_json(ModelMessagesTypeAdapter.dump_json(messages)) == messages
+
+    # Settings that serialize messages differently don't use the stored result
+    assert InstrumentationSettings(incremental_messages=True, include_content=False).serialize_messages(
+        messages
+    ) == snapshot(
+        '[{"role": "system", "parts": [{"type": "text"}]}, {"role": "user", "parts": [{"type": "text"}, {"type": "binary", "media_type": "application/pdf"}]}, {"role": "assistant", "parts": [{"type": "text"}], "finish_reason": "stop"}]'
+    )
+
+    # Entries are dropped along with their messages
+    message = ModelResponse(parts=[TextPart('text')])
+    settings.serialize_messages([message])
+    assert _serialized_messages.get(message) is not None
+    entries = len(_serialized_messages._entries)  # pyright: ignore[reportPrivateUsage]
+    del message
+    assert len(_serialized_messages._entries) == entries - 1  # pyright: ignore[reportPrivateUsage]
+
+
+def test_max_binary_content_size():
+    messages: list[ModelMessage] = [
+        ModelRequest(
+            parts=[
+                UserPromptPart(
+                    [
+                        BinaryContent(b'small', media_type='image/png'),
+                        BinaryContent(b'larger content', media_type='image/png'),
+                    ]
+                )
+            ]
+        ),
+    ]
+    settings = InstrumentationSettings(max_binary_content_size=10)
+    assert settings.messages_to_otel_messages(messages) == snapshot(
+        [
+            {
+                'role': 'user',
+                'parts': [
+                    {'type': 'binary', 'media_type': 'image/png', 'content': 'c21hbGw='},
+                    {
+                        'type': 'binary',
+                        'media_type': 'image/png',
+                        'size': 14,
+                        'sha256': '5a728fd5846abf87ef9c9246a2dd48f2769b5fb73dff4384a5f80db258576476',
+                    },
+                ],
+            }
+        ]
+    )
+    assert [InstrumentedModel.event_to_dict(e) for e in settings.messages_to_otel_events(messages)] == snapshot(
+        [
+            {
+                'content': [
+                    {'kind': 'binary', 'media_type': 'image/png', 'binary_content': 'c21hbGw='},
+                    {
+                        'kind': 'binary',
+                        'media_type': 'image/png',
+                        'size': 14,
+                        'sha256': '5a728fd5846abf87ef9c9246a2dd48f2769b5fb73dff4384a5f80db258576476',
+                    },
+                ],
+                'role': 'user',
+                'gen_ai.message.index': 0,
+                'event.name': 'gen_ai.user.message',
+            }
+        ]
+    )
@@ -1,3 +1,4 @@
+import gc
 import os
 import warnings
 from importlib import import_module
@@ -6,7 +7,8 @@ from unittest.mock import patch
 import pytest
 
 from pydantic_ai import UserError
-from pydantic_ai.models import Model, infer_model
+from pydantic_ai.messages import UserPromptPart
+from pydantic_ai.models import Model, UserPromptMappingCache, infer_model
 
 from ..conftest import try_import
 
@@ -218,3 +220,25 @@ def test_infer_model(
 def test_infer_str_unknown():
     with pytest.raises(UserError, match='Unknown model: foobar'):
         infer_model('foobar')
+
+
+async def test_user_prompt_mapping_cache():
+    cache = UserPromptMappingCache[list[str]]()
+
+    async def map_part(part: UserPromptPart) -> list[str]:
+        return [str(item) for item in part.content]
+
+    part = UserPromptPart(content=['a', 'b'])
+    mapped = await cache.get_or_map(part, map_part)
+    assert mapped == ['a', 'b']
+    assert await cache.get_or_map(part, map_part) is mapped
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # plain text prompts are cheap to map, so aren't cached
+    assert await cache.get_or_map(UserPromptPart(content='c'), map_part) == ['c']
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # entries are dropped once the part is garbage collected
+    del part
+    gc.collect()
+    assert cache._entries == {}  # pyright: ignore[reportPrivateUsage]
@@ -1,6 +1,17 @@
+from typing import Any
+
+import pytest
+from inline_snapshot import snapshot
 from pydantic import TypeAdapter
 
+from pydantic_ai import models
+from pydantic_ai._json_schema import InlineDefsJsonSchemaTransformer, JsonSchemaTransformCache
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart
 from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.output import OutputObjectDefinition
+from pydantic_ai.profiles import ModelProfile
+from pydantic_ai.tools import ToolDefinition
 
 
 def test_model_request_parameters_are_serializable():
@@ -15,3 +26,77 @@ def test_model_request_parameters_are_serializable():
         'output_tools': [],
         'output_object': None,
     }
+
+
+def _schema_with_defs(title: str) -> dict[str, Any]:
+    return {
+        'type': 'object',
+        'properties': {'point': {'$ref': '#/$defs/Point'}},
+        '$defs': {'Point': {'type': 'object', 'title': title, 'properties': {'x': {'type': 'integer'}}}},
+    }
+
+
+def test_json_schema_transform_cache():
+    cache = JsonSchemaTransformCache(maxsize=2)
+
+    transformed, is_strict_compatible = cache.transform(
+        InlineDefsJsonSchemaTransformer, _schema_with_defs('A'), strict=None
+    )
+    assert transformed == snapshot(
+        {
+            'type': 'object',
+            'properties': {'point': {'type': 'object', 'title': 'A', 'properties': {'x': {'type': 'integer'}}}},
+        }
+    )
+    assert is_strict_compatible
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # an equal schema hits the cache, even though it's a different object
+    assert cache.transform(InlineDefsJsonSchemaTransformer, _schema_with_defs('A'), strict=None)[0] is transformed
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # `strict` is part of the key
+    cache.transform(InlineDefsJsonSchemaTransformer, _schema_with_defs('A'), strict=True)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # the least recently used entry is evicted
+    cache.transform(InlineDefsJsonSchemaTransformer, _schema_with_defs('A'), strict=None)
+    cache.transform(InlineDefsJsonSchemaTransformer, _schema_with_defs('B'), strict=None)
+    assert (cache.hits, cache.misses) == (2, 3)
+    cache.transform(InlineDefsJsonSchemaTransformer, _schema_with_defs('A'), strict=None)
+    assert (cache.hits, cache.misses) == (3, 3)
+    cache.transform(InlineDefsJsonSchemaTransformer, _schema_with_defs('A'), strict=True)
+    assert (cache.hits, cache.misses) == (3, 4)
+
+    cache.clear()
+    assert (cache.hits, cache.misses) == (0, 0)
+    cache.transform(InlineDefsJsonSchemaTransformer, _schema_with_defs('A'), strict=None)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_customize_request_parameters_uses_transform_cache(monkeypatch: pytest.MonkeyPatch):
+    cache = JsonSchemaTransformCache(maxsize=16)
+    monkeypatch.setattr(models, '_json_schema_transform_cache', cache)
+
+    def return_text(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:  # pragma: no cover
+        return ModelResponse(parts=[TextPart('done')])
+
+    model = FunctionModel(return_text, profile=ModelProfile(json_schema_transformer=InlineDefsJsonSchemaTransformer))
+
+    def params() -> ModelRequestParameters:
+        return ModelRequestParameters(
+            function_tools=[
+                ToolDefinition(name='a', parameters_json_schema=_schema_with_defs('A')),
+                ToolDefinition(name='b', parameters_json_schema=_schema_with_defs('B'), strict=False),
+            ],
+            output_object=OutputObjectDefinition(json_schema=_schema_with_defs('A')),
+        )
+
+    first = model.customize_request_parameters(params())
+    assert (cache.hits, cache.misses) == (1, 2)
+    second = model.customize_request_parameters(params())
+    assert (cache.hits, cache.misses) == (4, 2)
+    assert second == first
+    assert [t.strict for t in second.function_tools] == [True, False]
+    assert second.output_object is not None
+    assert '$defs' not in second.output_object.json_schema
@@ -17,6 +17,7 @@ from pydantic_ai import (
     Agent,
     AudioUrl,
     BinaryContent,
+    CachePoint,
     DocumentUrl,
     ImageUrl,
     ModelHTTPError,
@@ -388,6 +389,78 @@ async def test_request_tool_call(allow_model_requests: None):
     )
 
 
+async def test_binary_content_mapped_once_per_run(allow_model_requests: None):
+    responses = [
+        completion_message(
+            ChatCompletionMessage(
+                content=None,
+                role='assistant',
+                tool_calls=[
+                    ChatCompletionMessageFunctionToolCall(
+                        id='1', function=Function(arguments='{}', name='get_location'), type='function'
+                    )
+                ],
+            )
+        ),
+        completion_message(ChatCompletionMessage(content='final response', role='assistant')),
+    ]
+    mock_client = MockOpenAI.create_mock(responses)
+    m = OpenAIChatModel('gpt-4o', provider=OpenAIProvider(openai_client=mock_client))
+    agent = Agent(m)
+
+    @agent.tool_plain
+    async def get_location() -> str:
+        return 'London'
+
+    image = BinaryContent(data=b'fake image', media_type='image/png')
+    result = await agent.run(['What is in this image?', image])
+    assert result.output == 'final response'
+
+    # the user prompt was only mapped for the first request, and reused for the second
+    cache = m._user_prompt_mapping_cache  # pyright: ignore[reportPrivateUsage]
+    assert (cache.hits, cache.misses) == (1, 1)
+    first_kwargs, second_kwargs = get_mock_chat_completion_kwargs(mock_client)
+    assert (
+        first_kwargs['messages'][0]
+        == second_kwargs['messages'][0]
+        == snapshot(
+            {
+                'role': 'user',
+                'content': [
+                    {'text': 'What is in this image?', 'type': 'text'},
+                    {'image_url': {'url': 'data:image/png;base64,ZmFrZSBpbWFnZQ=='}, 'type': 'image_url'},
+                ],
+            }
+        )
+    )
+
+    # changing the content of the prompt invalidates the cached params
+    user_prompt = result.all_messages()[0].parts[0]
+    assert isinstance(user_prompt, UserPromptPart)
+    assert not isinstance(user_prompt.content, str)
+    user_prompt.content = [*user_prompt.content, 'Please be brief.']
+    messages = await m._map_messages(result.all_messages())  # pyright: ignore[reportPrivateUsage]
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert messages[0]['content'][-1] == {'text': 'Please be brief.', 'type': 'text'}  # type: ignore[index]
+
+
+async def test_cache_point_ignored(allow_model_requests: None):
+    c = completion_message(ChatCompletionMessage(content='world', role='assistant'))
+    mock_client = MockOpenAI.create_mock(c)
+    m = OpenAIChatModel('gpt-4o', provider=OpenAIProvider(openai_client=mock_client))
+    agent = Agent(m)
+
+    await agent.run(['a long document', CachePoint(), 'a question'])
+    assert get_mock_chat_completion_kwargs(mock_client)[0]['messages'] == snapshot(
+        [
+            {
+                'role': 'user',
+                'content': [{'text': 'a long document', 'type': 'text'}, {'text': 'a question', 'type': 'text'}],
+            }
+        ]
+    )
+
+
 FinishReason = Literal['stop', 'length', 'tool_calls', 'content_filter', 'function_call']
 
 
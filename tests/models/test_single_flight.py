@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from inline_snapshot import snapshot
+
+from pydantic_ai import (
+    Agent,
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    PartStartEvent,
+    TextPart,
+    ThinkingPart,
+    ToolCallPart,
+    UserPromptPart,
+)
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.function import (
+    AgentInfo,
+    DeltaThinkingCalls,
+    DeltaThinkingPart,
+    DeltaToolCall,
+    DeltaToolCalls,
+    FunctionModel,
+)
+from pydantic_ai.models.single_flight import SingleFlightModel
+from pydantic_ai.usage import RequestUsage, RunUsage
+
+pytestmark = pytest.mark.anyio
+
+
+def gated_model(gate: asyncio.Event) -> tuple[FunctionModel, list[str]]:
+    calls: list[str] = []
+
+    async def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        prompt = messages[-1].parts[-1]
+        assert isinstance(prompt, UserPromptPart) and isinstance(prompt.content, str)
+        calls.append(prompt.content)
+        call_number = len(calls)
+        await gate.wait()
+        if prompt.content == 'fail':
+            raise ValueError('Failed')
+        return ModelResponse(parts=[TextPart(f'{prompt.content} {call_number}')], usage=RequestUsage(input_tokens=10))
+
+    async def stream(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+        prompt = messages[-1].parts[-1]
+        assert isinstance(prompt, UserPromptPart) and isinstance(prompt.content, str)
+        calls.append(prompt.content)
+        yield 'streamed '
+        await gate.wait()
+        if prompt.content == 'fail':
+            raise ValueError('Failed')
+        yield prompt.content
+
+    return FunctionModel(respond, stream_function=stream), calls
+
+
+async def test_concurrent_requests_coalesced():
+    gate = asyncio.Event()
+    model, calls = gated_model(gate)
+    single_flight_model = SingleFlightModel(model)
+    agent = Agent(single_flight_model)
+
+    runs = [asyncio.create_task(agent.run(prompt)) for prompt in ['Hello', 'Hello', 'Goodbye', 'Hello']]
+    await asyncio.sleep(0.01)
+    gate.set()
+    results = await asyncio.gather(*runs)
+
+    assert [result.output for result in results] == snapshot(['Hello 1', 'Hello 1', 'Goodbye 2', 'Hello 1'])
+    assert calls == ['Hello', 'Goodbye']
+    assert single_flight_model.coalesced_requests == 2
+    # Only the run that made the request reports its usage
+    assert [result.usage() for result in results] == snapshot(
+        [
+            RunUsage(requests=1, input_tokens=10),
+            RunUsage(requests=1),
+            RunUsage(requests=1, input_tokens=10),
+            RunUsage(requests=1),
+        ]
+    )
+
+    # Once the response has arrived, the same request is sent again
+    assert (await agent.run('Hello')).output == 'Hello 3'
+    assert single_flight_model.coalesced_requests == 2
+
+
+async def test_concurrent_requests_share_error():
+    gate = asyncio.Event()
+    model, calls = gated_model(gate)
+    agent = Agent(SingleFlightModel(model))
+
+    runs = [asyncio.create_task(agent.run('fail')) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    gate.set()
+    results = await asyncio.gather(*runs, return_exceptions=True)
+
+    assert [repr(r) for r in results] == snapshot(
+        ["ValueError('Failed')", "ValueError('Failed')", "ValueError('Failed')"]
+    )
+    assert calls == ['fail']
+
+
+async def test_cancelled_request_does_not_affect_others():
+    gate = asyncio.Event()
+    model, calls = gated_model(gate)
+    agent = Agent(SingleFlightModel(model))
+
+    first = asyncio.create_task(agent.run('Hello'))
+    second = asyncio.create_task(agent.run('Hello'))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    gate.set()
+
+    assert (await second).output == 'Hello 1'
+    assert first.cancelled()
+    assert calls == ['Hello']
+
+
+async def test_stream_teed_to_joining_request():
+    gate = asyncio.Event()
+    model, calls = gated_model(gate)
+    single_flight_model = SingleFlightModel(model)
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('world')])]
+    parameters = ModelRequestParameters()
+
+    async with single_flight_model.request_stream(messages, None, parameters) as first:
+        first_events = first.__aiter__()
+        assert await first_events.__anext__() == snapshot(PartStartEvent(index=0, part=TextPart(content='streamed ')))
+
+        # A request that joins while the response is streaming gets the events received so far
+        async with single_flight_model.request_stream(messages, None, parameters) as second:
+            gate.set()
+            second_events = [event async for event in second]
+        assert [event async for event in first_events] == second_events[1:]
+
+    assert first.get().parts == second.get().parts == [TextPart('streamed world')]
+    assert first.usage().output_tokens > 0
+    assert second.usage() == RequestUsage()
+    assert (second.model_name, second.provider_name, second.timestamp) == (
+        first.model_name,
+        first.provider_name,
+        first.timestamp,
+    )
+    assert calls == ['world']
+    assert single_flight_model.coalesced_requests == 1
+
+
+async def test_concurrent_agent_streams():
+    gate = asyncio.Event()
+    model, calls = gated_model(gate)
+    agent = Agent(SingleFlightModel(model))
+
+    async def run_stream() -> list[str]:
+        async with agent.run_stream('world') as result:
+            return [text async for text in result.stream_text(debounce_by=None)]
+
+    runs = [asyncio.create_task(run_stream()) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    gate.set()
+
+    assert [texts[-1] for texts in await asyncio.gather(*runs)] == ['streamed world'] * 3
+    assert calls == ['world']
+
+
+async def test_stream_error_raised_for_every_request():
+    gate = asyncio.Event()
+    model, _ = gated_model(gate)
+    single_flight_model = SingleFlightModel(model)
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('fail')])]
+    parameters = ModelRequestParameters()
+
+    async def consume() -> None:
+        async with single_flight_model.request_stream(messages, None, parameters) as stream:
+            async for _ in stream:
+                pass
+
+    runs = [asyncio.create_task(consume()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    gate.set()
+    results = await asyncio.gather(*runs, return_exceptions=True)
+    assert [repr(r) for r in results] == snapshot(["ValueError('Failed')", "ValueError('Failed')"])
+
+
+async def test_abandoned_stream_is_cancelled():
+    gate = asyncio.Event()
+    model, calls = gated_model(gate)
+    single_flight_model = SingleFlightModel(model)
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('world')])]
+    parameters = ModelRequestParameters()
+
+    async with single_flight_model.request_stream(messages, None, parameters) as stream:
+        async for _ in stream:
+            break
+
+    # The stream was cancelled once nobody was reading it, so the next request is sent again
+    gate.set()
+    async with single_flight_model.request_stream(messages, None, parameters) as stream:
+        async for _ in stream:
+            pass
+    assert stream.get().parts == [TextPart('streamed world')]
+    assert calls == ['world', 'world']
+
+
+async def test_stream_replays_thinking_and_tool_calls():
+    async def stream(
+        messages: list[ModelMessage], info: AgentInfo
+    ) -> AsyncIterator[DeltaThinkingCalls | DeltaToolCalls]:
+        yield {0: DeltaThinkingPart(content='Let me ', signature='sig')}
+        yield {0: DeltaThinkingPart(content='think')}
+        yield {1: DeltaToolCall(name='get_')}
+        yield {1: DeltaToolCall(name='weather', json_args='{"city": ', tool_call_id='call_1')}
+        yield {1: DeltaToolCall(json_args='"Paris"}')}
+
+    single_flight_model = SingleFlightModel(FunctionModel(stream_function=stream))
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('Hello')])]
+    parameters = ModelRequestParameters()
+
+    async with single_flight_model.request_stream(messages, None, parameters) as first:
+        async with single_flight_model.request_stream(messages, None, parameters) as second:
+            async for _ in first:
+                pass
+            async for _ in second:
+                pass
+
+    assert first.get().parts == snapshot(
+        [
+            ThinkingPart(content='Let me think', signature='sig', provider_name='function'),
+            ToolCallPart(tool_name='get_weather', args='{"city": "Paris"}', tool_call_id='call_1'),
+        ]
+    )
+    assert second.get().parts == first.get().parts
+
+
+async def test_request_key():
+    model, _ = gated_model(asyncio.Event())
+    single_flight_model = SingleFlightModel(model)
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('Hello')])]
+    key = single_flight_model.request_key(messages, None, ModelRequestParameters())
+    assert key == single_flight_model.request_key(
+        [ModelRequest(parts=[UserPromptPart('Hello')])], {}, ModelRequestParameters()
+    )
+    assert key != single_flight_model.request_key(messages, {'max_tokens': 10}, ModelRequestParameters())
@@ -3,7 +3,7 @@ import json
 import re
 import sys
 from collections import defaultdict
-from collections.abc import AsyncIterable, Callable
+from collections.abc import AsyncIterable, Callable, Sequence
 from dataclasses import dataclass, replace
 from datetime import timezone
 from typing import Any, Literal, Union
@@ -33,6 +33,7 @@ from pydantic_ai import (
     ModelResponse,
     ModelResponsePart,
     ModelRetry,
+    PartStartEvent,
     PrefixedToolset,
     RetryPromptPart,
     RunContext,
@@ -57,8 +58,10 @@ from pydantic_ai._output import (
     ToolOutputSchema,
 )
 from pydantic_ai.agent import AgentRunResult, WrapperAgent
+from pydantic_ai.models import BatchModelRequest, Model
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 from pydantic_ai.models.test import TestModel
+from pydantic_ai.models.wrapper import WrapperModel
 from pydantic_ai.output import StructuredDict, ToolOutput
 from pydantic_ai.result import RunUsage
 from pydantic_ai.tools import DeferredToolRequests, DeferredToolResults, ToolDefinition, ToolDenied
@@ -4604,6 +4607,48 @@ def test_sequential_calls(mode: Literal['argument', 'contextmanager']):
     assert integer_holder == 2
 
 
+def test_max_concurrent_tool_calls():
+    async def call_tools(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        if len(messages) == 1:
+            return ModelResponse(
+                parts=[ToolCallPart(tool_name='slow_tool', args={'x': i}) for i in range(5)]
+                + [ToolCallPart(tool_name='barrier'), ToolCallPart(tool_name='slow_tool', args={'x': 5})]
+            )
+        return ModelResponse(parts=[TextPart('done')])
+
+    running = 0
+    max_running = 0
+    log: list[str] = []
+
+    toolset = FunctionToolset()
+
+    @toolset.tool
+    async def slow_tool(x: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        log.append(f'start {x}')
+        await asyncio.sleep(0.01)
+        running -= 1
+        return x
+
+    @toolset.tool(sequential=True)
+    def barrier() -> str:
+        log.append(f'barrier ({running} running)')
+        return 'ok'
+
+    agent = Agent(FunctionModel(call_tools), toolsets=[toolset], max_concurrent_tool_calls=2)
+    assert agent.max_concurrent_tool_calls == 2
+
+    result = agent.run_sync()
+    assert result.output == 'done'
+    assert max_running == 2
+    assert log[5:] == snapshot(['barrier (0 running)', 'start 5'])
+
+    with pytest.raises(UserError, match='`max_concurrent_tool_calls` must be at least 1'):
+        Agent(FunctionModel(call_tools), max_concurrent_tool_calls=0)
+
+
 def test_set_mcp_sampling_model():
     try:
         from pydantic_ai.mcp import MCPServerStdio
@@ -5511,3 +5556,101 @@ def test_continue_conversation_that_ended_in_output_tool_call(allow_model_reques
     )
 
     assert not any(isinstance(p, ToolReturnPart) and p.tool_name == 'final_result' for p in new_messages[0].parts)
+
+
+class BatchRecordingModel(WrapperModel):
+    def __init__(self, wrapped: Model):
+        super().__init__(wrapped)
+        self.batch_sizes: list[int] = []
+
+    async def request_batch(
+        self, requests: Sequence[BatchModelRequest], *, poll_interval: float = 60
+    ) -> list[ModelResponse | Exception]:
+        self.batch_sizes.append(len(requests))
+        return await super().request_batch(requests, poll_interval=poll_interval)
+
+
+def batch_function_model() -> FunctionModel:
+    def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        last_part = messages[-1].parts[-1]
+        if isinstance(last_part, ToolReturnPart):
+            return ModelResponse(parts=[TextPart(f'The answer is {last_part.content}')])
+        assert isinstance(last_part, UserPromptPart) and isinstance(last_part.content, str)
+        if last_part.content == 'fail':
+            raise ValueError('Failed')
+        elif last_part.content.startswith('double'):
+            return ModelResponse(parts=[ToolCallPart('double', {'x': int(last_part.content.split()[1])})])
+        return ModelResponse(parts=[TextPart(last_part.content.upper())])
+
+    return FunctionModel(respond)
+
+
+async def test_run_batch():
+    model = BatchRecordingModel(batch_function_model())
+    agent = Agent(model)
+
+    @agent.tool_plain
+    def double(x: int) -> int:
+        return x * 2
+
+    results = await agent.run_batch(['double 2', 'hello', 'fail', 'double 5'])
+
+    assert [repr(r) if isinstance(r, Exception) else r.output for r in results] == snapshot(
+        ['The answer is 4', 'HELLO', "ValueError('Failed')", 'The answer is 10']
+    )
+    # The requests that follow the tool calls go into a second batch
+    assert model.batch_sizes == [4, 2]
+    first_result = results[0]
+    assert isinstance(first_result, AgentRunResult)
+    assert first_result.usage().requests == 2
+
+
+async def test_run_batch_max_batch_size():
+    model = BatchRecordingModel(batch_function_model())
+    agent = Agent(model, output_type=str)
+
+    results = await agent.run_batch(['a', 'b', 'c', 'd', 'e'], output_type=str, max_batch_size=2)
+
+    assert [r if isinstance(r, Exception) else r.output for r in results] == ['A', 'B', 'C', 'D', 'E']
+    assert model.batch_sizes == [2, 2, 1]
+
+
+async def test_run_batch_streamed_requests():
+    events: list[AgentStreamEvent] = []
+
+    async def handle_events(ctx: RunContext[None], stream: AsyncIterable[AgentStreamEvent]):
+        async for event in stream:
+            events.append(event)
+
+    model = BatchRecordingModel(batch_function_model())
+    agent = Agent(model, event_stream_handler=handle_events)
+
+    results = await agent.run_batch(['hello', 'world'])
+
+    assert [r if isinstance(r, Exception) else r.output for r in results] == ['HELLO', 'WORLD']
+    assert model.batch_sizes == [2]
+    assert [event.part for event in events if isinstance(event, PartStartEvent)] == [
+        TextPart('HELLO'),
+        TextPart('WORLD'),
+    ]
+
+
+async def test_run_batch_request_batch_error():
+    class FailingBatchModel(BatchRecordingModel):
+        async def request_batch(
+            self, requests: Sequence[BatchModelRequest], *, poll_interval: float = 60
+        ) -> list[ModelResponse | Exception]:
+            raise RuntimeError('Batch failed')
+
+    agent = Agent(FailingBatchModel(batch_function_model()))
+    results = await agent.run_batch(['hello', 'world'])
+    assert [str(r) for r in results] == ['Batch failed', 'Batch failed']
+
+
+async def test_run_batch_without_model():
+    agent = Agent()
+    with pytest.raises(UserError, match='`model` must either be set on the agent or included when calling it.'):
+        await agent.run_batch(['hello'])
+
+    results = await agent.run_batch(['hello'], model=batch_function_model())
+    assert [r if isinstance(r, Exception) else r.output for r in results] == ['HELLO']
@@ -1,6 +1,6 @@
 from __future__ import annotations as _annotations
 
-from collections.abc import Callable
+from collections.abc import AsyncIterable, AsyncIterator, Callable
 from dataclasses import dataclass
 from typing import Any, Literal
 
@@ -10,10 +10,10 @@ from inline_snapshot import snapshot
 from pydantic import BaseModel
 from typing_extensions import NotRequired, TypedDict
 
-from pydantic_ai import Agent, ModelMessage, ModelResponse, TextPart, ToolCallPart
+from pydantic_ai import Agent, AgentStreamEvent, ModelMessage, ModelResponse, TextPart, ToolCallPart
 from pydantic_ai._utils import get_traceparent
 from pydantic_ai.exceptions import ModelRetry, UnexpectedModelBehavior
-from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, DeltaToolCalls, FunctionModel
 from pydantic_ai.models.instrumented import InstrumentationSettings, InstrumentedModel
 from pydantic_ai.models.test import TestModel
 from pydantic_ai.output import PromptedOutput, TextOutput
@@ -460,6 +460,7 @@ def test_logfire(
                                 'outer_typed_dict_key': None,
                                 'strict': None,
                                 'sequential': False,
+                                'side_effect_free': False,
                                 'kind': 'function',
                                 'metadata': None,
                             }
@@ -905,6 +906,7 @@ def test_instructions_with_structured_output_exclude_content_v2_v3(
                                 'outer_typed_dict_key': None,
                                 'strict': None,
                                 'sequential': False,
+                                'side_effect_free': False,
                                 'kind': 'output',
                                 'metadata': None,
                             }
@@ -1109,6 +1111,55 @@ async def test_feedback(capfire: CaptureLogfire) -> None:
     )
 
 
+@pytest.mark.skipif(not logfire_installed, reason='logfire not installed')
+@pytest.mark.anyio
+async def test_speculative_tool_call_spans(get_logfire_summary: Callable[[], LogfireSummary]) -> None:
+    async def stream_function(
+        messages: list[ModelMessage], agent_info: AgentInfo
+    ) -> AsyncIterator[str | DeltaToolCalls]:
+        if len(messages) == 1:
+            yield {0: DeltaToolCall(name='lookup', json_args='{"key": "a"}', tool_call_id='call_1')}
+            yield {1: DeltaToolCall(name='lookup', json_args='{"key": "b"}', tool_call_id='call_2')}
+        else:
+            yield 'done'
+
+    my_agent = Agent(model=FunctionModel(stream_function=stream_function), instrument=True)
+
+    @my_agent.tool_plain(side_effect_free=True)
+    async def lookup(key: str) -> str:
+        return key.upper()
+
+    async def consume(ctx: RunContext[None], events: AsyncIterable[AgentStreamEvent]) -> None:
+        async for _ in events:
+            pass
+
+    result = await my_agent.run('Hello', event_stream_handler=consume)
+    assert result.output == 'done'
+
+    # The call that was started while the response was streamed isn't traced as part of the model request
+    summary = get_logfire_summary()
+    assert summary.traces == snapshot(
+        [
+            {
+                'id': 0,
+                'name': 'agent run',
+                'message': 'my_agent run',
+                'children': [
+                    {'id': 1, 'name': 'chat function::stream_function', 'message': 'chat function::stream_function'},
+                    {
+                        'id': 2,
+                        'name': 'running tools',
+                        'message': 'running 2 tools',
+                        'children': [{'id': 4, 'name': 'running tool', 'message': 'running tool: lookup'}],
+                    },
+                    {'id': 3, 'name': 'running tool', 'message': 'running tool: lookup'},
+                    {'id': 5, 'name': 'chat function::stream_function', 'message': 'chat function::stream_function'},
+                ],
+            }
+        ]
+    )
+
+
 @pytest.mark.skipif(not logfire_installed, reason='logfire not installed')
 @pytest.mark.parametrize('include_content,tool_error', [(True, False), (True, True), (False, False), (False, True)])
 def test_include_tool_args_span_attributes(
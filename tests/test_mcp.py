@@ -37,7 +37,15 @@ with try_import() as imports_successful:
     from mcp import ErrorData, McpError, SamplingMessage
     from mcp.client.session import ClientSession
     from mcp.shared.context import RequestContext
-    from mcp.types import CreateMessageRequestParams, ElicitRequestParams, ElicitResult, ImageContent, TextContent
+    from mcp.types import (
+        CreateMessageRequestParams,
+        ElicitRequestParams,
+        ElicitResult,
+        ImageContent,
+        ServerNotification,
+        TextContent,
+        ToolListChangedNotification,
+    )
 
     from pydantic_ai._mcp import map_from_mcp_params, map_from_model_response
     from pydantic_ai.mcp import CallToolFunc, MCPServerSSE, MCPServerStdio, ToolResult
@@ -141,6 +149,56 @@ async def test_stdio_server_with_cwd(run_context: RunContext[int]):
         assert len(tools) == snapshot(18)
 
 
+async def test_stdio_server_tools_cache(run_context: RunContext[int]):
+    server = MCPServerStdio('python', ['-m', 'tests.mcp_server'], cache_tools=True)
+    async with server:
+        with patch.object(ClientSession, 'list_tools', wraps=server._client.list_tools) as list_tools:  # pyright: ignore[reportPrivateUsage]
+            tools = await server.get_tools(run_context)
+            assert await server.get_tools(run_context) == tools
+            assert list_tools.call_count == 1
+            assert (server.tools_cache_hits, server.tools_cache_misses) == (1, 1)
+
+            # The server notifying the client that the list of tools changed invalidates the cache
+            await server._handle_message(  # pyright: ignore[reportPrivateUsage]
+                ServerNotification(ToolListChangedNotification(method='notifications/tools/list_changed'))
+            )
+            assert await server.get_tools(run_context) == tools
+            assert list_tools.call_count == 2
+            assert (server.tools_cache_hits, server.tools_cache_misses) == (1, 2)
+
+    # The cache is kept when the server isn't running, and works through other toolsets
+    prefixed = server.prefixed('foo')
+    assert len(await prefixed.get_tools(run_context)) == len(tools)
+    assert server.is_running is False
+    assert (server.tools_cache_hits, server.tools_cache_misses) == (2, 2)
+
+    server.invalidate_tools_cache()
+    async with server:
+        await server.get_tools(run_context)
+    assert (server.tools_cache_hits, server.tools_cache_misses) == (2, 3)
+
+
+async def test_stdio_server_tools_cache_ttl(run_context: RunContext[int]):
+    server = MCPServerStdio('python', ['-m', 'tests.mcp_server'], cache_tools=True, tools_cache_ttl=60)
+    async with server:
+        with patch('pydantic_ai.mcp.time.monotonic', return_value=0):
+            await server.get_tools(run_context)
+        with patch('pydantic_ai.mcp.time.monotonic', return_value=59):
+            await server.get_tools(run_context)
+        assert (server.tools_cache_hits, server.tools_cache_misses) == (1, 1)
+        with patch('pydantic_ai.mcp.time.monotonic', return_value=60):
+            await server.get_tools(run_context)
+        assert (server.tools_cache_hits, server.tools_cache_misses) == (1, 2)
+
+
+async def test_stdio_server_tools_not_cached_by_default(run_context: RunContext[int]):
+    server = MCPServerStdio('python', ['-m', 'tests.mcp_server'])
+    async with server:
+        await server.get_tools(run_context)
+        await server.get_tools(run_context)
+    assert (server.tools_cache_hits, server.tools_cache_misses) == (0, 0)
+
+
 async def test_process_tool_call(run_context: RunContext[int]) -> int:
     called: bool = False
 
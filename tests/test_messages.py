@@ -7,8 +7,10 @@ from inline_snapshot import snapshot
 from pydantic_ai import (
     AudioUrl,
     BinaryContent,
+    CachePoint,
     DocumentUrl,
     ImageUrl,
+    ModelMessage,
     ModelMessagesTypeAdapter,
     ModelRequest,
     ModelResponse,
@@ -410,3 +412,20 @@ def test_pre_usage_refactor_messages_deserializable():
             ),
         ]
     )
+
+
+def test_cache_point_round_trip():
+    from pydantic_ai.models.instrumented import InstrumentationSettings
+
+    request = ModelRequest(parts=[UserPromptPart(content=['a long document', CachePoint(), 'a question'])])
+    messages: list[ModelMessage] = [request]
+    serialized = ModelMessagesTypeAdapter.dump_python(messages, mode='json')
+    assert serialized[0]['parts'][0]['content'] == snapshot(['a long document', {'kind': 'cache-point'}, 'a question'])
+    assert ModelMessagesTypeAdapter.validate_python(serialized) == messages
+
+    # Cache points aren't content, so they're not included in telemetry
+    part = request.parts[0]
+    assert isinstance(part, UserPromptPart)
+    assert part.otel_message_parts(InstrumentationSettings()) == snapshot(
+        [{'type': 'text', 'content': 'a long document'}, {'type': 'text', 'content': 'a question'}]
+    )
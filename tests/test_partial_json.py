@@ -0,0 +1,90 @@
+from __future__ import annotations as _annotations
+
+from inline_snapshot import snapshot
+from pydantic_core import from_json
+
+from pydantic_ai._partial_json import JsonArraySplitter, PartialJsonScanner
+
+
+def stable_prefixes(document: str, chunk_size: int = 1) -> list[str]:
+    scanner = PartialJsonScanner()
+    prefixes: list[str] = []
+    for end in range(chunk_size, len(document) + chunk_size, chunk_size):
+        text = document[:end]
+        prefix = text[: scanner.feed(text)]
+        if not prefixes or prefixes[-1] != prefix:
+            prefixes.append(prefix)
+    return prefixes
+
+
+def test_stable_prefix():
+    assert stable_prefixes('{"a": 1, "b": "x\\"y", "c": [true, {}], "d": null}') == snapshot(
+        [
+            '{',
+            '{"a": 1',
+            '{"a": 1, "b": "',
+            '{"a": 1, "b": "x',
+            '{"a": 1, "b": "x\\',
+            '{"a": 1, "b": "x\\"',
+            '{"a": 1, "b": "x\\"y',
+            '{"a": 1, "b": "x\\"y"',
+            '{"a": 1, "b": "x\\"y", "c": [',
+            '{"a": 1, "b": "x\\"y", "c": [t',
+            '{"a": 1, "b": "x\\"y", "c": [tr',
+            '{"a": 1, "b": "x\\"y", "c": [tru',
+            '{"a": 1, "b": "x\\"y", "c": [true',
+            '{"a": 1, "b": "x\\"y", "c": [true, {',
+            '{"a": 1, "b": "x\\"y", "c": [true, {}',
+            '{"a": 1, "b": "x\\"y", "c": [true, {}]',
+            '{"a": 1, "b": "x\\"y", "c": [true, {}], "d": n',
+            '{"a": 1, "b": "x\\"y", "c": [true, {}], "d": nu',
+            '{"a": 1, "b": "x\\"y", "c": [true, {}], "d": nul',
+            '{"a": 1, "b": "x\\"y", "c": [true, {}], "d": null',
+            '{"a": 1, "b": "x\\"y", "c": [true, {}], "d": null}',
+        ]
+    )
+
+
+def test_stable_prefix_in_chunks():
+    document = '{"key with \\"escapes\\"": ["value", {"nested": "value, with: \\"punctuation\\" {}"}]}'
+    assert stable_prefixes(document, chunk_size=7)[-1] == document
+    assert all(stable_prefixes(document, chunk_size=size)[-1] == document for size in range(1, len(document) + 1))
+
+
+def test_keys_are_not_stable_until_their_value_starts():
+    scanner = PartialJsonScanner()
+    assert scanner.feed('{"a": "b", ') == len('{"a": "b"')
+    assert scanner.feed('{"a": "b", "c": ') == len('{"a": "b"')
+    assert scanner.feed('{"a": "b", "c": [') == len('{"a": "b", "c": [')
+    # Strings in arrays are values, not keys
+    assert scanner.feed('{"a": "b", "c": ["d", "e') == len('{"a": "b", "c": ["d", "e')
+
+
+def test_stable_prefix_parses_like_whole_text():
+    document = '{"a": 1, "b": "x\\"y", "c": [true, {"e": [1.5, -2e3]}, "z"], "d": null, "f": {}}'
+    scanner = PartialJsonScanner()
+    for end in range(1, len(document) + 1):
+        text = document[:end]
+        stable_text = text[: scanner.feed(text)]
+        assert from_json(text, allow_partial='trailing-strings') == from_json(
+            stable_text or 'null', allow_partial='trailing-strings'
+        )
+
+
+def test_json_array_splitter():
+    document = b'[{"a": "}]\\\\"}, {"b": [1, {"c": "\\"["}]}\r\n,\r\n[2, 3], {}]'
+    expected = [b'{"a": "}]\\\\"}', b'{"b": [1, {"c": "\\"["}]}', b'[2, 3]', b'{}']
+    for chunk_size in range(1, len(document) + 1):
+        splitter = JsonArraySplitter()
+        items: list[bytes] = []
+        for start in range(0, len(document), chunk_size):
+            items.extend(splitter.feed(document[start : start + chunk_size]))
+        assert items == expected
+
+
+def test_json_array_splitter_discards_completed_items():
+    splitter = JsonArraySplitter()
+    assert splitter.feed(b'[{"a": 1}, {"b"') == [b'{"a": 1}']
+    assert splitter._buffer == bytearray(b'{"b"')  # pyright: ignore[reportPrivateUsage]
+    assert splitter.feed(b': 2}]') == [b'{"b": 2}']
+    assert splitter._buffer == bytearray()  # pyright: ignore[reportPrivateUsage]
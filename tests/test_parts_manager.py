@@ -583,6 +583,92 @@ def test_handle_thinking_delta_no_content_or_signature():
         manager.handle_thinking_delta(vendor_part_id='thinking', content=None, signature=None)
 
 
+def test_handle_thinking_delta_signature_with_buffered_content():
+    manager = ModelResponsePartsManager()
+
+    manager.handle_thinking_delta(vendor_part_id='thinking', content='initial')
+    manager.handle_thinking_delta(vendor_part_id='thinking', content=' thought')
+    manager.handle_thinking_delta(vendor_part_id='thinking', signature='sig', provider_name='anthropic')
+    manager.handle_thinking_delta(vendor_part_id='thinking', content='!')
+
+    assert manager.get_parts() == snapshot(
+        [ThinkingPart(content='initial thought!', signature='sig', provider_name='anthropic')]
+    )
+
+
+def test_get_parts_joins_content_lazily():
+    manager = ModelResponsePartsManager()
+
+    manager.handle_text_delta(vendor_part_id='text', content='hello')
+    manager.handle_text_delta(vendor_part_id='text', content=' ')
+    manager.handle_thinking_delta(vendor_part_id='thinking', content='hmm')
+    manager.handle_text_delta(vendor_part_id='text', content='world')
+
+    parts = manager.get_parts()
+    assert parts == snapshot([TextPart(content='hello world'), ThinkingPart(content='hmm')])
+    # The joined content is reused until the next delta arrives
+    assert manager.get_parts()[0] is parts[0]
+
+    manager.handle_text_delta(vendor_part_id='text', content='!')
+    assert manager.get_parts() == snapshot([TextPart(content='hello world!'), ThinkingPart(content='hmm')])
+
+
+@pytest.mark.parametrize('vendor_part_id', [None, 'content'])
+def test_handle_long_text_stream(vendor_part_id: str | None):
+    """A long stream only buffers its deltas, as content is only joined on `get_parts()`."""
+    manager = ModelResponsePartsManager()
+    tokens = [f'tok{i % 10} ' for i in range(50_000)]
+
+    manager.handle_text_delta(vendor_part_id=vendor_part_id, content=tokens[0])
+    part = manager._parts[0]  # pyright: ignore[reportPrivateUsage]
+    for token in tokens[1:]:
+        manager.handle_text_delta(vendor_part_id=vendor_part_id, content=token)
+
+    # Copying the whole content string on every delta would make the stream quadratic
+    assert manager._parts[0] is part  # pyright: ignore[reportPrivateUsage]
+    assert manager._pending_chunks[0] == tokens  # pyright: ignore[reportPrivateUsage]
+
+    assert manager.get_parts() == [TextPart(content=''.join(tokens))]
+    assert manager._pending_chunks == {}  # pyright: ignore[reportPrivateUsage]
+
+
+def test_handle_tool_call_args_buffered_until_get_parts():
+    manager = ModelResponsePartsManager()
+
+    manager.handle_tool_call_delta(vendor_part_id=1, tool_name='tool', args='{"a": ', tool_call_id='call_1')
+    event = manager.handle_tool_call_delta(vendor_part_id=1, args='1, "b"')
+    assert event == snapshot(
+        PartDeltaEvent(index=0, delta=ToolCallPartDelta(args_delta='1, "b"', tool_call_id='call_1'))
+    )
+    manager.handle_tool_call_delta(vendor_part_id=1, args=': 2}')
+    assert manager.get_parts() == snapshot(
+        [ToolCallPart(tool_name='tool', args='{"a": 1, "b": 2}', tool_call_id='call_1')]
+    )
+
+    # Fully overwriting the part discards any buffered args
+    manager.handle_tool_call_delta(vendor_part_id=1, args='garbage')
+    manager.handle_tool_call_part(vendor_part_id=1, tool_name='tool', args='{}', tool_call_id='call_1')
+    assert manager.get_parts() == snapshot([ToolCallPart(tool_name='tool', args='{}', tool_call_id='call_1')])
+
+
+def test_handle_long_tool_call_args_stream():
+    """A large streamed JSON argument only buffers its deltas, as args are joined lazily."""
+    manager = ModelResponsePartsManager()
+    chunks = ['{"items": ['] + [f'{{"id": {i}, "name": "item {i}"}}, ' for i in range(50_000)] + ['null]}']
+
+    manager.handle_tool_call_delta(vendor_part_id='call', tool_name='report', tool_call_id='call_1')
+    part = manager._parts[0]  # pyright: ignore[reportPrivateUsage]
+    for chunk in chunks:
+        manager.handle_tool_call_delta(vendor_part_id='call', args=chunk)
+
+    # Copying the whole args string on every delta would make the stream quadratic
+    assert manager._parts[0] is part  # pyright: ignore[reportPrivateUsage]
+    assert manager._pending_chunks[0] == ['', *chunks]  # pyright: ignore[reportPrivateUsage]
+
+    assert manager.get_parts() == [ToolCallPart(tool_name='report', args=''.join(chunks), tool_call_id='call_1')]
+    assert manager._pending_chunks == {}  # pyright: ignore[reportPrivateUsage]
+
+
 def test_handle_builtin_tool_call_part():
     manager = ModelResponsePartsManager()
 
@@ -634,3 +720,40 @@ def test_handle_builtin_tool_return_part():
     event = manager.handle_builtin_tool_return_part(vendor_part_id=None, part=part3)
     assert event == snapshot(PartStartEvent(index=1, part=part3))
     assert manager.get_parts() == snapshot([part2, part3])
+
+
+def test_tool_call_end_handler():
+    manager = ModelResponsePartsManager()
+    ended: list[ToolCallPart] = []
+    manager.tool_call_end_handler = ended.append
+
+    manager.handle_tool_call_delta(vendor_part_id=0, tool_name='tool1', args='{"a": ', tool_call_id='call_1')
+    manager.handle_tool_call_delta(vendor_part_id=0, args='1}')
+    assert ended == []
+
+    # A tool call ends when the next part starts
+    manager.handle_text_delta(vendor_part_id=1, content='text')
+    assert ended == snapshot([ToolCallPart(tool_name='tool1', args='{"a": 1}', tool_call_id='call_1')])
+
+    # Or when the vendor signals the end of a part, which also ends the parts before it
+    manager.handle_tool_call_delta(vendor_part_id=2, args='{"b": 2}', tool_call_id='call_2')
+    manager.handle_tool_call_delta(vendor_part_id=2, tool_name='tool2')
+    manager.handle_builtin_tool_call_part(vendor_part_id=3, part=BuiltinToolCallPart(tool_name='builtin', args='{}'))
+    manager.handle_tool_call_delta(vendor_part_id=4, args='{"c": 3}', tool_call_id='call_3')
+    manager.handle_tool_call_part(vendor_part_id=5, tool_name='tool3', args={'d': 4}, tool_call_id='call_4')
+    manager.handle_part_end(vendor_part_id=5)
+    manager.handle_part_end(vendor_part_id=4)
+    manager.handle_part_end(vendor_part_id='unknown')
+    # Built-in tool calls and tool calls without a name aren't reported
+    assert ended[1:] == snapshot(
+        [
+            ToolCallPart(tool_name='tool2', args='{"b": 2}', tool_call_id='call_2'),
+            ToolCallPart(tool_name='tool3', args={'d': 4}, tool_call_id='call_4'),
+        ]
+    )
+
+    # Parts aren't reported without a handler
+    manager.tool_call_end_handler = None
+    manager.handle_tool_call_part(vendor_part_id=6, tool_name='tool4', args='{}', tool_call_id='call_5')
+    manager.handle_text_delta(vendor_part_id=7, content='text')
+    assert len(ended) == 3
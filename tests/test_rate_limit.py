@@ -0,0 +1,192 @@
+from __future__ import annotations as _annotations
+
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from pydantic_ai import Agent, ModelMessage, ModelResponse, TextPart
+from pydantic_ai._http_pool import PooledAsyncClient
+from pydantic_ai.models import HttpPoolSettings, HttpPoolStats, set_http_pool_settings
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.rate_limit import (
+    AdaptiveRateLimiter,
+    AsyncRateLimitTransport,
+    _parse_limit,  # pyright: ignore[reportPrivateUsage]
+    _parse_reset,  # pyright: ignore[reportPrivateUsage]
+)
+from pydantic_ai.usage import RequestUsage
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def pool_settings() -> Iterator[None]:
+    yield
+    set_http_pool_settings(HttpPoolSettings())
+
+
+def test_parse_reset():
+    assert _parse_reset('6m0s') == 360
+    assert _parse_reset('20ms') == 0.02
+    assert _parse_reset('1h2m3.5s') == 3723.5
+    assert _parse_reset(None) is None
+    assert _parse_reset('soon') is None
+
+    reset_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    reset = _parse_reset(reset_at.isoformat().replace('+00:00', 'Z'))
+    assert reset is not None and 25 < reset <= 30
+    assert _parse_reset('2020-01-01T00:00:00') == 0
+
+
+def test_parse_limit():
+    openai_headers = httpx.Headers(
+        {
+            'x-ratelimit-limit-requests': '100',
+            'x-ratelimit-remaining-requests': '90',
+            'x-ratelimit-reset-requests': '2s',
+        }
+    )
+    assert _parse_limit(openai_headers, 'requests') == (100, 90, 5)
+    assert _parse_limit(openai_headers, 'tokens') is None
+
+    # Without a reset time, the limit is assumed to be per minute
+    anthropic_headers = httpx.Headers(
+        {'anthropic-ratelimit-input-tokens-limit': '60000', 'anthropic-ratelimit-input-tokens-remaining': '60000'}
+    )
+    assert _parse_limit(anthropic_headers, 'input-tokens') == (60000, 60000, 1000)
+
+
+async def test_requests_paced_by_remaining_budget():
+    limiter = AdaptiveRateLimiter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # 10 requests per 100ms, none of which are left
+        return httpx.Response(
+            200,
+            headers={
+                'x-ratelimit-limit-requests': '10',
+                'x-ratelimit-remaining-requests': '0',
+                'x-ratelimit-reset-requests': '100ms',
+            },
+        )
+
+    async with httpx.AsyncClient(transport=AsyncRateLimitTransport(limiter, httpx.MockTransport(handler))) as client:
+        # Nothing is known about the budget before the first response
+        await client.get('https://api.example.com/v1')
+        assert limiter.stats.delayed_requests == 0
+
+        await client.get('https://api.example.com/v1')
+        assert limiter.stats.delayed_requests == 1
+
+        # Other hosts have their own budget
+        await client.get('https://other.example.com/v1')
+        assert limiter.stats.delayed_requests == 1
+
+    assert limiter.stats.requests == 3
+    assert limiter.stats.requests_waiting == 0
+    assert limiter.stats.average_wait_time == limiter.stats.total_wait_time / 3
+
+
+async def test_token_budget():
+    limiter = AdaptiveRateLimiter(tokens_per_request=100)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={
+                'anthropic-ratelimit-tokens-limit': '10000',
+                'anthropic-ratelimit-tokens-remaining': '0',
+                'anthropic-ratelimit-tokens-reset': (datetime.now(timezone.utc) + timedelta(seconds=1)).isoformat(),
+            },
+        )
+
+    async with httpx.AsyncClient(transport=AsyncRateLimitTransport(limiter, httpx.MockTransport(handler))) as client:
+        await client.get('https://api.anthropic.com/v1/messages')
+        # 100 tokens take around 10ms to be replenished
+        await client.get('https://api.anthropic.com/v1/messages')
+        assert limiter.stats.delayed_requests == 1
+        assert 0.005 <= limiter.stats.max_wait_time < 0.5
+
+
+async def test_rate_limited_response_blocks_host():
+    limiter = AdaptiveRateLimiter()
+    status_codes = [429, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_codes.pop(0), headers={'retry-after': '0.05'})
+
+    async with httpx.AsyncClient(transport=AsyncRateLimitTransport(limiter, httpx.MockTransport(handler))) as client:
+        assert (await client.get('https://api.example.com/v1')).status_code == 429
+        assert (await client.get('https://api.example.com/v1')).status_code == 200
+
+    assert limiter.stats.rate_limited_responses == 1
+    assert limiter.stats.delayed_requests == 1
+    assert limiter.stats.max_wait_time >= 0.04
+
+
+async def test_max_wait():
+    limiter = AdaptiveRateLimiter(max_wait=0.01)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={'retry-after': '60'})
+
+    async with httpx.AsyncClient(transport=AsyncRateLimitTransport(limiter, httpx.MockTransport(handler))) as client:
+        await client.get('https://api.example.com/v1')
+        await client.get('https://api.example.com/v1')
+
+    assert limiter.stats.delayed_requests == 1
+    assert limiter.stats.max_wait_time < 1
+
+
+def test_record_usage():
+    limiter = AdaptiveRateLimiter(tokens_per_request=1000, usage_smoothing=0.5)
+    limiter.record_usage(RequestUsage(input_tokens=2000, output_tokens=1000))
+    assert limiter.tokens_per_request == 2000
+    limiter.record_usage(RequestUsage())
+    assert limiter.tokens_per_request == 2000
+
+
+async def test_pooled_client_rate_limiter(pool_settings: None):
+    limiter = AdaptiveRateLimiter(tokens_per_request=1000, usage_smoothing=0.5)
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b'ok'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={'x-ratelimit-limit-tokens': '100000', 'x-ratelimit-remaining-tokens': '50000'},
+            content=chunks(),
+        )
+
+    settings = HttpPoolSettings(rate_limiter=limiter)
+    async with PooledAsyncClient(
+        pool_settings=settings, stats=HttpPoolStats(max_connections=100), transport=httpx.MockTransport(handler)
+    ) as client:
+        async with client.stream('GET', 'https://api.example.com/v1') as response:
+            budget = limiter._budgets['api.example.com']  # pyright: ignore[reportPrivateUsage]
+            assert budget.requests_in_flight == 1
+            await response.aread()
+        assert budget.requests_in_flight == 0
+        assert budget.tokens is not None and budget.tokens.level <= 50000
+
+    # The usage of model responses is only recorded on the rate limiter of the shared client that sent the request
+    set_http_pool_settings(settings)
+
+    def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        return ModelResponse(parts=[TextPart('ok')], usage=RequestUsage(input_tokens=2000, output_tokens=1000))
+
+    await Agent(FunctionModel(respond)).run('Hello')
+    assert limiter.tokens_per_request == 1000
+
+    async def respond_via_client(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        async with PooledAsyncClient(
+            pool_settings=settings, stats=HttpPoolStats(max_connections=100), transport=httpx.MockTransport(handler)
+        ) as client:
+            await client.get('https://api.example.com/v1')
+        return respond(messages, info)
+
+    await Agent(FunctionModel(respond_via_client)).run('Hello')
+    assert limiter.tokens_per_request == 2000
@@ -1,5 +1,6 @@
 from __future__ import annotations as _annotations
 
+import asyncio
 import datetime
 import json
 import re
@@ -169,6 +170,36 @@ async def test_structured_response_iter():
                 pass
 
 
+async def test_stream_output_skips_unchanged_partial_args():
+    class Point(BaseModel):
+        x: int
+        y: int = 0
+
+    async def stream_function(_messages: list[ModelMessage], agent_info: AgentInfo) -> AsyncIterator[DeltaToolCalls]:
+        assert agent_info.output_tools is not None
+        yield {0: DeltaToolCall(name=agent_info.output_tools[0].name, json_args='{"x": 1')}
+        # None of these change the result of partial validation
+        yield {0: DeltaToolCall(json_args=', ')}
+        yield {0: DeltaToolCall(json_args='"y"')}
+        yield {0: DeltaToolCall(json_args=': ')}
+        yield {0: DeltaToolCall(json_args='2}')}
+
+    agent = Agent(FunctionModel(stream_function=stream_function), output_type=Point)
+    validated: list[Point] = []
+
+    @agent.output_validator
+    def record_validation(output: Point) -> Point:
+        validated.append(output)
+        return output
+
+    async with agent.run_stream('') as result:
+        outputs = [output async for output in result.stream_output(debounce_by=None)]
+
+    assert validated == [Point(x=1), Point(x=1, y=2), Point(x=1, y=2)]
+    assert outputs[-1] == Point(x=1, y=2)
+    assert set(map(repr, outputs)) == {repr(Point(x=1)), repr(Point(x=1, y=2))}
+
+
 async def test_streamed_text_stream():
     m = TestModel(custom_output_text='The cat sat on the mat.')
 
@@ -863,6 +894,130 @@ async def test_early_strategy_does_not_apply_to_tool_calls_without_final_tool():
     )
 
 
+async def test_side_effect_free_tool_calls_start_while_streaming():
+    started: list[str] = []
+    second_call_streamed = asyncio.Event()
+
+    async def stream_function(
+        messages: list[ModelMessage], agent_info: AgentInfo
+    ) -> AsyncIterator[DeltaToolCalls | str]:
+        if len(messages) == 1:
+            yield {0: DeltaToolCall(name='lookup', json_args='{"key": ', tool_call_id='call_1')}
+            yield {0: DeltaToolCall(json_args='"a"}')}
+            yield {1: DeltaToolCall(name='lookup', json_args='{"key": "b"}', tool_call_id='call_2')}
+            # The first call was complete once the second one started, so it's already running
+            await asyncio.sleep(0)
+            assert started == ['a']
+            yield {2: DeltaToolCall(name='write', json_args='{"key": "c"}', tool_call_id='call_3')}
+            second_call_streamed.set()
+            await asyncio.sleep(0)
+            assert started == ['a', 'b']
+        else:
+            yield 'done'
+
+    agent = Agent(FunctionModel(stream_function=stream_function))
+
+    @agent.tool_plain(side_effect_free=True)
+    async def lookup(key: str) -> str:
+        started.append(key)
+        await second_call_streamed.wait()
+        return key.upper()
+
+    @agent.tool_plain
+    async def write(key: str) -> str:
+        started.append(key)
+        return key.upper()
+
+    async with agent.run_stream('Hello') as result:
+        assert await result.get_output() == 'done'
+
+    # Calls that don't have side effects still only run once, and their results come in the original order
+    assert started == ['a', 'b', 'c']
+    assert [part.content for part in result.all_messages()[2].parts if isinstance(part, ToolReturnPart)] == snapshot(
+        ['A', 'B', 'C']
+    )
+
+
+async def test_speculative_tool_calls_cancelled_after_final_result():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def stream_function(messages: list[ModelMessage], agent_info: AgentInfo) -> AsyncIterator[DeltaToolCalls]:
+        assert agent_info.output_tools is not None
+        yield {0: DeltaToolCall(name='lookup', json_args='{"key": "a"}', tool_call_id='call_1')}
+        yield {
+            1: DeltaToolCall(name=agent_info.output_tools[0].name, json_args='{"response": 1}', tool_call_id='call_2')
+        }
+        await asyncio.wait_for(started.wait(), 1)
+
+    agent = Agent(FunctionModel(stream_function=stream_function), output_type=int)
+
+    @agent.tool_plain(side_effect_free=True)
+    async def lookup(key: str) -> str:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            cancelled.set()
+        return key  # pragma: no cover
+
+    result = await agent.run('Hello', event_stream_handler=lambda ctx, events: _consume(events))
+    assert result.output == 1
+    assert cancelled.is_set()
+    assert result.all_messages()[-1].parts == snapshot(
+        [
+            ToolReturnPart(
+                tool_name='final_result',
+                content='Final result processed.',
+                tool_call_id='call_2',
+                timestamp=IsNow(tz=timezone.utc),
+            ),
+            ToolReturnPart(
+                tool_name='lookup',
+                content='Tool not executed - a final result was already processed.',
+                tool_call_id='call_1',
+                timestamp=IsNow(tz=timezone.utc),
+            ),
+        ]
+    )
+
+
+async def test_speculative_tool_calls_cancelled_when_run_is_abandoned():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def stream_function(messages: list[ModelMessage], agent_info: AgentInfo) -> AsyncIterator[DeltaToolCalls]:
+        yield {0: DeltaToolCall(name='lookup', json_args='{"key": "a"}', tool_call_id='call_1')}
+        yield {1: DeltaToolCall(name='lookup', json_args='{"key": "b"}', tool_call_id='call_2')}
+        await asyncio.wait_for(started.wait(), 1)
+
+    agent = Agent(FunctionModel(stream_function=stream_function))
+
+    @agent.tool_plain(side_effect_free=True)
+    async def lookup(key: str) -> str:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            cancelled.set()
+        return key  # pragma: no cover
+
+    async with agent.iter('Hello') as run:
+        async for node in run:
+            if Agent.is_model_request_node(node):
+                async with node.stream(run.ctx) as stream:
+                    async for _ in stream:
+                        pass
+                break
+
+    assert cancelled.is_set()
+
+
+async def _consume(events: AsyncIterable[AgentStreamEvent]) -> None:
+    async for _ in events:
+        pass
+
+
 async def test_custom_output_type_default_str() -> None:
     agent = Agent('test')
 
@@ -148,6 +148,7 @@ def test_docstring_google(docstring_format: Literal['google', 'auto']):
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -182,6 +183,7 @@ def test_docstring_sphinx(docstring_format: Literal['sphinx', 'auto']):
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -224,6 +226,7 @@ def test_docstring_numpy(docstring_format: Literal['numpy', 'auto']):
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -266,6 +269,7 @@ def test_google_style_with_returns():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -306,6 +310,7 @@ def test_sphinx_style_with_returns():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -352,6 +357,7 @@ def test_numpy_style_with_returns():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -386,6 +392,7 @@ def test_only_returns_type():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -411,6 +418,7 @@ def test_docstring_unknown():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -454,6 +462,7 @@ def test_docstring_google_no_body(docstring_format: Literal['google', 'auto']):
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -490,6 +499,7 @@ def test_takes_just_model():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -535,6 +545,7 @@ def test_takes_model_and_int():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -900,6 +911,7 @@ def test_suppress_griffe_logging(caplog: LogCaptureFixture):
             'parameters_json_schema': {'additionalProperties': False, 'properties': {}, 'type': 'object'},
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
@@ -972,6 +984,7 @@ def test_json_schema_required_parameters():
                 },
                 'strict': None,
                 'kind': 'function',
+                'side_effect_free': False,
                 'sequential': False,
                 'metadata': None,
             },
@@ -987,6 +1000,7 @@ def test_json_schema_required_parameters():
                 },
                 'strict': None,
                 'kind': 'function',
+                'side_effect_free': False,
                 'sequential': False,
                 'metadata': None,
             },
@@ -1075,6 +1089,7 @@ def test_schema_generator():
                 },
                 'strict': None,
                 'kind': 'function',
+                'side_effect_free': False,
                 'sequential': False,
                 'metadata': None,
             },
@@ -1088,6 +1103,7 @@ def test_schema_generator():
                 },
                 'strict': None,
                 'kind': 'function',
+                'side_effect_free': False,
                 'sequential': False,
                 'metadata': None,
             },
@@ -1125,6 +1141,7 @@ def test_tool_parameters_with_attribute_docstrings():
             'outer_typed_dict_key': None,
             'strict': None,
             'kind': 'function',
+            'side_effect_free': False,
             'sequential': False,
             'metadata': None,
         }
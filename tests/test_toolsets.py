@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import re
 from collections import defaultdict
+from contextvars import ContextVar, copy_context
 from dataclasses import dataclass, replace
 from typing import Any, TypeVar
 from unittest.mock import AsyncMock
@@ -13,6 +15,7 @@ from typing_extensions import Self
 from pydantic_ai import (
     AbstractToolset,
     CombinedToolset,
+    ConcurrencyLimitedToolset,
     FilteredToolset,
     FunctionToolset,
     PrefixedToolset,
@@ -23,11 +26,11 @@ from pydantic_ai import (
 )
 from pydantic_ai._run_context import RunContext
 from pydantic_ai._tool_manager import ToolManager
-from pydantic_ai.exceptions import ModelRetry, ToolRetryError, UnexpectedModelBehavior, UserError
+from pydantic_ai.exceptions import ModelRetry, ToolRetryError, UnexpectedModelBehavior, UsageLimitExceeded, UserError
 from pydantic_ai.models.test import TestModel
 from pydantic_ai.tools import ToolDefinition
 from pydantic_ai.toolsets._dynamic import DynamicToolset
-from pydantic_ai.usage import RunUsage
+from pydantic_ai.usage import RunUsage, UsageLimits
 
 pytestmark = pytest.mark.anyio
 
@@ -679,7 +682,7 @@ async def test_tool_manager_multiple_failed_tools():
     assert new_tool_manager.failed_tools == set()  # reset for new run step
 
 
-async def test_tool_manager_sequential_tool_call():
+async def test_tool_manager_batch_calls():
     toolset = FunctionToolset[None]()
 
     @toolset.tool(sequential=True)
@@ -688,19 +691,143 @@ async def test_tool_manager_sequential_tool_call():
     @toolset.tool(sequential=False)
     def tool_b(x: int) -> int: ...  # pragma: no cover
 
-    tool_manager = ToolManager[None](toolset)
+    tool_manager = await ToolManager[None](toolset).for_run_step(build_run_context(None))
 
-    prepared_tool_manager = await tool_manager.for_run_step(build_run_context(None))
+    def calls(*names: str) -> list[ToolCallPart]:
+        return [ToolCallPart(tool_name=name, args={'x': 1}) for name in names]
 
-    assert prepared_tool_manager.should_call_sequentially([ToolCallPart(tool_name='tool_a', args={'x': 1})])
-    assert not prepared_tool_manager.should_call_sequentially([ToolCallPart(tool_name='tool_b', args={'x': 1})])
+    assert tool_manager.batch_calls(calls('tool_b', 'tool_b', 'tool_b')) == [[0, 1, 2]]
+    assert tool_manager.batch_calls(calls('tool_b', 'tool_b', 'tool_a', 'tool_b', 'unknown', 'tool_a', 'tool_a')) == [
+        [0, 1],
+        [2],
+        [3, 4],
+        [5],
+        [6],
+    ]
 
-    assert prepared_tool_manager.should_call_sequentially(
-        [ToolCallPart(tool_name='tool_a', args={'x': 1}), ToolCallPart(tool_name='tool_b', args={'x': 1})]
-    )
-    assert prepared_tool_manager.should_call_sequentially(
-        [ToolCallPart(tool_name='tool_b', args={'x': 1}), ToolCallPart(tool_name='tool_a', args={'x': 1})]
+    with ToolManager.sequential_tool_calls():
+        assert tool_manager.batch_calls(calls('tool_b', 'tool_b')) == [[0], [1]]
+
+
+async def test_tool_manager_speculative_calls():
+    toolset = FunctionToolset[None]()
+    calls: list[str] = []
+    release = asyncio.Event()
+
+    @toolset.tool(side_effect_free=True)
+    async def lookup(key: str) -> str:
+        calls.append(key)
+        await release.wait()
+        return key.upper()
+
+    @toolset.tool
+    async def write(key: str) -> str: ...  # pragma: no cover
+
+    @toolset.tool(sequential=True, side_effect_free=True)
+    async def barrier() -> None: ...  # pragma: no cover
+
+    tool_manager = await ToolManager[None](toolset).for_run_step(build_run_context(None))
+
+    # Calls are only started early for side-effect-free tools with valid arguments
+    tool_manager.start_speculative_call(ToolCallPart('lookup', {'key': 'a'}, tool_call_id='call_1'))
+    tool_manager.start_speculative_call(ToolCallPart('lookup', '{"key": "a"}', tool_call_id='call_1'))
+    tool_manager.start_speculative_call(ToolCallPart('lookup', '{"key": ', tool_call_id='call_2'))
+    tool_manager.start_speculative_call(ToolCallPart('write', {'key': 'b'}, tool_call_id='call_3'))
+    tool_manager.start_speculative_call(ToolCallPart('unknown', {}, tool_call_id='call_4'))
+    tool_manager.start_speculative_call(ToolCallPart('lookup', {'key': 'c'}, tool_call_id='call_5'))
+    await asyncio.sleep(0)
+    assert calls == ['a', 'c']
+
+    # The result of a call that was started early is used
+    release.set()
+    assert await tool_manager.handle_call(ToolCallPart('lookup', {'key': 'a'}, tool_call_id='call_1')) == 'A'
+    assert calls == ['a', 'c']
+
+    # Unless the arguments changed since it was started
+    assert await tool_manager.handle_call(ToolCallPart('lookup', {'key': 'd'}, tool_call_id='call_5')) == 'D'
+    assert calls == ['a', 'c', 'd']
+    # The discarded call doesn't count towards the usage
+    assert tool_manager.ctx is not None
+    assert tool_manager.ctx.usage.tool_calls == 2
+
+    # Calls after a call to a sequential tool may depend on it, so they aren't started early
+    release.clear()
+    tool_manager.start_speculative_call(ToolCallPart('barrier', {}, tool_call_id='call_6'))
+    tool_manager.start_speculative_call(ToolCallPart('lookup', {'key': 'e'}, tool_call_id='call_7'))
+    await asyncio.sleep(0)
+    assert calls == ['a', 'c', 'd']
+
+    # Nor when the concurrency of tool calls is limited
+    limited_tool_manager = await ToolManager[None](toolset, max_concurrent_calls=2).for_run_step(
+        build_run_context(None)
     )
+    limited_tool_manager.start_speculative_call(ToolCallPart('lookup', {'key': 'f'}, tool_call_id='call_8'))
+    await asyncio.sleep(0)
+    assert calls == ['a', 'c', 'd']
+
+    # Calls whose results aren't used are cancelled
+    tool_manager = await ToolManager[None](toolset).for_run_step(build_run_context(None))
+    tool_manager.start_speculative_call(ToolCallPart('lookup', {'key': 'g'}, tool_call_id='call_9'))
+    await asyncio.sleep(0)
+    assert calls == ['a', 'c', 'd', 'g']
+    await tool_manager.cancel_speculative_calls()
+    with pytest.raises(asyncio.TimeoutError):
+        # The call would wait for `release`, so this shows it isn't picked up anymore
+        await asyncio.wait_for(
+            tool_manager.handle_call(ToolCallPart('lookup', {'key': 'g'}, tool_call_id='call_9')), timeout=0.01
+        )
+
+
+async def test_tool_manager_speculative_call_accounting():
+    toolset = FunctionToolset[None]()
+    current_step: ContextVar[str] = ContextVar('current_step', default='none')
+    steps: list[str] = []
+
+    @toolset.tool(side_effect_free=True)
+    async def lookup(key: str) -> str:
+        steps.append(current_step.get())
+        if key == 'retry':
+            raise ModelRetry('Try again')
+        return key.upper()
+
+    tool_manager = await ToolManager[None](toolset).for_run_step(build_run_context(None))
+    assert tool_manager.ctx is not None
+
+    # Calls run in the context they're given, rather than the one they're started in
+    token = current_step.set('run step')
+    context = copy_context()
+    current_step.reset(token)
+    tool_manager.start_speculative_call(ToolCallPart('lookup', {'key': 'retry'}, tool_call_id='call_1'), None, context)
+    tool_manager.start_speculative_call(ToolCallPart('lookup', {'key': 'a'}, tool_call_id='call_2'), None, context)
+    await asyncio.sleep(0)
+    assert steps == ['run step', 'run step']
+
+    # Failures and usage are only recorded once the results are used
+    assert tool_manager.failed_tools == set()
+    assert tool_manager.ctx.usage.tool_calls == 0
+    await tool_manager.cancel_speculative_calls()
+    assert tool_manager.failed_tools == set()
+    assert tool_manager.ctx.usage.tool_calls == 0
+
+    tool_manager.start_speculative_call(ToolCallPart('lookup', {'key': 'retry'}, tool_call_id='call_3'))
+    tool_manager.start_speculative_call(ToolCallPart('lookup', {'key': 'b'}, tool_call_id='call_4'))
+    await asyncio.sleep(0)
+    with pytest.raises(ToolRetryError):
+        await tool_manager.handle_call(ToolCallPart('lookup', {'key': 'retry'}, tool_call_id='call_3'))
+    assert tool_manager.failed_tools == {'lookup'}
+    assert await tool_manager.handle_call(ToolCallPart('lookup', {'key': 'b'}, tool_call_id='call_4')) == 'B'
+    assert tool_manager.ctx.usage.tool_calls == 1
+
+    # Usage limits are checked when the result is used, and calls they wouldn't allow aren't started at all
+    usage_limits = UsageLimits(tool_calls_limit=1)
+    tool_manager.start_speculative_call(ToolCallPart('lookup', {'key': 'c'}, tool_call_id='call_5'), usage_limits)
+    assert tool_manager._speculative_calls == {}  # pyright: ignore[reportPrivateUsage]
+    tool_manager.start_speculative_call(ToolCallPart('lookup', {'key': 'd'}, tool_call_id='call_6'))
+    with pytest.raises(UsageLimitExceeded):
+        await tool_manager.handle_call(
+            ToolCallPart('lookup', {'key': 'd'}, tool_call_id='call_6'), usage_limits=usage_limits
+        )
+    assert tool_manager.ctx.usage.tool_calls == 1
 
 
 async def test_visit_and_replace():
@@ -822,3 +949,84 @@ async def test_dynamic_toolset_empty():
         assert tools == {}
 
         assert toolset._toolset is None  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_concurrency_limited_toolset():
+    running: list[str] = []
+    max_running: dict[str, int] = defaultdict(int)
+    max_total_weight = 0
+    weights = {'heavy': 3}
+
+    toolset = FunctionToolset[None]()
+
+    async def record(name: str) -> str:
+        nonlocal max_total_weight
+        running.append(name)
+        for tool_name in set(running):
+            max_running[tool_name] = max(max_running[tool_name], running.count(tool_name))
+        max_total_weight = max(max_total_weight, sum(weights.get(tool_name, 1) for tool_name in running))
+        await asyncio.sleep(0.01)
+        running.remove(name)
+        return name
+
+    @toolset.tool
+    async def light() -> str:
+        return await record('light')
+
+    @toolset.tool
+    async def limited() -> str:
+        return await record('limited')
+
+    @toolset.tool
+    async def heavy() -> str:
+        return await record('heavy')
+
+    limited_toolset = toolset.concurrency_limited(4, tool_max_concurrency={'limited': 1}, tool_weights=weights)
+    assert isinstance(limited_toolset, ConcurrencyLimitedToolset)
+
+    tool_manager = await ToolManager[None](limited_toolset).for_run_step(build_run_context(None))
+    names = ['light'] * 4 + ['limited'] * 3 + ['heavy'] * 2 + ['light'] * 2
+    results = await asyncio.gather(*(tool_manager.handle_call(ToolCallPart(tool_name=name)) for name in names))
+
+    assert results == names
+    assert max_total_weight == 4
+    assert max_running == snapshot({'light': 4, 'limited': 1, 'heavy': 1})
+    assert limited_toolset._limiter.used == 0  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_weighted_limiter_fifo_and_cancellation():
+    from pydantic_ai.toolsets.concurrency_limited import WeightedLimiter
+
+    limiter = WeightedLimiter(2)
+    order: list[str] = []
+
+    async def hold(name: str, weight: int, event: asyncio.Event):
+        async with limiter.acquire(weight):
+            order.append(name)
+            await event.wait()
+
+    release_first = asyncio.Event()
+    release_rest = asyncio.Event()
+    release_rest.set()
+
+    first = asyncio.create_task(hold('first', 2, release_first))
+    await asyncio.sleep(0)
+    assert limiter.used == 2
+
+    # A light call queued behind a heavy one doesn't overtake it
+    heavy = asyncio.create_task(hold('heavy', 5, release_rest))
+    await asyncio.sleep(0)
+    light = asyncio.create_task(hold('light', 1, release_rest))
+    cancelled = asyncio.create_task(hold('cancelled', 1, release_rest))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert order == ['first']
+
+    release_first.set()
+    await asyncio.gather(first, heavy, light)
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    assert order == ['first', 'heavy', 'light']
+    assert limiter.used == 0
@@ -15,6 +15,8 @@ from pydantic_ai._utils import (
     UNSET,
     PeekableAsyncStream,
     check_object_json_schema,
+    chunk_by_size,
+    gather_or_cancel,
     group_by_temporal,
     is_async_callable,
     merge_json_schema_defs,
@@ -541,3 +543,38 @@ def test_validate_empty_kwargs_preserves_order():
     assert '`first`' in error_msg
     assert '`second`' in error_msg
     assert '`third`' in error_msg
+
+
+def test_chunk_by_size():
+    items = ['a', 'bb', 'cccccc', 'd', 'e', 'f']
+    sizes = [len(item) for item in items]
+    assert chunk_by_size(items, sizes, max_count=10, max_size=4) == snapshot([['a', 'bb'], ['cccccc'], ['d', 'e', 'f']])
+    assert chunk_by_size(items, sizes, max_count=2, max_size=100) == snapshot(
+        [['a', 'bb'], ['cccccc', 'd'], ['e', 'f']]
+    )
+    assert chunk_by_size([], [], max_count=2, max_size=100) == []
+
+
+async def test_gather_or_cancel():
+    assert await gather_or_cancel(asyncio.sleep(0, 'a'), asyncio.sleep(0, 'b')) == ['a', 'b']
+    assert await gather_or_cancel() == []
+
+    cancelled = asyncio.Event()
+
+    async def wait_forever() -> None:
+        try:
+            await asyncio.Event().wait()
+        finally:
+            cancelled.set()
+
+    async def fail() -> None:
+        raise ValueError('failed')
+
+    async def fail_later() -> None:
+        await asyncio.sleep(0)
+        raise ValueError('failed later')
+
+    # Once one fails, the others are cancelled and waited for
+    with pytest.raises(ValueError, match='^failed$'):
+        await gather_or_cancel(wait_forever(), fail(), fail_later())
+    assert cancelled.is_set()